@@ -0,0 +1,10 @@
+from .bot import Bot, BotStats
+from .client import GameClient, serve_in_process
+from .harness import create_room, play_room
+from .strategy import GreedyStrategy, Strategy, get_strategy
+from .view import BotView
+
+__all__ = [
+    'Bot', 'BotStats', 'BotView', 'GameClient', 'GreedyStrategy', 'Strategy',
+    'create_room', 'get_strategy', 'play_room', 'serve_in_process',
+]
@@ -0,0 +1,313 @@
+"""
+Bot jugador: se conecta como un cliente real (API REST + Socket.IO), arma su
+vista de la partida con los eventos que recibe y juega su turno eligiendo
+jugadas legales con una Strategy.
+
+En su turno: (opcional) baja un set o juega un evento pasando por la ventana
+NSF, descarta, repone la mano del draft / mazo y termina el turno. Fuera de su
+turno responde NSF dentro de la ventana y elige su secreto cuando un detective
+de dos pasos lo apunta (`select_own_secret`).
+"""
+
+import asyncio
+import logging
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import socketio
+
+from app.schemas.detective_set_schema import NextActionType
+
+from .client import BotRequestError, GameClient
+from .rules import (
+    CARDS_OFF_THE_TABLE_CARD_ID,
+    DELAY_ESCAPE_CARD_ID,
+    EARLY_TRAIN_CARD_ID,
+    HAND_SIZE,
+    LOOK_INTO_ASHES_CARD_ID,
+    SetPlay,
+    find_nsf,
+)
+from .strategy import Strategy
+from .view import BotView
+
+logger = logging.getLogger(__name__)
+
+# Margen para que un NSF llegue antes de que cierre la ventana (segundos)
+NSF_SAFETY_MARGIN = 1.0
+
+
+@dataclass
+class BotStats:
+    """Contadores de una corrida: jugadas por tipo y errores por request."""
+    turns: int = 0
+    moves: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+
+
+class Bot:
+    """
+    Un jugador automático en una sala.
+
+    Args:
+        client: GameClient contra el servidor
+        user_id: Player.id del bot
+        room_id: Sala en la que juega
+        strategy: Strategy que elige las jugadas (default: al azar)
+        think_time: (mín, máx) segundos de "pensar" antes de cada decisión
+        nsf_timeout: Cuánto esperar el resultado de una ventana NSF propia
+        transports: Transportes de Engine.IO (default: polling con upgrade a websocket)
+    """
+
+    def __init__(self, client: GameClient, user_id: int, room_id: int,
+                 strategy: Optional[Strategy] = None, think_time: Tuple[float, float] = (0.2, 1.0),
+                 nsf_timeout: float = 60.0, transports: Optional[List[str]] = None):
+        self.client = client
+        self.user_id = user_id
+        self.room_id = room_id
+        self.strategy = strategy or Strategy()
+        self.rng: random.Random = self.strategy.rng
+        self.think_time = think_time
+        self.nsf_timeout = nsf_timeout
+        self.transports = transports
+        self.view = BotView(user_id, room_id)
+        self.stats = BotStats()
+        self.sio: Optional[socketio.AsyncClient] = None
+        self._wake = asyncio.Event()
+        self._turn_ended = False
+        self._nsf_waiters: Dict[int, asyncio.Future] = {}
+        self._tasks: set = set()
+
+    # ---------- conexión ----------
+
+    async def connect(self) -> None:
+        self.sio = socketio.AsyncClient(reconnection=True)
+        self.sio.on("*", self.handle_event)
+        await self.sio.connect(
+            f"{self.client.base_url}?user_id={self.user_id}&room_id={self.room_id}",
+            transports=self.transports,
+        )
+
+    async def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        if self.sio is not None and self.sio.connected:
+            await self.sio.disconnect()
+
+    async def run(self, timeout: Optional[float] = None) -> BotStats:
+        """Juega hasta que termine la partida (o se cumpla el timeout)."""
+        if self.sio is None:
+            await self.connect()
+        try:
+            await asyncio.wait_for(self._loop(), timeout)
+        finally:
+            await self.close()
+        return self.stats
+
+    async def _loop(self) -> None:
+        while not self.view.finished:
+            await self._wake.wait()
+            self._wake.clear()
+            if self.view.is_my_turn and not self._turn_ended:
+                await self.take_turn()
+
+    # ---------- eventos ----------
+
+    async def handle_event(self, event: str, data=None) -> None:
+        """Handler de todos los eventos de socket (también se puede llamar directo)."""
+        self.view.apply(event, data)
+        if not isinstance(data, dict):
+            return
+
+        if event == "game_state_public" and data.get("turno_actual") != self.user_id:
+            self._turn_ended = False
+        elif event == "nsf_counter_complete":
+            waiter = self._nsf_waiters.pop(data.get("action_id"), None)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(data.get("final_result"))
+        elif event == "nsf_counter_start" and data.get("player_id") != self.user_id:
+            self._spawn(self._react_nsf(data["action_id"], data.get("time_remaining") or 5))
+        elif event == "nsf_played" and data.get("player_id") != self.user_id:
+            # Cada NSF reinicia la ventana
+            self._spawn(self._react_nsf(data["action_id"], 5))
+        elif event == "select_own_secret":
+            self._spawn(self._reply_secret(int(data["action_id"])))
+
+        self._wake.set()
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _think(self, limit: Optional[float] = None) -> None:
+        low, high = self.think_time
+        delay = self.rng.uniform(low, high)
+        if limit is not None:
+            delay = min(delay, max(0.0, limit))
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _call(self, move: str, coro) -> Optional[Dict]:
+        """Ejecuta un request contando la jugada o el error."""
+        try:
+            result = await coro
+        except BotRequestError as e:
+            self.stats.errors[f"{move}:{e.status_code}"] += 1
+            logger.warning(f"Bot {self.user_id} {move} failed: {e}")
+            return None
+        self.stats.moves[move] += 1
+        return result
+
+    # ---------- turno ----------
+
+    async def take_turn(self) -> None:
+        """Una jugada opcional, descarte, reponer la mano y terminar el turno."""
+        self.stats.turns += 1
+        await self._think()
+
+        play = self.strategy.choose_play(self.view)
+        if isinstance(play, SetPlay):
+            await self._play_set(play)
+        elif play is not None:
+            await self._play_event(play)
+        if self.view.finished:
+            return
+
+        await self._think()
+        # El estado privado puede no haber llegado todavía: lo jugado ya no está en la mano
+        played = set(play.cards) if isinstance(play, SetPlay) else ({play["id"]} if play else set())
+        self.view.hand = [card for card in self.view.hand if card["id"] not in played]
+        hand_size = len(self.view.hand)
+        discard = self.strategy.choose_discard(self.view)
+        if discard:
+            response = await self._call("discard", self.client.discard(self.room_id, self.user_id, discard))
+            if response is not None:
+                hand_size = len(response["hand"]["cards"])
+
+        await self._refill(hand_size)
+        if self.view.finished:
+            return
+
+        self._turn_ended = True
+        if await self._call("finish_turn", self.client.finish_turn(self.room_id, self.user_id)) is None:
+            self._turn_ended = False
+
+    async def _refill(self, hand_size: int) -> None:
+        missing = HAND_SIZE - hand_size
+        if missing <= 0:
+            return
+        for card_id in self.strategy.choose_draft_picks(self.view, missing):
+            picked = await self._call("draft_pick", self.client.draft_pick(self.view.game_id, self.user_id, card_id))
+            if picked is not None:
+                missing -= 1
+        if missing > 0:
+            await self._call("take_deck", self.client.take_deck(self.room_id, self.user_id, missing))
+
+    async def _start_action(self, card_ids: List[int], action_type: str) -> Optional[int]:
+        """
+        Abre la ventana NSF de una jugada y espera su resultado.
+
+        Returns:
+            actionId si la jugada sigue, None si falló o la cancelaron
+        """
+        response = await self._call("start_action", self.client.start_action(
+            self.room_id, self.user_id, card_ids, action_type
+        ))
+        if response is None:
+            return None
+        action_id = response["actionId"]
+        if not response.get("cancellable") or response.get("actionNSFId") is None:
+            return action_id
+
+        result = self.view.nsf_results.get(action_id)
+        if result is None:
+            waiter = asyncio.get_running_loop().create_future()
+            self._nsf_waiters[action_id] = waiter
+            try:
+                result = await asyncio.wait_for(waiter, self.nsf_timeout)
+            except asyncio.TimeoutError:
+                self._nsf_waiters.pop(action_id, None)
+                self.stats.errors["nsf_timeout"] += 1
+                return None
+
+        if result == "cancelled":
+            await self._call("cancel_action", self.client.cancel_action(
+                self.room_id, self.user_id, action_id, card_ids, action_type
+            ))
+            return None
+        return action_id
+
+    async def _play_set(self, play: SetPlay) -> None:
+        if await self._start_action(play.cards, "CREATE_SET") is None:
+            return
+        response = await self._call(f"set:{play.set_type.value}", self.client.play_detective_set(
+            self.room_id, self.user_id, play.set_type.value, play.cards, play.has_wildcard
+        ))
+        if response is None:
+            return
+
+        next_action = response["nextAction"]
+        target, secret = self.strategy.choose_target(self.view, play.set_type, next_action["allowedPlayers"])
+        if target is None:
+            self.stats.errors["set_without_target"] += 1
+            return
+        await self._think()
+        if next_action["type"] == NextActionType.SELECT_PLAYER_AND_SECRET.value:
+            await self._call("detective_action", self.client.detective_action(
+                self.room_id, response["actionId"], self.user_id, target_player_id=target, secret_id=secret
+            ))
+        else:
+            # El target elige su secreto al recibir select_own_secret
+            await self._call("detective_target", self.client.detective_action(
+                self.room_id, response["actionId"], self.user_id, target_player_id=target
+            ))
+
+    async def _play_event(self, card: Dict) -> None:
+        if await self._start_action([card["id"]], "EVENT") is None:
+            return
+        move = f"event:{card['card_id']}"
+        if card["card_id"] == CARDS_OFF_THE_TABLE_CARD_ID:
+            target = self.strategy.choose_event_target(self.view, card)
+            if target is not None:
+                await self._call(move, self.client.cards_off_the_table(self.room_id, self.user_id, target))
+        elif card["card_id"] == EARLY_TRAIN_CARD_ID:
+            await self._call(move, self.client.early_train(self.room_id, self.user_id, card["id"]))
+        elif card["card_id"] == DELAY_ESCAPE_CARD_ID:
+            quantity = max(1, min(5, self.view.discard_count()))
+            await self._call(move, self.client.delay_escape(self.room_id, self.user_id, card["id"], quantity))
+        elif card["card_id"] == LOOK_INTO_ASHES_CARD_ID:
+            response = await self._call(move, self.client.look_into_ashes(self.room_id, self.user_id, card["id"]))
+            if response is None:
+                return
+            await self._think()
+            choice = self.strategy.choose_from_ashes(self.view, response.get("available_cards", []))
+            if choice is not None:
+                await self._call("look_into_ashes_select", self.client.look_into_ashes_select(
+                    self.room_id, self.user_id, response["action_id"], choice
+                ))
+
+    # ---------- reacciones ----------
+
+    async def _react_nsf(self, action_id: int, time_remaining: float) -> None:
+        await self._think(limit=time_remaining - NSF_SAFETY_MARGIN)
+        if not self.strategy.should_play_nsf(self.view, action_id):
+            return
+        card = find_nsf(self.view.hand)
+        if card is None:
+            return
+        # Que no se juegue dos veces la misma carta antes del próximo estado privado
+        self.view.hand = [c for c in self.view.hand if c["id"] != card["id"]]
+        await self._call("nsf", self.client.play_nsf(self.room_id, self.user_id, action_id, card["id"]))
+
+    async def _reply_secret(self, action_id: int) -> None:
+        await self._think()
+        secret_id = self.strategy.choose_own_secret(self.view)
+        if secret_id is None:
+            self.stats.errors["no_secret_to_reveal"] += 1
+            return
+        await self._call("detective_reply", self.client.detective_action(
+            self.room_id, action_id, self.user_id, secret_id=secret_id
+        ))
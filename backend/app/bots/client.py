@@ -0,0 +1,177 @@
+"""
+Cliente HTTP de la API de partidas, con los mismos requests que arma el
+frontend, y un servidor en el mismo proceso para correr bots sin levantar
+uno aparte.
+"""
+
+import asyncio
+import contextlib
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class BotRequestError(Exception):
+    """Respuesta no 2xx de la API."""
+
+    def __init__(self, method: str, path: str, status_code: int, detail: Any):
+        super().__init__(f"{method} {path} -> {status_code}: {detail}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+class GameClient:
+    """
+    Requests de un jugador contra la API REST.
+
+    Args:
+        base_url: URL del servidor (p.ej. http://localhost:8000)
+        http: httpx.AsyncClient a compartir entre bots (si no, se crea uno)
+    """
+
+    def __init__(self, base_url: str, http: Optional[httpx.AsyncClient] = None, timeout: float = 10.0):
+        self.base_url = base_url.rstrip("/")
+        self._owns_http = http is None
+        self.http = http or httpx.AsyncClient(base_url=self.base_url, timeout=timeout)
+
+    async def close(self) -> None:
+        if self._owns_http:
+            await self.http.aclose()
+
+    async def _request(self, method: str, path: str, user_id: Optional[int] = None,
+                       header: str = "HTTP_USER_ID", **kwargs) -> Dict:
+        headers = {header: str(user_id)} if user_id is not None else None
+        response = await self.http.request(method, path, headers=headers, **kwargs)
+        if response.status_code >= 400:
+            try:
+                detail = response.json().get("detail")
+            except ValueError:
+                detail = response.text
+            raise BotRequestError(method, path, response.status_code, detail)
+        return response.json() if response.content else {}
+
+    # ---------- lobby ----------
+
+    async def create_game(self, room_name: str, player_name: str, players_min: int = 2,
+                          players_max: int = 6) -> Dict:
+        return await self._request("POST", "/game", json={
+            "room": {"nombre_partida": room_name, "jugadoresMin": players_min, "jugadoresMax": players_max},
+            "player": {"nombre": player_name, "avatar": "/avatars/bot.png", "fechaNacimiento": "1990-01-01"},
+        })
+
+    async def join_game(self, room_id: int, player_name: str) -> Dict:
+        return await self._request("POST", f"/game/{room_id}/join", json={
+            "name": player_name, "avatar": "/avatars/bot.png", "birthdate": "1990-01-01",
+        })
+
+    async def start_game(self, room_id: int, user_id: int, seed: Optional[int] = None) -> Dict:
+        body = {"user_id": user_id}
+        if seed is not None:
+            body["seed"] = seed
+        return await self._request("POST", f"/game/{room_id}/start", json=body)
+
+    # ---------- turno ----------
+
+    async def discard(self, room_id: int, user_id: int, card_ids: List[int]) -> Dict:
+        body = {"card_ids": [{"order": i, "card_id": card_id} for i, card_id in enumerate(card_ids)]}
+        return await self._request("POST", f"/game/{room_id}/discard", user_id, json=body)
+
+    async def take_deck(self, room_id: int, user_id: int, cantidad: int) -> Dict:
+        return await self._request("POST", f"/game/{room_id}/take-deck", user_id, json={"cantidad": cantidad})
+
+    async def draft_pick(self, game_id: int, user_id: int, card_id: int) -> Dict:
+        return await self._request("POST", f"/game/{game_id}/draft/pick", json={"card_id": card_id, "user_id": user_id})
+
+    async def finish_turn(self, room_id: int, user_id: int) -> Dict:
+        return await self._request("POST", f"/game/{room_id}/finish-turn", json={"user_id": user_id})
+
+    # ---------- Not So Fast ----------
+
+    async def start_action(self, room_id: int, user_id: int, card_ids: List[int], action_type: str) -> Dict:
+        return await self._request("POST", f"/api/game/{room_id}/start-action", json={
+            "playerId": user_id, "cardIds": card_ids, "additionalData": {"actionType": action_type},
+        })
+
+    async def play_nsf(self, room_id: int, user_id: int, action_id: int, card_id: int) -> Dict:
+        return await self._request("POST", f"/api/game/{room_id}/instant/not-so-fast", json={
+            "actionId": action_id, "playerId": user_id, "cardId": card_id,
+        })
+
+    async def cancel_action(self, room_id: int, user_id: int, action_id: int, card_ids: List[int],
+                            action_type: str) -> Dict:
+        return await self._request("POST", f"/api/game/{room_id}/instant/not-so-fast/cancel", json={
+            "actionId": action_id, "playerId": user_id, "cardIds": card_ids,
+            "additionalData": {"actionType": action_type},
+        })
+
+    # ---------- detectives ----------
+
+    async def play_detective_set(self, room_id: int, user_id: int, set_type: str, cards: List[int],
+                                 has_wildcard: bool) -> Dict:
+        return await self._request("POST", f"/api/game/{room_id}/play-detective-set", json={
+            "owner": user_id, "setType": set_type, "cards": cards, "hasWildcard": has_wildcard,
+        })
+
+    async def detective_action(self, room_id: int, action_id: int, executor_id: int,
+                               target_player_id: Optional[int] = None, secret_id: Optional[int] = None) -> Dict:
+        return await self._request("POST", f"/api/game/{room_id}/detective-action", json={
+            "actionId": action_id, "executorId": executor_id,
+            "targetPlayerId": target_player_id, "secretId": secret_id,
+        })
+
+    # ---------- eventos ----------
+
+    async def cards_off_the_table(self, room_id: int, user_id: int, target_player_id: int) -> Dict:
+        return await self._request("POST", f"/api/game/{room_id}/cards_off_the_table", user_id,
+                                   json={"targetPlayerId": target_player_id})
+
+    async def early_train(self, room_id: int, user_id: int, card_id: int) -> Dict:
+        return await self._request("POST", f"/api/game/{room_id}/early_train_to_paddington", user_id,
+                                   header="http-user-id", json={"card_id": card_id})
+
+    async def delay_escape(self, room_id: int, user_id: int, card_id: int, quantity: int) -> Dict:
+        return await self._request("POST", f"/api/game/{room_id}/event/delay-murderer-escape", user_id,
+                                   json={"card_id": card_id, "quantity": quantity})
+
+    async def look_into_ashes(self, room_id: int, user_id: int, card_id: int) -> Dict:
+        return await self._request("POST", f"/api/game/{room_id}/look-into-ashes/play", user_id,
+                                   header="http-user-id", json={"card_id": card_id})
+
+    async def look_into_ashes_select(self, room_id: int, user_id: int, action_id: int, card_id: int) -> Dict:
+        return await self._request("POST", f"/api/game/{room_id}/look-into-ashes/select", user_id,
+                                   header="http-user-id",
+                                   json={"action_id": action_id, "selected_card_id": card_id})
+
+
+@contextlib.asynccontextmanager
+async def serve_in_process(host: str = "127.0.0.1", port: int = 0) -> AsyncIterator[str]:
+    """
+    Levanta app.main:socket_app con uvicorn en este mismo event loop.
+
+    Los bots se conectan por loopback como cualquier cliente, pero comparten
+    proceso (y estado en memoria) con el servidor: sirve para cargas sin
+    deploy y para medir el servidor con un profiler.
+
+    Yields:
+        URL base del servidor
+    """
+    import uvicorn
+
+    from app.main import socket_app
+
+    config = uvicorn.Config(socket_app, host=host, port=port, log_level="warning", lifespan="on")
+    server = uvicorn.Server(config)
+    task = asyncio.ensure_future(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    bound_port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://{host}:{bound_port}"
+    finally:
+        server.should_exit = True
+        await task
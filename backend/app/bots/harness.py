@@ -0,0 +1,77 @@
+"""
+Salas completas de bots: crear la sala, sumar jugadores, conectarlos,
+iniciar la partida y jugarla. Varias salas en paralelo dan una mezcla de
+tráfico realista (lobby, turnos, NSF, detectives, eventos) para pruebas de
+carga.
+"""
+
+import asyncio
+import logging
+import random
+import uuid
+from typing import List, Optional, Tuple
+
+import httpx
+
+from .bot import Bot, BotStats
+from .client import GameClient
+from .strategy import get_strategy
+
+logger = logging.getLogger(__name__)
+
+
+async def create_room(client: GameClient, players: int, name: Optional[str] = None) -> Tuple[int, List[int]]:
+    """
+    Crea una sala con `players` jugadores (el primero es el host).
+
+    Returns:
+        (room_id, [Player.id, ...]) en orden de llegada
+    """
+    name = name or f"bots-{uuid.uuid4().hex[:8]}"
+    created = await client.create_game(name, f"{name}-1", players_min=2, players_max=max(players, 2))
+    room_id = created["room"]["id"]
+    user_ids = [created["players"][0]["id"]]
+    for seat in range(2, players + 1):
+        player_name = f"{name}-{seat}"
+        joined = await client.join_game(room_id, player_name)
+        user_ids.append(next(p["id"] for p in joined["players"] if p["name"] == player_name))
+    return room_id, user_ids
+
+
+async def play_room(base_url: str, players: int = 4, strategy: str = "random",
+                    think_time: Tuple[float, float] = (0.2, 1.0), seed: Optional[int] = None,
+                    timeout: Optional[float] = None, transports: Optional[List[str]] = None,
+                    http: Optional[httpx.AsyncClient] = None, deal_seed: Optional[int] = None) -> List[BotStats]:
+    """
+    Juega una partida entera entre bots.
+
+    Args:
+        base_url: Servidor
+        players: Jugadores en la sala (2-6)
+        strategy: Nombre de la estrategia (ver strategy.STRATEGIES)
+        think_time: (mín, máx) segundos por decisión
+        seed: Semilla de las estrategias (cada bot deriva la suya)
+        timeout: Máximo de segundos por partida
+        transports: Transportes de Engine.IO de los bots
+        http: httpx.AsyncClient compartido entre salas
+        deal_seed: Semilla del reparto (el servidor necesita SEEDED_DEALS_ENABLED)
+
+    Returns:
+        BotStats de cada jugador
+    """
+    client = GameClient(base_url, http=http)
+    rng = random.Random(seed)
+    try:
+        room_id, user_ids = await create_room(client, players)
+        bots = [
+            Bot(client, user_id, room_id,
+                strategy=get_strategy(strategy, random.Random(rng.random())),
+                think_time=think_time, transports=transports)
+            for user_id in user_ids
+        ]
+        await asyncio.gather(*(bot.connect() for bot in bots))
+        await client.start_game(room_id, user_ids[0], seed=deal_seed)
+        logger.info(f"Room {room_id}: {players} bots playing ({strategy})")
+        return list(await asyncio.gather(*(bot.run(timeout) for bot in bots)))
+    finally:
+        await client.close()
@@ -0,0 +1,48 @@
+"""
+Reglas que un bot necesita para elegir jugadas legales a partir de su mano.
+
+Los ids de carta (`card_id`, la fila de la tabla `card`) son los de
+scripts/carga-datos.sql; la validación de sets y los ids de detectives y NSF
+vienen de app/services/game_rules, las mismas reglas que aplican los servicios.
+"""
+
+from typing import Dict, List, Optional
+
+from app.schemas.detective_set_schema import SetType
+from app.services.game_rules import (  # noqa: F401 (re-export)
+    CARDS_OFF_THE_TABLE_CARD_ID,
+    HARLEY_QUIN_CARD_ID,
+    NOT_SO_FAST_CARD_ID,
+    TOMMY_BERESFORD_CARD_ID,
+    TUPPENCE_BERESFORD_CARD_ID,
+    SetPlay,
+    find_detective_sets,
+    is_valid_set,
+)
+
+HAND_SIZE = 6
+
+# Eventos que los bots saben jugar (todos con una sola decisión del que juega)
+DELAY_ESCAPE_CARD_ID = 16
+LOOK_INTO_ASHES_CARD_ID = 20
+EARLY_TRAIN_CARD_ID = 23
+PLAYABLE_EVENT_CARD_IDS = frozenset((
+    DELAY_ESCAPE_CARD_ID,
+    LOOK_INTO_ASHES_CARD_ID,
+    EARLY_TRAIN_CARD_ID,
+    CARDS_OFF_THE_TABLE_CARD_ID,
+))
+
+# Sets en los que el activo elige el secreto (un paso) vs. el target elige el suyo (dos pasos)
+ONE_STEP_SETS = frozenset((SetType.POIROT, SetType.MARPLE, SetType.PYNE))
+TWO_STEP_SETS = frozenset((SetType.SATTERTHWAITE, SetType.BERESFORD, SetType.EILEENBRENT))
+
+
+def find_nsf(hand: List[Dict]) -> Optional[Dict]:
+    """Primera carta Not So Fast de la mano, si hay."""
+    return next((card for card in hand if card["card_id"] == NOT_SO_FAST_CARD_ID), None)
+
+
+def find_events(hand: List[Dict]) -> List[Dict]:
+    """Cartas de evento de la mano que los bots saben jugar."""
+    return [card for card in hand if card["card_id"] in PLAYABLE_EVENT_CARD_IDS]
@@ -0,0 +1,202 @@
+"""
+Estrategias de los bots: dada la vista de la partida eligen entre las jugadas
+legales. Todas reciben un random.Random para que una corrida con semilla se
+pueda repetir.
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple, Union
+
+from app.schemas.detective_set_schema import SetType
+from app.services.game_rules import NSF_CANCELLED, nsf_chain_result
+
+from .rules import (
+    CARDS_OFF_THE_TABLE_CARD_ID,
+    EARLY_TRAIN_CARD_ID,
+    HAND_SIZE,
+    NOT_SO_FAST_CARD_ID,
+    SetPlay,
+    find_detective_sets,
+    find_events,
+    find_nsf,
+)
+from .view import BotView
+
+# Jugada principal del turno: un set, un evento (la carta de la mano) o nada
+TurnPlay = Union[SetPlay, Dict, None]
+
+
+class Strategy:
+    """
+    Estrategia base: juega al azar entre las opciones legales.
+
+    Attributes:
+        play_rate: Probabilidad de bajar un set / jugar un evento si hay uno
+        nsf_rate: Probabilidad de responder con NSF cuando conviene
+        draft_rate: Probabilidad de reponer del draft (y no del mazo) cada carta
+    """
+
+    name = "random"
+
+    def __init__(self, rng: Optional[random.Random] = None, play_rate: float = 0.8,
+                 nsf_rate: float = 0.5, draft_rate: float = 0.5):
+        self.rng = rng or random.Random()
+        self.play_rate = play_rate
+        self.nsf_rate = nsf_rate
+        self.draft_rate = draft_rate
+
+    # ---------- turno propio ----------
+
+    def choose_play(self, view: BotView) -> TurnPlay:
+        """Set o evento a jugar antes de descartar, o None."""
+        options: List[TurnPlay] = [
+            play for play in find_detective_sets(view.hand) if self._set_has_target(view, play)
+        ]
+        options += [card for card in find_events(view.hand) if self._event_is_playable(view, card)]
+        if not options or self.rng.random() >= self.play_rate:
+            return None
+        return self._pick_play(view, options)
+
+    def _pick_play(self, view: BotView, options: List[TurnPlay]) -> TurnPlay:
+        return self.rng.choice(options)
+
+    def choose_discard(self, view: BotView) -> List[int]:
+        """CardsXGame.id de las cartas a descartar (al menos una si hay mano)."""
+        if not view.hand:
+            return []
+        count = self.rng.randint(1, min(3, len(view.hand)))
+        return [card["id"] for card in self.rng.sample(view.hand, count)]
+
+    def choose_draft_picks(self, view: BotView, missing: int) -> List[int]:
+        """CardsXGame.id de las cartas del draft a tomar para reponer la mano."""
+        picks = []
+        for card in view.draft():
+            if len(picks) >= missing:
+                break
+            if self.rng.random() < self.draft_rate:
+                picks.append(card["id"])
+        return picks
+
+    def choose_target(self, view: BotView, set_type: SetType, allowed: List[int]) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Jugador (y secreto, para los sets de un paso) al que apunta un set.
+
+        Returns:
+            (targetPlayerId, secretId); secretId None si elige el target
+        """
+        if set_type == SetType.PYNE:
+            pool = [s for s in view.table_secrets(hidden=False) if s["player_id"] in allowed]
+        else:
+            pool = [s for s in view.table_secrets(hidden=True) if s["player_id"] in allowed]
+        if not pool:
+            return None, None
+        secret = self._pick_secret(view, pool)
+        if set_type in (SetType.POIROT, SetType.MARPLE, SetType.PYNE):
+            return secret["player_id"], secret["id"]
+        return secret["player_id"], None
+
+    def _pick_secret(self, view: BotView, pool: List[Dict]) -> Dict:
+        return self.rng.choice(pool)
+
+    def choose_event_target(self, view: BotView, card: Dict) -> Optional[int]:
+        opponents = [p["player_id"] for p in view.opponents()]
+        return self.rng.choice(opponents) if opponents else None
+
+    def choose_own_secret(self, view: BotView) -> Optional[int]:
+        """Secreto propio a revelar cuando un detective de dos pasos apunta al bot."""
+        hidden = view.own_hidden_secrets()
+        return self.rng.choice(hidden)["id"] if hidden else None
+
+    def choose_from_ashes(self, view: BotView, cards: List[Dict]) -> Optional[int]:
+        return self.rng.choice(cards)["id"] if cards else None
+
+    # ---------- reacciones ----------
+
+    def should_play_nsf(self, view: BotView, action_id: int) -> bool:
+        """
+        Si conviene jugar un NSF en la ventana abierta: el dueño de la acción
+        quiere que la cadena quede par (continúa), el resto impar (se cancela).
+        """
+        window = view.nsf_windows.get(action_id)
+        if window is None or find_nsf(view.hand) is None:
+            return False
+        wants_cancel = window["player_id"] != view.user_id
+        cancelled_now = nsf_chain_result(window["played"]) == NSF_CANCELLED
+        return wants_cancel != cancelled_now and self.rng.random() < self.nsf_rate
+
+    # ---------- helpers ----------
+
+    def _set_has_target(self, view: BotView, play: SetPlay) -> bool:
+        # Sin secretos que revelar (u ocultar, Pyne) en la mesa el set no tiene efecto posible
+        hidden = play.set_type != SetType.PYNE
+        return any(s["player_id"] != view.user_id for s in view.table_secrets(hidden=hidden))
+
+    def _event_is_playable(self, view: BotView, card: Dict) -> bool:
+        if card["card_id"] == CARDS_OFF_THE_TABLE_CARD_ID:
+            return bool(view.opponents())
+        # Delay / Look into the ashes trabajan sobre el descarte, Early train sobre el mazo
+        if card["card_id"] == EARLY_TRAIN_CARD_ID:
+            return view.deck_count() > HAND_SIZE
+        return view.discard_count() > 0
+
+
+class GreedyStrategy(Strategy):
+    """
+    Juega siempre la jugada más grande, apunta a quien tiene más secretos
+    ocultos, guarda los NSF y descarta primero lo que no forma sets.
+    """
+
+    name = "greedy"
+
+    def __init__(self, rng: Optional[random.Random] = None, play_rate: float = 1.0,
+                 nsf_rate: float = 1.0, draft_rate: float = 1.0):
+        super().__init__(rng, play_rate, nsf_rate, draft_rate)
+
+    def _pick_play(self, view: BotView, options: List[TurnPlay]) -> TurnPlay:
+        sets = [option for option in options if isinstance(option, SetPlay)]
+        if sets:
+            return max(sets, key=lambda play: len(play.cards))
+        return options[0]
+
+    def choose_discard(self, view: BotView) -> List[int]:
+        if not view.hand:
+            return []
+        in_sets = {card_id for play in find_detective_sets(view.hand) for card_id in play.cards}
+        candidates = [
+            card for card in view.hand
+            if card["id"] not in in_sets and card["card_id"] != NOT_SO_FAST_CARD_ID
+        ]
+        if not candidates:
+            candidates = [card for card in view.hand if card["card_id"] != NOT_SO_FAST_CARD_ID] or view.hand
+        return [card["id"] for card in candidates[:2]]
+
+    def _pick_secret(self, view: BotView, pool: List[Dict]) -> Dict:
+        hidden_by_player: Dict[int, int] = {}
+        for secret in view.table_secrets(hidden=True):
+            hidden_by_player[secret["player_id"]] = hidden_by_player.get(secret["player_id"], 0) + 1
+        return max(pool, key=lambda s: hidden_by_player.get(s["player_id"], 0))
+
+    def choose_event_target(self, view: BotView, card: Dict) -> Optional[int]:
+        opponents = view.opponents()
+        if not opponents:
+            return None
+        return max(opponents, key=lambda p: p.get("hand_size", 0))["player_id"]
+
+
+STRATEGIES = {
+    Strategy.name: Strategy,
+    GreedyStrategy.name: GreedyStrategy,
+}
+
+
+def get_strategy(name: str, rng: Optional[random.Random] = None) -> Strategy:
+    """
+    Instancia una estrategia por nombre.
+
+    Raises:
+        ValueError si el nombre no existe
+    """
+    try:
+        return STRATEGIES[name](rng)
+    except KeyError:
+        raise ValueError(f"Unknown bot strategy: {name} (available: {', '.join(STRATEGIES)})")
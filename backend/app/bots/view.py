@@ -0,0 +1,104 @@
+"""
+Lo que un bot sabe de la partida: el último `game_state_public`, su
+`game_state_private` y las ventanas NSF abiertas, armado solo con los eventos
+de socket que recibe un cliente real.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+class BotView:
+    """
+    Estado de la partida visto por un jugador.
+
+    Attributes:
+        user_id: Player.id del bot
+        room_id: Sala
+        public: Último game_state_public recibido
+        hand: Mano (game_state_private.mano)
+        secrets: Secretos propios (game_state_private.secretos)
+        nsf_windows: action_id -> {"player_id", "played"} de las ventanas NSF abiertas
+        nsf_results: action_id -> "continue" / "cancelled" de las ventanas cerradas
+        finished: True cuando la partida terminó o se canceló
+    """
+
+    def __init__(self, user_id: int, room_id: int):
+        self.user_id = user_id
+        self.room_id = room_id
+        self.public: Dict[str, Any] = {}
+        self.hand: List[Dict] = []
+        self.secrets: List[Dict] = []
+        self.nsf_windows: Dict[int, Dict] = {}
+        self.nsf_results: Dict[int, str] = {}
+        self.finished = False
+        self.won: Optional[bool] = None
+
+    # ---------- eventos ----------
+
+    def apply(self, event: str, data: Any) -> None:
+        """Actualiza la vista con un evento de socket."""
+        if not isinstance(data, dict):
+            return
+        if event == "game_state_public":
+            # Las salas en lobby mandan solo el roster, sin game_id
+            self.public = {**self.public, **data}
+            if data.get("status") == "FINISH":
+                self.finished = True
+        elif event == "game_state_private":
+            if data.get("user_id", self.user_id) == self.user_id:
+                self.hand = list(data.get("mano", []))
+                self.secrets = list(data.get("secretos", []))
+        elif event == "nsf_counter_start":
+            self.nsf_windows[data["action_id"]] = {"player_id": data.get("player_id"), "played": 0}
+        elif event == "nsf_played":
+            window = self.nsf_windows.get(data.get("action_id"))
+            if window is not None:
+                window["played"] += 1
+        elif event == "nsf_counter_complete":
+            self.nsf_windows.pop(data.get("action_id"), None)
+            self.nsf_results[data.get("action_id")] = data.get("final_result")
+        elif event == "game_ended":
+            self.finished = True
+            self.won = bool(data.get("ganaste"))
+        elif event == "game_cancelled":
+            self.finished = True
+
+    # ---------- consultas ----------
+
+    @property
+    def game_id(self) -> Optional[int]:
+        return self.public.get("game_id")
+
+    @property
+    def started(self) -> bool:
+        return self.public.get("status") == "INGAME"
+
+    @property
+    def is_my_turn(self) -> bool:
+        return self.started and not self.finished and self.public.get("turno_actual") == self.user_id
+
+    def players(self) -> List[Dict]:
+        return list(self.public.get("jugadores", []))
+
+    def opponents(self) -> List[Dict]:
+        return [p for p in self.players() if p.get("player_id") != self.user_id]
+
+    def draft(self) -> List[Dict]:
+        return list(self.public.get("mazos", {}).get("deck", {}).get("draft", []))
+
+    def deck_count(self) -> int:
+        return self.public.get("mazos", {}).get("deck", {}).get("count", 0)
+
+    def discard_count(self) -> int:
+        return self.public.get("mazos", {}).get("discard", {}).get("count", 0)
+
+    def table_secrets(self, player_id: Optional[int] = None, hidden: Optional[bool] = None) -> List[Dict]:
+        """Secretos en la mesa (secretsFromAllPlayers), filtrados por dueño y si están ocultos."""
+        return [
+            s for s in self.public.get("secretsFromAllPlayers", [])
+            if (player_id is None or s.get("player_id") == player_id)
+            and (hidden is None or s.get("hidden") == hidden)
+        ]
+
+    def own_hidden_secrets(self) -> List[Dict]:
+        return [s for s in self.secrets if not s.get("revealed")]
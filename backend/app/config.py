@@ -12,4 +12,49 @@ class Settings:
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", 8000))
 
+    # Watchdog del event loop (ver services/loop_monitor.py)
+    LOOP_MONITOR_ENABLED: bool = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true"
+    LOOP_MONITOR_INTERVAL_MS: int = int(os.getenv("LOOP_MONITOR_INTERVAL_MS", 50))
+    LOOP_LAG_THRESHOLD_MS: int = int(os.getenv("LOOP_LAG_THRESHOLD_MS", 100))
+
+    # Profiling opcional (ver services/profiling.py)
+    SECRET_KEY: str = os.getenv("SECRET_KEY", "")
+    PROFILING_ENABLED: bool = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+    PROFILE_TOP_N: int = int(os.getenv("PROFILE_TOP_N", 15))
+
+    # Reparto con semilla elegida por el cliente en /start (debug y benchmarks, ver routes/start.py)
+    SEEDED_DEALS_ENABLED: bool = os.getenv("SEEDED_DEALS_ENABLED", "false").lower() == "true"
+
+    # Logging (ver logging_config.py)
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "kv")
+    SOCKETIO_LOGGER: bool = os.getenv("SOCKETIO_LOGGER", "false").lower() == "true"
+    ENGINEIO_LOGGER: bool = os.getenv("ENGINEIO_LOGGER", "false").lower() == "true"
+
+    # Canal de lobby por Socket.IO (ver sockets/lobby_channel.py)
+    LOBBY_PUSH_WINDOW_MS: int = int(os.getenv("LOBBY_PUSH_WINDOW_MS", 50))
+    # Roster de una sala cuando se conectan varios jugadores juntos; 0 = uno por conexión
+    JOIN_BROADCAST_WINDOW_MS: int = int(os.getenv("JOIN_BROADCAST_WINDOW_MS", 50))
+
+    # Emits privados en paralelo (ver WebSocketManager.emit_many)
+    EMIT_CONCURRENCY: int = int(os.getenv("EMIT_CONCURRENCY", 16))
+    EMIT_TIMEOUT_MS: int = int(os.getenv("EMIT_TIMEOUT_MS", 2000))
+
+    # Agrupamiento de estados por sala (ver sockets/room_broadcast.py); 0 = deshabilitado
+    ROOM_BROADCAST_WINDOW_MS: int = int(os.getenv("ROOM_BROADCAST_WINDOW_MS", 30))
+
+    # Backpressure por socket (ver sockets/outbound.py)
+    OUTBOUND_SOFT_LIMIT: int = int(os.getenv("OUTBOUND_SOFT_LIMIT", 8))
+    OUTBOUND_HARD_LIMIT: int = int(os.getenv("OUTBOUND_HARD_LIMIT", 200))
+    OUTBOUND_HARD_LIMIT_GRACE_MS: int = int(os.getenv("OUTBOUND_HARD_LIMIT_GRACE_MS", 5000))
+
+    # Eventos por sala guardados para reanudar sesiones (ver sockets/event_log.py)
+    ROOM_EVENT_BUFFER: int = int(os.getenv("ROOM_EVENT_BUFFER", 256))
+
+    # Archivado de partidas terminadas (ver services/game_archive.py)
+    ARCHIVE_AFTER_MINUTES: int = int(os.getenv("ARCHIVE_AFTER_MINUTES", 60))
+    ARCHIVE_RETENTION_DAYS: int = int(os.getenv("ARCHIVE_RETENTION_DAYS", 0))
+    ARCHIVE_BATCH_SIZE: int = int(os.getenv("ARCHIVE_BATCH_SIZE", 100))
+
 settings = Settings()
@@ -0,0 +1,91 @@
+"""
+Buffer de filas de auditoría de ActionsPerTurn.
+
+Las operaciones de cartas (descartar, robar, draft, Early Train) registran una
+acción padre y una acción hija por cada carta movida. Con create_action cada
+hija era un INSERT + flush individual: descartar 6 cartas eran 7 round-trips.
+
+Las hijas son solo auditoría (nadie las lee dentro del mismo comando), así que
+se acumulan en `session.info` y se escriben con un único INSERT multi-fila
+justo antes del commit. La acción padre se sigue creando con flush inmediato:
+es un solo INSERT por comando y así su id queda disponible para las hijas.
+
+Las acciones que manejan lógica de juego (cadenas de NSF, acciones PENDING de
+varios pasos, etc.) NO pasan por acá: siguen usando crud.create_action y son
+visibles inmediatamente.
+"""
+
+import logging
+from typing import Dict, List
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from app.db.models import ActionsPerTurn
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "action_log_pending"
+
+# Columnas opcionales que pueden faltar en una fila; se completan con None para
+# que todas las filas tengan las mismas claves y entren en un solo INSERT.
+_OPTIONAL_COLUMNS = ("parent_action_id", "card_given_id", "card_received_id", "position_card", "source_pile")
+
+
+def queue_action(db: Session, action_data: dict) -> bool:
+    """
+    Encola una fila de ActionsPerTurn para escribirla al hacer commit.
+
+    Args:
+        db: Sesión de base de datos
+        action_data: Diccionario con los campos de la acción
+
+    Returns:
+        True si quedó encolada; False si la sesión no soporta el buffer
+        (p.ej. un mock sin `info`) y el llamador debe escribirla directamente.
+    """
+    info = getattr(db, "info", None)
+    if not isinstance(info, dict):
+        return False
+
+    row = {column: None for column in _OPTIONAL_COLUMNS}
+    row.update(action_data)
+    info.setdefault(_PENDING_KEY, []).append(row)
+    return True
+
+
+def pending_actions(db: Session) -> List[Dict]:
+    """Filas encoladas que todavía no se escribieron."""
+    info = getattr(db, "info", None)
+    if not isinstance(info, dict):
+        return []
+    return list(info.get(_PENDING_KEY, ()))
+
+
+def flush_actions(db: Session) -> int:
+    """
+    Escribe las filas encoladas con un único INSERT multi-fila.
+
+    Args:
+        db: Sesión de base de datos
+
+    Returns:
+        Cantidad de filas escritas
+    """
+    rows = db.info.pop(_PENDING_KEY, None)
+    if not rows:
+        return 0
+    db.execute(insert(ActionsPerTurn), rows)
+    logger.debug("action log: %d fila(s) escritas en un INSERT", len(rows))
+    return len(rows)
+
+
+@event.listens_for(Session, "before_commit")
+def _flush_actions_before_commit(session: Session) -> None:
+    if session.info.get(_PENDING_KEY):
+        flush_actions(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_actions_on_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
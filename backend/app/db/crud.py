@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from . import models
+from .action_log import queue_action
 
 # ------------------------------
 # ROOM
@@ -312,7 +313,7 @@ def create_action(db: Session, action_data: dict):
 def create_card_action(db: Session, game_id: int, turn_id: int, player_id: int, 
                       action_type: str, source_pile: str, card_id: int = None,
                       position: int = None, result: str = "SUCCESS", action_name: str = None,
-                      parent_action_id: int = None):
+                      parent_action_id: int = None, deferred: bool = False):
     """
     Crea una acción de carta (discard, draw, draft) en ActionsPerTurn.
     
@@ -323,14 +324,18 @@ def create_card_action(db: Session, game_id: int, turn_id: int, player_id: int,
         player_id: ID del jugador que realiza la acción
         action_type: Tipo de acción (DISCARD, DRAW)
         source_pile: Pila origen/destino (DISCARD_PILE, DRAW_PILE, DRAFT_PILE)
-        card_id: ID de la carta involucrada (opcional)
+        card_id: CardsXGame.id de la carta involucrada (opcional); se guarda en
+            card_given_id / card_received_id, que referencian cardsXgame
         position: Posición de la carta (opcional)
         result: Resultado de la acción (por defecto SUCCESS)
         action_name: Nombre de la acción (opcional, se auto-genera si no se provee)
         parent_action_id: ID de la acción padre (opcional, para acciones hijas)
+        deferred: Si es True la fila se encola y se escribe en un único INSERT
+            multi-fila al hacer commit (ver app.db.action_log). Solo para filas
+            de auditoría que nadie lee dentro del mismo comando.
     
     Returns:
-        ActionsPerTurn creado
+        ActionsPerTurn creado, o None si la fila quedó encolada
     """
     from datetime import datetime
     
@@ -373,6 +378,9 @@ def create_card_action(db: Session, game_id: int, turn_id: int, player_id: int,
     if position is not None:
         action_data['position_card'] = position
     
+    if deferred and queue_action(db, action_data):
+        return None
+    
     return create_action(db, action_data)
 
 
@@ -55,7 +55,7 @@ def _handle_social_disgrace_check(target: CardsXGame):
     IMPORTANTE: Esta función ahora crea su PROPIA sesión de DB para evitar
     conflictos de 'Session is already flushing' con el listener de SQLAlchemy.
     """
-    logger.warning("DEBUG: 'events.py' listener DESHABILITADO. La lógica manual en el servicio se encargará.")
+    logger.debug("'events.py' listener DESHABILITADO. La lógica manual en el servicio se encargará.")
     return
     
     # Saltar si los eventos están deshabilitados (ej: durante tests)
@@ -72,7 +72,7 @@ def _handle_social_disgrace_check(target: CardsXGame):
     if not _should_check_social_disgrace(target):
         return
     
-    logger.warning("DEBUG: 2c. Creando nueva sesión (SessionLocal) para desgracia social...") # <-- LOG DE DEBUG NUEVO
+    logger.debug("2c. Creando nueva sesión (SessionLocal) para desgracia social...") # <-- LOG DE DEBUG NUEVO
     
     db = SessionLocal() # <-- AÑADIDO: Creamos una sesión nueva e independiente
     try:
@@ -83,11 +83,11 @@ def _handle_social_disgrace_check(target: CardsXGame):
             player_id=target.player_id
         )
         
-        logger.warning(f"DEBUG: 3. (En nueva sesión) 'update_social_disgrace_status' devolvió: {change_info}") # <-- LOG DE DEBUG MEJORADO
+        logger.debug("3. (En nueva sesión) 'update_social_disgrace_status' devolvió: %s", change_info) # <-- LOG DE DEBUG MEJORADO
         
         # Si hubo un cambio, programar notificación por WebSocket (operación asíncrona)
         if change_info:
-            logger.warning("DEBUG: 4. (En nueva sesión) ¡HUBO CAMBIO! Llamando a _run_async_task(notify_social_disgrace_change)...") # <-- LOG DE DEBUG MEJORADO
+            logger.debug("4. (En nueva sesión) ¡HUBO CAMBIO! Llamando a _run_async_task(notify_social_disgrace_change)...") # <-- LOG DE DEBUG MEJORADO
             _run_async_task(
                 notify_social_disgrace_change(
                     game_id=target.id_game,
@@ -95,12 +95,12 @@ def _handle_social_disgrace_check(target: CardsXGame):
                 )
             )
         else:
-             logger.warning("DEBUG: 4a. (En nueva sesión) NO HUBO CAMBIO. No se emite evento.") # <-- LOG DE DEBUG MEJORADO
+             logger.debug("4a. (En nueva sesión) NO HUBO CAMBIO. No se emite evento.") # <-- LOG DE DEBUG MEJORADO
             
     except Exception as e:
         logger.error(f"Error handling social disgrace check (con sesión propia): {e}", exc_info=True)
     finally:
-        logger.warning("DEBUG: 8. Cerrando sesión (SessionLocal) de desgracia social.") # <-- LOG DE DEBUG NUEVO
+        logger.debug("8. Cerrando sesión (SessionLocal) de desgracia social.") # <-- LOG DE DEBUG NUEVO
         db.close() # <-- AÑADIDO: Cerramos la sesión
 
 
@@ -111,13 +111,13 @@ def after_update_cards_x_game(mapper, connection, target):
     
     Este es el caso más común: cuando se revela u oculta un secreto (cambio en 'hidden').
     """
-    logger.warning(f"DEBUG: 1. 'after_update_cards_x_game' DISPARADO para game={target.id_game}, card={target.id_card}, hidden={target.hidden}")
+    logger.debug("1. 'after_update_cards_x_game' DISPARADO para game=%s, card=%s, hidden=%s", target.id_game, target.id_card, target.hidden)
     
     # Saltar si los eventos están deshabilitados (ej: durante tests)
     if not _events_enabled():
         return
     
-    logger.warning(f"DEBUG: 1c. 'after_update_cards_x_game' - Llamando a _handle_social_disgrace_check...")
+    logger.debug("1c. 'after_update_cards_x_game' - Llamando a _handle_social_disgrace_check...")
     
     _handle_social_disgrace_check(target)
 
@@ -133,7 +133,7 @@ def after_insert_cards_x_game(mapper, connection, target):
     if not _events_enabled():
         return
     
-    logger.warning(f"🔔 CardsXGame inserted: game={target.id_game}, player={target.player_id}, is_in={target.is_in}, hidden={target.hidden}")
+    logger.debug("🔔 CardsXGame inserted: game=%s, player=%s, is_in=%s, hidden=%s", target.id_game, target.player_id, target.is_in, target.hidden)
     
     _handle_social_disgrace_check(target)
 
@@ -156,9 +156,8 @@ def after_delete_cards_x_game(mapper, connection, target):
         notify_social_disgrace_change
     )
     
-    logger.debug(f"🔔 CardsXGame deleted: game={target.id_game}, "
-                f"player={target.player_id}, card={target.id_card}, "
-                f"is_in={target.is_in}")
+    logger.debug("🔔 CardsXGame deleted: game=%s, player=%s, card=%s, is_in=%s",
+                 target.id_game, target.player_id, target.id_card, target.is_in)
     
     if not _should_check_social_disgrace(target):
         return
@@ -192,4 +191,4 @@ def register_events():
     Puede ser llamada desde database.py o main.py para asegurar que los listeners
     estén registrados.
     """
-    print(f"\n✅ Social disgrace event listeners registered")
\ No newline at end of file
+    logger.info("✅ Social disgrace event listeners registered")
\ No newline at end of file
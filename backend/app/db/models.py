@@ -1,4 +1,5 @@
 from sqlalchemy import (
+    BigInteger,
     Column,
     Integer,
     String,
@@ -7,6 +8,7 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Enum,
+    LargeBinary,
     UniqueConstraint,
     text
 )
@@ -154,6 +156,8 @@ class Game(Base):
     
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     player_turn_id = Column(Integer, ForeignKey("player.id"))
+    # Semilla del reparto (ver routes/start.py); no se manda a los clientes
+    seed = Column(BigInteger, nullable=True)
 
     rooms = relationship("Room", back_populates="game")
     cards = relationship("CardsXGame", back_populates="game")
@@ -304,4 +308,42 @@ class SocialDisgracePlayer(Base):
     
     # Relaciones
     game = relationship("Game")
-    player = relationship("Player")
\ No newline at end of file
+    player = relationship("Player")
+
+
+class GameArchive(Base):
+    """
+    Partida terminada archivada fuera de las tablas vivas.
+
+    Al archivar, las filas de turn, cardsXgame, actions_per_turn y
+    social_disgrace_player de la partida se serializan a JSON, se comprimen
+    con zlib en `payload` y se borran de las tablas vivas
+    (ver services/game_archive.py).
+    """
+    __tablename__ = "game_archive"
+
+    id_game = Column(Integer, ForeignKey("game.id"), primary_key=True)
+    room_id = Column(Integer)
+    format_version = Column(Integer, nullable=False, default=1)
+    finished_at = Column(DateTime)
+    archived_at = Column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP'))
+    turns_count = Column(Integer, nullable=False, default=0)
+    cards_count = Column(Integer, nullable=False, default=0)
+    actions_count = Column(Integer, nullable=False, default=0)
+    payload = Column(LargeBinary(length=2**24), nullable=False)
+
+    game = relationship("Game")
+
+
+class GameDeal(Base):
+    """
+    Reparto inicial de una partida, codificado con el formato de replay
+    (ver services/replay.py). cardsXgame se modifica in-place durante la
+    partida, así que es la única forma de recuperar el estado inicial.
+    """
+    __tablename__ = "game_deal"
+
+    id_game = Column(Integer, ForeignKey("game.id"), primary_key=True)
+    payload = Column(LargeBinary(length=2**16), nullable=False)
+
+    game = relationship("Game")
@@ -0,0 +1,135 @@
+"""
+Configuración de logging de la aplicación.
+
+- Los handlers del root logger se reemplazan por un QueueHandler: el event
+  loop solo encola el record y un QueueListener (thread aparte) se encarga del
+  formateo y la escritura, así el I/O de logging no bloquea el loop.
+- Formato key=value (LOG_FORMAT=kv, default) o texto plano (LOG_FORMAT=plain).
+  Los campos pasados en `extra={...}` se agregan como pares key=value.
+- Niveles por módulo vía LOG_LEVELS, p.ej.
+  LOG_LEVELS="app.sockets=DEBUG,socketio=WARNING,engineio=WARNING".
+
+Para que el formateo sea lazy usar estilo %:
+    logger.debug("carta descartada card_id=%s pos=%s", card_id, pos)
+en lugar de f-strings, que se evalúan aunque el nivel esté deshabilitado.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import Dict, Optional
+
+from app.config import settings
+
+# Atributos estándar de LogRecord: todo lo demás viene de `extra`
+_STANDARD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+# Librerías muy verbosas por defecto (cada paquete de socket)
+DEFAULT_MODULE_LEVELS = {
+    "socketio": "WARNING",
+    "engineio": "WARNING",
+}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+
+
+def _quote(value) -> str:
+    text = str(value)
+    if not text or any(c in text for c in ' ="\n'):
+        text = '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+    return text
+
+
+class KeyValueFormatter(logging.Formatter):
+    """Formatea cada record como una línea `ts=... level=... logger=... msg=...`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = [
+            ("ts", self.formatTime(record, "%Y-%m-%dT%H:%M:%S")),
+            ("level", record.levelname),
+            ("logger", record.name),
+            ("msg", record.getMessage()),
+        ]
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS and not key.startswith("_"):
+                fields.append((key, value))
+        line = " ".join(f"{key}={_quote(value)}" for key, value in fields)
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        elif record.exc_text:
+            line += "\n" + record.exc_text
+        return line
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler que no formatea en el thread que loguea: solo resuelve el
+    mensaje (%-args) para que no cambie si los argumentos mutan después. El
+    formateo completo (timestamp, extras, traceback) lo hace el listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def parse_module_levels(spec: str) -> Dict[str, str]:
+    """Parsea "mod=LEVEL,mod2=LEVEL" a un dict (ignora entradas inválidas)."""
+    levels = {}
+    for item in spec.split(","):
+        name, sep, level = item.strip().partition("=")
+        if sep and name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging() -> None:
+    """
+    Instala el QueueHandler/QueueListener en el root logger y aplica los
+    niveles configurados. Es idempotente.
+    """
+    global _listener, _queue_handler
+
+    root = logging.getLogger()
+    root.setLevel(settings.LOG_LEVEL.upper())
+
+    if _listener is None:
+        if settings.LOG_FORMAT == "plain":
+            formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        else:
+            formatter = KeyValueFormatter()
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(
+            log_queue, stream_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        # Reemplazar handlers de consola previos (basicConfig) por la cola
+        for handler in root.handlers[:]:
+            if type(handler) is logging.StreamHandler:
+                root.removeHandler(handler)
+        _queue_handler = LazyQueueHandler(log_queue)
+        root.addHandler(_queue_handler)
+
+    levels = dict(DEFAULT_MODULE_LEVELS)
+    levels.update(parse_module_levels(settings.LOG_LEVELS))
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+
+def shutdown_logging() -> None:
+    """Vacía la cola y detiene el listener (se registra con atexit)."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
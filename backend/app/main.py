@@ -3,13 +3,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 import socketio
-import logging
+from app.logging_config import setup_logging
 
-# Configurar logging para debugging (comentado en producción)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging asíncrono (QueueHandler) con niveles por módulo desde config
+setup_logging()
 
 # Inicializar FastAPI
 app = FastAPI(
@@ -29,18 +26,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Etiquetar cada request con su ruta para el watchdog del event loop
+from app.services.loop_monitor import LoopLabelMiddleware, get_loop_monitor
+app.add_middleware(LoopLabelMiddleware)
+
+# Profiling opcional por request (PROFILING_ENABLED o header X-Profile-Token)
+from app.services.profiling import ProfilingMiddleware
+app.add_middleware(ProfilingMiddleware)
+
 # Configurar Socket.IO para WebSocket
 sio = socketio.AsyncServer(
     async_mode="asgi",
     cors_allowed_origins="*",
-    logger=True,           # Logs de Socket.IO (cambiar a True para debugging)
-    engineio_logger=True   # Logs de Engine.IO (cambiar a True para debugging)
+    logger=settings.SOCKETIO_LOGGER,          # SOCKETIO_LOGGER=true para debugging
+    engineio_logger=settings.ENGINEIO_LOGGER  # ENGINEIO_LOGGER=true loguea cada paquete
 )
 
 # Inicializar manager global
 from app.sockets.socket_manager import init_ws_manager
 from app.db.database import SessionLocal
-init_ws_manager(sio, lambda: SessionLocal())
+ws_manager = init_ws_manager(sio, lambda: SessionLocal())
+
+# Canal de lobby: push de room_added / room_updated / room_removed
+from app.sockets.lobby_channel import init_lobby_broadcaster
+init_lobby_broadcaster(sio, lambda: SessionLocal())
 
 # Registrar event listeners de base de datos (desgracia social, etc.)
 from app.db.events import register_events as register_db_events
@@ -93,6 +102,12 @@ from app.routes import card_trade
 app.include_router(card_trade.router)
 from app.routes import dead_card_folly
 app.include_router(dead_card_folly.router)
+from app.routes import history
+app.include_router(history.router)
+from app.routes import cards
+app.include_router(cards.router)
+from app.routes import debug
+app.include_router(debug.router)
 
 
 # Aplicación ASGI con Socket.IO
@@ -103,3 +118,22 @@ socket_app = socketio.ASGIApp(sio, app)
 async def health_check():
     return {"status": "healthy", "environment": settings.ENVIRONMENT}
 
+# Métricas en memoria del worker (lag del loop, bloqueos, etc.)
+from app.services.metrics import get_metrics
+
+@app.get("/metrics")
+async def metrics():
+    snapshot = get_metrics().snapshot()
+    snapshot["loop_stalls"] = list(get_loop_monitor().recent_stalls)
+    snapshot["slow_consumers"] = ws_manager.slowest_consumers()
+    return snapshot
+
+@app.on_event("startup")
+async def start_loop_monitor():
+    if settings.LOOP_MONITOR_ENABLED:
+        get_loop_monitor().start()
+
+@app.on_event("shutdown")
+async def stop_loop_monitor():
+    await get_loop_monitor().stop()
+
@@ -4,13 +4,14 @@ from sqlalchemy.orm import Session
 from app.db.database import SessionLocal
 from pydantic import BaseModel
 from app.db.models import (
-    Game, Room, CardsXGame, CardState, Player, ActionsPerTurn, 
-    ActionType, ActionResult, Turn, TurnStatus, Card, ActionName
+    CardsXGame, CardState, Player, ActionsPerTurn,
+    ActionType, ActionResult, Card, ActionName
 )
 from app.schemas.detective_set_schema import SetType, NextAction
 from app.sockets.socket_service import get_websocket_service
 from app.services.game_status_service import build_complete_game_state
 from app.services.detective_set_service import DetectiveSetService
+from app.services.game_context import load_game_context
 from datetime import datetime
 import logging
 
@@ -66,33 +67,29 @@ async def another_victim(
         VictimResponse con información del set transferido, actionId y la siguiente acción
     """
 
-    print(f"owner: {request.originalOwnerId} postiion: {request.setPosition}")
+    logger.debug("owner: %s postiion: %s", request.originalOwnerId, request.setPosition)
     
     logger.info(f"POST /game/{room_id}/event/another-victim received")
     logger.info(f"Request: originalOwnerId={request.originalOwnerId}, setPosition={request.setPosition}")
     logger.info(f"Actor: {actor_user_id}")
     
     try:
-        # Busco la sala
-        room = db.query(Room).filter(Room.id == room_id).first()
-        if not room:
+        # Sala, juego, actor y turno activo (una sola query)
+        context = load_game_context(db, room_id, actor_user_id)
+        if not context:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Room not found"
             )
 
-        # Busco el juego
-        game = db.query(Game).filter(Game.id == room.id_game).first()
+        game = context.game
         if not game:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Game not found"
             )
 
-        actor = db.query(Player).filter(
-            Player.id == actor_user_id,
-            Player.id_room == room_id
-        ).first()
+        actor = context.actor
         if not actor:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -100,17 +97,13 @@ async def another_victim(
             )
         
         # chequeo si es el turno del jugador
-        if game.player_turn_id != actor.id:
+        if not context.is_actor_turn:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not your turn"
             )
         
-        current_turn = db.query(Turn).filter(
-            Turn.id_game == game.id,
-            Turn.player_id == actor.id,
-            Turn.status == TurnStatus.IN_PROGRESS
-        ).first()
+        current_turn = context.actor_turn
         
         if not current_turn:
             raise HTTPException(
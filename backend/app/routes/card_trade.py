@@ -2,13 +2,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Header, status
 from sqlalchemy.orm import Session
 from app.db.database import SessionLocal
-from app.services.game_status_service import build_complete_game_state
+from app.services.game_status_service import game_state_builder
 from pydantic import BaseModel
-from app.db.crud import get_room_by_id, get_player_by_id, get_game_by_id
 from app.db.models import (
     CardsXGame, CardState, ActionsPerTurn, ActionType, 
-    ActionResult, ActionName, Turn, TurnStatus, Card, Room, Game, Player
+    ActionResult, ActionName, Card, Player
 )
+from app.services.game_context import load_game_context
 from app.sockets.socket_service import get_websocket_service
 from datetime import datetime
 import logging
@@ -62,11 +62,12 @@ async def card_trade_play(
     db: Session = Depends(get_db)
 ):
   try:
-    room = get_room_by_id(db, room_id)
-    if not room:
+    # Sala, juego, actor y turno activo (una sola query)
+    context = load_game_context(db, room_id, actor_user_id)
+    if not context:
       raise HTTPException(status_code=404, detail="Room not found")
     
-    game = get_game_by_id(db, room.id_game)
+    game = context.game
     if not game:
       raise HTTPException(status_code=404, detail="Game not found")
     
@@ -74,10 +75,7 @@ async def card_trade_play(
     if game.player_turn_id != actor_user_id:
       raise HTTPException(status_code=403, detail="Not your turn")
 
-    actor = db.query(Player).filter(
-       Player.id == actor_user_id,
-       Player.id_room == room_id
-    ).first()
+    actor = context.actor
     if not actor:
       raise HTTPException(status_code=404, detail="Actor not found")
     
@@ -92,11 +90,7 @@ async def card_trade_play(
       raise HTTPException(status_code=400, detail="Cannot trade yourself")
 
     # Obtener el turno actual
-    current_turn = db.query(Turn).filter(
-      Turn.id_game == game.id,
-      Turn.player_id == actor.id,
-      Turn.status == TurnStatus.IN_PROGRESS
-    ).first()
+    current_turn = context.actor_turn
     if not current_turn:
       raise HTTPException(status_code=403, detail="No active turn found")
     
@@ -229,12 +223,12 @@ async def card_trade_complete(
    db: Session = Depends(get_db)
 ):
   try:
-    # Validar room y game
-    room = get_room_by_id(db, room_id)
-    if not room:
+    # Validar room y game (el actor es P2, el target del intercambio)
+    context = load_game_context(db, room_id, actor_user_id)
+    if not context:
       raise HTTPException(status_code=404, detail="Room not found")
     
-    game = get_game_by_id(db, room.id_game)
+    game = context.game
     if not game:
       raise HTTPException(status_code=404, detail="Game not found")
     
@@ -256,7 +250,7 @@ async def card_trade_complete(
     
     # Obtener jugadores
     p1 = db.query(Player).filter(Player.id == action.player_source).first()
-    p2 = db.query(Player).filter(Player.id == actor_user_id).first()
+    p2 = context.actor
     
     if not p1 or not p2:
       raise HTTPException(status_code=404, detail="Players not found")
@@ -331,7 +325,7 @@ async def card_trade_complete(
     )
     
     # Actualizar el estado completo del juego para todos
-    game_state = build_complete_game_state(db, game.id)
+    game_state = game_state_builder(game.id)
     await ws_service.notificar_estado_partida(
         room_id=room_id,
         game_state=game_state,
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+from app.services.card_catalog import get_card_catalog
+import logging
+
+router = APIRouter(prefix="/api/cards", tags=["Cards"])
+logger = logging.getLogger(__name__)
+
+# El ETag cambia si cambia el contenido; el cliente revalida en cada carga
+CACHE_CONTROL = "public, max-age=3600, must-revalidate"
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+# GET /api/cards/catalog
+@router.get("/catalog", status_code=200)
+def get_catalog(request: Request, db: Session = Depends(get_db)):
+    """
+    Catálogo de cartas (id, nombre, descripción, tipo, imagen) para resolver
+    los `card_id` de los estados con cartas por id. Responde 304 si el
+    cliente ya tiene la versión actual (If-None-Match).
+    """
+    catalog = get_card_catalog()
+    catalog.load(db)
+    headers = {"ETag": catalog.etag, "Cache-Control": CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, catalog.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=catalog.body, media_type="application/json", headers=headers)
@@ -2,13 +2,14 @@
 from fastapi import APIRouter, Depends, HTTPException, Header, status
 from sqlalchemy.orm import Session
 from app.db.database import SessionLocal
-from app.services.game_status_service import build_complete_game_state
+from app.services.game_status_service import game_state_builder
+from app.services.game_tracker import get_game_tracker, has_uncommitted_card_changes
 from pydantic import BaseModel
-from app.db.crud import get_room_by_id, get_player_by_id, get_game_by_id
 from app.db.models import (
     CardsXGame, CardState, ActionsPerTurn, ActionType, 
-    ActionResult, ActionName, Turn, TurnStatus, Card, Room, Game, Player
+    ActionResult, ActionName, Card, Player
 )
+from app.services.game_context import load_game_context
 from app.sockets.socket_service import get_websocket_service
 from datetime import datetime
 import logging
@@ -77,16 +78,16 @@ async def cards_off_the_table(
     Esta acción NO puede ser cancelada por NSF.
     """
 
-    print(f"==> Entró al endpoint cards_off_the_table")
-    print(f"room_id={room_id}, actor_user_id={actor_user_id}, target={request.targetPlayerId}")
+    logger.debug("==> Entró al endpoint cards_off_the_table")
+    logger.debug("room_id=%s, actor_user_id=%s, target=%s", room_id, actor_user_id, request.targetPlayerId)
 
     try:
-        # Buscar sala y juego
-        room = get_room_by_id(db, room_id)
-        if not room:
+        # Sala, juego, actor y turno activo (una sola query)
+        context = load_game_context(db, room_id, actor_user_id)
+        if not context:
             raise HTTPException(status_code=404, detail="Room not found")
 
-        game = get_game_by_id(db, room.id_game)
+        game = context.game
         if not game:
             raise HTTPException(status_code=404, detail="Game not found")
 
@@ -95,7 +96,7 @@ async def cards_off_the_table(
             raise HTTPException(status_code=403, detail="Not your turn")
 
         # Obtener jugadores
-        actor = db.query(Player).filter(Player.id == actor_user_id, Player.id_room == room_id).first()
+        actor = context.actor
         if not actor:
             raise HTTPException(status_code=404, detail="Actor player not found")
 
@@ -104,11 +105,7 @@ async def cards_off_the_table(
             raise HTTPException(status_code=400, detail="Invalid target player")
 
         # Obtener turno actual
-        current_turn = db.query(Turn).filter(
-            Turn.id_game == game.id,
-            Turn.player_id == actor.id,
-            Turn.status == TurnStatus.IN_PROGRESS
-        ).first()
+        current_turn = context.actor_turn
         if not current_turn:
             raise HTTPException(status_code=403, detail="No active turn found")
 
@@ -123,12 +120,20 @@ async def cards_off_the_table(
             raise HTTPException(status_code=404, detail="Cards Off the Table card not found in hand")
 
         # Buscar todas las cartas NSF en la mano del objetivo
-        target_nsf_cards = db.query(CardsXGame).join(Card).filter(
-            CardsXGame.player_id == target.id,
-            CardsXGame.id_game == game.id,
-            CardsXGame.is_in == CardState.HAND,
-            Card.name == "Not so fast"
-        ).all()
+        tracker = get_game_tracker(game.id)
+        if tracker is not None and not has_uncommitted_card_changes(db, game.id):
+            # El índice del tracker ya sabe cuáles son (o que no tiene ninguna)
+            nsf_ids = tracker.nsf_cards(target.id)
+            target_nsf_cards = db.query(CardsXGame).filter(
+                CardsXGame.id.in_(nsf_ids)
+            ).order_by(CardsXGame.id).all() if nsf_ids else []
+        else:
+            target_nsf_cards = db.query(CardsXGame).join(Card).filter(
+                CardsXGame.player_id == target.id,
+                CardsXGame.id_game == game.id,
+                CardsXGame.is_in == CardState.HAND,
+                Card.name == "Not so fast"
+            ).all()
 
         # Guardar posiciones previas
         nsf_previous_positions = {card.id: card.position for card in target_nsf_cards}
@@ -262,7 +267,7 @@ async def cards_off_the_table(
         )
 
         # Notificar estado actualizado
-        game_state = build_complete_game_state(db, game.id)
+        game_state = game_state_builder(game.id)
         ws_service = get_websocket_service()
         await ws_service.notificar_estado_partida(
             room_id=room_id,
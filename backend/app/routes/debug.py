@@ -0,0 +1,15 @@
+from fastapi import APIRouter, HTTPException
+from ..services.profiling import get_report
+import logging
+
+router = APIRouter(prefix="/debug", tags=["Debug"])
+logger = logging.getLogger(__name__)
+
+# GET /debug/profile/{report_id}
+@router.get("/profile/{report_id}")
+async def get_profile_report(report_id: str):
+    """Devuelve un reporte de profiling generado por ProfilingMiddleware o @profiled"""
+    report = get_report(report_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Profile report not found")
+    return report
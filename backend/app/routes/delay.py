@@ -26,6 +26,7 @@ from app.db import crud, models
 from app.schemas.delay_schema import delay_escape_request, delay_escape_response
 from app.sockets.socket_service import get_websocket_service
 from app.services.game_status_service import build_complete_game_state
+from app.services.game_context import load_game_context
 
 router = APIRouter(prefix="/api/game", tags=["Events"])
 
@@ -48,13 +49,14 @@ async def delay_murderer_escape(
     user_id: int = Header(..., alias="HTTP_USER_ID"),
     db: Session = Depends(get_db)
 ):
-    # Buscar sala
-    room = crud.get_room_by_id(db, room_id)
-    if not room:
+    # Sala, partida y turno activo (una sola query)
+    context = load_game_context(db, room_id, user_id)
+    if not context:
         raise HTTPException(status_code=404, detail="room_not_found")
+    room = context.room
 
     # Buscar partida
-    game = crud.get_game_by_id(db, room.id_game)
+    game = context.game
     if not game:
         raise HTTPException(status_code=404, detail="game_not_found")
 
@@ -76,7 +78,7 @@ async def delay_murderer_escape(
         raise HTTPException(status_code=400, detail="not_an_event_card")
 
     try:
-        current_turn = crud.get_current_turn(db, room.id_game)
+        current_turn = context.current_turn
         parent_action = crud.create_action(db, {
             "id_game": room.id_game,
             "turn_id": current_turn.id,
@@ -8,7 +8,7 @@ from app.schemas.detective_action_schema import (
     DetectiveActionResponse
 )
 from app.services.detective_action_service import DetectiveActionService
-from app.services.game_status_service import build_complete_game_state
+from app.services.game_status_service import game_state_builder
 from app.sockets.socket_service import get_websocket_service
 
 import logging
@@ -74,11 +74,7 @@ async def execute_detective_action(
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
-    try:
-        game_state = build_complete_game_state(db, game_id)
-    except Exception as e:
-        logger.error(f"Error building game state: {str(e)}")
-        game_state = {}
+    game_state = game_state_builder(game_id)
     
     ws_service = get_websocket_service()
     
@@ -7,11 +7,13 @@ from app.schemas.discard_schema import DiscardRequest, DiscardResponse
 from app.services.discard import descartar_cartas
 from app.services.game_service import actualizar_turno
 from app.sockets.socket_service import get_websocket_service
-from app.services.game_status_service import build_complete_game_state
+from app.services.game_status_service import game_state_builder
 
 from datetime import datetime
+import logging
 
 router = APIRouter(prefix="/game", tags=["Games"])
+logger = logging.getLogger(__name__)
 
 def get_db():
     db = SessionLocal()
@@ -54,7 +56,7 @@ async def discard_cards(
 
     card_ids = [c.card_id for c in card_ids_with_order]
 
-    print(f"🎯 POST /discard received: {DiscardRequest}")
+    logger.debug("🎯 POST /discard received: %s", DiscardRequest)
 
     player_cards = (
         db.query(CardsXGame)
@@ -69,13 +71,13 @@ async def discard_cards(
     
     if len(player_cards) != len(card_ids):
         raise HTTPException(status_code=400, detail="validation_error: invalid or not owned cards")
-    print(f"❌ Orden después del query (DESORDENADO): {[c.id_card for c in player_cards]}")  # LOG 2
+    logger.debug("❌ Orden después del query (DESORDENADO): %s", [c.id_card for c in player_cards])
 
     # reordenar cartas para mantener orden de descarte
     card_dict = {card.id: card for card in player_cards}
     ordered_player_cards = [card_dict[card_id] for card_id in card_ids]
     ordered_card_ids = [c.id_card for c in ordered_player_cards]
-    print(f"✅ Orden corregido: {ordered_card_ids}")  # LOG 3
+    logger.debug("✅ Orden corregido: %s", ordered_card_ids)
 
     ordered_card_ids = [c.id_card for c in ordered_player_cards]
 
@@ -90,7 +92,7 @@ async def discard_cards(
 
     # Capture card IDs BEFORE any other operation that might detach objects
     discarded_card_ids = [c.id_card for c in discarded_rows]
-    print(f"📤 Orden final descartado: {discarded_card_ids}")  # LOG 4
+    logger.debug("📤 Orden final descartado: %s", discarded_card_ids)
     
     all_hand_cards = db.query(CardsXGame).filter(
         CardsXGame.id_game == game.id,
@@ -121,9 +123,9 @@ async def discard_cards(
         }
     )
 
-    print(f"response: {response.discard.top}")
+    logger.debug("response: %s", response.discard.top)
 
-    game_state = build_complete_game_state(db, game.id)
+    game_state = game_state_builder(game.id)
 
     # Emit complete game state via WebSocket
     ws_service = get_websocket_service()
@@ -139,15 +141,16 @@ async def discard_cards(
         cards_to_draw=len(discarded)
     )
 
-    # Verificar todo el mazo de descarte
-    all_discarded = db.query(CardsXGame).filter(
-        CardsXGame.id_game == game.id,
-        CardsXGame.is_in == CardState.DISCARD
-    ).order_by(CardsXGame.position.asc()).all()
+    # Verificar todo el mazo de descarte (solo con DEBUG: cuesta una query extra)
+    if logger.isEnabledFor(logging.DEBUG):
+        all_discarded = db.query(CardsXGame).filter(
+            CardsXGame.id_game == game.id,
+            CardsXGame.is_in == CardState.DISCARD
+        ).order_by(CardsXGame.position.asc()).all()
 
-    print(f"\n MAZO DE DESCARTE COMPLETO (orden por position):")
-    for card in all_discarded:
-        print(f"  Position {card.position}: Carta {card.id_card} - {card.card.name if card.card else 'N/A'}")
-    print(f"Total: {len(all_discarded)} cartas\n")
+        logger.debug("MAZO DE DESCARTE COMPLETO (orden por position):")
+        for card in all_discarded:
+            logger.debug("Position %s: Carta %s - %s", card.position, card.id_card, card.card.name if card.card else 'N/A')
+        logger.debug("Total: %s cartas", len(all_discarded))
 
     return response
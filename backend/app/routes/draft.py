@@ -5,7 +5,8 @@ from app.db.models import Game, Room, CardsXGame, CardState
 from app.schemas.draft import DraftRequest
 from app.services.draft_service import list_draft_cards, pick_card_from_draft
 from app.services.game_service import procesar_ultima_carta
-from app.services.game_status_service import _build_hand_view, _build_deck_view, build_complete_game_state
+from app.services.game_tracker import get_game_tracker
+from app.services.game_status_service import _build_hand_view, _build_deck_view, build_complete_game_state, game_state_builder
 from app.sockets.socket_service import get_websocket_service
 import logging
 
@@ -44,8 +45,7 @@ async def pick_card(game_id: int, draft_request: DraftRequest, db: Session = Dep
 
     # Obtener cartas del draft y validar que la carta este ahi
     draft_cards = list_draft_cards(db, game_id)
-    print("draft_request.card_id =", draft_request.card_id)
-    print("draft_cards =", [c.id for c in draft_cards])
+    logger.debug("draft_request.card_id=%s draft_cards=%s", draft_request.card_id, [c.id for c in draft_cards])
     card = next((card for card in draft_cards if card.id == draft_request.card_id), None)
     if not card:
         raise HTTPException(status_code=404, detail="Card not found in draft")
@@ -54,7 +54,6 @@ async def pick_card(game_id: int, draft_request: DraftRequest, db: Session = Dep
     picked_card = pick_card_from_draft(db, draft_request.card_id, draft_request.user_id)
 
     # Actualizar mano, draft y deck
-    game_state = build_complete_game_state(db, game_id)
     new_hand = _build_hand_view(db, game_id, draft_request.user_id)
     new_deck = _build_deck_view(db, game_id)
 
@@ -63,22 +62,30 @@ async def pick_card(game_id: int, draft_request: DraftRequest, db: Session = Dep
     room_id = room.id if room else game_id
 
     # Verificar si el draft esta vacio para terminar la partida
-    draft_remaining = db.query(CardsXGame).filter(
-        CardsXGame.id_game == game_id,
-        CardsXGame.is_in == CardState.DRAFT
-    ).count()
+    tracker = get_game_tracker(game_id)
+    if tracker is not None:
+        draft_remaining = tracker.draft_count
+    else:
+        draft_remaining = db.query(CardsXGame).filter(
+            CardsXGame.id_game == game_id,
+            CardsXGame.is_in == CardState.DRAFT
+        ).count()
 
     # Emitir eventos por WebSocket
     try:
         ws_service = get_websocket_service()
         
         if draft_remaining == 0:
+            # Fin de partida: el estado final se necesita ya
+            game_state = build_complete_game_state(db, game_id)
             await procesar_ultima_carta(game_id=game_id, room_id=room_id, game_state=game_state)
         else:
-            # Notificar al jugador su mano actualizada
-            await ws_service.notificar_estados_privados(room_id=room_id, estados_privados=game_state["estados_privados"])
-            # Notificar a la sala el estado del deck y draft
-            await ws_service.notificar_estado_partida(room_id=room_id, jugador_que_actuo=draft_request.user_id, game_state=game_state)
+            # Estado público y privados de la sala (incluida la mano del jugador), armado al flush
+            await ws_service.notificar_estado_partida(
+                room_id=room_id,
+                jugador_que_actuo=draft_request.user_id,
+                game_state=game_state_builder(game_id),
+            )
             # Notificar a todos que el jugador robo del draft
             await ws_service.notificar_card_drawn_simple(
                 room_id=room_id,
@@ -3,12 +3,12 @@ from sqlalchemy.orm import Session
 from app.db.database import SessionLocal
 from pydantic import BaseModel
 from app.db.models import (
-  Game, Room, CardsXGame, CardState, Player, ActionsPerTurn,
-  ActionType, ActionResult, Turn, TurnStatus, Card, ActionName
+  CardsXGame, CardState, ActionsPerTurn,
+  ActionType, ActionResult, Card, ActionName
 )
-from app.db.crud import get_room_by_id, get_game_by_id
+from app.services.game_context import load_game_context
 from app.sockets.socket_service import get_websocket_service
-from app.services.game_status_service import build_complete_game_state
+from app.services.game_status_service import game_state_builder
 from datetime import datetime
 import logging
 
@@ -61,11 +61,12 @@ async def early_train_to_paddington(
 ):
 
   try:
-    room = get_room_by_id(db, room_id)
-    if not room:
+    # Sala, juego, actor y turno activo (una sola query)
+    context = load_game_context(db, room_id, actor_user_id)
+    if not context:
       raise HTTPException(status_code=404, detail="Room not found")
     
-    game = get_game_by_id(db, room.id_game)
+    game = context.game
     if not game:
       raise HTTPException(status_code=404, detail="Game not found")
     
@@ -73,19 +74,12 @@ async def early_train_to_paddington(
     if game.player_turn_id != actor_user_id:
       raise HTTPException(status_code=403, detail="Not your turn")
   
-    actor = db.query(Player).filter(
-      Player.id == actor_user_id, 
-      Player.id_room == room_id
-    ).first()
+    actor = context.actor
     if not actor:
       raise HTTPException(status_code=404, detail="Actor player not found")
 
     # Obtener el turno actual
-    current_turn = db.query(Turn).filter(
-      Turn.id_game == game.id,
-      Turn.player_id == actor.id,
-      Turn.status == TurnStatus.IN_PROGRESS
-    ).first()
+    current_turn = context.actor_turn
     if not current_turn:
       raise HTTPException(status_code=403, detail="No active turn found")
     
@@ -220,7 +214,7 @@ async def early_train_to_paddington(
     )
     logger.info("Se emitió el evento event_step_update del robo del set")    
 
-    game_state = build_complete_game_state(db, game.id)
+    game_state = game_state_builder(game.id)
     await ws_service.notificar_estado_partida(
         room_id=room_id,
         game_state=game_state,
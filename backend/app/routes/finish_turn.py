@@ -5,12 +5,16 @@ from ..db.database import SessionLocal
 from ..db.models import Room, Player, RoomStatus, Game, CardsXGame, CardState, Turn, TurnStatus
 from app.sockets.socket_service import get_websocket_service
 from fastapi import APIRouter, Query, Depends, HTTPException, Path
-from app.services.game_status_service import build_complete_game_state
+from app.services.game_status_service import game_state_builder
+from app.services.game_context import load_game_context
+from app.services.seat_ring import get_seat_rings
 
 from pydantic import BaseModel
 from datetime import datetime
+import logging
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Conexión a la DB
 def get_db():
@@ -29,15 +33,15 @@ async def finish_turn(
     request: FinishTurnRequest,
     db: Session = Depends(get_db)
 ):
-    print(f"🎯 POST /finish-turn received: {FinishTurnRequest}")
+    logger.debug("🎯 POST /finish-turn received: %s", FinishTurnRequest)
 
-    # Buscar sala
-    room = db.query(Room).filter(Room.id == room_id).first()
-    if not room:
+    # Sala, partida y turno activo en una sola query
+    context = load_game_context(db, room_id, request.user_id)
+    if not context:
         raise HTTPException(status_code=404, detail="room_not_found")
+    room = context.room
     
-    # Buscar partida
-    game = db.query(Game).filter(Game.id == room.id_game).first()
+    game = context.game
     if not game:
         raise HTTPException(status_code=404, detail="game_not_found")
 
@@ -90,38 +94,31 @@ async def finish_turn(
     #db.add(new_card)
     
     # Avanzar turno
-    players = db.query(Player).filter(Player.id_room == room.id).order_by(Player.order.asc()).all()
-
-    current_order = next((p.order for p in players if p.id == request.user_id), None)
-    next_order = (current_order % len(players)) + 1
-    next_player = next((p for p in players if p.order == next_order), None)
+    ring = get_seat_rings().ensure(db, room.id)
+    next_player_id = ring.next(request.user_id) or request.user_id
     
     # Finalizar turno actual
-    current_turn = db.query(Turn).filter(
-        Turn.id_game == game.id,
-        Turn.player_id == request.user_id,
-        Turn.status == TurnStatus.IN_PROGRESS
-    ).first()
+    current_turn = context.actor_turn
     
     if current_turn:
         current_turn.status = TurnStatus.FINISHED
         db.add(current_turn)
-        print(f"🔄 Turn {current_turn.number} finished for player {request.user_id}")
+        logger.debug("🔄 Turn %s finished for player %s", current_turn.number, request.user_id)
         
         # Crear nuevo turno para el siguiente jugador
         new_turn = Turn(
             number=current_turn.number + 1,
             id_game=game.id,
-            player_id=next_player.id,
+            player_id=next_player_id,
             status=TurnStatus.IN_PROGRESS,
             start_time=datetime.now()
         )
         db.add(new_turn)
-        print(f"🆕 Turn {new_turn.number} created for player {next_player.id}")
+        logger.debug("🆕 Turn %s created for player %s", new_turn.number, next_player_id)
     else:
-        print(f"⚠️ No active turn found for player {request.user_id}")
+        logger.debug("⚠️ No active turn found for player %s", request.user_id)
     
-    game.player_turn_id = next_player.id
+    game.player_turn_id = next_player_id
     
     db.commit()
     db.refresh(game)
@@ -129,7 +126,7 @@ async def finish_turn(
     deck_count = db.query(CardsXGame).filter(CardsXGame.id_game == game.id, CardsXGame.is_in == CardState.DECK).count()
 
     # Build game state
-    game_state = build_complete_game_state(db, game.id)
+    game_state = game_state_builder(game.id)
        
 
     ws_service = get_websocket_service()
@@ -142,5 +139,5 @@ async def finish_turn(
     
     return {
         "status": "ok",
-        "next_turn": next_player.id
+        "next_turn": next_player_id
     }
\ No newline at end of file
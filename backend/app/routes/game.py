@@ -4,9 +4,12 @@ from app.db import crud
 from app.db.database import SessionLocal
 from app.db import models
 from app.schemas.game import GameCreateRequest, GameResponse, RoomResponse, PlayerResponse
+from app.services.lobby_directory import get_lobby_directory
 from datetime import datetime
+import logging
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 def get_db():
     db = SessionLocal()
@@ -17,7 +20,7 @@ def get_db():
 
 @router.post("/game", response_model=GameResponse, status_code=201)
 def create_game(newgame: GameCreateRequest, db: Session = Depends(get_db)):
-    print(f"🎯 POST /game received: {newgame}")
+    logger.debug("🎯 POST /game received: %s", newgame)
     
     try:
         existing_room = db.query(models.Room).filter(
@@ -61,6 +64,9 @@ def create_game(newgame: GameCreateRequest, db: Session = Depends(get_db)):
             "order": 1  # Host is first player
         }
         new_player = crud.create_player(db, player_data)
+
+        # Publicar la sala nueva en el directorio del lobby
+        get_lobby_directory().upsert_room(new_room, [new_player])
         
         return GameResponse(
             room=RoomResponse(
@@ -86,7 +92,7 @@ def create_game(newgame: GameCreateRequest, db: Session = Depends(get_db)):
     except HTTPException:
         raise  # Re-raise HTTP exceptions
     except Exception as e:
-        print(f"Error creating game: {e}")
+        logger.error("Error creating game: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Query, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 from ..db.database import SessionLocal
-from ..db.models import Room, Player, RoomStatus
+from ..services.lobby_directory import get_lobby_directory
 import logging
 
 router = APIRouter(prefix="/api", tags=["API"])
@@ -32,54 +32,40 @@ class GameListResponse(BaseModel):
     items: List[GameItem]
     page: int
     limit: int
+    next_cursor: Optional[int] = None
 
 # GET /api/game_list
 @router.get("/game_list", response_model=GameListResponse)
-def get_game_list(page: int = Query(1, ge=1), limit: int = Query(20, ge=1, le=100), db: Session = Depends(get_db)):
-    try:
-        # Query rooms in WAITING status
-        rooms = (
-            db.query(Room)
-            .filter(Room.status == RoomStatus.WAITING)
-            .order_by(Room.id.desc())
-            .all()
-        )
-        logger.info(f"Retrieved {len(rooms)} rooms in WAITING status")
-
-        available = []
-        for room in rooms:
-            # Count players in the room
-            players = db.query(Player).filter(Player.id_room == room.id).all()
-            players_joined = len(players)
-
-            # Find the host
-            host = next((p for p in players if p.is_host), None)
+def get_game_list(
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+):
+    """
+    Lista las salas disponibles desde el directorio en memoria del lobby.
 
-            # Include rooms with available slots
-            if players_joined < room.players_max:
-                available.append({
-                    "id": room.id,
-                    "name": room.name,
-                    "players_min": room.players_min,
-                    "players_max": room.players_max,
-                    "players_joined": players_joined,
-                    "host_id": host.id if host else None
-                })
-
-        # Pagination
-        start = (page - 1) * limit
-        end = start + limit
-        paginated = available[start:end]
+    Con `cursor` (el `next_cursor` de la respuesta anterior) la paginación es
+    por cursor; sin él se mantiene la paginación por `page`.
+    """
+    try:
+        directory = get_lobby_directory()
+        # Solo consulta la BD en el cold start
+        directory.ensure_loaded(db)
 
-        db.commit()
-        logger.debug(f"Returning {len(paginated)} games for page {page}, limit {limit}")
+        rooms, next_cursor = directory.list_available(
+            limit=limit,
+            cursor=cursor,
+            offset=(page - 1) * limit
+        )
+        logger.debug(f"Returning {len(rooms)} games for page {page}, cursor {cursor}, limit {limit}")
 
         return GameListResponse(
-            items=[GameItem(**r) for r in paginated],
+            items=[GameItem(**r.to_item()) for r in rooms],
             page=page,
-            limit=limit
+            limit=limit,
+            next_cursor=next_cursor
         )
     except Exception as e:
-        db.rollback()
         logger.error(f"Error in game_list: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from app.db.database import SessionLocal
+from app.db.models import Room, RoomStatus
+from app.services.game_archive import load_game_history
+from app.services.replay import MEDIA_TYPE, iter_replay
+import logging
+
+router = APIRouter(prefix="/api/game", tags=["Games"])
+logger = logging.getLogger(__name__)
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _get_finished_room(db: Session, room_id: int) -> Room:
+    room = db.query(Room).filter(Room.id == room_id).first()
+    if not room:
+        raise HTTPException(status_code=404, detail="Room not found")
+    if not room.id_game:
+        raise HTTPException(status_code=400, detail="Room has no game")
+    # Mientras la partida sigue en curso el historial revela cartas ocultas
+    if room.status != RoomStatus.FINISH:
+        raise HTTPException(status_code=400, detail="Game is not finished")
+    return room
+
+
+# GET /api/game/{room_id}/history
+@router.get("/{room_id}/history", status_code=200)
+def get_game_history(room_id: int, db: Session = Depends(get_db)):
+    """
+    Historial de una partida terminada (turnos, cartas, acciones y desgracia
+    social). Se lee del archivo si la partida ya fue archivada.
+    """
+    room = _get_finished_room(db, room_id)
+    history = load_game_history(db, room.id_game)
+    if history is None:
+        raise HTTPException(status_code=404, detail="Game history not found")
+    return history
+
+
+# GET /api/game/{room_id}/replay
+@router.get("/{room_id}/replay", status_code=200)
+def get_game_replay(room_id: int, db: Session = Depends(get_db)):
+    """
+    Replay binario de una partida terminada (reparto inicial + acciones),
+    generado en streaming. Formato y lector en services/replay.py.
+    """
+    room = _get_finished_room(db, room_id)
+
+    def _stream():
+        # La sesión se cierra acá: el dependency termina antes de que se
+        # consuma el body
+        try:
+            yield from iter_replay(db, room)
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        _stream(),
+        media_type=MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="game-{room.id_game}.dotr"'},
+    )
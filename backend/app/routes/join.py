@@ -6,8 +6,10 @@ from datetime import date
 from ..db.database import SessionLocal
 from ..db.models import Room, Player, RoomStatus
 from ..services.game_service import join_game_logic
+import logging
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Conexión a la DB
 def get_db():
@@ -49,7 +51,7 @@ class JoinGameResponse(BaseModel):
 @router.post("/game/{room_id}/join", response_model=JoinGameResponse)
 async def join_game(room_id: int, request: JoinGameRequest, db: Session = Depends(get_db)):
     
-    print(f"🎯 POST /join received: {JoinGameRequest}")
+    logger.debug("🎯 POST /join received: %s", JoinGameRequest)
 
     try:
         result = join_game_logic(db, room_id, request.dict())
@@ -95,5 +97,5 @@ async def join_game(room_id: int, request: JoinGameRequest, db: Session = Depend
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error in join_game: {e}")  # Para debug
+        logger.error("Error in join_game: %s", e)  # Para debug
         raise HTTPException(status_code=500, detail="server_error")
\ No newline at end of file
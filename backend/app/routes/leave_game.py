@@ -4,8 +4,10 @@ from ..db.database import SessionLocal
 from ..db.models import Room, Player, RoomStatus
 from ..services.leave_game_service import leave_game_logic
 from ..schemas.leave_game import LeaveGameResponse
+import logging
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Conexion a la DB
 def get_db():
@@ -33,7 +35,7 @@ async def leave_game(
         403 si el jugador no pertenece a esta sala
         409 si la partida ya fue iniciada (status != WAITING)
     """
-    print(f"Cancelar o abandonar recibido: room_id={room_id}, user_id={http_user_id}")
+    logger.debug("Cancelar o abandonar recibido: room_id=%s, user_id=%s", room_id, http_user_id)
     
     try:
         result = await leave_game_logic(db, room_id, http_user_id)
@@ -57,5 +59,5 @@ async def leave_game(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error al abandonar la partida: {e}")
+        logger.error("Error al abandonar la partida: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
@@ -6,10 +6,13 @@ from datetime import datetime, timedelta
 
 from app.db import models, crud
 from app.sockets.socket_service import get_websocket_service
-from app.services.game_status_service import build_complete_game_state
+from app.services.game_status_service import game_state_builder
+from app.services.game_context import load_game_context
 from app.schemas.look_ashes_schema import LookAshesPlayRequest, LookAshesSelectRequest
+import logging
 
 router = APIRouter(prefix="/api/game", tags=["event_cards"])
+logger = logging.getLogger(__name__)
 
 def get_db():
     db = SessionLocal()
@@ -38,17 +41,18 @@ async def play_look_into_ashes(
         available_cards: Top 5 cards from discard (private info)
     """
 
-    print(f"Received room: {room_id} player: {http_user_id} card: {request.card_id}")
+    logger.debug("Received room: %s player: %s card: %s", room_id, http_user_id, request.card_id)
     
-    # Get room and game
-    room = crud.get_room_by_id(db, room_id)
-    if not room:
+    # Get room, game and active turn (single query)
+    context = load_game_context(db, room_id, http_user_id)
+    if not context:
         raise HTTPException(status_code=404, detail="Room not found")
     
+    room = context.room
     if not room.id_game:
         raise HTTPException(status_code=400, detail="Room has no active game")
     
-    game = crud.get_game_by_id(db, room.id_game)
+    game = context.game
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
     
@@ -91,8 +95,8 @@ async def play_look_into_ashes(
             detail="Discard pile is empty"
         )
     
-    # Get current turn using crud helper
-    current_turn = crud.get_current_turn(db, room.id_game)
+    # Current turn was loaded with the context
+    current_turn = context.current_turn
     
     if not current_turn:
         raise HTTPException(
@@ -173,12 +177,13 @@ async def select_card_from_ashes(
         success: True if card was taken
     """
     
-    # Get room and game
-    room = crud.get_room_by_id(db, room_id)
-    if not room:
+    # Get room and game (single query)
+    context = load_game_context(db, room_id, http_user_id)
+    if not context:
         raise HTTPException(status_code=404, detail="Room not found")
     
-    game = crud.get_game_by_id(db, room.id_game)
+    room = context.room
+    game = context.game
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
     
@@ -247,9 +252,9 @@ async def select_card_from_ashes(
         old_pos = card.position
         card.position = idx
         if old_pos != idx:
-            print(f"  📦 Reindexando: Carta {card.id_card} de pos {old_pos} → {idx}")
+            logger.debug("📦 Reindexando: Carta %s de pos %s → %s", card.id_card, old_pos, idx)
     
-    print(f"🔄 Reindexado completo: {len(remaining_discard)} cartas en descarte")
+    logger.debug("🔄 Reindexado completo: %s cartas en descarte", len(remaining_discard))
     
     # Create completion action using crud helper
     completion_action_data = {
@@ -278,7 +283,7 @@ async def select_card_from_ashes(
     )
     
     # Update full game state
-    game_state = build_complete_game_state(db, room.id_game)
+    game_state = game_state_builder(room.id_game)
     await ws_service.notificar_estado_partida(
         room_id=room_id,
         game_state=game_state,
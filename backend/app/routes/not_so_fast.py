@@ -12,7 +12,7 @@ from app.schemas.not_so_fast_schema import (
     CancelNSFResponse
 )
 from app.services.not_so_fast_service import NotSoFastService
-from app.services.game_status_service import build_complete_game_state
+from app.services.game_status_service import game_state_builder
 from app.services.timer_manager import get_timer_manager
 from app.services.counter_timeout_handler import handle_nsf_timeout
 from app.sockets.socket_service import get_websocket_service
@@ -147,7 +147,7 @@ async def start_action(
             )
         
         # 4. Emitir actualización de estado del juego
-        game_state = build_complete_game_state(db, game_id)
+        game_state = game_state_builder(game_id)
         
         await ws_service.notificar_estado_partida(
             room_id=room_id,
@@ -226,7 +226,7 @@ async def play_not_so_fast(
         
         # 4. Obtener el estado actualizado del juego
         ws_service = get_websocket_service()
-        game_state = build_complete_game_state(db, game_id)
+        game_state = game_state_builder(game_id)
         
         # 5. Emitir eventos WebSocket
         
@@ -380,7 +380,7 @@ async def cancel_nsf_action(
         
         # 4. Obtener el estado actualizado del juego
         ws_service = get_websocket_service()
-        game_state = build_complete_game_state(db, game_id)
+        game_state = game_state_builder(game_id)
         
         # 5. Emitir eventos WebSocket
         
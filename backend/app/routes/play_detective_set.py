@@ -7,7 +7,7 @@ from app.schemas.detective_set_schema import (
     PlayDetectiveSetResponse
 )
 from app.services.detective_set_service import DetectiveSetService
-from app.services.game_status_service import build_complete_game_state
+from app.services.game_status_service import game_state_builder
 from app.sockets.socket_service import get_websocket_service
 
 import logging
@@ -69,11 +69,7 @@ async def play_detective_set(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
     
     # 3. Obtener estado completo del juego para WebSocket
-    try:
-        game_state = build_complete_game_state(db, game_id)
-    except Exception as e:
-        logger.error(f"Error building game state: {str(e)}")
-        game_state = {}
+    game_state = game_state_builder(game_id)
     
     # 4. Emitir eventos WebSocket
     ws_service = get_websocket_service()
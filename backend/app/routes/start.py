@@ -6,10 +6,15 @@ from app.db.models import Player, Room, Card, CardsXGame, CardState, CardType, R
 from app.schemas.start import StartRequest
 from app.sockets.socket_service import get_websocket_service
 from datetime import date, datetime
-from app.services.game_status_service import build_complete_game_state
+from app.services.game_status_service import game_state_builder
+from app.services.lobby_directory import get_lobby_directory
+from app.services.game_tracker import get_game_trackers
+from app.services.seat_ring import get_seat_rings
+from app.sockets.event_log import get_room_event_logs
+from app.services.replay import record_initial_deal
+from app.services.game_rules import deal_cards, game_rng, new_game_seed
+from app.config import settings
 import logging
-import random
-import typing
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +29,7 @@ def get_db():
 
 @router.post("/start", status_code=201)
 async def start_game(room_id: int, userid: StartRequest, db: Session = Depends(get_db)):
-    print(f"🎯 POST /start received: {StartRequest}")
+    logger.debug("🎯 POST /start received: %s", StartRequest)
 
     try:
         # Buscar sala
@@ -57,8 +62,15 @@ async def start_game(room_id: int, userid: StartRequest, db: Session = Depends(g
         if not isHost:
             raise HTTPException(status_code=403, detail="Solo el host puede iniciar la partida")
 
+        # Semilla del reparto: elegida por el cliente solo en modo debug / benchmark
+        seed = getattr(userid, "seed", None)
+        if seed is not None and not settings.SEEDED_DEALS_ENABLED:
+            raise HTTPException(status_code=403, detail="Reparto con semilla deshabilitado")
+        if seed is None:
+            seed = new_game_seed()
+
         # Crear juego
-        game = create_game(db, game_data={"player_turn_id": None})
+        game = create_game(db, game_data={"player_turn_id": None, "seed": seed})
         room.id_game = game.id
         room.status = RoomStatus.INGAME
         db.add(room)
@@ -74,12 +86,18 @@ async def start_game(room_id: int, userid: StartRequest, db: Session = Depends(g
             dy = day_of_year(d)
             diff = abs(dy - ref_day)
             return min(diff, 365 - diff)
-        players_sorted = sorted(players, key=lambda p: day_diff(p.birthdate))
+        # Empates por id: el orden no depende de cómo devuelva las filas la BD
+        players_sorted = sorted(players, key=lambda p: (day_diff(p.birthdate), p.id))
         for i, p in enumerate(players_sorted, start=1):
             p.order = i
             db.add(p)
         db.commit()
 
+        # La sala deja de estar disponible en el lobby
+        get_lobby_directory().upsert_room(room, players_sorted)
+        get_seat_rings().build(room.id, players_sorted)
+        get_room_event_logs().ensure(room.id)
+
         # Turno inicial
         first_player = players_sorted[0]
         game.player_turn_id = first_player.id
@@ -101,54 +119,17 @@ async def start_game(room_id: int, userid: StartRequest, db: Session = Depends(g
         
         logger.info(f"✅ Created first turn: number=1, game_id={game.id}, player_id={first_player.id}")
 
-        exclude_special = ['Card Back', 'Murderer Escapes!', 'Secret Front']
-
-        def pick_cards(card_types: typing.List[CardType], count: int, exclude_names: typing.List[str] = None) -> typing.List[Card]:
-            cards = db.query(Card).filter(
-                Card.type.in_(card_types),
-                ~Card.name.in_(exclude_names or [])
-            ).all()
-            card_pool = []
-            for c in cards:
-                card_pool.extend([c] * c.qty)
-            random.shuffle(card_pool)
-            return card_pool[:count]
+        # Repartir cartas (todo el azar sale de la semilla de la partida)
+        catalog = db.query(Card).order_by(Card.id).all()
+        deal = deal_cards(catalog, len(players_sorted), game_rng(seed))
 
         manos = {}
         secretos = {}
 
-        # Asignar secretos especiales
-        num_players = len(players_sorted)
-        secret_murderer = db.query(Card).filter(Card.name == "You are the Murderer!!").first()
-        secret_accomplice = db.query(Card).filter(Card.name == "You are the Accomplice!").first() if num_players > 4 else None
-
-        player_indices = list(range(num_players))
-        random.shuffle(player_indices)
-        murderer_player_index = player_indices[0]
-        accomplice_player_index = player_indices[1] if num_players > 4 else None
-
-        # Repartir cartas
         for i, p in enumerate(players_sorted):
-            if num_players == 2:
-                exclude_special.extend(['Point your suspicions', 'Blackmailed'])    
-            game_cards = pick_cards([CardType.EVENT, CardType.DEVIUOS, CardType.DETECTIVE], 5, exclude_special)
-            instant_cards = pick_cards([CardType.INSTANT], 1, exclude_special)
-
-            # Secretos
-            player_secrets: typing.List[Card] = []
-            if i == murderer_player_index and secret_murderer:
-                player_secrets.append(secret_murderer)
-            if i == accomplice_player_index and secret_accomplice:
-                player_secrets.append(secret_accomplice)
-
-            remaining_secrets_needed = 3 - len(player_secrets)
-            if remaining_secrets_needed > 0:
-                exclude_special.extend(["You are the Murderer!!", "You are the Accomplice!"])
-                player_secrets.extend(pick_cards([CardType.SECRET], remaining_secrets_needed, exclude_special))
-
             # Persistir en bd
             manos[p.id] = []
-            for pos, c in enumerate(game_cards + instant_cards, start=1):
+            for pos, c in enumerate(deal.hands[i], start=1):
                 cxg = CardsXGame(
                     id_game=game.id,
                     id_card=c.id,
@@ -166,7 +147,7 @@ async def start_game(room_id: int, userid: StartRequest, db: Session = Depends(g
                 })
 
             secretos[p.id] = []
-            for pos, c in enumerate(player_secrets, start=1):
+            for pos, c in enumerate(deal.secrets[i], start=1):
                 cxg = CardsXGame(
                     id_game=game.id,
                     id_card=c.id,
@@ -185,16 +166,9 @@ async def start_game(room_id: int, userid: StartRequest, db: Session = Depends(g
 
         db.commit()
 
-        remaining_cards = db.query(Card).filter(
-            Card.type != CardType.SECRET,
-            Card.name != "Card Back",
-            Card.name != "Murderer Escapes!"
-        ).all()
-
         # Draft
-        draft_cards = pick_cards([CardType.EVENT, CardType.DEVIUOS, CardType.DETECTIVE], 3, exclude_special)
         draft_cxg = []
-        for pos, c in enumerate(draft_cards, start=1):
+        for pos, c in enumerate(deal.draft, start=1):
             cxg = CardsXGame(
                 id_game=game.id,
                 id_card=c.id,
@@ -210,30 +184,7 @@ async def start_game(room_id: int, userid: StartRequest, db: Session = Depends(g
                 "type": c.type
             })
 
-        deck_pool = []
-        for c in remaining_cards:
-            if num_players > 2:
-                deck_pool.extend([c] * c.qty)
-            else:
-                if c.name != 'Point your suspicions' and c.name != 'Blackmailed':
-                    deck_pool.extend([c] * c.qty)
-
-        # Eliminar cartas que ya estan repartidas
-        for mano in manos.values():
-            for carta in mano:
-                for idx, c in enumerate(deck_pool):
-                    if c.id == carta['card_id']:
-                        deck_pool.pop(idx)
-                        break
-        for carta in draft_cards:
-            for idx, c in enumerate(deck_pool):
-                if c.id == carta.id:
-                    deck_pool.pop(idx)
-                    break
-
-        random.shuffle(deck_pool)
-
-        firstDiscard = deck_pool.pop(0) if deck_pool else None
+        firstDiscard = deal.discard
         if firstDiscard:
             db.add(CardsXGame(
                 id_game=game.id,
@@ -242,7 +193,7 @@ async def start_game(room_id: int, userid: StartRequest, db: Session = Depends(g
                 position=1
             ))
 
-        for pos, c in enumerate(deck_pool, start=1):
+        for pos, c in enumerate(deal.deck, start=1):
             db.add(CardsXGame(
                 id_game=game.id,
                 id_card=c.id,
@@ -251,6 +202,19 @@ async def start_game(room_id: int, userid: StartRequest, db: Session = Depends(g
             ))
         db.commit()
 
+        # Roles, secretos y mazos quedan trackeados en memoria desde acá
+        try:
+            get_game_trackers().load(db, game.id)
+        except Exception as e:
+            logger.warning("game tracker not loaded game=%s error=%s", game.id, e)
+
+        # cardsXgame se pisa durante la partida: el reparto se guarda para el replay
+        try:
+            record_initial_deal(db, game.id)
+        except Exception as e:
+            db.rollback()
+            logger.warning("initial deal not recorded game=%s error=%s", game.id, e)
+
         payload = {
             "game": {
                 "id": game.id,
@@ -268,7 +232,7 @@ async def start_game(room_id: int, userid: StartRequest, db: Session = Depends(g
         }
 
         # Build game_state
-        game_state = build_complete_game_state(db, game.id)
+        game_state = game_state_builder(game.id)
 
         # Notificar por WebSocket
         ws_service = get_websocket_service()
@@ -7,10 +7,13 @@ from app.services.take_deck import robar_cartas_del_mazo
 from app.sockets.socket_service import get_websocket_service
 from datetime import datetime
 from app.services.game_service import procesar_ultima_carta
-from app.services.game_status_service import build_complete_game_state
+from app.services.game_status_service import game_state_builder
+from app.services.game_context import load_game_context
+import logging
 
 
 router = APIRouter(prefix="/game", tags=["Games"])
+logger = logging.getLogger(__name__)
 
 def get_db():
     db = SessionLocal()
@@ -37,13 +40,12 @@ async def take_from_deck(
 ):
     """Endpoint para robar cartas del mazo regular"""
     
-    # Validar sala
-    room = db.query(Room).filter(Room.id == room_id).first()
-    if not room:
+    # Validar sala y juego (una sola query)
+    context = load_game_context(db, room_id, user_id)
+    if not context:
         raise HTTPException(status_code=404, detail="room_not_found")
     
-    # Validar juego
-    game = db.query(Game).filter(Game.id == room.id_game).first()
+    game = context.game
     if not game:
         raise HTTPException(status_code=404, detail="game_not_found")
     
@@ -51,7 +53,7 @@ async def take_from_deck(
     if game.player_turn_id != user_id:
         raise HTTPException(status_code=403, detail="not_your_turn")
     
-    print(f"🎴 Jugador {user_id} quiere robar {request.cantidad} carta(s)")
+    logger.debug("🎴 Jugador %s quiere robar %s carta(s)", user_id, request.cantidad)
     
     # Robar cartas
     drawn = await robar_cartas_del_mazo(db, game, user_id, request.cantidad)
@@ -72,7 +74,7 @@ async def take_from_deck(
         CardsXGame.is_in == CardState.DECK
     ).count()
     
-    print(f"✅ Robadas {len(drawn)} carta(s). Quedan {deck_remaining} en el mazo")
+    logger.debug("✅ Robadas %s carta(s). Quedan %s en el mazo", len(drawn), deck_remaining)
     
     # Preparar respuesta
     response = TakeDeckResponse(
@@ -84,7 +86,7 @@ async def take_from_deck(
     # Notificar vía WebSocket (opcional - si querés que otros vean que robó)
     players = db.query(Player).filter(Player.id_room == room_id).order_by(Player.order.asc()).all()
     
-    game_state = game_state = build_complete_game_state(db, game.id)
+    game_state = game_state_builder(game.id)
 
     ws_service = get_websocket_service()
         
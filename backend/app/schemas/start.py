@@ -1,6 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from typing import Optional
 
 class StartRequest(BaseModel):
     user_id: int
+    # Solo con SEEDED_DEALS_ENABLED: misma semilla, mismo reparto
+    seed: Optional[int] = Field(None, ge=0, lt=2**63)
 
     model_config = {"from_attributes": True}
\ No newline at end of file
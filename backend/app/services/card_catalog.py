@@ -0,0 +1,101 @@
+"""
+Catálogo de cartas para clientes que reciben los estados con cartas por id.
+
+La tabla `card` no cambia mientras corre el servidor (se carga con
+create_db.py), así que el catálogo se lee una vez, se serializa una vez y su
+versión es el hash del contenido: sirve de ETag fuerte y el cliente puede
+guardarlo indefinidamente y revalidar con If-None-Match.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Card
+
+logger = logging.getLogger(__name__)
+
+
+class CardCatalog:
+    """Catálogo de cartas serializado y versionado por contenido."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._body: Optional[bytes] = None
+        self._version: Optional[str] = None
+        self._by_id: Dict[int, Dict] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self._body is not None
+
+    def load(self, db: Session) -> None:
+        """Lee la tabla `card` si el catálogo todavía no está cargado."""
+        if self._body is not None:
+            return
+        with self._lock:
+            if self._body is not None:
+                return
+            cards: List[Dict] = [
+                {
+                    "id": card.id,
+                    "name": card.name,
+                    "description": card.description,
+                    "type": card.type.value if hasattr(card.type, "value") else card.type,
+                    "img_src": card.img_src,
+                }
+                for card in db.query(Card).order_by(Card.id).all()
+            ]
+            cards_json = json.dumps(cards, separators=(",", ":"), ensure_ascii=False)
+            version = hashlib.sha256(cards_json.encode("utf-8")).hexdigest()[:16]
+            self._by_id = {card["id"]: card for card in cards}
+            self._version = version
+            self._body = json.dumps(
+                {"version": version, "cards": cards},
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ).encode("utf-8")
+            logger.info(f"Card catalog loaded: {len(cards)} cards, version {version}")
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    @property
+    def etag(self) -> Optional[str]:
+        return f'"{self._version}"' if self._version else None
+
+    @property
+    def body(self) -> Optional[bytes]:
+        return self._body
+
+    def get(self, card_id: int) -> Optional[Dict]:
+        return self._by_id.get(card_id)
+
+    def invalidate(self) -> None:
+        """Descarta el catálogo (p.ej. después de recargar la tabla `card`)."""
+        with self._lock:
+            self._body = None
+            self._version = None
+            self._by_id = {}
+
+
+# Instancia global del CardCatalog
+_card_catalog: Optional[CardCatalog] = None
+
+
+def get_card_catalog() -> CardCatalog:
+    """
+    Obtiene la instancia global del CardCatalog (Singleton).
+
+    Returns:
+        CardCatalog instance
+    """
+    global _card_catalog
+    if _card_catalog is None:
+        _card_catalog = CardCatalog()
+    return _card_catalog
@@ -12,6 +12,7 @@ import logging
 from sqlalchemy.orm import Session
 from app.db import crud
 from app.db.models import ActionResult, ActionType
+from app.services.game_rules import NSF_CANCELLED, nsf_chain_result
 from app.sockets.socket_service import get_websocket_service
 
 logger = logging.getLogger(__name__)
@@ -57,17 +58,16 @@ async def handle_nsf_timeout(
         logger.info(f"📊 NSF jugadas en la cadena: {nsf_chain_len}")
         
         # 2. Calcular resultado según paridad
-        if nsf_chain_len % 2 != 0:
+        result_str = nsf_chain_result(nsf_chain_len)
+        if result_str == NSF_CANCELLED:
             # Impar → la acción se CANCELA
             final_result = ActionResult.CANCELLED      # YYY
             intention_result = ActionResult.CANCELLED  # XXX
-            result_str = "cancelled"
             logger.info("❌ Acción CANCELADA (NSF impar)")
         else:
             # Par (incluyendo 0) → la acción CONTINÚA
             final_result = ActionResult.SUCCESS     # YYY
             intention_result = ActionResult.CONTINUE  # XXX
-            result_str = "continue"
             logger.info("✅ Acción CONTINÚA (NSF par)")
         
         # 3. Actualizar registros en DB
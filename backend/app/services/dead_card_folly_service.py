@@ -20,6 +20,7 @@ from ..schemas.dead_card_folly_schema import (
 )
 from ..sockets.socket_service import get_websocket_service
 from ..services.game_status_service import build_complete_game_state
+from ..services.seat_ring import get_seat_rings
 
 logger = logging.getLogger(__name__)
 
@@ -361,25 +362,21 @@ class DeadCardFollyService:
         # - Entonces cada jugador RECIBE de su vecino derecho (quien le da a él)
         # - Por eso invertimos la dirección para encontrar de quién recibimos
         inverse_direction = Direction.RIGHT if direction == Direction.LEFT else Direction.LEFT
+        donors = get_seat_rings().ensure(self.db, room.id).rotation(inverse_direction)
         assignments = []
         
         for player_id, (action, card_give_id) in player_data_map.items():
             # Encontrar DE QUIÉN recibe (dirección inversa)
-            donor = crud.get_player_neighbor_by_direction(
-                self.db,
-                player_id=player_id,
-                room_id=room.id,
-                direction=inverse_direction  # ← Invertida!
-            )
+            donor_id = donors.get(player_id)
             
-            if not donor:
+            if donor_id is None:
                 logger.warning(f"No donor found for player {player_id}")
                 continue
             
             # Obtener la carta que el donor seleccionó (la que este jugador recibirá)
-            donor_data = player_data_map.get(donor.id)
+            donor_data = player_data_map.get(donor_id)
             if not donor_data:
-                logger.warning(f"No card selection found for donor {donor.id}")
+                logger.warning(f"No card selection found for donor {donor_id}")
                 continue
             
             card_receive_id = donor_data[1]  # El card_given_id del donor
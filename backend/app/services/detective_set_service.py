@@ -7,6 +7,7 @@ from ..db.models import (
     CardState, ActionType, ActionResult
 )
 from ..db import crud
+from . import game_rules
 from ..schemas.detective_set_schema import (
     SetType, PlayDetectiveSetRequest, addDetectiveToSetRequest, NextActionType, 
     NextAction, NextActionMetadata, SecretInfo, SET_MIN_CARDS, SET_ACTION_NAMES
@@ -16,20 +17,14 @@ from ..schemas.detective_set_schema import (
 class DetectiveSetService:
     """Servicio para manejar la lógica de bajar sets de detectives"""
     
-    # IDs de cartas detective
-    HARLEY_QUIN_CARD_ID = 4  
-    TOMMY_BERESFORD_CARD_ID = 8
-    TUPPENCE_BERESFORD_CARD_ID = 10
+    # IDs de cartas detective (ver game_rules)
+    HARLEY_QUIN_CARD_ID = game_rules.HARLEY_QUIN_CARD_ID
+    TOMMY_BERESFORD_CARD_ID = game_rules.TOMMY_BERESFORD_CARD_ID
+    TUPPENCE_BERESFORD_CARD_ID = game_rules.TUPPENCE_BERESFORD_CARD_ID
     
     # Mapeo de setType a id_card esperado
-    SET_CARD_IDS = {
-        SetType.POIROT: 11,           # Hercule Poirot
-        SetType.MARPLE: 6,            # Miss Marple
-        SetType.SATTERTHWAITE: 12,    # Mr Satterthwaite
-        SetType.PYNE: 7,              # Parker Pyne
-        SetType.EILEENBRENT: 9,       # Lady Eileen "Bundle" Brent
-        # BERESFORD es especial: acepta 8 (Tommy) o 10 (Tuppence)
-    }
+    # BERESFORD es especial: acepta 8 (Tommy) o 10 (Tuppence)
+    SET_CARD_IDS = game_rules.SET_CARD_IDS
     
     def __init__(self, db: Session):
         self.db = db
@@ -302,77 +297,16 @@ class DetectiveSetService:
         has_wildcard: bool
     ):
         """Valida que las cartas forman un set válido según el tipo"""
-        # Verificar cantidad mínima
-        min_cards = SET_MIN_CARDS[set_type]
-        if len(cards) < min_cards:
-            raise HTTPException(
-                status_code=400,
-                detail=f"{set_type.value} set requires at least {min_cards} cards"
-            )
-        
-        # Obtener los id_card de las cartas
         card_types = [card.id_card for card in cards]
-        
-        # Contar comodines
-        wildcard_count = card_types.count(self.HARLEY_QUIN_CARD_ID)
-        
-        # Validar que hasWildcard coincide con la realidad
-        if has_wildcard and wildcard_count == 0:
-            raise HTTPException(
-                status_code=400,
-                detail="hasWildcard is true but no Harley Quin card found"
-            )
-        
-        if not has_wildcard and wildcard_count > 0:
-            raise HTTPException(
-                status_code=400,
-                detail="Harley Quin found but hasWildcard is false"
-            )
-        
-        # Validación específica por tipo de set
-        if set_type == SetType.BERESFORD:
-            self._validate_beresford_set(card_types, wildcard_count)
-        else:
-            self._validate_regular_set(card_types, set_type, wildcard_count)
+        error = game_rules.set_combination_error(card_types, set_type, has_wildcard)
+        if error:
+            raise HTTPException(status_code=400, detail=error)
     
     def _validate_beresford_set(self, card_types: List[int], wildcard_count: int):
         """Valida set de Hermanos Beresford (caso especial)"""
-        non_wildcard = [c for c in card_types if c != self.HARLEY_QUIN_CARD_ID]
-        
-        # Debe tener al menos 2 cartas totales
-        if len(card_types) < 2:
-            raise HTTPException(
-                status_code=400,
-                detail="Beresford set requires at least 2 cards"
-            )
-        
-        # Casos válidos:
-        # 1. 2 iguales (Tommy + Tommy o Tuppence + Tuppence)
-        # 2. Tommy + Tuppence
-        # 3. 1 hermano + comodín
-        
-        tommy_count = non_wildcard.count(self.TOMMY_BERESFORD_CARD_ID)
-        tuppence_count = non_wildcard.count(self.TUPPENCE_BERESFORD_CARD_ID)
-        
-        valid = False
-        
-        # Caso 1: 2 o más del mismo hermano
-        if tommy_count >= 2 or tuppence_count >= 2:
-            valid = True
-        
-        # Caso 2: Tommy + Tuppence
-        if tommy_count >= 1 and tuppence_count >= 1:
-            valid = True
-        
-        # Caso 3: 1 hermano + comodín
-        if (tommy_count == 1 or tuppence_count == 1) and wildcard_count >= 1:
-            valid = True
-        
-        if not valid:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid Beresford set combination"
-            )
+        error = game_rules.beresford_set_error(card_types, wildcard_count)
+        if error:
+            raise HTTPException(status_code=400, detail=error)
     
     def _validate_regular_set(
         self, 
@@ -381,37 +315,9 @@ class DetectiveSetService:
         wildcard_count: int
     ):
         """Valida sets regulares (Poirot, Marple, Satterthwaite, Pyne, Eileen)"""
-        expected_card_id = self.SET_CARD_IDS[set_type]
-        
-        # Contar cartas del tipo esperado (excluyendo comodines)
-        matching_cards = [c for c in card_types if c == expected_card_id]
-        
-        # Total de cartas válidas = cartas correctas + comodines
-        total_valid = len(matching_cards) + wildcard_count
-        min_required = SET_MIN_CARDS[set_type]
-        
-        # Debe tener al menos 1 carta del tipo correcto (no solo comodines)
-        if len(matching_cards) < 1:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Set must contain at least 1 {set_type.value} card"
-            )
-        
-        # El total debe cumplir el mínimo
-        if total_valid < min_required:
-            raise HTTPException(
-                status_code=400,
-                detail=f"{set_type.value} set requires at least {min_required} valid cards"
-            )
-        
-        # No debe haber cartas de otros tipos
-        invalid_cards = [c for c in card_types 
-                        if c != expected_card_id and c != self.HARLEY_QUIN_CARD_ID]
-        if invalid_cards:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Set contains invalid cards for {set_type.value}"
-            )
+        error = game_rules.regular_set_error(card_types, set_type, wildcard_count)
+        if error:
+            raise HTTPException(status_code=400, detail=error)
     
     def _get_next_set_position(self, game_id: int, player_id: int) -> int:
         """Obtiene la siguiente posición disponible para un nuevo set del jugador"""
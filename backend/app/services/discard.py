@@ -4,6 +4,9 @@ from app.db.models import Room, CardsXGame, CardState, Game, ActionType, SourceP
 from app.db.crud import get_current_turn, create_parent_card_action, create_card_action
 from app.services.early_train_discard import early_train_discard_effect
 from typing import List
+import logging
+
+logger = logging.getLogger(__name__)
 
 async def descartar_cartas(db, game, user_id, ordered_player_cards):
     discarded = []
@@ -29,7 +32,7 @@ async def descartar_cartas(db, game, user_id, ordered_player_cards):
         CardsXGame.is_in == CardState.DISCARD
     ).count()
     
-    print(f"🔢 Próxima posición en descarte: {next_pos}")
+    logger.debug("🔢 Próxima posición en descarte: %s", next_pos)
     
     # Capture card IDs and prepare data before any deletion
     card_ids_to_process = [card.id_card for card in ordered_player_cards]
@@ -63,13 +66,14 @@ async def descartar_cartas(db, game, user_id, ordered_player_cards):
               player_id=user_id,
               action_type=ActionType.DISCARD,
               source_pile=SourcePile.DISCARD_PILE,
-              card_id=card.id_card,
+              card_id=card.id,
               position=card.position,
               result=ActionResult.SUCCESS,
-              parent_action_id=parent_action.id
+              parent_action_id=parent_action.id,
+              deferred=True
             )
 
-            print("Se descartó Early train to paddington, se descartan cartas del deck despues del discard")
+            logger.debug("Se descartó Early train to paddington, se descartan cartas del deck despues del discard")
         else:
           # Descartar la carta (modificar el objeto existente)
           card.is_in = CardState.DISCARD
@@ -86,13 +90,14 @@ async def descartar_cartas(db, game, user_id, ordered_player_cards):
               player_id=user_id,
               action_type=ActionType.DISCARD,
               source_pile=SourcePile.DISCARD_PILE,
-              card_id=card.id_card,
+              card_id=card.id,
               position=card.position,
               result=ActionResult.SUCCESS,
-              parent_action_id=parent_action.id
+              parent_action_id=parent_action.id,
+              deferred=True
           )
         
-        print(f"📤 Carta {card.id_card} → posición {card.position}")
+        logger.debug("📤 Carta %s → posición %s", card.id_card, card.position)
     
     # Flush changes to database but don't commit yet
     db.flush()
@@ -103,10 +108,10 @@ async def descartar_cartas(db, game, user_id, ordered_player_cards):
     
     # Se ejecuta el efecto de la early train si fue descartada
     if early_train_found:
-      print("🚂 Early Train to paddington descartada: ejecutando efecto que mueve 6 cartas del deck al discard.")
+      logger.debug("🚂 Early Train to paddington descartada: ejecutando efecto que mueve 6 cartas del deck al discard.")
       for i in range(1, early_train_counter + 1): 
         await early_train_discard_effect(db, game.id, user_id, room.id)
     
-    print(f"✅ Total descartado en orden: {card_ids_to_process}")
+    logger.debug("✅ Total descartado en orden: %s", card_ids_to_process)
     
     return discarded
\ No newline at end of file
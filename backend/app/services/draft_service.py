@@ -53,10 +53,11 @@ def pick_card_from_draft(db: Session, card_id: int, user_id: int) -> CardSummary
         player_id=user_id,
         action_type=ActionType.DRAW,
         source_pile=SourcePile.DRAFT_PILE,
-        card_id=draft_entry.id_card,
+        card_id=draft_entry.id,
         position=selected_pos,
         result=ActionResult.SUCCESS,
-        parent_action_id=parent_action.id
+        parent_action_id=parent_action.id,
+        deferred=True
     )
 
     # Mover la carta a la mano del jugador
@@ -80,10 +81,11 @@ def pick_card_from_draft(db: Session, card_id: int, user_id: int) -> CardSummary
             player_id=user_id,  # Who triggered the replenishment
             action_type=ActionType.DRAW,  # Moving from deck to draft
             source_pile=SourcePile.DRAFT_PILE,
-            card_id=top_deck.id_card,
+            card_id=top_deck.id,
             position=top_deck.position,
             result=ActionResult.SUCCESS,
-            parent_action_id=parent_action.id
+            parent_action_id=parent_action.id,
+            deferred=True
         )
         
         top_deck.is_in = 'DRAFT'
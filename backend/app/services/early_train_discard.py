@@ -63,10 +63,11 @@ async def early_train_discard_effect(db: Session, game_id: int, player_id: int,
             player_id=player_id,
             action_type=ActionType.DISCARD,
             source_pile=SourcePile.DISCARD_PILE,
-            card_id=card.id_card,
+            card_id=card.id,
             position=card.position,
             result=ActionResult.SUCCESS,
-            parent_action_id=parent_action.id
+            parent_action_id=parent_action.id,
+            deferred=True
         )
 
         logger.debug(f"early_train: moved card id_card={card.id_card} old_pos={old_pos} -> new_pos={card.position}")
@@ -0,0 +1,231 @@
+"""
+Archivado de partidas terminadas (split hot / cold).
+
+turn, cardsXgame, actions_per_turn y social_disgrace_player guardan todas las
+filas de todas las partidas, y las salas en FINISH conviven con las activas:
+los índices y los scans crecen sin límite aunque solo importen las partidas en
+curso. El job de archivado mueve cada partida terminada a una fila de
+`game_archive` (JSON comprimido con zlib) y borra sus filas vivas, así el
+working set queda proporcional a las partidas activas.
+
+Política de retención (ver config):
+- ARCHIVE_AFTER_MINUTES: cuánto tiempo sigue "caliente" una partida en FINISH
+  (medido desde el último turno) antes de archivarse.
+- ARCHIVE_RETENTION_DAYS: cuántos días se guarda el archivo; 0 = para siempre.
+
+Room, Game y Player no se mueven: son una fila por partida / jugador y el
+listado de salas ya filtra las FINISH.
+
+El historial se lee con load_game_history(), que usa el archivo si existe y
+las tablas vivas si la partida todavía no se archivó.
+"""
+
+import enum
+import json
+import logging
+import zlib
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models import (
+    ActionsPerTurn,
+    CardsXGame,
+    GameArchive,
+    Room,
+    RoomStatus,
+    SocialDisgracePlayer,
+    Turn,
+)
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMAT_VERSION = 1
+
+# Secciones del archivo -> tabla viva, en el orden en que se borran
+# (las acciones referencian turnos y cartas, así que van primero).
+_SECTIONS = (
+    ("actions", ActionsPerTurn),
+    ("social_disgrace", SocialDisgracePlayer),
+    ("cards", CardsXGame),
+    ("turns", Turn),
+)
+
+
+def _jsonable(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _dump_rows(db: Session, model, game_id: int) -> List[Dict]:
+    """Filas de la partida como dicts planos (sin pasar por el ORM)."""
+    table = model.__table__
+    rows = db.execute(
+        select(table).where(table.c.id_game == game_id).order_by(table.c.id)
+    ).mappings()
+    return [{key: _jsonable(value) for key, value in row.items()} for row in rows]
+
+
+def _live_history(db: Session, game_id: int) -> Dict[str, List[Dict]]:
+    return {name: _dump_rows(db, model, game_id) for name, model in _SECTIONS}
+
+
+def encode_payload(history: Dict) -> bytes:
+    """Serializa el historial de una partida a JSON comprimido."""
+    raw = json.dumps(history, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw, 9)
+
+
+def decode_payload(payload: bytes) -> Dict:
+    return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+
+def archive_game(db: Session, game_id: int) -> Optional[GameArchive]:
+    """
+    Archiva una partida terminada y borra sus filas de las tablas vivas.
+
+    No hace commit: el llamador decide el límite de la transacción.
+
+    Args:
+        db: Sesión de base de datos
+        game_id: ID del juego
+
+    Returns:
+        GameArchive creado, o None si la partida no está terminada o ya
+        estaba archivada
+    """
+    room = db.query(Room).filter(Room.id_game == game_id).first()
+    if room is None or room.status != RoomStatus.FINISH:
+        return None
+    if db.get(GameArchive, game_id) is not None:
+        return None
+
+    history = _live_history(db, game_id)
+    finished_at = db.query(func.max(Turn.start_time)).filter(Turn.id_game == game_id).scalar()
+
+    archive = GameArchive(
+        id_game=game_id,
+        room_id=room.id,
+        format_version=ARCHIVE_FORMAT_VERSION,
+        finished_at=finished_at,
+        turns_count=len(history["turns"]),
+        cards_count=len(history["cards"]),
+        actions_count=len(history["actions"]),
+        payload=encode_payload(history),
+    )
+    db.add(archive)
+
+    # actions_per_turn se referencia a sí misma: MySQL chequea la FK fila por
+    # fila, así que primero se cortan los vínculos y después se borra.
+    db.execute(
+        update(ActionsPerTurn)
+        .where(ActionsPerTurn.id_game == game_id)
+        .values(parent_action_id=None, triggered_by_action_id=None)
+    )
+    for _, model in _SECTIONS:
+        db.query(model).filter(model.id_game == game_id).delete(synchronize_session=False)
+
+    logger.info(
+        "archived game=%s room=%s turns=%d cards=%d actions=%d bytes=%d",
+        game_id, room.id, archive.turns_count, archive.cards_count,
+        archive.actions_count, len(archive.payload),
+    )
+    return archive
+
+
+def find_archivable_games(db: Session, older_than: timedelta, limit: int = 100) -> List[int]:
+    """
+    Partidas en FINISH, sin archivar, cuyo último turno empezó hace más de
+    `older_than` (o que no tienen turnos).
+    """
+    cutoff = datetime.now() - older_than
+    last_turn = func.max(Turn.start_time)
+    rows = (
+        db.query(Room.id_game)
+        .outerjoin(Turn, Turn.id_game == Room.id_game)
+        .outerjoin(GameArchive, GameArchive.id_game == Room.id_game)
+        .filter(
+            Room.status == RoomStatus.FINISH,
+            Room.id_game.isnot(None),
+            GameArchive.id_game.is_(None),
+        )
+        .group_by(Room.id_game)
+        .having((last_turn.is_(None)) | (last_turn < cutoff))
+        .order_by(Room.id_game)
+        .limit(limit)
+        .all()
+    )
+    return [row[0] for row in rows]
+
+
+def archive_finished_games(db: Session, older_than: timedelta, limit: int = 100) -> List[int]:
+    """
+    Archiva las partidas terminadas elegibles, una transacción por partida.
+
+    Returns:
+        IDs de los juegos archivados
+    """
+    archived = []
+    for game_id in find_archivable_games(db, older_than, limit):
+        try:
+            if archive_game(db, game_id) is not None:
+                db.commit()
+                archived.append(game_id)
+        except Exception:
+            db.rollback()
+            logger.exception("archive failed game=%s", game_id)
+    return archived
+
+
+def purge_expired_archives(db: Session, retention_days: int) -> int:
+    """
+    Borra los archivos más viejos que `retention_days`. 0 o menos = no borrar.
+
+    Returns:
+        Cantidad de archivos borrados
+    """
+    if retention_days <= 0:
+        return 0
+    cutoff = datetime.now() - timedelta(days=retention_days)
+    deleted = (
+        db.query(GameArchive)
+        .filter(GameArchive.archived_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    if deleted:
+        logger.info("purged %d expired game archive(s)", deleted)
+    return deleted
+
+
+def load_game_history(db: Session, game_id: int) -> Optional[Dict]:
+    """
+    Historial completo de una partida (turnos, cartas, acciones, desgracia
+    social), desde el archivo si existe o desde las tablas vivas si no.
+
+    Returns:
+        Dict con game_id, archived y una lista por sección, o None si la
+        partida no existe en ninguno de los dos lados
+    """
+    archive = db.get(GameArchive, game_id)
+    if archive is not None:
+        history = decode_payload(archive.payload)
+        history.update(
+            game_id=game_id,
+            room_id=archive.room_id,
+            archived=True,
+            archived_at=_jsonable(archive.archived_at),
+        )
+        return history
+
+    room = db.query(Room).filter(Room.id_game == game_id).first()
+    if room is None:
+        return None
+    history = _live_history(db, game_id)
+    history.update(game_id=game_id, room_id=room.id, archived=False, archived_at=None)
+    return history
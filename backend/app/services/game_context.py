@@ -0,0 +1,112 @@
+"""
+Contexto de partida para validar acciones.
+
+Casi todas las rutas de juego repiten el mismo prólogo: sala por id, juego por
+room.id_game, jugador que actúa (filtrado por sala), turno IN_PROGRESS y
+chequeo de game.player_turn_id. load_game_context resuelve todo eso con una
+sola query (outer joins) y lo memoiza en la Session del request
+(`db.info`), así los servicios que se llaman después (p.ej.
+NotSoFastService) lo reutilizan sin volver a consultar.
+
+Cada router tiene su propio get_db por request, así que la Session ES el
+scope del request: memoizar ahí evita abrir una segunda sesión desde otra
+dependencia. El memo se descarta en cada commit/rollback, porque el turno
+activo puede haber cambiado.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import and_, event
+from sqlalchemy.orm import Session
+
+from app.db.models import Game, Player, Room, Turn, TurnStatus
+
+_CACHE_KEY = "game_context"
+
+
+@dataclass
+class GameContext:
+    """
+    Objetos resueltos para una acción sobre una sala.
+
+    Attributes:
+        room: Sala
+        game: Juego de la sala (None si no arrancó)
+        actor: Jugador que actúa, solo si pertenece a la sala
+        current_turn: Turno IN_PROGRESS del juego (de cualquier jugador)
+    """
+    room: Room
+    game: Optional[Game] = None
+    actor: Optional[Player] = None
+    current_turn: Optional[Turn] = None
+
+    @property
+    def is_actor_turn(self) -> bool:
+        """True si el juego indica que es el turno del actor."""
+        return (
+            self.game is not None
+            and self.actor is not None
+            and self.game.player_turn_id == self.actor.id
+        )
+
+    @property
+    def actor_turn(self) -> Optional[Turn]:
+        """Turno IN_PROGRESS del actor (None si el turno activo es de otro)."""
+        if self.current_turn is not None and self.actor is not None \
+                and self.current_turn.player_id == self.actor.id:
+            return self.current_turn
+        return None
+
+
+def _cache(db: Session) -> Optional[dict]:
+    info = getattr(db, "info", None)
+    if not isinstance(info, dict):
+        return None
+    return info.setdefault(_CACHE_KEY, {})
+
+
+def load_game_context(db: Session, room_id: int, actor_id: Optional[int] = None) -> Optional[GameContext]:
+    """
+    Carga sala, juego, actor y turno activo en una sola query.
+
+    Args:
+        db: Sesión del request
+        room_id: ID de la sala
+        actor_id: ID del jugador que actúa (opcional)
+
+    Returns:
+        GameContext, o None si la sala no existe
+    """
+    cache = _cache(db)
+    key = (room_id, actor_id)
+    if cache is not None and key in cache:
+        return cache[key]
+
+    row = (
+        db.query(Room, Game, Player, Turn)
+        .outerjoin(Game, Game.id == Room.id_game)
+        .outerjoin(Player, and_(Player.id_room == Room.id, Player.id == actor_id))
+        .outerjoin(Turn, and_(Turn.id_game == Room.id_game, Turn.status == TurnStatus.IN_PROGRESS))
+        .filter(Room.id == room_id)
+        .order_by(Turn.id.desc())
+        .first()
+    )
+    context = GameContext(*row) if row is not None else None
+
+    if cache is not None:
+        cache[key] = context
+    return context
+
+
+def invalidate_game_context(db: Session) -> None:
+    """Descarta los contextos memoizados (p.ej. después de cambiar de turno)."""
+    cache = _cache(db)
+    if cache is not None:
+        cache.clear()
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_soft_rollback")
+def _clear_on_transaction_end(session, *args):
+    session.info.pop(_CACHE_KEY, None)
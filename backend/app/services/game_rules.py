@@ -0,0 +1,316 @@
+"""
+Reglas del juego sin base de datos: validación de sets de detectives, qué se
+puede cancelar con NSF, resultado de una cadena NSF y reparto inicial.
+
+Los servicios y la ruta de inicio las aplican sobre filas del ORM; los bots
+(app/bots/) y el simulador (app/simulator/) sobre su propio estado en memoria,
+así las tres cosas juegan con las mismas reglas.
+
+Los ids de carta son los de la tabla `card` (ver scripts/carga-datos.sql).
+"""
+
+import random
+import secrets
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.schemas.detective_set_schema import SET_MIN_CARDS, SetType
+
+# ---------- cartas ----------
+
+HARLEY_QUIN_CARD_ID = 4
+TOMMY_BERESFORD_CARD_ID = 8
+TUPPENCE_BERESFORD_CARD_ID = 10
+EILEEN_BRENT_CARD_ID = 9
+NOT_SO_FAST_CARD_ID = 13
+CARDS_OFF_THE_TABLE_CARD_ID = 24
+
+# Carta que forma cada set (Beresford acepta a los dos hermanos)
+SET_CARD_IDS: Dict[SetType, int] = {
+    SetType.POIROT: 11,           # Hercule Poirot
+    SetType.MARPLE: 6,            # Miss Marple
+    SetType.SATTERTHWAITE: 12,    # Mr Satterthwaite
+    SetType.PYNE: 7,              # Parker Pyne
+    SetType.EILEENBRENT: EILEEN_BRENT_CARD_ID,
+}
+SET_DETECTIVE_IDS: Dict[SetType, frozenset] = {
+    **{set_type: frozenset((card_id,)) for set_type, card_id in SET_CARD_IDS.items()},
+    SetType.BERESFORD: frozenset((TOMMY_BERESFORD_CARD_ID, TUPPENCE_BERESFORD_CARD_ID)),
+}
+
+# ---------- sets de detectives ----------
+
+
+@dataclass(frozen=True)
+class SetPlay:
+    """Un set de detectives que se puede bajar desde la mano."""
+    set_type: SetType
+    cards: List[int]  # CardsXGame.id
+    has_wildcard: bool
+
+
+def beresford_set_error(card_types: Sequence[int], wildcard_count: int) -> Optional[str]:
+    """
+    Valida un set de hermanos Beresford: dos iguales, Tommy + Tuppence o un
+    hermano + comodín.
+
+    Returns:
+        Mensaje de error, o None si el set es válido
+    """
+    if len(card_types) < 2:
+        return "Beresford set requires at least 2 cards"
+
+    non_wildcard = [c for c in card_types if c != HARLEY_QUIN_CARD_ID]
+    tommy_count = non_wildcard.count(TOMMY_BERESFORD_CARD_ID)
+    tuppence_count = non_wildcard.count(TUPPENCE_BERESFORD_CARD_ID)
+
+    if tommy_count >= 2 or tuppence_count >= 2:
+        return None
+    if tommy_count >= 1 and tuppence_count >= 1:
+        return None
+    if (tommy_count == 1 or tuppence_count == 1) and wildcard_count >= 1:
+        return None
+    return "Invalid Beresford set combination"
+
+
+def regular_set_error(card_types: Sequence[int], set_type: SetType, wildcard_count: int) -> Optional[str]:
+    """
+    Valida un set de un solo detective (Poirot, Marple, Satterthwaite, Pyne,
+    Eileen): al menos una carta del detective, el mínimo contando comodines y
+    ninguna carta de otro tipo.
+
+    Returns:
+        Mensaje de error, o None si el set es válido
+    """
+    expected_card_id = SET_CARD_IDS[set_type]
+    matching = sum(1 for c in card_types if c == expected_card_id)
+    min_required = SET_MIN_CARDS[set_type]
+
+    if matching < 1:
+        return f"Set must contain at least 1 {set_type.value} card"
+    if matching + wildcard_count < min_required:
+        return f"{set_type.value} set requires at least {min_required} valid cards"
+    if any(c != expected_card_id and c != HARLEY_QUIN_CARD_ID for c in card_types):
+        return f"Set contains invalid cards for {set_type.value}"
+    return None
+
+
+def set_combination_error(card_types: Sequence[int], set_type: SetType, has_wildcard: bool) -> Optional[str]:
+    """
+    Valida que las cartas (por `card_id`) formen un set del tipo pedido.
+
+    Args:
+        card_types: id_card de cada carta del set
+        set_type: Tipo de set que se quiere bajar
+        has_wildcard: Si el cliente declaró un Harley Quin en el set
+
+    Returns:
+        Mensaje de error (el detail del 400), o None si el set es válido
+    """
+    min_cards = SET_MIN_CARDS[set_type]
+    if len(card_types) < min_cards:
+        return f"{set_type.value} set requires at least {min_cards} cards"
+
+    wildcard_count = sum(1 for c in card_types if c == HARLEY_QUIN_CARD_ID)
+    if has_wildcard and wildcard_count == 0:
+        return "hasWildcard is true but no Harley Quin card found"
+    if not has_wildcard and wildcard_count > 0:
+        return "Harley Quin found but hasWildcard is false"
+
+    if set_type == SetType.BERESFORD:
+        return beresford_set_error(card_types, wildcard_count)
+    return regular_set_error(card_types, set_type, wildcard_count)
+
+
+def is_valid_set(card_types: Sequence[int], set_type: SetType) -> bool:
+    """set_combination_error con hasWildcard tal como viene en las cartas."""
+    return set_combination_error(card_types, set_type, HARLEY_QUIN_CARD_ID in card_types) is None
+
+
+def find_detective_sets(hand: List[Dict]) -> List[SetPlay]:
+    """
+    Sets legales que se pueden bajar con la mano, uno por tipo: todas las
+    cartas del tipo y, si no alcanzan, más un comodín.
+
+    Args:
+        hand: cartas con `id` y `card_id`, como vienen en `game_state_private.mano`
+
+    Returns:
+        Lista de SetPlay, los más grandes primero
+    """
+    plays: List[SetPlay] = []
+    wildcards = [card for card in hand if card["card_id"] == HARLEY_QUIN_CARD_ID]
+
+    for set_type, allowed in SET_DETECTIVE_IDS.items():
+        detectives = [card for card in hand if card["card_id"] in allowed]
+        if not detectives:
+            continue
+        # Todas las cartas del tipo, sin comodín y con uno
+        for extra in ([], wildcards[:1]):
+            cards = detectives + extra
+            if is_valid_set([card["card_id"] for card in cards], set_type):
+                plays.append(SetPlay(set_type, [card["id"] for card in cards], bool(extra)))
+                break
+
+    plays.sort(key=lambda play: len(play.cards), reverse=True)
+    return plays
+
+
+# ---------- Not So Fast ----------
+
+NSF_CONTINUE = "continue"
+NSF_CANCELLED = "cancelled"
+
+
+def is_set_cancellable(card_types: Sequence[int]) -> bool:
+    """Un set con Tommy y Tuppence no se puede cancelar con NSF."""
+    return not (TOMMY_BERESFORD_CARD_ID in card_types and TUPPENCE_BERESFORD_CARD_ID in card_types)
+
+
+def is_event_cancellable(card_type: int) -> bool:
+    """Todos los eventos se pueden cancelar salvo Cards off the table."""
+    return card_type != CARDS_OFF_THE_TABLE_CARD_ID
+
+
+def nsf_chain_result(chain_len: int) -> str:
+    """
+    Resultado de una ventana NSF según cuántos NSF se jugaron: impar cancela
+    la acción, par (incluido 0) la deja seguir.
+
+    Returns:
+        NSF_CANCELLED o NSF_CONTINUE (el `final_result` de nsf_counter_complete)
+    """
+    return NSF_CANCELLED if chain_len % 2 != 0 else NSF_CONTINUE
+
+
+# ---------- reparto ----------
+
+HAND_GAME_CARDS = 5
+HAND_INSTANT_CARDS = 1
+SECRETS_PER_PLAYER = 3
+DRAFT_SIZE = 3
+# Desde esta cantidad de jugadores hay cómplice
+ACCOMPLICE_MIN_PLAYERS = 5
+
+MURDERER_SECRET_NAME = "You are the Murderer!!"
+ACCOMPLICE_SECRET_NAME = "You are the Accomplice!"
+NOT_DEALT_NAMES = frozenset(('Card Back', 'Murderer Escapes!', 'Secret Front'))
+TWO_PLAYER_EXCLUDED_NAMES = frozenset(('Point your suspicions', 'Blackmailed'))
+
+# Valores de CardType (es un str Enum, así que comparan igual con el miembro)
+GAME_CARD_TYPES = ("EVENT", "DEVIUOS", "DETECTIVE")
+INSTANT_CARD_TYPES = ("INSTANT",)
+SECRET_CARD_TYPE = "SECRET"
+
+
+# Entra en un BIGINT con signo (Game.seed)
+GAME_SEED_BITS = 63
+
+
+def new_game_seed() -> int:
+    """Semilla de reparto impredecible: con ella se reconstruyen todas las manos."""
+    return secrets.randbits(GAME_SEED_BITS)
+
+
+def game_rng(seed: int) -> random.Random:
+    """RNG de una partida: misma semilla, mismo reparto y mismo mazo."""
+    return random.Random(seed)
+
+
+@dataclass
+class InitialDeal:
+    """
+    Reparto de una partida, por asiento (el orden de los jugadores).
+
+    Las cartas son las mismas filas del catálogo que recibió deal_cards (una
+    referencia por copia física).
+    """
+    hands: List[List[Any]]
+    secrets: List[List[Any]]
+    draft: List[Any]
+    discard: Optional[Any]
+    deck: List[Any]
+    murderer: int
+    accomplice: Optional[int]
+
+
+def _pick_cards(catalog: Sequence[Any], card_types: Sequence[str], count: int,
+                excluded: frozenset, rng) -> List[Any]:
+    pool: List[Any] = []
+    for card in catalog:
+        if card.type in card_types and card.name not in excluded:
+            pool.extend([card] * card.qty)
+    # Igual que mezclar el pozo y tomar las primeras `count`, sin mezclarlo entero
+    return rng.sample(pool, min(count, len(pool)))
+
+
+def deal_cards(catalog: Sequence[Any], num_players: int, rng=random) -> InitialDeal:
+    """
+    Reparte una partida: asesino (y cómplice con 5 o más), 5 cartas de juego
+    + 1 instantánea y 3 secretos por jugador, 3 cartas de draft, la primera
+    del descarte y el mazo con lo que queda.
+
+    Cada mano, secreto y draft se saca del catálogo completo; al mazo se le
+    descuenta una copia de cada carta repartida en manos y draft.
+
+    Args:
+        catalog: Filas de `card` (cualquier objeto con id, name, type y qty)
+        num_players: Jugadores de la partida
+        rng: random.Random (o el módulo random) con el que se mezcla
+
+    Returns:
+        InitialDeal
+    """
+    seats = list(range(num_players))
+    rng.shuffle(seats)
+    murderer = seats[0]
+    accomplice = seats[1] if num_players >= ACCOMPLICE_MIN_PLAYERS else None
+
+    murderer_card = next((c for c in catalog if c.name == MURDERER_SECRET_NAME), None)
+    accomplice_card = (
+        next((c for c in catalog if c.name == ACCOMPLICE_SECRET_NAME), None)
+        if accomplice is not None else None
+    )
+
+    excluded = NOT_DEALT_NAMES | {MURDERER_SECRET_NAME, ACCOMPLICE_SECRET_NAME}
+    if num_players == 2:
+        excluded |= TWO_PLAYER_EXCLUDED_NAMES
+
+    hands: List[List[Any]] = []
+    secrets: List[List[Any]] = []
+    for seat in range(num_players):
+        hands.append(
+            _pick_cards(catalog, GAME_CARD_TYPES, HAND_GAME_CARDS, excluded, rng)
+            + _pick_cards(catalog, INSTANT_CARD_TYPES, HAND_INSTANT_CARDS, excluded, rng)
+        )
+
+        player_secrets: List[Any] = []
+        if seat == murderer and murderer_card:
+            player_secrets.append(murderer_card)
+        if seat == accomplice and accomplice_card:
+            player_secrets.append(accomplice_card)
+        missing = SECRETS_PER_PLAYER - len(player_secrets)
+        if missing > 0:
+            player_secrets.extend(_pick_cards(catalog, (SECRET_CARD_TYPE,), missing, excluded, rng))
+        secrets.append(player_secrets)
+
+    draft = _pick_cards(catalog, GAME_CARD_TYPES, DRAFT_SIZE, excluded, rng)
+
+    deck_excluded = frozenset(('Card Back', 'Murderer Escapes!'))
+    if num_players == 2:
+        deck_excluded |= TWO_PLAYER_EXCLUDED_NAMES
+    deck: List[Any] = []
+    for card in catalog:
+        if card.type != SECRET_CARD_TYPE and card.name not in deck_excluded:
+            deck.extend([card] * card.qty)
+
+    # Lo repartido sale del mazo (una copia por carta)
+    for dealt in [card for hand in hands for card in hand] + draft:
+        for idx, card in enumerate(deck):
+            if card.id == dealt.id:
+                deck.pop(idx)
+                break
+
+    rng.shuffle(deck)
+    discard = deck.pop(0) if deck else None
+    return InitialDeal(hands, secrets, draft, discard, deck, murderer, accomplice)
@@ -10,6 +10,11 @@ from datetime import datetime
 from ..db import crud
 from ..services.social_disgrace_service import get_players_in_social_disgrace
 from ..db import models
+from ..services.lobby_directory import get_lobby_directory
+from ..services.game_tracker import get_game_tracker, get_game_trackers
+from ..services.seat_ring import get_seat_rings
+from ..sockets.frames import get_state_frames
+from ..sockets.event_log import get_room_event_logs
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +50,11 @@ async def finalizar_partida(game_id: int, winners: List[Dict]):
         room.status = RoomStatus.FINISH
         db.add(room)
         db.commit()
+        get_lobby_directory().remove_room(room.id)
+        get_game_trackers().discard(game_id)
+        get_seat_rings().invalidate(room.id)
+        get_state_frames().discard_room(room.id)
+        get_room_event_logs().discard_room(room.id)
         logger.info(f"Persistida partida {game_id} como terminada.")
     finally:
         db.close()
@@ -64,38 +74,46 @@ async def procesar_ultima_carta(game_id: int, room_id: int, game_state: Dict):
         jugadores_info = game_state.get("jugadores", [])
 
         jugadores_map = {j["player_id"]: j for j in jugadores_info}
-        logger.info(f"🔍 Estados privados disponibles: {list(estados_privados.keys())}")
-        
-        for player_id, estado_privado in estados_privados.items():
-            secretos = estado_privado.get("secretos", [])
-            player_info = jugadores_map.get(player_id, {})
-            logger.info(f"🔍 Player {player_id} ({player_info.get('name', 'Unknown')}): {len(secretos)} secretos")
+        logger.debug("🔍 Estados privados disponibles: %s", list(estados_privados.keys()))
+
+        # Con tracker los roles ya se conocen: no hace falta recorrer secretos
+        tracker = get_game_tracker(game_id)
+        if tracker is not None:
+            if tracker.murderer_id is not None:
+                winners.append(tracker.player_entry(tracker.murderer_id, "murderer"))
+            if tracker.accomplice_id is not None:
+                winners.append(tracker.player_entry(tracker.accomplice_id, "accomplice"))
+        else:
+            for player_id, estado_privado in estados_privados.items():
+                secretos = estado_privado.get("secretos", [])
+                player_info = jugadores_map.get(player_id, {})
+                logger.debug("🔍 Player %s (%s): %s secretos", player_id, player_info.get('name', 'Unknown'), len(secretos))
             
-            for secret in secretos:
-                secret_name = secret.get("name", "")
-                logger.info(f"  - Secret: {secret_name}")
-                if secret_name == "You are the Murderer!!":
-                    winners.append({
-                        "role": "murderer",
-                        "player_id": player_id,
-                        "name": player_info.get("name", "Unknown"),
-                        "avatar_src": player_info.get("avatar_src", "")
-                    })
-                    logger.info(f"🔪 Asesino encontrado: {player_info.get('name')} (ID: {player_id})")
-                elif secret_name == "You are the Accomplice!":
-                    winners.append({
-                        "role": "accomplice",
-                        "player_id": player_id,
-                        "name": player_info.get("name", "Unknown"),
-                        "avatar_src": player_info.get("avatar_src", "")
-                    })
-                    logger.info(f"🤝 Cómplice encontrado: {player_info.get('name')} (ID: {player_id})")
+                for secret in secretos:
+                    secret_name = secret.get("name", "")
+                    logger.debug("  - Secret: %s", secret_name)
+                    if secret_name == "You are the Murderer!!":
+                        winners.append({
+                            "role": "murderer",
+                            "player_id": player_id,
+                            "name": player_info.get("name", "Unknown"),
+                            "avatar_src": player_info.get("avatar_src", "")
+                        })
+                        logger.info(f"🔪 Asesino encontrado: {player_info.get('name')} (ID: {player_id})")
+                    elif secret_name == "You are the Accomplice!":
+                        winners.append({
+                            "role": "accomplice",
+                            "player_id": player_id,
+                            "name": player_info.get("name", "Unknown"),
+                            "avatar_src": player_info.get("avatar_src", "")
+                        })
+                        logger.info(f"🤝 Cómplice encontrado: {player_info.get('name')} (ID: {player_id})")
 
         if not winners:
             logger.error(f"⚠️ No se encontraron ganadores!")
             logger.error(f"Estados privados: {estados_privados}")
         else:
-            print(f"\n✅ Ganadores identificados: {winners}")
+            logger.debug("✅ Ganadores identificados: %s", winners)
         
         # Mark room as finished in database
         await finalizar_partida(game_id, winners)
@@ -124,7 +142,7 @@ def join_game_logic(db: Session, room_id: int, player_data: dict):
         # Get current players in the room
         current_players = crud.list_players_by_room(db, room_id)
 
-        print(current_players)
+        logger.debug("current_players=%s", current_players)
 
         # Calculate next order for players
         next_order = len(current_players) + 1
@@ -154,6 +172,10 @@ def join_game_logic(db: Session, room_id: int, player_data: dict):
         
         # Get updated list of players
         updated_players = crud.list_players_by_room(db, room_id)
+
+        # Actualizar el directorio del lobby (players_joined / disponibilidad)
+        get_lobby_directory().upsert_room(room, updated_players)
+        get_seat_rings().invalidate(room_id)
         
         return {
             "success": True,
@@ -163,24 +185,20 @@ def join_game_logic(db: Session, room_id: int, player_data: dict):
         }
     
     except Exception as e:
-        print(f"Error in join_game_logic: {e}")
+        logger.error("Error in join_game_logic: %s", e)
         return {"success": False, "error": "internal_error"}
 
 
 async def actualizar_turno(db, game):
-    room = db.query(Room).filter(Room.id_game == game.id).first()
-    players = (
-        db.query(Player)
-        .filter(Player.id_room == room.id)
-        .order_by(Player.order)
-        .all()
-    )
-    ids = [p.id for p in players]
+    tracker = get_game_tracker(game.id)
+    if tracker is not None:
+        room_id = tracker.room_id
+    else:
+        room_id = db.query(Room).filter(Room.id_game == game.id).first().id
+    ring = get_seat_rings().ensure(db, room_id)
 
-    if game.player_turn_id in ids:
-        idx = ids.index(game.player_turn_id)
-        next_idx = (idx + 1) % len(ids)
-        game.player_turn_id = ids[next_idx]
+    if game.player_turn_id in ring:
+        game.player_turn_id = ring.next(game.player_turn_id) or game.player_turn_id
         db.commit()
 
 async def win_for_reveal(
@@ -199,6 +217,26 @@ async def win_for_reveal(
     Returns:
         True si la partida termino, false si continua.
     """
+    tracker = get_game_tracker(game_id)
+    if tracker is not None:
+        # Camino O(1): el tracker ya sabe cuál es el secreto del asesino
+        if not tracker.is_murderer_secret(revealed_card.id):
+            return False
+        losers_ids = {revealed_card.player_id, tracker.accomplice_id}
+        winners = [
+            tracker.player_entry(player_id, "detective")
+            for player_id in tracker.players
+            if player_id not in losers_ids
+        ]
+        await _end_game_with_winners(
+            db=db,
+            game_id=game_id,
+            room_id=room_id,
+            winners=winners,
+            reason="murderer_caught"
+        )
+        return True
+
     #Obtener info de la carta revelada
     card = db.query(Card).filter(Card.id == revealed_card.id_card).first()
     
@@ -302,6 +340,11 @@ async def _end_game_with_winners(
     room.status = RoomStatus.FINISH
     db.add(room)
     db.commit()
+    get_lobby_directory().remove_room(room_id)
+    get_game_trackers().discard(game_id)
+    get_seat_rings().invalidate(room_id)
+    get_state_frames().discard_room(room_id)
+    get_room_event_logs().discard_room(room_id)
     
     #Emitir evento game_ended por websocket
     ws_service = get_websocket_service()
@@ -319,11 +362,15 @@ async def win_for_total_disgrace(db: Session, game_id: int) -> bool:
     Returns:
         True si el juego terminó, False si no.
     """
-    logger.debug(f"Checking 'TOTAL_DISGRACE' win condition for game {game_id}...")
+    tracker = get_game_tracker(game_id)
+    if tracker is not None:
+        return await _win_for_total_disgrace_tracked(db, tracker)
+
+    logger.debug("Checking 'TOTAL_DISGRACE' win condition for game %s...", game_id)
     fresh_db = SessionLocal()
     
     try:
-        logger.debug(f"Checking 'TOTAL_DISGRACE' win condition for game {game_id}...")
+        logger.debug("Checking 'TOTAL_DISGRACE' win condition for game %s...", game_id)
         
         room = fresh_db.query(models.Room).filter(models.Room.id_game == game_id).first() # <-- USA fresh_db
         if not room:
@@ -349,7 +396,7 @@ async def win_for_total_disgrace(db: Session, game_id: int) -> bool:
         if accomplice_id:
             villain_ids.add(accomplice_id)
 
-        logger.debug(f"Villain IDs for game {game_id}: {villain_ids}")
+        logger.debug("Villain IDs for game %s: %s", game_id, villain_ids)
 
         # Encontrar a todos los jugadores ---
         all_players = fresh_db.query(models.Player).filter(models.Player.id_room == room.id).all()
@@ -361,7 +408,7 @@ async def win_for_total_disgrace(db: Session, game_id: int) -> bool:
         disgraced_players = get_players_in_social_disgrace(fresh_db, game_id)
         disgraced_player_ids = {p['player_id'] for p in disgraced_players}
         
-        logger.warning(f"DEBUG (win_for_total_disgrace): Jugadores en desgracia (leído por sesión fresca): {disgraced_player_ids}")
+        logger.debug("(win_for_total_disgrace) Jugadores en desgracia (leído por sesión fresca): %s", disgraced_player_ids)
 
         # Verificacion Logica
         all_good_players_in_disgrace = True
@@ -401,3 +448,37 @@ async def win_for_total_disgrace(db: Session, game_id: int) -> bool:
         return False # Asegurarse de retornar False en caso de error
     finally:
         fresh_db.close() #Cierra la sesion fresca.
+
+
+async def _win_for_total_disgrace_tracked(db: Session, tracker) -> bool:
+    """
+    Versión O(1) de win_for_total_disgrace usando el GameTracker: villanos y
+    jugadores en desgracia ya están en memoria, no se consulta la BD salvo
+    para cerrar la partida.
+    """
+    if tracker.murderer_id is None:
+        logger.error(f"Cannot check win condition: Murderer not found for game {tracker.game_id}")
+        return False
+
+    if not tracker.all_detectives_disgraced():
+        logger.debug("Win condition 'TOTAL_DISGRACE' not met.")
+        return False
+
+    logger.info(f"¡VICTORIA POR DESGRACIA TOTAL en game {tracker.game_id}! Los malos ganan.")
+    winner_list = [
+        {"player_id": player_id, "name": tracker.players.get(player_id, {}).get("name")}
+        for player_id in tracker.players
+        if player_id in tracker.villain_ids
+    ]
+    try:
+        await _end_game_with_winners(
+            db=db,
+            game_id=tracker.game_id,
+            room_id=tracker.room_id,
+            winners=winner_list,
+            reason="TOTAL_DISGRACE"
+        )
+    except Exception as e:
+        logger.error(f"Error en win_for_total_disgrace: {e}", exc_info=True)
+        return False
+    return True
@@ -1,13 +1,17 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 from app.db import crud, models
+from app.db.database import SessionLocal
 from app.schemas.game_status_schema import (
     GameStateView, GameView, PlayerView, CardSummary, 
     DeckView, DiscardView, HandView, SecretsView, TurnInfo,
     STATUS_MAPPING
 )
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 from collections import defaultdict
+import logging
+
+logger = logging.getLogger(__name__)
 
 def get_game_status_service(db: Session, game_id: int, user_id: int) -> GameStateView:
     """Recupera el estado de la partida y valida la pertenencia del usuario."""
@@ -170,6 +174,24 @@ def _build_turn_info(game, players, user_id: int):
         can_act=game.player_turn_id == user_id
     )
 
+def game_state_builder(game_id: int) -> Callable[[], Dict[str, Any]]:
+    """
+    Builder diferido de build_complete_game_state para notificar_estado_partida.
+
+    El estado se arma recién cuando la sala se vacía (una vez por ventana,
+    aunque la hayan marcado varios requests) y en un thread aparte, así que
+    abre su propia sesión: la del request ya puede estar cerrada.
+    """
+    def build() -> Dict[str, Any]:
+        db = SessionLocal()
+        try:
+            return build_complete_game_state(db, game_id)
+        finally:
+            db.close()
+
+    return build
+
+
 def build_complete_game_state(db: Session, game_id: int) -> Dict[str, Any]:
     """
     Build complete game state with public and private data
@@ -232,6 +254,7 @@ def build_complete_game_state(db: Session, game_id: int) -> Dict[str, Any]:
         revealed_secrets_list = [
             {
                 "id": c.id,
+                "card_id": c.id_card,
                 "name": c.card.name,
                 "img_src": c.card.img_src,
                 "type": c.card.type.value
@@ -243,6 +266,7 @@ def build_complete_game_state(db: Session, game_id: int) -> Dict[str, Any]:
         for secret in all_secrets:
             secretsFromAllPlayers.append({
                 "id": secret.id,
+                "card_id": secret.id_card,
                 "player_id": player.id,
                 "player_name": player.name,
                 "name": secret.card.name,
@@ -289,6 +313,7 @@ def build_complete_game_state(db: Session, game_id: int) -> Dict[str, Any]:
     draft = [
         {
             "id": c.id,  # CardsXGame.id
+            "card_id": c.id_card,
             "name": c.card.name,
             "img_src": c.card.img_src,
             "type": c.card.type.value
@@ -303,7 +328,8 @@ def build_complete_game_state(db: Session, game_id: int) -> Dict[str, Any]:
         },
         "discard": {
             "count": discard_count,
-            "top": discard_top.card.img_src if discard_top else ""
+            "top": discard_top.card.img_src if discard_top else "",
+            "top_card_id": discard_top.id_card if discard_top else None
         }
     }
     
@@ -352,6 +378,7 @@ def build_complete_game_state(db: Session, game_id: int) -> Dict[str, Any]:
                 "cards": [
                     {
                         "id": c.id,
+                        "card_id": c.id_card,
                         "name": c.card.name,
                         "description": c.card.description,
                         "type": c.card.type.value,
@@ -362,7 +389,7 @@ def build_complete_game_state(db: Session, game_id: int) -> Dict[str, Any]:
                 "count": len(cards)
             })
 
-    print(f"SETS to SEND: {sets}")
+    logger.debug("SETS to SEND: %s", sets)
 
     # Build private states for each player
     estados_privados = {}
@@ -377,6 +404,7 @@ def build_complete_game_state(db: Session, game_id: int) -> Dict[str, Any]:
         mano = [
             {
                 "id": c.id,  # CardsXGame.id (instance ID)
+                "card_id": c.id_card,
                 "name": c.card.name,
                 "description": c.card.description,
                 "type": c.card.type.value,
@@ -395,6 +423,7 @@ def build_complete_game_state(db: Session, game_id: int) -> Dict[str, Any]:
         secretos = [
             {
                 "id": c.id,  # CardsXGame.id
+                "card_id": c.id_card,
                 "name": c.card.name,
                 "description": c.card.description,
                 "img_src": c.card.img_src,
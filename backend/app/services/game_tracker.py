@@ -0,0 +1,425 @@
+"""
+Tracker incremental de roles y condiciones de victoria por partida.
+
+Antes cada chequeo de victoria re-derivaba todo desde la BD (buscar la carta
+del asesino por nombre, el cómplice, todos los jugadores y la tabla de
+desgracia social). El tracker se inicializa una vez en start_game y después
+se mantiene solo:
+
+- Un listener `after_flush` de la Session toma una foto de cada CardsXGame
+  insertada / modificada / borrada de una partida trackeada (ubicación,
+  dueño, hidden) y la deja pendiente en `session.info`.
+- Al hacer commit las fotos se aplican al tracker; en rollback se descartan,
+  así el tracker nunca ve cambios que no llegaron a la BD.
+
+Con eso el asesino/cómplice (dueño actual de cada secreto especial), los
+secretos ocultos/totales por jugador, los detectives en desgracia, quién
+tiene "Not so fast" en mano y el tamaño de mazo y draft se consultan en O(1).
+
+La tabla SocialDisgracePlayer también se refleja en memoria
+(`disgrace_registered`): los servicios encolan las altas/bajas con
+queue_disgrace_change y se aplican al tracker con el mismo commit que las
+escribe.
+
+Igual que el LobbyDirectory es por proceso: las partidas sin tracker (p.ej.
+iniciadas antes de reiniciar el servidor) siguen usando el camino por BD.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.db.models import Card, CardState, CardsXGame, Player, Room, SocialDisgracePlayer
+
+logger = logging.getLogger(__name__)
+
+MURDERER_SECRET = "You are the Murderer!!"
+ACCOMPLICE_SECRET = "You are the Accomplice!"
+NOT_SO_FAST = "Not so fast"
+
+_PENDING_KEY = "game_tracker_pending"
+_DISGRACE_PENDING_KEY = "game_tracker_disgrace_pending"
+
+
+@dataclass
+class CardSnapshot:
+    """Estado de una carta de la partida relevante para el tracker."""
+    is_in: Optional[CardState]
+    player_id: Optional[int]
+    hidden: bool
+    card_id: Optional[int] = None
+
+    @property
+    def secret_owner(self) -> Optional[int]:
+        if self.is_in == CardState.SECRET_SET:
+            return self.player_id
+        return None
+
+
+@dataclass
+class GameTracker:
+    """
+    Estado derivado de una partida.
+
+    Attributes:
+        game_id: ID del juego
+        room_id: ID de la sala
+        players: player_id -> {"name", "avatar_src"}
+        murderer_secret_id: CardsXGame.id del secreto del asesino
+        accomplice_secret_id: CardsXGame.id del secreto del cómplice (o None)
+        hidden_secrets: player_id -> cantidad de secretos ocultos
+        total_secrets: player_id -> cantidad de secretos en su set
+        disgraced: jugadores con todos sus secretos revelados
+        disgrace_registered: player_id -> entered_at de las filas de
+                             SocialDisgracePlayer ya commiteadas
+        nsf_card_id: Card.id de "Not so fast"
+        nsf_in_hand: player_id -> CardsXGame.ids de NSF en su mano
+        pile_counts: cantidad de cartas por ubicación (DECK, DRAFT, ...)
+    """
+    game_id: int
+    room_id: int
+    players: Dict[int, dict]
+    murderer_secret_id: Optional[int] = None
+    accomplice_secret_id: Optional[int] = None
+    cards: Dict[int, CardSnapshot] = field(default_factory=dict)
+    hidden_secrets: Dict[int, int] = field(default_factory=dict)
+    total_secrets: Dict[int, int] = field(default_factory=dict)
+    disgraced: Set[int] = field(default_factory=set)
+    disgrace_registered: Dict[int, datetime] = field(default_factory=dict)
+    nsf_card_id: Optional[int] = None
+    nsf_in_hand: Dict[int, Set[int]] = field(default_factory=dict)
+    pile_counts: Dict[CardState, int] = field(default_factory=dict)
+
+    # ------------------------------------------------------------------
+    # Roles
+    # ------------------------------------------------------------------
+
+    def _owner_of(self, cxg_id: Optional[int]) -> Optional[int]:
+        snapshot = self.cards.get(cxg_id) if cxg_id is not None else None
+        return snapshot.secret_owner if snapshot else None
+
+    @property
+    def murderer_id(self) -> Optional[int]:
+        return self._owner_of(self.murderer_secret_id)
+
+    @property
+    def accomplice_id(self) -> Optional[int]:
+        return self._owner_of(self.accomplice_secret_id)
+
+    @property
+    def villain_ids(self) -> Set[int]:
+        return {pid for pid in (self.murderer_id, self.accomplice_id) if pid is not None}
+
+    @property
+    def detective_ids(self) -> Set[int]:
+        return set(self.players) - self.villain_ids
+
+    def player_entry(self, player_id: int, role: str) -> dict:
+        """Formato de ganador que espera notificar_fin_partida."""
+        info = self.players.get(player_id, {})
+        return {
+            "role": role,
+            "player_id": player_id,
+            "name": info.get("name", "Unknown"),
+            "avatar_src": info.get("avatar_src", ""),
+        }
+
+    # ------------------------------------------------------------------
+    # Condiciones de victoria
+    # ------------------------------------------------------------------
+
+    def is_murderer_secret(self, cxg_id: int) -> bool:
+        return self.murderer_secret_id is not None and cxg_id == self.murderer_secret_id
+
+    def all_detectives_disgraced(self) -> bool:
+        """True si todos los jugadores que no son villanos están en desgracia."""
+        return self.detective_ids <= self.disgraced
+
+    def disgrace_entries(self) -> List[dict]:
+        """Jugadores en desgracia social (formato de get_players_in_social_disgrace)."""
+        return [
+            {
+                "player_id": player_id,
+                "player_name": self.players.get(player_id, {}).get("name"),
+                "avatar_src": self.players.get(player_id, {}).get("avatar_src"),
+                "entered_at": entered_at.isoformat(),
+            }
+            for player_id, entered_at in self.disgrace_registered.items()
+        ]
+
+    def has_nsf(self, player_id: int) -> bool:
+        return bool(self.nsf_in_hand.get(player_id))
+
+    def nsf_cards(self, player_id: int) -> Set[int]:
+        """CardsXGame.ids de las NSF en la mano del jugador."""
+        return set(self.nsf_in_hand.get(player_id, ()))
+
+    def any_other_has_nsf(self, exclude_player_id: int) -> bool:
+        """True si algún jugador distinto de exclude_player_id tiene NSF en mano."""
+        return any(cards for pid, cards in self.nsf_in_hand.items() if pid != exclude_player_id)
+
+    @property
+    def deck_count(self) -> int:
+        return self.pile_counts.get(CardState.DECK, 0)
+
+    @property
+    def draft_count(self) -> int:
+        return self.pile_counts.get(CardState.DRAFT, 0)
+
+    @property
+    def is_draft_exhausted(self) -> bool:
+        return self.draft_count == 0
+
+    # ------------------------------------------------------------------
+    # Mantenimiento
+    # ------------------------------------------------------------------
+
+    def apply(self, cxg_id: int, snapshot: Optional[CardSnapshot]) -> None:
+        """
+        Aplica el nuevo estado de una carta (None si fue borrada) y ajusta
+        contadores de mazos, secretos y desgracia.
+        """
+        previous = self.cards.pop(cxg_id, None)
+        if snapshot is not None:
+            self.cards[cxg_id] = snapshot
+
+        if previous is not None and previous.is_in is not None:
+            self.pile_counts[previous.is_in] = self.pile_counts.get(previous.is_in, 0) - 1
+        if snapshot is not None and snapshot.is_in is not None:
+            self.pile_counts[snapshot.is_in] = self.pile_counts.get(snapshot.is_in, 0) + 1
+
+        if previous is not None and self._is_nsf_in_hand(previous):
+            self.nsf_in_hand.get(previous.player_id, set()).discard(cxg_id)
+        if snapshot is not None and self._is_nsf_in_hand(snapshot):
+            self.nsf_in_hand.setdefault(snapshot.player_id, set()).add(cxg_id)
+
+        touched = set()
+        if previous is not None and previous.secret_owner is not None:
+            owner = previous.secret_owner
+            self.total_secrets[owner] = self.total_secrets.get(owner, 0) - 1
+            if previous.hidden:
+                self.hidden_secrets[owner] = self.hidden_secrets.get(owner, 0) - 1
+            touched.add(owner)
+        if snapshot is not None and snapshot.secret_owner is not None:
+            owner = snapshot.secret_owner
+            self.total_secrets[owner] = self.total_secrets.get(owner, 0) + 1
+            if snapshot.hidden:
+                self.hidden_secrets[owner] = self.hidden_secrets.get(owner, 0) + 1
+            touched.add(owner)
+
+        for player_id in touched:
+            self._refresh_disgrace(player_id)
+
+    def _is_nsf_in_hand(self, snapshot: CardSnapshot) -> bool:
+        return (
+            self.nsf_card_id is not None
+            and snapshot.card_id == self.nsf_card_id
+            and snapshot.is_in == CardState.HAND
+            and snapshot.player_id is not None
+        )
+
+    def _refresh_disgrace(self, player_id: int) -> None:
+        if self.total_secrets.get(player_id, 0) > 0 and self.hidden_secrets.get(player_id, 0) == 0:
+            self.disgraced.add(player_id)
+        else:
+            self.disgraced.discard(player_id)
+
+
+class GameTrackerRegistry:
+    """Trackers de las partidas en curso, indexados por game_id."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._trackers: Dict[int, GameTracker] = {}
+
+    def get(self, game_id: int) -> Optional[GameTracker]:
+        return self._trackers.get(game_id)
+
+    def is_tracked(self, game_id: Optional[int]) -> bool:
+        return game_id is not None and game_id in self._trackers
+
+    def load(self, db: Session, game_id: int) -> Optional[GameTracker]:
+        """
+        Construye el tracker de una partida desde la BD (una vez, en start_game).
+
+        Returns:
+            GameTracker, o None si la partida no tiene sala
+        """
+        room = db.query(Room).filter(Room.id_game == game_id).first()
+        if not room:
+            return None
+        players = db.query(Player).filter(Player.id_room == room.id).all()
+        special = dict(
+            db.query(Card.name, Card.id)
+            .filter(Card.name.in_([MURDERER_SECRET, ACCOMPLICE_SECRET, NOT_SO_FAST]))
+            .all()
+        )
+        rows = db.query(
+            CardsXGame.id, CardsXGame.id_card, CardsXGame.is_in,
+            CardsXGame.player_id, CardsXGame.hidden
+        ).filter(CardsXGame.id_game == game_id).all()
+        disgrace_rows = db.query(
+            SocialDisgracePlayer.player_id, SocialDisgracePlayer.entered_at
+        ).filter(SocialDisgracePlayer.id_game == game_id).all()
+
+        tracker = GameTracker(
+            game_id=game_id,
+            room_id=room.id,
+            players={p.id: {"name": p.name, "avatar_src": p.avatar_src} for p in players},
+            nsf_card_id=special.get(NOT_SO_FAST),
+        )
+        for cxg_id, card_id, is_in, player_id, hidden in rows:
+            snapshot = CardSnapshot(
+                is_in=is_in, player_id=player_id, hidden=bool(hidden), card_id=card_id
+            )
+            tracker.apply(cxg_id, snapshot)
+            if snapshot.secret_owner is None:
+                continue
+            if card_id == special.get(MURDERER_SECRET):
+                tracker.murderer_secret_id = cxg_id
+            elif card_id == special.get(ACCOMPLICE_SECRET):
+                tracker.accomplice_secret_id = cxg_id
+        tracker.disgrace_registered = {
+            player_id: entered_at for player_id, entered_at in disgrace_rows
+        }
+
+        with self._lock:
+            self._trackers[game_id] = tracker
+        logger.info(
+            "game tracker loaded game=%s players=%d cards=%d", game_id, len(players), len(rows)
+        )
+        return tracker
+
+    def discard(self, game_id: int) -> None:
+        with self._lock:
+            self._trackers.pop(game_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._trackers.clear()
+
+    def apply_changes(self, changes: Iterable[Tuple[int, int, Optional[CardSnapshot]]]) -> None:
+        """Aplica (game_id, cxg_id, snapshot) ya commiteados."""
+        with self._lock:
+            for game_id, cxg_id, snapshot in changes:
+                tracker = self._trackers.get(game_id)
+                if tracker is not None:
+                    tracker.apply(cxg_id, snapshot)
+
+    def apply_disgrace_changes(self, changes: Dict[Tuple[int, int], Optional[datetime]]) -> None:
+        """Aplica altas (entered_at) y bajas (None) de desgracia ya commiteadas."""
+        with self._lock:
+            for (game_id, player_id), entered_at in changes.items():
+                tracker = self._trackers.get(game_id)
+                if tracker is None:
+                    continue
+                if entered_at is None:
+                    tracker.disgrace_registered.pop(player_id, None)
+                else:
+                    tracker.disgrace_registered[player_id] = entered_at
+
+
+# Instancia global del registro
+_registry: Optional[GameTrackerRegistry] = None
+
+
+def get_game_trackers() -> GameTrackerRegistry:
+    """
+    Obtiene la instancia global del GameTrackerRegistry (Singleton).
+
+    Returns:
+        GameTrackerRegistry instance
+    """
+    global _registry
+    if _registry is None:
+        _registry = GameTrackerRegistry()
+    return _registry
+
+
+def get_game_tracker(game_id: int) -> Optional[GameTracker]:
+    """Atajo: tracker de una partida, o None si no está trackeada."""
+    return get_game_trackers().get(game_id)
+
+
+# ----------------------------------------------------------------------
+# Desgracia social (write-through por Session)
+# ----------------------------------------------------------------------
+
+def queue_disgrace_change(
+    session: Session, game_id: int, player_id: int, entered_at: Optional[datetime]
+) -> None:
+    """
+    Registra que en esta transacción el jugador entra (entered_at) o sale
+    (None) de desgracia social. Se aplica al tracker en el commit.
+    """
+    session.info.setdefault(_DISGRACE_PENDING_KEY, {})[(game_id, player_id)] = entered_at
+
+
+def is_disgrace_registered(session: Session, tracker: GameTracker, player_id: int) -> bool:
+    """Estado de registro visto desde la transacción actual (pendientes incluidos)."""
+    pending = session.info.get(_DISGRACE_PENDING_KEY, {})
+    key = (tracker.game_id, player_id)
+    if key in pending:
+        return pending[key] is not None
+    return player_id in tracker.disgrace_registered
+
+
+def has_uncommitted_card_changes(session: Session, game_id: int) -> bool:
+    """
+    True si la Session tiene cambios de CardsXGame de la partida que el tracker
+    todavía no ve (flusheados sin commit, o sin flushear).
+    """
+    if any(g == game_id for g, _, _ in session.info.get(_PENDING_KEY, ())):
+        return True
+    for objs in (session.new, session.dirty, session.deleted):
+        for obj in objs:
+            if isinstance(obj, CardsXGame) and obj.id_game == game_id:
+                return True
+    return False
+
+
+# ----------------------------------------------------------------------
+# Listeners de Session
+# ----------------------------------------------------------------------
+
+def _snapshot(obj: CardsXGame) -> CardSnapshot:
+    # Algunos servicios asignan is_in como string ('HAND'); normalizar al enum
+    is_in = CardState(obj.is_in) if obj.is_in is not None else None
+    hidden = True if obj.hidden is None else bool(obj.hidden)
+    return CardSnapshot(is_in=is_in, player_id=obj.player_id, hidden=hidden, card_id=obj.id_card)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_card_changes(session, flush_context):
+    registry = get_game_trackers()
+    if not registry._trackers:
+        return
+    pending: Optional[List] = None
+    for objs, deleted in ((session.new, False), (session.dirty, False), (session.deleted, True)):
+        for obj in objs:
+            if not isinstance(obj, CardsXGame) or not registry.is_tracked(obj.id_game):
+                continue
+            if pending is None:
+                pending = session.info.setdefault(_PENDING_KEY, [])
+            pending.append((obj.id_game, obj.id, None if deleted else _snapshot(obj)))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_card_changes(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        get_game_trackers().apply_changes(pending)
+    disgrace = session.info.pop(_DISGRACE_PENDING_KEY, None)
+    if disgrace:
+        get_game_trackers().apply_disgrace_changes(disgrace)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_card_changes(session, previous_transaction):
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_DISGRACE_PENDING_KEY, None)
@@ -1,6 +1,10 @@
 from sqlalchemy.orm import Session
 from app.db.models import Room, Player, RoomStatus
 from app.sockets.socket_service import get_websocket_service
+from app.services.lobby_directory import get_lobby_directory
+from app.services.seat_ring import get_seat_rings
+from app.sockets.frames import get_state_frames
+from app.sockets.event_log import get_room_event_logs
 from datetime import datetime
 import logging
 
@@ -55,6 +59,10 @@ async def leave_game_logic(db: Session, room_id: int, user_id: int):
             # Eliminar la sala
             db.delete(room)
             db.commit()
+            get_lobby_directory().remove_room(room_id)
+            get_seat_rings().invalidate(room_id)
+            get_state_frames().discard_room(room_id)
+            get_room_event_logs().discard_room(room_id)
             
             logger.info(f"Room {room_id} deleted and all players removed from DB")
             
@@ -82,6 +90,8 @@ async def leave_game_logic(db: Session, room_id: int, user_id: int):
             # Obtener jugadores restantes DESPUÉS de eliminar
             remaining_players = db.query(Player).filter(Player.id_room == room_id).all()
             players_count = len(remaining_players)
+            get_lobby_directory().upsert_room(room, remaining_players)
+            get_seat_rings().invalidate(room_id)
             
             # Serializar jugadores para el evento
             players_data = [
@@ -0,0 +1,256 @@
+"""
+Directorio en memoria de salas para el lobby.
+
+GET /api/game_list es uno de los endpoints con más QPS. En lugar de cargar
+todas las salas WAITING y hacer una query de Player por sala, el listado se
+sirve desde este directorio:
+
+- Se carga desde la BD una sola vez (cold start) con dos queries.
+- create_game / join / leave_game / start lo actualizan incrementalmente
+  (upsert_room / remove_room) después de hacer commit.
+- Las salas disponibles (WAITING y con lugar) se mantienen en una lista
+  ordenada por id descendente, así la paginación por cursor es
+  O(log n + tamaño de página).
+- Cada cambio se notifica a los listeners registrados con
+  add_listener(callback(previous, current)), p.ej. el canal de lobby de
+  Socket.IO (sockets/lobby_channel.py).
+
+El directorio es por proceso: con varios workers cada uno mantiene el suyo a
+partir de sus propias escrituras (correr el lobby en un solo worker o llamar
+a invalidate() para forzar una recarga).
+"""
+
+import bisect
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Player, Room, RoomStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LobbyRoom:
+    """Entrada del directorio: datos de la sala más su roster de jugadores."""
+    id: int
+    name: str
+    players_min: int
+    players_max: int
+    status: RoomStatus
+    id_game: Optional[int] = None
+    players: Dict[int, dict] = field(default_factory=dict)
+
+    @property
+    def players_joined(self) -> int:
+        return len(self.players)
+
+    @property
+    def host_id(self) -> Optional[int]:
+        return next((pid for pid, p in self.players.items() if p["is_host"]), None)
+
+    @property
+    def is_available(self) -> bool:
+        return self.status == RoomStatus.WAITING and self.players_joined < self.players_max
+
+    def to_item(self) -> dict:
+        """Formato de GameItem (GET /api/game_list)."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "players_min": self.players_min,
+            "players_max": self.players_max,
+            "players_joined": self.players_joined,
+            "host_id": self.host_id,
+        }
+
+
+def _player_entry(player) -> dict:
+    return {
+        "id": player.id,
+        "name": player.name,
+        "avatar": player.avatar_src,
+        "is_host": bool(player.is_host),
+        "order": player.order,
+    }
+
+
+class LobbyDirectory:
+    """
+    Directorio de salas activas (WAITING e INGAME) indexado por room_id.
+
+    Attributes:
+        loaded: True una vez hecha la carga inicial desde la BD
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._rooms: Dict[int, LobbyRoom] = {}
+        # -room_id de las salas disponibles, ordenado ascendente (= id desc)
+        self._available: List[int] = []
+        self._listeners: List[Callable[[Optional[LobbyRoom], Optional[LobbyRoom]], None]] = []
+        self.loaded = False
+
+    def add_listener(self, callback: Callable[[Optional[LobbyRoom], Optional[LobbyRoom]], None]) -> None:
+        """Registra un callback(previous, current) que se llama en cada cambio."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, previous: Optional[LobbyRoom], current: Optional[LobbyRoom]) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(previous, current)
+            except Exception as e:
+                logger.warning("lobby directory listener failed error=%s", e)
+
+    # ------------------------------------------------------------------
+    # Carga / invalidación
+    # ------------------------------------------------------------------
+
+    def ensure_loaded(self, db: Session) -> None:
+        """Carga el directorio desde la BD si todavía no se hizo."""
+        if self.loaded:
+            return
+        with self._lock:
+            if self.loaded:
+                return
+            rooms = db.query(Room).filter(Room.status != RoomStatus.FINISH).all()
+            room_ids = [r.id for r in rooms]
+            players = (
+                db.query(Player).filter(Player.id_room.in_(room_ids)).all()
+                if room_ids else []
+            )
+            by_room: Dict[int, list] = {}
+            for p in players:
+                by_room.setdefault(p.id_room, []).append(p)
+
+            self._rooms.clear()
+            self._available.clear()
+            for room in rooms:
+                self._store(self._entry_from(room, by_room.get(room.id, [])))
+            self.loaded = True
+            logger.info("lobby directory loaded rooms=%d players=%d", len(rooms), len(players))
+
+    def invalidate(self) -> None:
+        """Descarta el contenido; la próxima lectura recarga desde la BD."""
+        with self._lock:
+            self._rooms.clear()
+            self._available.clear()
+            self.loaded = False
+
+    # ------------------------------------------------------------------
+    # Mutaciones (hooks de create / join / leave / start)
+    # ------------------------------------------------------------------
+
+    def upsert_room(self, room, players: Iterable) -> Optional[LobbyRoom]:
+        """
+        Inserta o reemplaza una sala con su roster completo.
+        No hace nada si el directorio aún no fue cargado.
+        """
+        if not self.loaded:
+            return None
+        try:
+            entry = self._entry_from(room, players)
+        except Exception as e:
+            # Un hook del directorio nunca debe romper el request
+            logger.warning("lobby directory upsert skipped room=%s error=%s", getattr(room, "id", None), e)
+            return None
+        with self._lock:
+            previous = self._discard(entry.id)
+            if entry.status != RoomStatus.FINISH:
+                self._store(entry)
+            else:
+                entry = None
+        self._notify(previous, entry)
+        return entry
+
+    def remove_room(self, room_id: int) -> Optional[LobbyRoom]:
+        """Elimina una sala (cancelada o terminada)."""
+        if not self.loaded:
+            return None
+        with self._lock:
+            previous = self._discard(room_id)
+        if previous is not None:
+            self._notify(previous, None)
+        return previous
+
+    # ------------------------------------------------------------------
+    # Lecturas
+    # ------------------------------------------------------------------
+
+    def get_room(self, room_id: int) -> Optional[LobbyRoom]:
+        return self._rooms.get(room_id)
+
+    def list_available(
+        self, limit: int, cursor: Optional[int] = None, offset: int = 0
+    ) -> Tuple[List[LobbyRoom], Optional[int]]:
+        """
+        Devuelve una página de salas disponibles ordenadas por id descendente.
+
+        Args:
+            limit: Tamaño de página
+            cursor: Último room_id de la página anterior (paginación por cursor)
+            offset: Desplazamiento (compatibilidad con ?page=)
+
+        Returns:
+            (salas, next_cursor) - next_cursor es None si no hay más
+        """
+        with self._lock:
+            start = bisect.bisect_right(self._available, -cursor) if cursor is not None else offset
+            keys = self._available[start:start + limit + 1]
+            page = [self._rooms[-k] for k in keys[:limit]]
+        next_cursor = page[-1].id if len(keys) > limit and page else None
+        return page, next_cursor
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _entry_from(room, players: Iterable) -> LobbyRoom:
+        return LobbyRoom(
+            id=room.id,
+            name=room.name,
+            players_min=room.players_min,
+            players_max=room.players_max,
+            status=room.status,
+            id_game=room.id_game,
+            players={p.id: _player_entry(p) for p in players},
+        )
+
+    def _store(self, entry: LobbyRoom) -> None:
+        self._rooms[entry.id] = entry
+        if entry.is_available:
+            bisect.insort(self._available, -entry.id)
+
+    def _discard(self, room_id: int) -> Optional[LobbyRoom]:
+        entry = self._rooms.pop(room_id, None)
+        if entry is not None:
+            idx = bisect.bisect_left(self._available, -room_id)
+            if idx < len(self._available) and self._available[idx] == -room_id:
+                self._available.pop(idx)
+        return entry
+
+
+# Instancia global del LobbyDirectory
+_lobby_directory: Optional[LobbyDirectory] = None
+
+
+def get_lobby_directory() -> LobbyDirectory:
+    """
+    Obtiene la instancia global del LobbyDirectory (Singleton).
+
+    Returns:
+        LobbyDirectory instance
+    """
+    global _lobby_directory
+    if _lobby_directory is None:
+        _lobby_directory = LobbyDirectory()
+    return _lobby_directory
@@ -0,0 +1,237 @@
+"""
+Watchdog de lag del event loop.
+
+Los handlers async (rutas y eventos de Socket.IO) llaman al ORM síncrono, así
+que una query lenta bloquea el loop y atrasa los ticks de NSF de todas las
+salas del worker. Este módulo:
+
+- Corre un heartbeat async que mide cuánto se atrasa el loop (lag).
+- Corre un thread watchdog que, si el heartbeat no llega a tiempo, captura el
+  stack del thread del loop y lo loguea junto con la etiqueta (ruta o evento
+  de socket) de la tarea que lo está bloqueando.
+- Publica contadores en el MetricsRegistry (ver GET /metrics).
+"""
+
+import asyncio
+import functools
+import logging
+import re
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
+
+from app.config import settings
+from app.services.metrics import get_metrics, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+# Etiqueta (ruta / evento de socket) de cada tarea asyncio en curso
+_task_labels: "weakref.WeakKeyDictionary[asyncio.Task, str]" = weakref.WeakKeyDictionary()
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def normalize_path(path: str) -> str:
+    """Reemplaza segmentos numéricos por {id} para no explotar la cardinalidad."""
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+def get_task_label(task: Optional[asyncio.Task]) -> str:
+    """Devuelve la etiqueta asociada a una tarea (o su nombre si no tiene)."""
+    if task is None:
+        return "unknown"
+    label = _task_labels.get(task)
+    if label:
+        return label
+    return task.get_name()
+
+
+@contextmanager
+def task_label(label: str):
+    """
+    Asocia una etiqueta a la tarea asyncio actual mientras dura el bloque.
+
+    Si no hay tarea corriendo (código síncrono) no hace nada.
+    """
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is None:
+        yield
+        return
+
+    previous = _task_labels.get(task)
+    _task_labels[task] = label
+    try:
+        yield
+    finally:
+        if previous is None:
+            _task_labels.pop(task, None)
+        else:
+            _task_labels[task] = previous
+
+
+def labelled(label: str):
+    """Decorador para handlers async (eventos de socket) que los etiqueta."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with task_label(label):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class LoopLabelMiddleware:
+    """
+    Middleware ASGI que etiqueta la tarea de cada request HTTP con
+    "METHOD /ruta/{id}" para que los bloqueos se atribuyan a la ruta.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        label = f"{scope.get('method', 'GET')} {normalize_path(scope.get('path', ''))}"
+        with task_label(label):
+            await self.app(scope, receive, send)
+
+
+class LoopMonitor:
+    """
+    Mide el lag del event loop y detecta llamadas bloqueantes.
+
+    Attributes:
+        interval: Período del heartbeat en segundos
+        threshold: Lag en segundos a partir del cual se considera bloqueo
+        recent_stalls: Últimos bloqueos detectados (label, duración, stack)
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.05,
+        threshold: float = 0.1,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self.metrics = metrics or get_metrics()
+        self.recent_stalls: deque = deque(maxlen=20)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._last_beat = 0.0
+        self._beat = 0
+        self._reported_beat = -1
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat_task is not None and not self._heartbeat_task.done()
+
+    def start(self) -> None:
+        """Arranca heartbeat y watchdog. Debe llamarse desde el event loop."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = self._loop.create_task(self._heartbeat(), name="loop-monitor")
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(
+            "loop monitor started interval_ms=%d threshold_ms=%d",
+            self.interval * 1000, self.threshold * 1000,
+        )
+
+    async def stop(self) -> None:
+        """Detiene heartbeat y watchdog."""
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _heartbeat(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - started - self.interval)
+            lag_ms = lag * 1000
+            self.metrics.set_gauge("loop.lag_ms", lag_ms)
+            self.metrics.observe("loop.lag_ms", lag_ms)
+            if lag > self.threshold:
+                self.metrics.inc("loop.lag_exceeded")
+            self._last_beat = now
+            self._beat += 1
+
+    def _watch(self):
+        poll = max(self.interval / 2, 0.005)
+        while not self._stop.wait(poll):
+            stalled_for = time.monotonic() - self._last_beat - self.interval
+            if stalled_for > self.threshold and self._reported_beat != self._beat:
+                self._reported_beat = self._beat
+                self._report_stall(stalled_for)
+
+    def _report_stall(self, stalled_for: float) -> None:
+        """Captura el stack del thread del loop y la etiqueta de la tarea activa."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        label = get_task_label(task)
+
+        self.metrics.inc("loop.blocked")
+        self.metrics.inc(f"loop.blocked.{label}")
+        self.recent_stalls.append({
+            "label": label,
+            "stalled_ms": round(stalled_for * 1000, 1),
+            "stack": stack,
+        })
+        logger.warning(
+            "event loop blocked label=%s stalled_ms=%.1f\n%s",
+            label, stalled_for * 1000, stack,
+        )
+
+
+# Instancia global del LoopMonitor
+_loop_monitor: Optional[LoopMonitor] = None
+
+
+def get_loop_monitor() -> LoopMonitor:
+    """
+    Obtiene la instancia global del LoopMonitor (Singleton).
+
+    Returns:
+        LoopMonitor instance
+    """
+    global _loop_monitor
+    if _loop_monitor is None:
+        _loop_monitor = LoopMonitor(
+            interval=settings.LOOP_MONITOR_INTERVAL_MS / 1000,
+            threshold=settings.LOOP_LAG_THRESHOLD_MS / 1000,
+        )
+    return _loop_monitor
@@ -0,0 +1,85 @@
+"""
+Registro de métricas en memoria del proceso.
+
+Contadores, gauges y resúmenes (count/sum/max) simples, pensados para
+exponerse vía GET /metrics. No depende de ninguna librería externa: cada
+worker mantiene sus propias métricas.
+"""
+
+import threading
+from typing import Dict, Optional
+
+
+class MetricsRegistry:
+    """
+    Registro thread-safe de métricas.
+
+    Attributes:
+        counters: Contadores monótonos (nombre -> valor)
+        gauges: Último valor observado (nombre -> valor)
+        summaries: Agregados de observaciones (nombre -> count/sum/max)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+        self.summaries: Dict[str, Dict[str, float]] = {}
+
+    def inc(self, name: str, value: float = 1) -> None:
+        """Incrementa un contador."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Fija el valor actual de un gauge."""
+        with self._lock:
+            self.gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        """Registra una observación (latencia, tamaño, etc.) en un resumen."""
+        with self._lock:
+            summary = self.summaries.get(name)
+            if summary is None:
+                summary = {"count": 0, "sum": 0.0, "max": 0.0}
+                self.summaries[name] = summary
+            summary["count"] += 1
+            summary["sum"] += value
+            if value > summary["max"]:
+                summary["max"] = value
+
+    def get_counter(self, name: str) -> float:
+        return self.counters.get(name, 0)
+
+    def snapshot(self) -> dict:
+        """Copia consistente de todas las métricas (para serializar)."""
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+                "summaries": {k: dict(v) for k, v in self.summaries.items()},
+            }
+
+    def reset(self) -> None:
+        """Limpia todas las métricas (usado en tests)."""
+        with self._lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.summaries.clear()
+
+
+# Instancia global del registro
+_metrics: Optional[MetricsRegistry] = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """
+    Obtiene la instancia global del MetricsRegistry (Singleton).
+
+    Returns:
+        MetricsRegistry instance
+    """
+    global _metrics
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+    return _metrics
@@ -12,6 +12,9 @@ from ..db.models import (
     CardState, ActionType, ActionResult, ActionName, CardType
 )
 from ..db import crud
+from . import game_rules
+from .game_context import GameContext, load_game_context
+from .game_tracker import get_game_tracker, has_uncommitted_card_changes
 from ..schemas.not_so_fast_schema import StartActionRequest, StartActionResponse
 
 logger = logging.getLogger(__name__)
@@ -50,8 +53,9 @@ class NotSoFastService:
         Raises:
             HTTPException con códigos 400, 403, 404
         """
-        # 1. Obtener game_id desde room_id
-        game_id = self._get_game_id_from_room(room_id)
+        # 1. Sala, juego, jugador y turno activo en una sola query
+        context = self._get_context(room_id, request.playerId)
+        game_id = context.room.id_game
         
         # 2. Validar que la acción es válida según el tipo
         self._validate_action(
@@ -59,11 +63,12 @@ class NotSoFastService:
             player_id=request.playerId,
             card_ids=request.cardIds,
             action_type=request.additionalData.actionType,
-            set_position=request.additionalData.setPosition
+            set_position=request.additionalData.setPosition,
+            context=context
         )
         
         # 3. Obtener el turno actual
-        current_turn = crud.get_active_turn_for_player(self.db, game_id, request.playerId)
+        current_turn = context.actor_turn
         if not current_turn:
             raise HTTPException(
                 status_code=404,
@@ -131,19 +136,27 @@ class NotSoFastService:
         player_id: int,
         card_ids: List[int],
         action_type: str,
-        set_position: Optional[int]
+        set_position: Optional[int],
+        context: Optional[GameContext] = None
     ):
         """
         Valida que la acción es válida según el tipo.
         
+        Args:
+            context: GameContext ya cargado por start_action (evita volver a
+                     consultar jugador y juego)
+        
         Raises:
             HTTPException si la acción no es válida
         """
-        # Validar que el jugador existe y pertenece al juego
-        player = self._get_player(player_id, game_id)
+        if context is not None:
+            player, game = context.actor, context.game
+        else:
+            # Validar que el jugador existe y pertenece al juego
+            player = self._get_player(player_id, game_id)
+            game = crud.get_game_by_id(self.db, game_id)
         
         # Validar que es el turno del jugador
-        game = crud.get_game_by_id(self.db, game_id)
         if not game:
             raise HTTPException(status_code=404, detail="Game not found")
         
@@ -302,6 +315,11 @@ class NotSoFastService:
         Returns:
             True si al menos un jugador tiene NSF, False en caso contrario
         """
+        # Índice en memoria de NSF por mano (sin tocar la BD)
+        tracker = get_game_tracker(game_id)
+        if tracker is not None and not has_uncommitted_card_changes(self.db, game_id):
+            return tracker.any_other_has_nsf(exclude_player_id)
+        
         # Obtener todos los jugadores del juego (excepto el activo)
         room = crud.get_room_by_game_id(self.db, game_id)
         if not room:
@@ -363,12 +381,8 @@ class NotSoFastService:
         if not card:
             return False
         
-        # Cards off the table NO es cancelable
-        if card.id_card == self.CARDS_OFF_THE_TABLE_ID:
-            return False
-        
-        # Todas las demás cartas evento SON cancelables
-        return True
+        # Cards off the table NO es cancelable, el resto de los eventos sí
+        return game_rules.is_event_cancellable(card.id_card)
     
     def _is_create_set_cancellable(self, card_ids: List[int], game_id: int) -> bool:
         """
@@ -386,19 +400,8 @@ class NotSoFastService:
         if not cards:
             return True
         
-        # Obtener los id_card (sin contar comodines)
-        card_types = [c.id_card for c in cards if c.id_card != self.HARLEY_QUIN_CARD_ID]
-        
-        # Verificar si tiene ambos hermanos
-        has_tommy = self.TOMMY_BERESFORD_ID in card_types
-        has_tuppence = self.TUPPENCE_BERESFORD_ID in card_types
-        
         # NO cancelable si tiene ambos hermanos
-        if has_tommy and has_tuppence:
-            return False
-        
-        # Cancelable en todos los demás casos
-        return True
+        return game_rules.is_set_cancellable([c.id_card for c in cards])
     
     def _is_add_to_set_cancellable(
         self,
@@ -519,6 +522,29 @@ class NotSoFastService:
     # HELPERS
     # =============================
     
+    def _get_context(self, room_id: int, player_id: int) -> GameContext:
+        """
+        Carga (o reutiliza, si la ruta ya lo hizo) el GameContext del request
+        y valida sala, juego y pertenencia del jugador.
+        """
+        context = load_game_context(self.db, room_id, player_id)
+        if not context:
+            raise HTTPException(status_code=404, detail="Room not found")
+        
+        if not context.room.id_game:
+            raise HTTPException(status_code=400, detail="Room has no active game")
+        
+        if context.actor is None:
+            # Solo en el camino de error: distinguir inexistente de ajeno
+            if not crud.get_player_by_id(self.db, player_id):
+                raise HTTPException(status_code=404, detail="Player not found")
+            raise HTTPException(
+                status_code=403,
+                detail="Player does not belong to this game"
+            )
+        
+        return context
+    
     def _get_game_id_from_room(self, room_id: int) -> int:
         """Obtiene el game_id desde el room_id"""
         room = crud.get_room_by_id(self.db, room_id)
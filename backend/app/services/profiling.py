@@ -0,0 +1,258 @@
+"""
+Profiling opcional por request / evento de socket.
+
+Se activa de dos maneras:
+- PROFILING_ENABLED=true: se perfila todo (solo para staging).
+- Header X-Profile-Token firmado con SECRET_KEY (ver make_profile_token):
+  permite perfilar un único /start o NSF lento sin redeployar.
+
+Cada ejecución perfilada corre bajo cProfile, cuenta las sentencias SQL
+emitidas y guarda un reporte (top de funciones, cantidad de SQL, wall time)
+recuperable por id en GET /debug/profile/{report_id}. En HTTP el resumen
+también viaja en los headers X-Profile-Id y X-Profile-Summary.
+
+Nota: cProfile mide el thread del event loop, así que mientras un request se
+perfila también se cuentan las otras tareas del loop (y no el cuerpo de las
+rutas síncronas, que corren en el threadpool; sus SQL sí se cuentan). Solo se
+perfila una ejecución a la vez; las concurrentes se ejecutan sin perfilar.
+"""
+
+import cProfile
+import functools
+import hashlib
+import hmac
+import io
+import logging
+import pstats
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile-token"
+MAX_REPORTS = 50
+
+# Contador de SQL de la ejecución perfilada actual (lista mutable de 1 elemento
+# para que los incrementos hechos en threads del threadpool se vean afuera)
+_sql_counter: ContextVar[Optional[list]] = ContextVar("profile_sql_counter", default=None)
+
+_reports: "OrderedDict[str, dict]" = OrderedDict()
+_reports_lock = threading.Lock()
+_profiler_busy = threading.Lock()
+_sql_listener_installed = False
+
+
+def _count_sql(conn, cursor, statement, parameters, context, executemany):
+    counter = _sql_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def install_sql_counter() -> None:
+    """Registra (una sola vez) el listener que cuenta sentencias SQL."""
+    global _sql_listener_installed
+    if not _sql_listener_installed:
+        event.listen(Engine, "before_cursor_execute", _count_sql)
+        _sql_listener_installed = True
+
+
+def _sign(expires: int) -> str:
+    return hmac.new(
+        settings.SECRET_KEY.encode(), f"profile:{expires}".encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def make_profile_token(ttl_seconds: int = 3600) -> str:
+    """Genera un token "<expira>.<firma>" para el header X-Profile-Token."""
+    expires = int(time.time()) + ttl_seconds
+    return f"{expires}.{_sign(expires)}"
+
+
+def verify_profile_token(token: Optional[str]) -> bool:
+    """Valida firma y expiración del token. Sin SECRET_KEY nunca es válido."""
+    if not token or not settings.SECRET_KEY:
+        return False
+    try:
+        expires_str, signature = token.split(".", 1)
+        expires = int(expires_str)
+    except ValueError:
+        return False
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(signature, _sign(expires))
+
+
+def get_report(report_id: str) -> Optional[dict]:
+    with _reports_lock:
+        return _reports.get(report_id)
+
+
+def _store_report(report: dict) -> None:
+    with _reports_lock:
+        _reports[report["id"]] = report
+        while len(_reports) > MAX_REPORTS:
+            _reports.popitem(last=False)
+
+
+def clear_reports() -> None:
+    with _reports_lock:
+        _reports.clear()
+
+
+class ProfileSession:
+    """
+    Una ejecución perfilada.
+
+    Uso:
+        session = ProfileSession.start("POST /api/game/{id}/start")
+        if session: ... ; report = session.finish()
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.profiler = cProfile.Profile()
+        self.counter = [0]
+        self._token = None
+        self._started = 0.0
+
+    @classmethod
+    def start(cls, label: str) -> Optional["ProfileSession"]:
+        """Arranca el perfilado o devuelve None si ya hay otro en curso."""
+        if not _profiler_busy.acquire(blocking=False):
+            return None
+        install_sql_counter()
+        session = cls(label)
+        session._token = _sql_counter.set(session.counter)
+        session._started = time.perf_counter()
+        session.profiler.enable()
+        return session
+
+    def finish(self) -> dict:
+        """Detiene el perfilado, guarda el reporte y lo devuelve."""
+        self.profiler.disable()
+        wall_ms = (time.perf_counter() - self._started) * 1000
+        try:
+            _sql_counter.reset(self._token)
+        except ValueError:
+            # finish() llamado desde otro Context (p.ej. callback de send)
+            _sql_counter.set(None)
+        _profiler_busy.release()
+
+        stats = pstats.Stats(self.profiler)
+        stats.sort_stats("cumulative")
+        top = []
+        for (filename, line, func), (cc, nc, tt, ct, callers) in sorted(
+            stats.stats.items(), key=lambda item: item[1][3], reverse=True
+        )[: settings.PROFILE_TOP_N]:
+            top.append({
+                "function": f"{func} ({filename}:{line})",
+                "calls": nc,
+                "cumulative_ms": round(ct * 1000, 2),
+                "own_ms": round(tt * 1000, 2),
+            })
+
+        text = io.StringIO()
+        pstats.Stats(self.profiler, stream=text).sort_stats("cumulative").print_stats(40)
+
+        report = {
+            "id": uuid.uuid4().hex[:16],
+            "label": self.label,
+            "wall_ms": round(wall_ms, 2),
+            "sql_count": self.counter[0],
+            "top": top,
+            "text": text.getvalue(),
+        }
+        _store_report(report)
+        logger.info(
+            "profile id=%s label=%s wall_ms=%.1f sql=%d",
+            report["id"], self.label, wall_ms, self.counter[0],
+        )
+        return report
+
+
+def summarize(report: dict, n: int = 3) -> str:
+    """Resumen corto apto para header HTTP."""
+    top = ",".join(
+        f"{entry['function'].split(' ')[0]}:{entry['cumulative_ms']}ms"
+        for entry in report["top"][:n]
+    )
+    return f"wall_ms={report['wall_ms']};sql={report['sql_count']};top={top}"
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI que perfila el request si PROFILING_ENABLED está activo o
+    si trae un X-Profile-Token válido, y agrega X-Profile-Id/X-Profile-Summary
+    a la respuesta.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    def _wants_profile(self, scope) -> bool:
+        if settings.PROFILING_ENABLED:
+            return True
+        for name, value in scope.get("headers", []):
+            if name.decode("latin-1").lower() == PROFILE_HEADER:
+                return verify_profile_token(value.decode("latin-1"))
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path", "").startswith("/debug/profile"):
+            await self.app(scope, receive, send)
+            return
+        if not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        session = ProfileSession.start(f"{scope.get('method')} {scope.get('path')}")
+        if session is None:
+            await self.app(scope, receive, send)
+            return
+
+        finished = {}
+
+        async def send_with_profile(message):
+            if message["type"] == "http.response.start" and "report" not in finished:
+                finished["report"] = report = session.finish()
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", report["id"].encode()))
+                headers.append((b"x-profile-summary", summarize(report).encode("latin-1", "replace")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            if "report" not in finished:
+                finished["report"] = session.finish()
+
+
+def profiled(label: str):
+    """
+    Decorador para handlers de eventos de Socket.IO. Solo perfila si
+    PROFILING_ENABLED está activo; el id del reporte queda en el log.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not settings.PROFILING_ENABLED:
+                return await func(*args, **kwargs)
+            session = ProfileSession.start(label)
+            if session is None:
+                return await func(*args, **kwargs)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                session.finish()
+        return wrapper
+    return decorator
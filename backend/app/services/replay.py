@@ -0,0 +1,451 @@
+"""
+Replay binario compacto de partidas.
+
+Un replay es el reparto inicial más la secuencia ordenada de ActionsPerTurn,
+codificados como registros binarios con varints. Se genera en streaming (sin
+armar la partida en memoria ni pasar por objetos ORM) y se lee con
+read_replay() / ReplayState para reconstruir cualquier estado intermedio.
+
+Formato (versión 1):
+
+    b"DOTR" uvarint(version) opt(game_id) opt(room_id)
+    registros: tag (1 byte) + campos
+        STRING  uvarint(len) utf8      -> se agrega a la tabla de strings
+        PLAYER  campos de _PLAYER_FIELDS
+        CARD    campos de _CARD_FIELDS   (reparto inicial)
+        ACTION  campos de _ACTION_FIELDS (en orden de id)
+        END
+
+Todos los enteros son opcionales: 0 = None, si no zigzag(n) + 1 como uvarint
+(ids chicos = 1 byte, y admite posiciones negativas). Los strings y enums se
+internan: la primera vez se emite un registro STRING y después solo su índice.
+Los booleanos son 0 = None, 1 = False, 2 = True y los tiempos son segundos
+desde epoch.
+"""
+
+import enum
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models import (
+    ActionName,
+    ActionsPerTurn,
+    CardsXGame,
+    GameArchive,
+    GameDeal,
+    Player,
+    Room,
+    SourcePile,
+)
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"DOTR"
+REPLAY_VERSION = 1
+MEDIA_TYPE = "application/x-dotc-replay"
+
+TAG_END = 0
+TAG_STRING = 1
+TAG_PLAYER = 2
+TAG_CARD = 3
+TAG_ACTION = 4
+
+# Tipos de campo: i = entero, s = string / enum, b = booleano, t = tiempo
+_PLAYER_FIELDS = (("id", "i"), ("name", "s"), ("order", "i"))
+_CARD_FIELDS = (
+    ("id", "i"), ("id_card", "i"), ("is_in", "s"),
+    ("position", "i"), ("player_id", "i"), ("hidden", "b"),
+)
+_ACTION_FIELDS = (
+    ("id", "i"), ("parent_action_id", "i"), ("triggered_by_action_id", "i"),
+    ("turn_id", "i"), ("player_id", "i"), ("action_time", "t"),
+    ("action_name", "s"), ("action_type", "s"), ("result", "s"),
+    ("player_source", "i"), ("player_target", "i"), ("secret_target", "i"),
+    ("selected_card_id", "i"), ("card_given_id", "i"), ("card_received_id", "i"),
+    ("direction", "s"), ("source_pile", "s"), ("position_card", "i"),
+    ("selected_set_id", "i"), ("to_be_hidden", "b"),
+)
+_ACTION_COLUMNS = [ActionsPerTurn.__table__.c[name] for name, _ in _ACTION_FIELDS]
+_CARD_COLUMNS = [CardsXGame.__table__.c[name] for name, _ in _CARD_FIELDS]
+
+_EPOCH = datetime(1970, 1, 1)
+_CHUNK_SIZE = 64 * 1024
+
+
+class ReplayFormatError(ValueError):
+    """El buffer no es un replay válido."""
+
+
+# ------------------------------
+# VARINTS
+# ------------------------------
+def write_uvarint(buf: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def read_uvarint(data, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    try:
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result, pos
+            shift += 7
+    except IndexError:
+        raise ReplayFormatError("truncated varint") from None
+
+
+def _encode_opt_int(value: Optional[int]) -> int:
+    if value is None:
+        return 0
+    value = int(value)
+    return ((value << 1) ^ (value >> 63)) + 1
+
+
+def _decode_opt_int(raw: int) -> Optional[int]:
+    if raw == 0:
+        return None
+    raw -= 1
+    return (raw >> 1) ^ -(raw & 1)
+
+
+# ------------------------------
+# WRITER
+# ------------------------------
+class ReplayWriter:
+    """Codifica registros de replay en un buffer que se vacía con take()."""
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._strings: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def take(self) -> bytes:
+        data = bytes(self._buf)
+        self._buf.clear()
+        return data
+
+    def header(self, game_id: Optional[int], room_id: Optional[int]) -> None:
+        self._buf += MAGIC
+        write_uvarint(self._buf, REPLAY_VERSION)
+        write_uvarint(self._buf, _encode_opt_int(game_id))
+        write_uvarint(self._buf, _encode_opt_int(room_id))
+
+    def player(self, row) -> None:
+        self._record(TAG_PLAYER, _PLAYER_FIELDS, row)
+
+    def card(self, row) -> None:
+        self._record(TAG_CARD, _CARD_FIELDS, row)
+
+    def action(self, row) -> None:
+        self._record(TAG_ACTION, _ACTION_FIELDS, row)
+
+    def end(self) -> None:
+        self._buf.append(TAG_END)
+
+    def _intern(self, value) -> int:
+        if value is None:
+            return 0
+        if isinstance(value, enum.Enum):
+            value = value.value
+        index = self._strings.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._strings[value] = index
+            raw = value.encode("utf-8")
+            self._buf.append(TAG_STRING)
+            write_uvarint(self._buf, len(raw))
+            self._buf += raw
+        return index + 1
+
+    def _record(self, tag: int, fields, row) -> None:
+        # Los strings nuevos se emiten antes del registro que los usa
+        values = []
+        for name, kind in fields:
+            value = row[name]
+            if kind == "i":
+                values.append(_encode_opt_int(value))
+            elif kind == "s":
+                values.append(self._intern(value))
+            elif kind == "b":
+                values.append(0 if value is None else (2 if value else 1))
+            else:
+                values.append(_encode_opt_int(_to_seconds(value)))
+        self._buf.append(tag)
+        for value in values:
+            write_uvarint(self._buf, value)
+
+
+def _to_seconds(value) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return int((value - _EPOCH).total_seconds())
+
+
+# ------------------------------
+# READER
+# ------------------------------
+@dataclass
+class Replay:
+    game_id: Optional[int]
+    room_id: Optional[int]
+    players: List[Dict] = field(default_factory=list)
+    deal: List[Dict] = field(default_factory=list)
+    actions: List[Dict] = field(default_factory=list)
+
+    def state_at(self, n_actions: Optional[int] = None) -> "ReplayState":
+        """Estado después de aplicar las primeras `n_actions` acciones (todas si None)."""
+        state = ReplayState.from_deal(self.deal)
+        for action in self.actions[:n_actions]:
+            state.apply(action)
+        return state
+
+
+def iter_records(data: bytes) -> Iterator[Tuple[int, Dict]]:
+    """
+    Recorre los registros de un replay.
+
+    Yields:
+        (tag, dict) para PLAYER, CARD y ACTION. El header se devuelve como
+        (None, {"game_id", "room_id", "version"}) antes del primer registro.
+    """
+    view = memoryview(data)
+    if bytes(view[:4]) != MAGIC:
+        raise ReplayFormatError("bad magic")
+    version, pos = read_uvarint(view, 4)
+    if version != REPLAY_VERSION:
+        raise ReplayFormatError(f"unsupported replay version {version}")
+    game_id, pos = read_uvarint(view, pos)
+    room_id, pos = read_uvarint(view, pos)
+    yield None, {"version": version, "game_id": _decode_opt_int(game_id), "room_id": _decode_opt_int(room_id)}
+
+    strings: List[str] = []
+    layouts = {TAG_PLAYER: _PLAYER_FIELDS, TAG_CARD: _CARD_FIELDS, TAG_ACTION: _ACTION_FIELDS}
+    while pos < len(view):
+        tag = view[pos]
+        pos += 1
+        if tag == TAG_END:
+            return
+        if tag == TAG_STRING:
+            length, pos = read_uvarint(view, pos)
+            strings.append(bytes(view[pos:pos + length]).decode("utf-8"))
+            pos += length
+            continue
+        fields = layouts.get(tag)
+        if fields is None:
+            raise ReplayFormatError(f"unknown record tag {tag}")
+        record = {}
+        for name, kind in fields:
+            raw, pos = read_uvarint(view, pos)
+            if kind == "s":
+                record[name] = strings[raw - 1] if raw else None
+            elif kind == "b":
+                record[name] = None if raw == 0 else raw == 2
+            else:
+                record[name] = _decode_opt_int(raw)
+        yield tag, record
+    raise ReplayFormatError("missing END record")
+
+
+def read_replay(data: bytes) -> Replay:
+    records = iter_records(data)
+    _, header = next(records)
+    replay = Replay(game_id=header["game_id"], room_id=header["room_id"])
+    targets = {TAG_PLAYER: replay.players, TAG_CARD: replay.deal, TAG_ACTION: replay.actions}
+    for tag, record in records:
+        targets[tag].append(record)
+    return replay
+
+
+@dataclass
+class ReplayState:
+    """
+    Estado de la mesa reconstruido desde el reparto y las acciones.
+
+    Las manos y pilas se actualizan con los movimientos que dejan acción hija
+    en ActionsPerTurn (robo del mazo, draft, descarte de fin de turno y Early
+    Train). Los efectos que mueven cartas sin acción hija no se reflejan.
+
+    Las acciones guardan CardsXGame.id (card_given_id / card_received_id); el
+    estado se arma con el id de catálogo, traducido con el reparto.
+    """
+    hands: Dict[int, Counter] = field(default_factory=dict)
+    secrets: Dict[int, List[int]] = field(default_factory=dict)
+    draft: List[int] = field(default_factory=list)
+    discard: List[int] = field(default_factory=list)
+    deck_count: int = 0
+    turn_id: Optional[int] = None
+    actor_id: Optional[int] = None
+    applied: int = 0
+    _parents: Dict[int, Optional[str]] = field(default_factory=dict, repr=False)
+    _draft_picks: set = field(default_factory=set, repr=False)
+    _catalog_ids: Dict[int, int] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_deal(cls, deal: Iterable[Dict]) -> "ReplayState":
+        state = cls()
+        for card in sorted(deal, key=lambda c: (c["is_in"] or "", c["position"] or 0)):
+            state._catalog_ids[card["id"]] = card["id_card"]
+            where = card["is_in"]
+            if where == "HAND":
+                state.hands.setdefault(card["player_id"], Counter())[card["id_card"]] += 1
+            elif where == "SECRET_SET":
+                state.secrets.setdefault(card["player_id"], []).append(card["id_card"])
+            elif where == "DRAFT":
+                state.draft.append(card["id_card"])
+            elif where == "DISCARD":
+                state.discard.append(card["id_card"])
+            elif where == "DECK":
+                state.deck_count += 1
+        return state
+
+    def apply(self, action: Dict) -> None:
+        self.applied += 1
+        if action["turn_id"] is not None:
+            self.turn_id = action["turn_id"]
+        self.actor_id = action["player_id"]
+
+        parent_id = action["parent_action_id"]
+        if parent_id is None:
+            self._parents[action["id"]] = action["action_name"]
+            return
+        parent_name = self._parents.get(parent_id)
+        player_id = action["player_id"]
+        pile = action["source_pile"]
+
+        if action["action_type"] == "DRAW" and action["card_received_id"] is not None:
+            card_id = self._catalog_ids.get(action["card_received_id"])
+            if pile == SourcePile.DRAW_PILE.value:
+                self.deck_count -= 1
+                self._add(player_id, card_id)
+            elif pile == SourcePile.DRAFT_PILE.value:
+                # El primer hijo del draft es la carta elegida, el segundo la reposición
+                if parent_id not in self._draft_picks:
+                    self._draft_picks.add(parent_id)
+                    self._remove_first(self.draft, card_id)
+                    self._add(player_id, card_id)
+                else:
+                    self.deck_count -= 1
+                    self.draft.append(card_id)
+        elif action["action_type"] == "DISCARD" and action["card_given_id"] is not None:
+            card_id = self._catalog_ids.get(action["card_given_id"])
+            if parent_name == ActionName.EARLY_TRAIN_TO_PADDINGTON.value:
+                self.deck_count -= 1
+            else:
+                hand = self.hands.get(player_id)
+                if hand and hand[card_id] > 0:
+                    hand[card_id] -= 1
+            self.discard.append(card_id)
+
+    def _add(self, player_id: int, card_id: int) -> None:
+        self.hands.setdefault(player_id, Counter())[card_id] += 1
+
+    @staticmethod
+    def _remove_first(cards: List[int], card_id: int) -> None:
+        try:
+            cards.remove(card_id)
+        except ValueError:
+            pass
+
+
+# ------------------------------
+# EXPORT
+# ------------------------------
+def encode_deal(rows: Iterable) -> bytes:
+    writer = ReplayWriter()
+    writer.header(None, None)
+    for row in rows:
+        writer.card(row)
+    writer.end()
+    return writer.take()
+
+
+def record_initial_deal(db: Session, game_id: int) -> GameDeal:
+    """
+    Guarda el reparto inicial de la partida (llamar justo después de repartir).
+
+    Args:
+        db: Sesión de base de datos
+        game_id: ID del juego
+
+    Returns:
+        GameDeal creado
+    """
+    rows = db.execute(
+        select(*_CARD_COLUMNS).where(CardsXGame.id_game == game_id).order_by(CardsXGame.id)
+    ).mappings()
+    deal = GameDeal(id_game=game_id, payload=encode_deal(rows))
+    db.merge(deal)
+    db.commit()
+    return deal
+
+
+def _action_rows(db: Session, game_id: int) -> Iterator:
+    archive = db.get(GameArchive, game_id)
+    if archive is not None:
+        from app.services.game_archive import decode_payload
+        yield from decode_payload(archive.payload)["actions"]
+        return
+    result = db.execute(
+        select(*_ACTION_COLUMNS)
+        .where(ActionsPerTurn.id_game == game_id)
+        .order_by(ActionsPerTurn.id)
+        .execution_options(yield_per=500)
+    )
+    yield from result.mappings()
+
+
+def iter_replay(db: Session, room: Room, chunk_size: int = _CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Genera el replay de la partida de `room` en chunks de ~chunk_size bytes.
+
+    Las filas se leen como tuplas (sin ORM) y en streaming; para partidas
+    archivadas las acciones salen del archivo.
+    """
+    game_id = room.id_game
+    writer = ReplayWriter()
+    writer.header(game_id, room.id)
+
+    players = db.execute(
+        select(Player.id, Player.name, Player.order)
+        .where(Player.id_room == room.id)
+        .order_by(Player.order)
+    ).mappings()
+    for row in players:
+        writer.player(row)
+
+    deal = db.get(GameDeal, game_id)
+    if deal is not None:
+        for tag, card in iter_records(deal.payload):
+            if tag == TAG_CARD:
+                writer.card(card)
+    else:
+        logger.debug("replay without initial deal game=%s", game_id)
+
+    for row in _action_rows(db, game_id):
+        writer.action(row)
+        if len(writer) >= chunk_size:
+            yield writer.take()
+
+    writer.end()
+    yield writer.take()
+
+
+def export_replay(db: Session, room: Room) -> bytes:
+    return b"".join(iter_replay(db, room))
@@ -0,0 +1,137 @@
+"""
+Anillo de asientos por sala para rotación de turnos y efectos direccionales.
+
+finish_turn, actualizar_turno y Dead Card Folly necesitaban "el jugador
+siguiente / anterior" y para eso cargaban todos los Player de la sala
+ordenados por `order` y recorrían la lista. El orden de la mesa solo cambia
+cuando cambia la membresía (join / leave / start / fin de partida), así que
+se arma una vez un SeatRing inmutable y se reutiliza:
+
+- start_game lo construye con los jugadores ya ordenados.
+- join / leave / create / fin de partida lo invalidan.
+- Si no está (p.ej. después de reiniciar el proceso) ensure() lo arma con
+  una sola query.
+
+Convención de direcciones (igual que crud.get_player_neighbor_by_direction):
+RIGHT = order siguiente, LEFT = order anterior, ambas circulares.
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Direction, Player
+
+logger = logging.getLogger(__name__)
+
+
+class SeatRing:
+    """
+    Orden circular (inmutable) de los jugadores de una sala.
+
+    Attributes:
+        room_id: ID de la sala
+        seats: player_ids en orden de mesa
+    """
+
+    __slots__ = ("room_id", "seats", "_index")
+
+    def __init__(self, room_id: int, seats: Iterable[int]):
+        self.room_id = room_id
+        self.seats: Tuple[int, ...] = tuple(seats)
+        self._index: Dict[int, int] = {pid: i for i, pid in enumerate(self.seats)}
+
+    def __len__(self) -> int:
+        return len(self.seats)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._index
+
+    def _step(self, player_id: int, offset: int) -> Optional[int]:
+        idx = self._index.get(player_id)
+        if idx is None or len(self.seats) <= 1:
+            return None
+        return self.seats[(idx + offset) % len(self.seats)]
+
+    def next(self, player_id: int) -> Optional[int]:
+        """Jugador siguiente en la mesa (RIGHT), o None si no hay vecino."""
+        return self._step(player_id, 1)
+
+    def prev(self, player_id: int) -> Optional[int]:
+        """Jugador anterior en la mesa (LEFT), o None si no hay vecino."""
+        return self._step(player_id, -1)
+
+    def neighbor(self, player_id: int, direction: Direction) -> Optional[int]:
+        if direction == Direction.LEFT:
+            return self.prev(player_id)
+        return self.next(player_id)
+
+    def rotation(self, direction: Direction) -> Dict[int, int]:
+        """
+        Mapa player_id -> vecino en `direction` para todos los asientos
+        (p.ej. a quién le pasa carta cada jugador en Dead Card Folly).
+        """
+        if len(self.seats) <= 1:
+            return {}
+        offset = -1 if direction == Direction.LEFT else 1
+        n = len(self.seats)
+        return {pid: self.seats[(i + offset) % n] for i, pid in enumerate(self.seats)}
+
+
+class SeatRingRegistry:
+    """SeatRings indexados por room_id."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rings: Dict[int, SeatRing] = {}
+
+    def get(self, room_id: int) -> Optional[SeatRing]:
+        return self._rings.get(room_id)
+
+    def build(self, room_id: int, players: Iterable) -> SeatRing:
+        """Arma el anillo a partir de jugadores ya ordenados por `order`."""
+        ring = SeatRing(room_id, (p.id for p in players))
+        with self._lock:
+            self._rings[room_id] = ring
+        return ring
+
+    def ensure(self, db: Session, room_id: int) -> SeatRing:
+        """Devuelve el anillo de la sala, cargándolo desde la BD si hace falta."""
+        ring = self._rings.get(room_id)
+        if ring is None:
+            players = (
+                db.query(Player)
+                .filter(Player.id_room == room_id)
+                .order_by(Player.order)
+                .all()
+            )
+            ring = self.build(room_id, players)
+            logger.debug("seat ring loaded room=%s seats=%d", room_id, len(ring))
+        return ring
+
+    def invalidate(self, room_id: int) -> None:
+        with self._lock:
+            self._rings.pop(room_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rings.clear()
+
+
+# Instancia global del registro
+_seat_rings: Optional[SeatRingRegistry] = None
+
+
+def get_seat_rings() -> SeatRingRegistry:
+    """
+    Obtiene la instancia global del SeatRingRegistry (Singleton).
+
+    Returns:
+        SeatRingRegistry instance
+    """
+    global _seat_rings
+    if _seat_rings is None:
+        _seat_rings = SeatRingRegistry()
+    return _seat_rings
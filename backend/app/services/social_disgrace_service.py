@@ -1,13 +1,26 @@
 """
 Servicio para manejar la lógica de desgracia social.
 Un jugador entra en desgracia social cuando todos sus secretos están revelados.
+
+Para partidas con GameTracker (ver game_tracker.py) los contadores de
+secretos ocultos/totales y el conjunto de jugadores en desgracia ya están en
+memoria: entrar o salir de desgracia se detecta sin leer la BD y las
+altas/bajas en SocialDisgracePlayer se escriben junto con el commit del
+llamador.
 """
 from sqlalchemy.orm import Session
 import asyncio
-from app.db import crud
+from datetime import datetime
+from app.db import crud, models
 import logging
 from typing import List, Dict, Optional
 from ..db.database import SessionLocal
+from .game_tracker import (
+    get_game_tracker,
+    has_uncommitted_card_changes,
+    is_disgrace_registered,
+    queue_disgrace_change,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +49,7 @@ def check_player_social_disgrace_status(
         secrets = crud.get_player_secrets(db, game_id, player_id)
         
         if not secrets:
-            logger.debug(f"Player {player_id} has no secrets in game {game_id}")
+            logger.debug("Player %s has no secrets in game %s", player_id, game_id)
             return False # cambiar a true si consideramos sin secretos como desgracia
         
         all_revealed = all(not secret.hidden for secret in secrets)
@@ -60,6 +73,10 @@ def update_social_disgrace_status_no_commit(
     """
     Actualiza el estado de desgracia social de un jugador SIN hacer commit.
     """
+    tracker = get_game_tracker(game_id)
+    if tracker is not None and not has_uncommitted_card_changes(db, game_id):
+        return _update_tracked_disgrace_no_commit(db, tracker, player_id)
+
     try:
         should_be_in_disgrace = check_player_social_disgrace_status(db, game_id, player_id)
         is_in_disgrace = crud.check_player_in_social_disgrace(db, game_id, player_id)
@@ -104,7 +121,7 @@ def update_social_disgrace_status_no_commit(
             }
         
         # Sin cambios
-        logger.debug(f"No changes in social disgrace status for player {player_id} in game {game_id}")
+        logger.debug("No changes in social disgrace status for player %s in game %s", player_id, game_id)
         return None
         
     except Exception as e:
@@ -112,6 +129,50 @@ def update_social_disgrace_status_no_commit(
         return None
 
 
+def _update_tracked_disgrace_no_commit(db: Session, tracker, player_id: int) -> Optional[Dict]:
+    """
+    Variante sin lecturas de update_social_disgrace_status_no_commit: el
+    estado sale de los contadores del tracker y la escritura queda en la
+    Session hasta el commit del llamador.
+    """
+    game_id = tracker.game_id
+    should_be_in_disgrace = player_id in tracker.disgraced
+    is_in_disgrace = is_disgrace_registered(db, tracker, player_id)
+    if should_be_in_disgrace == is_in_disgrace:
+        logger.debug("No changes in social disgrace status for player %s in game %s", player_id, game_id)
+        return None
+
+    try:
+        if should_be_in_disgrace:
+            entered_at = datetime.now()
+            db.add(models.SocialDisgracePlayer(
+                id_game=game_id, player_id=player_id, entered_at=entered_at
+            ))
+            queue_disgrace_change(db, game_id, player_id, entered_at)
+            action = "entered"
+        else:
+            db.query(models.SocialDisgracePlayer).filter(
+                models.SocialDisgracePlayer.id_game == game_id,
+                models.SocialDisgracePlayer.player_id == player_id
+            ).delete(synchronize_session=False)
+            queue_disgrace_change(db, game_id, player_id, None)
+            action = "exited"
+    except Exception as e:
+        logger.error(f"Error updating social disgrace status (no commit): {e}")
+        return None
+
+    info = tracker.players.get(player_id, {})
+    player_name = info.get("name") or f"Player {player_id}"
+    logger.info(f"{player_name} (ID: {player_id}) {action} social disgrace in game {game_id}")
+    return {
+        "action": action,
+        "player_id": player_id,
+        "player_name": player_name,
+        "avatar_src": info.get("avatar_src") or "./avatar1.jpg",
+        "game_id": game_id
+    }
+
+
 def update_social_disgrace_status(
     db: Session, 
     game_id: int, 
@@ -187,7 +248,7 @@ def get_players_in_social_disgrace(db: Session, game_id: int) -> List[Dict]:
                 "entered_at": record["entered_at"].isoformat()
             })
         
-        logger.debug(f"Found {len(result)} players in social disgrace for game {game_id}")
+        logger.debug("Found %s players in social disgrace for game %s", len(result), game_id)
         return result
         
     except Exception as e:
@@ -202,10 +263,25 @@ async def notify_social_disgrace_change(
     """
     Emite una notificación por WebSocket sobre cambios en desgracia social.
     """
-    logger.warning(f"DEBUG: 5. ¡'notify_social_disgrace_change' FUE LLAMADO para game_id {game_id}!")
+    logger.debug("notify_social_disgrace_change game=%s", game_id)
     
     from app.sockets.socket_service import get_websocket_service
     from app.db.database import SessionLocal
+
+    # Con tracker la lista ya está en memoria (y es la commiteada): sin
+    # sesión, sin re-sincronizar y sin reintento por race condition
+    tracker = get_game_tracker(game_id)
+    if tracker is not None:
+        try:
+            await get_websocket_service().notificar_social_disgrace_update(
+                room_id=tracker.room_id,
+                game_id=game_id,
+                players_in_disgrace=tracker.disgrace_entries(),
+                change_info=change_info
+            )
+        except Exception as e:
+            logger.error(f"Error notifying social disgrace change: {e}", exc_info=True)
+        return
     
     db = SessionLocal() # Abrimos sesión UNA SOLA VEZ
     local_room_id = None # <-- Variable local para el ID
@@ -214,31 +290,31 @@ async def notify_social_disgrace_change(
         # 1. Obtenemos el room y guardamos su ID en una variable simple
         room = crud.get_room_by_game_id(db, game_id)
         if not room:
-            logger.error(f"DEBUG: 5a. NO SE ENCONTRÓ ROOM para game {game_id}")
+            logger.error("5a. NO SE ENCONTRÓ ROOM para game %s", game_id)
             return
         
         local_room_id = room.id # <-- ¡SOLUCIÓN AL CRASH!
-        logger.warning(f"DEBUG: 5b. Room ID {local_room_id} obtenido.")
+        logger.debug("5b. Room ID %s obtenido.", local_room_id)
         
         # 2. Sincronizamos la sesión
         db.commit() 
-        logger.warning("DEBUG: 6a. (Nueva Sesión) Commit inicial hecho para sincronizar.")
+        logger.debug("6a. (Nueva Sesión) Commit inicial hecho para sincronizar.")
         
         # 3. Consultamos la lista
         players_in_disgrace = get_players_in_social_disgrace(db, game_id)
         
         # 4. Si sigue vacía, re-intentamos (esto es por el race condition)
         if not players_in_disgrace and change_info and change_info.get("action") == "entered":
-            logger.warning(f"DEBUG: 6b. AÚN vacía. (Race Condition). Esperando 200ms y re-sincronizando...")
+            logger.debug("6b. AÚN vacía. (Race Condition). Esperando 200ms y re-sincronizando...")
             await asyncio.sleep(0.2)
             db.commit() # Re-sincronizamos
             players_in_disgrace = get_players_in_social_disgrace(db, game_id)
-            logger.warning(f"DEBUG: 6c. Segunda consulta (post-sleep) devolvió: {players_in_disgrace}")
+            logger.debug("6c. Segunda consulta (post-sleep) devolvió: %s", players_in_disgrace)
         
         ws_service = get_websocket_service()
         
         # 5. Usamos la variable local 'local_room_id'
-        logger.warning(f"DEBUG: 6. Emitiendo 'social_disgrace_update' a room_id {local_room_id}...")
+        logger.debug("6. Emitiendo 'social_disgrace_update' a room_id %s...", local_room_id)
         
         await ws_service.notificar_social_disgrace_update(
             room_id=local_room_id, # <-- USAMOS LA VARIABLE LOCAL
@@ -247,13 +323,13 @@ async def notify_social_disgrace_change(
             change_info=change_info
         )
         
-        logger.warning("DEBUG: 7. EMISIÓN COMPLETA.")
+        logger.debug("7. EMISIÓN COMPLETA.")
         
     except Exception as e:
         logger.error(f"Error notifying social disgrace change: {e}", exc_info=True)
     finally:
         if 'db' in locals() and db.is_active:
-             logger.warning("DEBUG: 8. Cerrando sesión final.")
+             logger.debug("8. Cerrando sesión final.")
              db.close()
 
 
@@ -264,11 +340,11 @@ async def check_and_notify_social_disgrace(game_id: int, player_id: int):
     Esta es la forma SEGURA de llamarlo desde un endpoint
     después de un commit, ya que evita datos "rancios" (stale data).
     """
-    logger.warning(f"DEBUG (check_and_notify): Iniciando chequeo para player {player_id} en game {game_id} (SESIÓN NUEVA)")
+    logger.debug("check_and_notify: Iniciando chequeo para player %s en game %s (SESIÓN NUEVA)", player_id, game_id)
     db = SessionLocal()  # Crea una sesion limpia
     try:
         db.commit()
-        logger.warning("DEBUG (check_and_notify): 'commit' inicial (sync) HECHO.")
+        logger.debug("check_and_notify: 'commit' inicial (sync) HECHO.")
         # Usamos la función con commit
         change_info = update_social_disgrace_status(
             db=db,
@@ -276,7 +352,7 @@ async def check_and_notify_social_disgrace(game_id: int, player_id: int):
             player_id=player_id
         )
         
-        logger.warning(f"DEBUG (check_and_notify): 'update_social_disgrace_status' (sesión limpia) devolvió: {change_info}")
+        logger.debug("check_and_notify: 'update_social_disgrace_status' (sesión limpia) devolvió: %s", change_info)
         db.expire_all()
 
         from ..services.game_service import win_for_total_disgrace
@@ -284,19 +360,19 @@ async def check_and_notify_social_disgrace(game_id: int, player_id: int):
         
         # Si el juego termino, no envia notificacion de "desgracia social",
         if game_has_ended:
-            logger.warning(f"DEBUG (check_and_notify): Juego terminado por TOTAL_DISGRACE. No se enviará 'social_disgrace_update'.")
+            logger.debug("check_and_notify: Juego terminado por TOTAL_DISGRACE. No se enviará 'social_disgrace_update'.")
             return
 
         # Si el juego no termino --> verifica si hay un cambio y notifica
         if change_info:
-            logger.warning(f"DEBUG (check_and_notify): Hubo cambio, llamando a notify...")
+            logger.debug("check_and_notify: Hubo cambio, llamando a notify...")
             # Esta función (notify...) también crea su propia sesion
             await notify_social_disgrace_change(
                 game_id=game_id,
                 change_info=change_info
             )
         else:
-            logger.warning(f"DEBUG (check_and_notify): No hubo cambios.")
+            logger.debug("check_and_notify: No hubo cambios.")
 
     except Exception as e:
         logger.error(f"Error en check_and_notify_social_disgrace: {e}", exc_info=True)
@@ -2,9 +2,12 @@ from sqlalchemy.orm import Session
 from app.db.models import CardsXGame, CardState, Game, ActionType, SourcePile, ActionResult, ActionName
 from app.db.crud import get_current_turn, create_parent_card_action, create_card_action
 from typing import List
+import logging
+
+logger = logging.getLogger(__name__)
 
 async def robar_cartas_del_mazo(db, game, user_id, cantidad):
-    print(f"🎴 Robando {cantidad} carta(s) del mazo para jugador {user_id}")
+    logger.debug("🎴 Robando %s carta(s) del mazo para jugador %s", cantidad, user_id)
     
     # Get current turn for action logging
     current_turn = get_current_turn(db, game.id)
@@ -40,17 +43,18 @@ async def robar_cartas_del_mazo(db, game, user_id, cantidad):
             player_id=user_id,
             action_type=ActionType.DRAW,
             source_pile=SourcePile.DRAW_PILE,
-            card_id=card.id_card,
+            card_id=card.id,
             position=card.position,
             result=ActionResult.SUCCESS,
-            parent_action_id=parent_action.id
+            parent_action_id=parent_action.id,
+            deferred=True
         )
         
         # resetear dueño
         card.player_id = user_id
         card.is_in = CardState.HAND
-        print(f"  ✓ Carta {card.id_card} ({card.card.name if card.card else 'N/A'}) → mano del jugador")
+        logger.debug("✓ Carta %s (%s) → mano del jugador", card.id_card, card.card.name if card.card else 'N/A')
 
     db.commit()
-    print(f"✅ Total robado: {len(drawn)} carta(s)")
+    logger.debug("✅ Total robado: %s carta(s)", len(drawn))
     return drawn
\ No newline at end of file
@@ -125,8 +125,8 @@ class TimerManager:
                 )
                 
                 logger.debug(
-                    f"⏱️ NSF action {timer.nsf_action_id} - "
-                    f"{current_time}s restantes"
+                    "⏱️ NSF action %s - %ss restantes",
+                    timer.nsf_action_id, current_time
                 )
                 
                 # Esperar 1 segundo
@@ -0,0 +1,8 @@
+from .catalog import DEFAULT_CATALOG_SQL, CatalogCard, catalog_from_db, load_catalog
+from .engine import GameResult, SimGame, play_game
+from .runner import SimulationReport, run_simulations
+
+__all__ = [
+    'DEFAULT_CATALOG_SQL', 'CatalogCard', 'GameResult', 'SimGame', 'SimulationReport',
+    'catalog_from_db', 'load_catalog', 'play_game', 'run_simulations',
+]
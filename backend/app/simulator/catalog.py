@@ -0,0 +1,58 @@
+"""
+Catálogo de cartas para el simulador, sin base de datos: se lee de
+scripts/carga-datos.sql (la misma carga que usa create_db) o de una sesión
+si se quiere simular con la tabla `card` de un servidor.
+"""
+
+import os
+import re
+from typing import List, NamedTuple
+
+from sqlalchemy.orm import Session
+
+DEFAULT_CATALOG_SQL = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "scripts", "carga-datos.sql",
+)
+
+_CARD_INSERT = re.compile(r"INSERT INTO card \(name, description, type, img_src, qty\) VALUES(.*?);", re.S)
+_CARD_ROW = re.compile(r"\('((?:[^']|'')*)',\s*'(?:[^']|'')*',\s*'(\w+)',\s*'[^']*',\s*(\d+)\)")
+
+
+class CatalogCard(NamedTuple):
+    """Fila de `card` con lo que usa el reparto (type es el valor de CardType)."""
+    id: int
+    name: str
+    type: str
+    qty: int
+
+
+def load_catalog(path: str = DEFAULT_CATALOG_SQL) -> List[CatalogCard]:
+    """
+    Lee las cartas del INSERT de `card` de un script SQL.
+
+    Los ids son los que les da el autoincrement a una tabla vacía (1, 2, ...
+    en el orden del INSERT), los mismos que usan los servicios.
+
+    Raises:
+        ValueError si el script no tiene el INSERT de cartas
+    """
+    with open(path, encoding="utf-8") as f:
+        sql = f.read()
+    block = _CARD_INSERT.search(sql)
+    if block is None:
+        raise ValueError(f"No card INSERT found in {path}")
+    return [
+        CatalogCard(card_id, name.replace("''", "'"), card_type, int(qty))
+        for card_id, (name, card_type, qty) in enumerate(_CARD_ROW.findall(block.group(1)), start=1)
+    ]
+
+
+def catalog_from_db(db: Session) -> List[CatalogCard]:
+    """Catálogo desde la tabla `card` de una base."""
+    from app.db.models import Card
+
+    return [
+        CatalogCard(card.id, card.name, card.type.value if hasattr(card.type, "value") else card.type, card.qty)
+        for card in db.query(Card).order_by(Card.id).all()
+    ]
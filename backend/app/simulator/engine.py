@@ -0,0 +1,339 @@
+"""
+Motor de partidas en memoria: reparte con game_rules.deal_cards y juega
+turno por turno con las mismas reglas que los servicios (validación de sets,
+qué se puede cancelar, paridad de la cadena NSF) sin ORM, sockets ni timers.
+
+Las decisiones siguen a los bots (app/bots/): las mismas jugadas legales y
+las probabilidades de su Strategy. Cada partida cuenta sus jugadas con los
+nombres de request de BotStats.moves, así la mezcla de acciones del
+simulador se compara directo con la de run_bots.py.
+"""
+
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from app.bots.rules import (
+    CARDS_OFF_THE_TABLE_CARD_ID,
+    DELAY_ESCAPE_CARD_ID,
+    EARLY_TRAIN_CARD_ID,
+    HAND_SIZE,
+    LOOK_INTO_ASHES_CARD_ID,
+    NOT_SO_FAST_CARD_ID,
+    ONE_STEP_SETS,
+    find_events,
+    find_nsf,
+)
+from app.schemas.detective_set_schema import SetType
+from app.services.game_rules import (
+    EILEEN_BRENT_CARD_ID,
+    MURDERER_SECRET_NAME,
+    NSF_CANCELLED,
+    NSF_CONTINUE,
+    SetPlay,
+    deal_cards,
+    find_detective_sets,
+    is_event_cancellable,
+    is_set_cancellable,
+    nsf_chain_result,
+)
+
+# Resultados de una partida
+MURDERER_CAUGHT = "murderer_caught"      # se reveló el secreto del asesino
+MURDERER_ESCAPED = "murderer_escaped"    # se terminaron mazo y draft
+TOTAL_DISGRACE = "total_disgrace"        # todos los detectives en desgracia social
+TURN_LIMIT = "turn_limit"                # corte de seguridad del simulador
+DETECTIVE_OUTCOMES = frozenset((MURDERER_CAUGHT,))
+
+# Eventos que sacan la carta del juego en vez de mandarla al descarte
+REMOVED_EVENT_CARD_IDS = frozenset((DELAY_ESCAPE_CARD_ID, EARLY_TRAIN_CARD_ID))
+EARLY_TRAIN_CARDS = 6
+DELAY_ESCAPE_MAX = 5
+LOOK_INTO_ASHES_CARDS = 5
+
+
+@dataclass
+class GameResult:
+    """Cómo terminó una partida simulada."""
+    outcome: str
+    turns: int
+    actions: Counter = field(default_factory=Counter)
+
+
+class SimGame:
+    """
+    Una partida en memoria.
+
+    Las cartas en mano, draft, mazo y descarte son dicts con `id` (único en la
+    partida, como CardsXGame.id) y `card_id`, el mismo formato que ven los
+    bots; los secretos llevan además `hidden`. El tope del mazo y del
+    descarte es el final de la lista.
+
+    Args:
+        catalog: Filas de `card` (ver catalog.load_catalog)
+        players: Jugadores (2-6)
+        rng: random.Random de la partida
+        play_rate: Probabilidad de jugar un set / evento si hay uno
+        nsf_rate: Probabilidad de responder con NSF cuando conviene
+        draft_rate: Probabilidad de reponer del draft cada carta
+        max_turns: Corte de seguridad
+    """
+
+    def __init__(self, catalog: Sequence, players: int, rng: random.Random,
+                 play_rate: float = 0.8, nsf_rate: float = 0.5, draft_rate: float = 0.5,
+                 max_turns: int = 1000):
+        self.rng = rng
+        self.players = players
+        self.play_rate = play_rate
+        self.nsf_rate = nsf_rate
+        self.draft_rate = draft_rate
+        self.max_turns = max_turns
+        self.actions: Counter = Counter()
+        self.turns = 0
+        self.outcome: Optional[str] = None
+        self._next_id = 0
+
+        deal = deal_cards(catalog, players, rng)
+        self.murderer = deal.murderer
+        self.accomplice = deal.accomplice
+        self.murderer_card_id = next((c.id for c in catalog if c.name == MURDERER_SECRET_NAME), None)
+        self.hands: List[List[Dict]] = [[self._card(c) for c in hand] for hand in deal.hands]
+        self.secrets: List[List[Dict]] = [
+            [dict(self._card(c), hidden=True) for c in secrets] for secrets in deal.secrets
+        ]
+        self.draft: List[Dict] = [self._card(c) for c in deal.draft]
+        self.deck: List[Dict] = [self._card(c) for c in reversed(deal.deck)]
+        self.discard: List[Dict] = [self._card(deal.discard)] if deal.discard else []
+
+    def _card(self, row) -> Dict:
+        self._next_id += 1
+        return {"id": self._next_id, "card_id": row.id}
+
+    # ---------- partida ----------
+
+    def play(self) -> GameResult:
+        """Juega hasta el final desde el primer asiento."""
+        seat = 0
+        while self.outcome is None:
+            if self.turns >= self.max_turns:
+                self.outcome = TURN_LIMIT
+                break
+            self.take_turn(seat)
+            seat = (seat + 1) % self.players
+        return GameResult(self.outcome, self.turns, self.actions)
+
+    def take_turn(self, seat: int) -> None:
+        """Una jugada opcional, descarte, reponer la mano y terminar el turno."""
+        self.turns += 1
+        hand = self.hands[seat]
+
+        if not self.is_disgraced(seat):
+            play = self.choose_play(seat)
+            if isinstance(play, SetPlay):
+                self.play_set(seat, play)
+            elif play is not None:
+                self.play_event(seat, play)
+            if self.outcome is not None:
+                return
+
+        if hand:
+            # En desgracia social solo se puede descartar una carta
+            count = 1 if self.is_disgraced(seat) else self.rng.randint(1, min(3, len(hand)))
+            for card in self.rng.sample(hand, count):
+                hand.remove(card)
+                self.discard.append(card)
+            self.actions["discard"] += 1
+
+        self.refill(seat)
+        if self.outcome is not None:
+            return
+        self.actions["finish_turn"] += 1
+
+    def refill(self, seat: int) -> None:
+        hand = self.hands[seat]
+        for card in list(self.draft):
+            if len(hand) >= HAND_SIZE:
+                break
+            # Sin mazo solo queda el draft
+            if self.deck and self.rng.random() >= self.draft_rate:
+                continue
+            self.draft.remove(card)
+            hand.append(card)
+            if self.deck:
+                self.draft.append(self.deck.pop())
+            self.actions["draft_pick"] += 1
+
+        missing = HAND_SIZE - len(hand)
+        if missing > 0 and self.deck:
+            for _ in range(min(missing, len(self.deck))):
+                hand.append(self.deck.pop())
+            self.actions["take_deck"] += 1
+
+        # Como procesar_ultima_carta: sin mazo ni draft el asesino escapa
+        if not self.deck and not self.draft:
+            self.outcome = MURDERER_ESCAPED
+
+    # ---------- decisiones ----------
+
+    def choose_play(self, seat: int) -> Union[SetPlay, Dict, None]:
+        hand = self.hands[seat]
+        options: List[Union[SetPlay, Dict]] = [
+            play for play in find_detective_sets(hand) if self._set_targets(seat, play.set_type)
+        ]
+        options += [card for card in find_events(hand) if self._event_is_playable(seat, card)]
+        if not options or self.rng.random() >= self.play_rate:
+            return None
+        return self.rng.choice(options)
+
+    def _set_targets(self, seat: int, set_type: SetType) -> List[Tuple[int, Dict]]:
+        """Secretos de otros jugadores sobre los que el set puede actuar."""
+        hidden = set_type != SetType.PYNE
+        return [
+            (target, secret)
+            for target in range(self.players) if target != seat
+            for secret in self.secrets[target] if secret["hidden"] == hidden
+        ]
+
+    def _event_is_playable(self, seat: int, card: Dict) -> bool:
+        if card["card_id"] == CARDS_OFF_THE_TABLE_CARD_ID:
+            return self.players > 1
+        if card["card_id"] == EARLY_TRAIN_CARD_ID:
+            return len(self.deck) > HAND_SIZE
+        return bool(self.discard)
+
+    # ---------- NSF ----------
+
+    def nsf_window(self, seat: int, cancellable: bool) -> bool:
+        """
+        Abre la ventana NSF de una jugada: los rivales juegan NSF para que la
+        cadena quede impar y el dueño contra-NSF para que quede par.
+
+        Returns:
+            True si la jugada sigue
+        """
+        self.actions["start_action"] += 1
+        others_have_nsf = any(
+            find_nsf(self.hands[other]) for other in range(self.players) if other != seat
+        )
+        if not cancellable or not others_have_nsf:
+            return True
+
+        chain = 0
+        while True:
+            if nsf_chain_result(chain) == NSF_CONTINUE:
+                candidates = [other for other in range(self.players) if other != seat]
+            else:
+                candidates = [seat]
+            responders = [
+                player for player in candidates
+                if find_nsf(self.hands[player]) and self.rng.random() < self.nsf_rate
+            ]
+            if not responders:
+                break
+            player = self.rng.choice(responders)
+            card = find_nsf(self.hands[player])
+            self.hands[player].remove(card)
+            self.discard.append(card)
+            self.actions["nsf"] += 1
+            chain += 1
+
+        if nsf_chain_result(chain) == NSF_CANCELLED:
+            self.actions["cancel_action"] += 1
+            return False
+        return True
+
+    # ---------- jugadas ----------
+
+    def play_set(self, seat: int, play: SetPlay) -> None:
+        hand = self.hands[seat]
+        cards = [card for card in hand if card["id"] in play.cards]
+        card_types = [card["card_id"] for card in cards]
+        if not self.nsf_window(seat, is_set_cancellable(card_types)):
+            # Cancelado: con Eileen vuelve a la mano, si no el set queda bajado sin efecto
+            if EILEEN_BRENT_CARD_ID not in card_types:
+                self._remove_from_hand(seat, cards)
+            return
+
+        self._remove_from_hand(seat, cards)
+        self.actions[f"set:{play.set_type.value}"] += 1
+        target, secret = self.rng.choice(self._set_targets(seat, play.set_type))
+
+        if play.set_type == SetType.PYNE:
+            self.actions["detective_action"] += 1
+            secret["hidden"] = True
+            return
+        if play.set_type in ONE_STEP_SETS:
+            self.actions["detective_action"] += 1
+        else:
+            # El target elige: nunca entrega su secreto de asesino si tiene otro
+            self.actions["detective_target"] += 1
+            self.actions["detective_reply"] += 1
+            hidden = [s for s in self.secrets[target] if s["hidden"]]
+            safe = [s for s in hidden if s["card_id"] != self.murderer_card_id]
+            secret = self.rng.choice(safe or hidden)
+
+        self.reveal(secret)
+        if self.outcome is None and play.set_type == SetType.SATTERTHWAITE and play.has_wildcard:
+            # Con comodín el secreto revelado pasa boca abajo a los secretos del que jugó
+            self.secrets[target].remove(secret)
+            secret["hidden"] = True
+            self.secrets[seat].append(secret)
+            self._check_total_disgrace()
+
+    def play_event(self, seat: int, card: Dict) -> None:
+        card_id = card["card_id"]
+        self.hands[seat].remove(card)
+        if not self.nsf_window(seat, is_event_cancellable(card_id)):
+            self.discard.append(card)
+            return
+
+        self.actions[f"event:{card_id}"] += 1
+        if card_id == CARDS_OFF_THE_TABLE_CARD_ID:
+            target = self.rng.choice([other for other in range(self.players) if other != seat])
+            nsf = [c for c in self.hands[target] if c["card_id"] == NOT_SO_FAST_CARD_ID]
+            self._remove_from_hand(target, nsf)
+            self.discard.extend(nsf)
+        elif card_id == EARLY_TRAIN_CARD_ID:
+            for _ in range(min(EARLY_TRAIN_CARDS, len(self.deck))):
+                self.discard.append(self.deck.pop())
+        elif card_id == DELAY_ESCAPE_CARD_ID:
+            for _ in range(min(DELAY_ESCAPE_MAX, len(self.discard))):
+                self.deck.append(self.discard.pop())
+        elif card_id == LOOK_INTO_ASHES_CARD_ID:
+            top = self.discard[-LOOK_INTO_ASHES_CARDS:]
+            if top:
+                picked = self.rng.choice(top)
+                self.discard.remove(picked)
+                self.hands[seat].append(picked)
+                self.actions["look_into_ashes_select"] += 1
+
+        if card_id not in REMOVED_EVENT_CARD_IDS:
+            self.discard.append(card)
+
+    # ---------- secretos ----------
+
+    def reveal(self, secret: Dict) -> None:
+        secret["hidden"] = False
+        if secret["card_id"] == self.murderer_card_id:
+            self.outcome = MURDERER_CAUGHT
+            return
+        self._check_total_disgrace()
+
+    def is_disgraced(self, seat: int) -> bool:
+        secrets = self.secrets[seat]
+        return bool(secrets) and not any(secret["hidden"] for secret in secrets)
+
+    def _check_total_disgrace(self) -> None:
+        detectives = [seat for seat in range(self.players) if seat not in (self.murderer, self.accomplice)]
+        if detectives and all(self.is_disgraced(seat) for seat in detectives):
+            self.outcome = TOTAL_DISGRACE
+
+    def _remove_from_hand(self, seat: int, cards: List[Dict]) -> None:
+        ids = {card["id"] for card in cards}
+        self.hands[seat][:] = [card for card in self.hands[seat] if card["id"] not in ids]
+
+
+def play_game(catalog: Sequence, players: int, rng: Optional[random.Random] = None, **kwargs) -> GameResult:
+    """Juega una partida entera (kwargs: los de SimGame)."""
+    return SimGame(catalog, players, rng or random.Random(), **kwargs).play()
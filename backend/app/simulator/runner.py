@@ -0,0 +1,141 @@
+"""
+Corridas de muchas partidas simuladas en un pool de procesos y su reporte:
+distribución de resultados, largo de partida en turnos y mezcla de acciones
+(por partida y por turno, para dimensionar BD y sockets).
+"""
+
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from app.bots.strategy import get_strategy
+from app.services.game_rules import game_rng
+
+from .catalog import load_catalog
+from .engine import DETECTIVE_OUTCOMES, SimGame
+
+# Partidas por tarea del pool: suficientes para amortizar el pickle del catálogo
+CHUNK_SIZE = 500
+
+
+@dataclass
+class SimulationReport:
+    """Agregado de una corrida; se arma por tarea y se suma con merge."""
+    players: int
+    games: int = 0
+    outcomes: Counter = field(default_factory=Counter)
+    turns: Counter = field(default_factory=Counter)  # turnos -> partidas
+    actions: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+
+    def add(self, outcome: str, turns: int, actions: Counter) -> None:
+        self.games += 1
+        self.outcomes[outcome] += 1
+        self.turns[turns] += 1
+        self.actions.update(actions)
+
+    def merge(self, other: "SimulationReport") -> None:
+        self.games += other.games
+        self.outcomes.update(other.outcomes)
+        self.turns.update(other.turns)
+        self.actions.update(other.actions)
+
+    @property
+    def total_turns(self) -> int:
+        return sum(turns * count for turns, count in self.turns.items())
+
+    def turns_percentile(self, q: float) -> int:
+        """Turnos de la partida en el percentil q (0-100)."""
+        if not self.games:
+            return 0
+        rank = max(1, int(round(q / 100 * self.games)))
+        seen = 0
+        for turns in sorted(self.turns):
+            seen += self.turns[turns]
+            if seen >= rank:
+                return turns
+        return max(self.turns)
+
+    def summary(self) -> Dict:
+        """Reporte serializable (lo imprime scripts/simulate_games.py)."""
+        games = self.games or 1
+        total_turns = self.total_turns or 1
+        return {
+            "players": self.players,
+            "games": self.games,
+            "games_per_second": round(self.games / self.elapsed, 1) if self.elapsed else None,
+            "outcomes": {outcome: count / games for outcome, count in self.outcomes.most_common()},
+            "detectives_win": sum(self.outcomes[o] for o in DETECTIVE_OUTCOMES) / games,
+            "turns": {
+                "mean": round(self.total_turns / games, 2),
+                "p50": self.turns_percentile(50),
+                "p90": self.turns_percentile(90),
+                "p99": self.turns_percentile(99),
+                "max": max(self.turns) if self.turns else 0,
+            },
+            "actions_per_game": {a: round(c / games, 3) for a, c in self.actions.most_common()},
+            "actions_per_turn": {a: round(c / total_turns, 4) for a, c in self.actions.most_common()},
+        }
+
+
+def _run_chunk(catalog: Sequence, players: int, seeds: List[int], strategy: str,
+               max_turns: int) -> SimulationReport:
+    rates = get_strategy(strategy)
+    report = SimulationReport(players)
+    for seed in seeds:
+        result = SimGame(
+            catalog, players, game_rng(seed),
+            play_rate=rates.play_rate, nsf_rate=rates.nsf_rate, draft_rate=rates.draft_rate,
+            max_turns=max_turns,
+        ).play()
+        report.add(result.outcome, result.turns, result.actions)
+    return report
+
+
+def run_simulations(games: int, players: int = 4, workers: Optional[int] = None,
+                    seed: Optional[int] = None, strategy: str = "random",
+                    catalog: Optional[Sequence] = None, max_turns: int = 1000) -> SimulationReport:
+    """
+    Simula `games` partidas repartidas en un pool de procesos.
+
+    La partida i usa la semilla seed + i, así el resultado con semilla es el
+    mismo con cualquier cantidad de workers.
+
+    Args:
+        games: Partidas a simular
+        players: Jugadores por partida (2-6)
+        workers: Procesos (default: os.cpu_count(); 1 corre en este proceso)
+        seed: Semilla base (default: al azar)
+        strategy: Estrategia de bots de la que se toman las probabilidades
+        catalog: Cartas (default: load_catalog())
+        max_turns: Corte de seguridad por partida
+
+    Returns:
+        SimulationReport con el total
+    """
+    get_strategy(strategy)  # ValueError antes de levantar el pool
+    catalog = list(catalog if catalog is not None else load_catalog())
+    base = seed if seed is not None else random.randrange(2 ** 32)
+    seeds = [base + i for i in range(games)]
+    chunks = [seeds[i:i + CHUNK_SIZE] for i in range(0, games, CHUNK_SIZE)]
+    workers = workers or os.cpu_count() or 1
+
+    report = SimulationReport(players)
+    started = time.perf_counter()
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            report.merge(_run_chunk(catalog, players, chunk, strategy, max_turns))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            futures = [
+                pool.submit(_run_chunk, catalog, players, chunk, strategy, max_turns)
+                for chunk in chunks
+            ]
+            for future in futures:
+                report.merge(future.result())
+    report.elapsed = time.perf_counter() - started
+    return report
@@ -0,0 +1,152 @@
+# app/sockets/event_log.py
+"""
+Buffer circular de eventos por sala para reanudar sesiones.
+
+Cada evento que WebSocketManager.emit_to_room manda a una sala lleva un
+número de secuencia (`seq`) creciente por sala y queda guardado en un buffer
+acotado (ROOM_EVENT_BUFFER eventos). Un cliente que se reconecta manda el
+último seq que vio (`?last_seq=N&epoch=E`) y recibe solo lo que se perdió:
+
+- Si todo lo perdido sigue en el buffer se le reenvía en orden. De los
+  snapshots de estado (game_state_public, nsf_counter_tick) solo el último,
+  los anteriores ya quedaron viejos.
+- Si se atrasó más que el buffer (o el epoch no coincide porque la sala se
+  recreó / el server se reinició) recibe un snapshot: el último estado
+  público y su estado privado ya codificados (ver frames.py).
+
+Los eventos privados (emit_to_sid) no se guardan: el estado privado del
+snapshot o el siguiente game_state_private los reemplaza.
+"""
+
+import logging
+import threading
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.config import settings
+
+from .frames import EncodedPayload
+from .outbound import LATEST_WINS_EVENTS
+
+logger = logging.getLogger(__name__)
+
+# (seq, evento, payload)
+LoggedEvent = Tuple[int, str, Any]
+
+
+class RoomEventLog:
+    """Eventos recientes de una sala."""
+
+    def __init__(self, capacity: int):
+        self.epoch = uuid.uuid4().hex[:8]
+        self.seq = 0
+        self.events: Deque[LoggedEvent] = deque(maxlen=capacity)
+
+    def append(self, event: str, data: Any) -> int:
+        self.seq += 1
+        self.events.append((self.seq, event, data))
+        return self.seq
+
+    def since(self, last_seq: int) -> Optional[List[LoggedEvent]]:
+        """
+        Eventos posteriores a `last_seq`, o None si ya no están todos en el
+        buffer.
+        """
+        if last_seq > self.seq or last_seq < 0:
+            return None
+        if last_seq == self.seq:
+            return []
+        oldest = self.events[0][0] if self.events else self.seq + 1
+        if last_seq < oldest - 1:
+            return None
+        missed = [entry for entry in self.events if entry[0] > last_seq]
+        # De cada snapshot de estado alcanza con el último
+        latest = {event: seq for seq, event, _ in missed if event in LATEST_WINS_EVENTS}
+        return [entry for entry in missed
+                if entry[1] not in LATEST_WINS_EVENTS or latest[entry[1]] == entry[0]]
+
+
+class RoomEventLogs:
+    """Registro de RoomEventLog por sala."""
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._logs: Dict[int, RoomEventLog] = {}
+
+    def get(self, room_id: int) -> Optional[RoomEventLog]:
+        return self._logs.get(room_id)
+
+    def ensure(self, room_id: int) -> RoomEventLog:
+        with self._lock:
+            log = self._logs.get(room_id)
+            if log is None:
+                log = RoomEventLog(self.capacity)
+                self._logs[room_id] = log
+            return log
+
+    def record(self, room_id: int, event: str, data: Dict) -> Dict:
+        """
+        Sella un evento de sala con su seq y lo guarda.
+
+        El log se crea al unirse a la sala / empezar la partida (ensure), no
+        acá: un emit tardío a una sala ya descartada (cancelada, terminada)
+        sale sin seq en lugar de dejar un log huérfano.
+
+        Args:
+            data: payload del evento; un EncodedPayload se sella en el lugar
+                (una sola vez: re-emitir la misma versión no genera otro seq)
+
+        Returns:
+            Payload a emitir (con `seq` si la sala tiene log)
+        """
+        log = self._logs.get(room_id)
+        if log is None:
+            return data
+        with self._lock:
+            if isinstance(data, EncodedPayload):
+                if data.seq is not None:
+                    return data
+                data.stamp(log.seq + 1)
+            else:
+                data = {**data, "seq": log.seq + 1}
+            log.append(event, data)
+        return data
+
+    def since(self, room_id: int, epoch: Optional[str], last_seq: int) -> Optional[List[LoggedEvent]]:
+        """Eventos perdidos por un cliente, o None si hace falta un snapshot."""
+        log = self._logs.get(room_id)
+        if log is None or epoch != log.epoch:
+            return None
+        return log.since(last_seq)
+
+    def position(self, room_id: int) -> Tuple[str, int]:
+        """(epoch, último seq) de la sala."""
+        log = self.ensure(room_id)
+        return log.epoch, log.seq
+
+    def discard_room(self, room_id: int) -> None:
+        with self._lock:
+            self._logs.pop(room_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._logs.clear()
+
+
+# Instancia global
+_room_event_logs: Optional[RoomEventLogs] = None
+
+
+def get_room_event_logs() -> RoomEventLogs:
+    """
+    Obtiene la instancia global del RoomEventLogs (Singleton).
+
+    Returns:
+        RoomEventLogs instance
+    """
+    global _room_event_logs
+    if _room_event_logs is None:
+        _room_event_logs = RoomEventLogs(settings.ROOM_EVENT_BUFFER)
+    return _room_event_logs
@@ -0,0 +1,219 @@
+# app/sockets/frames.py
+"""
+Frames de estado pre-codificados.
+
+notificar_estado_publico armaba un dict nuevo (con un timestamp nuevo) en cada
+llamada y python-socketio lo volvía a serializar en cada emit, aunque el
+estado no hubiera cambiado; los estados privados se serializaban de nuevo por
+cada sid. Acá cada payload de estado se versiona por sala (y por jugador para
+los privados):
+
+- El cuerpo se serializa a JSON una vez. Si es igual al de la versión
+  anterior se reutiliza esa versión completa (mismo timestamp, mismos frames).
+- Si cambió, el frame de Socket.IO se arma pegando el JSON ya generado con la
+  versión y el timestamp, sin volver a serializar.
+- El frame msgpack (ver wire_format.py) se genera a demanda, una vez por versión.
+
+Los frames son paquetes Engine.IO listos: WebSocketManager los entrega
+directo con eio.send_packet, sin pasar por el encoder de Socket.IO.
+
+El timestamp de un payload es el momento en que se generó esa versión.
+
+discard_room deja una marca de sala terminada: los broadcasts que llegan
+tarde (p.ej. el estado agrupado de un request que terminó la partida) se
+codifican igual pero ya no vuelven a quedar en la cache.
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from engineio import packet as eio_packet
+from socketio import packet as sio_packet
+
+from . import wire_format
+
+logger = logging.getLogger(__name__)
+
+_SEPARATORS = (",", ":")
+
+# Salas terminadas que se recuerdan (alcanza con cubrir los broadcasts tardíos)
+ENDED_ROOMS_KEPT = 1024
+
+
+def public_state_body(room_id: int, game_state: Dict) -> Dict:
+    """Cuerpo de 'game_state_public' a partir de build_complete_game_state."""
+    return {
+        "type": "game_state_public",
+        "room_id": room_id,
+        "game_id": game_state.get("game_id"),
+        "status": game_state.get("status", "WAITING"),
+        "turno_actual": game_state.get("turno_actual"),
+        "jugadores": game_state.get("jugadores", []),
+        "mazos": game_state.get("mazos", {}),
+        "sets": game_state.get("sets", []),
+        "secretsFromAllPlayers": game_state.get("secretsFromAllPlayers", []),
+    }
+
+
+class EncodedPayload(dict):
+    """
+    Payload de un evento (se usa como dict) más sus frames Engine.IO ya
+    codificados, uno por (evento, formato).
+    """
+
+    def __init__(self, data: Dict, version: Optional[int] = None):
+        super().__init__(data)
+        self.version = version
+        self._frames: Dict[Tuple[str, str], List[eio_packet.Packet]] = {}
+        self._variants: Dict[str, "EncodedPayload"] = {}
+        self.seq: Optional[int] = None
+
+    def stamp(self, seq: int) -> bool:
+        """
+        Agrega el `seq` de sala (ver event_log.py) la primera vez que se emite.
+        El frame JSON ya armado se extiende en lugar de re-serializarse.
+
+        Returns:
+            False si ya estaba sellado (re-emisión de la misma versión)
+        """
+        if self.seq is not None:
+            return False
+        self.seq = seq
+        self["seq"] = seq
+        stamped = {}
+        for (event, encoding), frames in self._frames.items():
+            text = frames[0].data if len(frames) == 1 else None
+            if encoding == wire_format.JSON and isinstance(text, str) and text.endswith("}]"):
+                stamped[(event, encoding)] = [eio_packet.Packet(
+                    eio_packet.MESSAGE, text[:-2] + ',"seq":' + str(seq) + "}]"
+                )]
+        self._frames = stamped
+        self._variants = {}
+        return True
+
+    def variant(self, name: str, transform: Callable[[Dict], Dict]) -> "EncodedPayload":
+        """
+        Variante derivada del payload (p.ej. cartas por id), calculada una
+        vez por versión y con sus propios frames.
+        """
+        payload = self._variants.get(name)
+        if payload is None:
+            payload = EncodedPayload(transform(dict(self)), self.version)
+            self._variants[name] = payload
+        return payload
+
+    def seed_json_frame(self, event: str, text: str) -> None:
+        """Registra el frame JSON ya armado (texto de un paquete EVENT en '/')."""
+        self._frames[(event, wire_format.JSON)] = [eio_packet.Packet(eio_packet.MESSAGE, text)]
+
+    def frames(self, sio, event: str, encoding: str = wire_format.JSON) -> List[eio_packet.Packet]:
+        """Frames Engine.IO del evento en `encoding`, codificados una sola vez."""
+        key = (event, encoding)
+        frames = self._frames.get(key)
+        if frames is None:
+            data = wire_format.pack(dict(self)) if encoding == wire_format.MSGPACK else self
+            pkt = sio.packet_class(sio_packet.EVENT, namespace="/", data=[event, data])
+            encoded = pkt.encode()
+            if not isinstance(encoded, list):
+                encoded = [encoded]
+            frames = [eio_packet.Packet(eio_packet.MESSAGE, part) for part in encoded]
+            self._frames[key] = frames
+        return frames
+
+
+class StateFrameCache:
+    """Última versión codificada de los estados público / privados por sala."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # room_id -> (cuerpo JSON, payload)
+        self._public: Dict[int, Tuple[str, EncodedPayload]] = {}
+        # (room_id, user_id) -> (cuerpo JSON, payload)
+        self._private: Dict[Tuple[int, int], Tuple[str, EncodedPayload]] = {}
+        self._versions: Dict[int, int] = {}
+        # room_id de salas descartadas, las más viejas primero
+        self._ended: "OrderedDict[int, None]" = OrderedDict()
+
+    def public(self, room_id: int, event: str, body: Dict) -> EncodedPayload:
+        return self._encode(self._public, room_id, room_id, event, body)
+
+    def private(self, room_id: int, user_id: int, event: str, body: Dict) -> EncodedPayload:
+        return self._encode(self._private, (room_id, user_id), room_id, event, body)
+
+    def _encode(self, store: Dict, key, room_id: int, event: str, body: Dict) -> EncodedPayload:
+        body_json = json.dumps(body, separators=_SEPARATORS)
+        cached = store.get(key)
+        if cached is not None and cached[0] == body_json:
+            return cached[1]
+
+        with self._lock:
+            ended = room_id in self._ended
+            version = self._versions.get(room_id, 0) + 1
+            if not ended:
+                self._versions[room_id] = version
+        timestamp = datetime.now().isoformat()
+        payload = EncodedPayload({**body, "version": version, "timestamp": timestamp}, version)
+        # Mismo texto que generaría socketio.Packet.encode(): '2' + json.dumps([event, payload])
+        payload.seed_json_frame(
+            event,
+            "2[" + json.dumps(event) + "," + body_json[:-1]
+            + ',"version":' + str(version)
+            + ',"timestamp":' + json.dumps(timestamp) + "}]",
+        )
+        if not ended:
+            store[key] = (body_json, payload)
+        return payload
+
+    def latest_public(self, room_id: int) -> Optional[EncodedPayload]:
+        cached = self._public.get(room_id)
+        return cached[1] if cached else None
+
+    def latest_private(self, room_id: int, user_id: int) -> Optional[EncodedPayload]:
+        cached = self._private.get((room_id, user_id))
+        return cached[1] if cached else None
+
+    def version(self, room_id: int) -> int:
+        return self._versions.get(room_id, 0)
+
+    def is_discarded(self, room_id: int) -> bool:
+        """True si la partida de la sala ya terminó (o se canceló)."""
+        return room_id in self._ended
+
+    def discard_room(self, room_id: int) -> None:
+        with self._lock:
+            self._ended[room_id] = None
+            self._ended.move_to_end(room_id)
+            while len(self._ended) > ENDED_ROOMS_KEPT:
+                self._ended.popitem(last=False)
+            self._public.pop(room_id, None)
+            self._versions.pop(room_id, None)
+            for key in [k for k in self._private if k[0] == room_id]:
+                del self._private[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._public.clear()
+            self._private.clear()
+            self._versions.clear()
+            self._ended.clear()
+
+
+# Instancia global
+_state_frames: Optional[StateFrameCache] = None
+
+
+def get_state_frames() -> StateFrameCache:
+    """
+    Obtiene la instancia global del StateFrameCache (Singleton).
+
+    Returns:
+        StateFrameCache instance
+    """
+    global _state_frames
+    if _state_frames is None:
+        _state_frames = StateFrameCache()
+    return _state_frames
@@ -0,0 +1,159 @@
+# sockets/lobby_channel.py
+"""
+Canal de lobby por Socket.IO.
+
+Los clientes se suscriben sin room_id (connect con ?lobby=1, o el evento
+'lobby_subscribe') y reciben:
+
+- 'lobby_snapshot' al suscribirse: primera página de salas disponibles.
+- 'room_added' / 'room_updated' / 'room_removed' cuando cambia el lobby.
+
+Los cambios llegan desde el LobbyDirectory (create_game, join, leave_game,
+start, fin de partida) y se agrupan por sala durante una ventana corta
+(LOBBY_PUSH_WINDOW_MS): si una sala cambia varias veces dentro de la
+ventana solo se emite su último estado.
+
+"Disponible" tiene la misma semántica que GET /api/game_list (WAITING y con
+lugar): una sala que se llena o arranca se emite como 'room_removed'.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional, Set
+
+import socketio
+
+from app.config import settings
+from app.services.lobby_directory import LobbyRoom, get_lobby_directory
+
+logger = logging.getLogger(__name__)
+
+LOBBY_ROOM = "lobby"
+SNAPSHOT_LIMIT = 50
+
+
+class LobbyBroadcaster:
+    """
+    Suscripciones al lobby y emisión agrupada de cambios de salas.
+
+    Attributes:
+        subscribers: sids suscriptos al canal de lobby
+        window: Ventana de agrupamiento en segundos
+    """
+
+    def __init__(self, sio: socketio.AsyncServer, db_factory, window: float = 0.05):
+        self.sio = sio
+        self.db_factory = db_factory
+        self.window = window
+        self.subscribers: Set[str] = set()
+
+        # room_id -> (estaba_disponible_al_inicio_de_la_ventana, estado_actual)
+        self._pending: Dict[int, tuple] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    # ------------------------------------------------------------------
+    # Suscripciones
+    # ------------------------------------------------------------------
+
+    async def subscribe(self, sid: str) -> None:
+        """Suscribe un sid al lobby y le envía el snapshot inicial."""
+        self._loop = asyncio.get_running_loop()
+        directory = get_lobby_directory()
+        if not directory.loaded:
+            db = self.db_factory()
+            try:
+                directory.ensure_loaded(db)
+            finally:
+                db.close()
+
+        await self.sio.enter_room(sid, LOBBY_ROOM)
+        self.subscribers.add(sid)
+
+        rooms, next_cursor = directory.list_available(limit=SNAPSHOT_LIMIT)
+        await self.sio.emit('lobby_snapshot', {
+            'items': [r.to_item() for r in rooms],
+            'next_cursor': next_cursor,
+        }, to=sid)
+        logger.debug("lobby subscribe sid=%s subscribers=%d", sid, len(self.subscribers))
+
+    async def unsubscribe(self, sid: str) -> None:
+        if sid not in self.subscribers:
+            return
+        self.subscribers.discard(sid)
+        await self.sio.leave_room(sid, LOBBY_ROOM)
+
+    # ------------------------------------------------------------------
+    # Cambios (listener del LobbyDirectory)
+    # ------------------------------------------------------------------
+
+    def on_directory_change(self, previous: Optional[LobbyRoom], current: Optional[LobbyRoom]) -> None:
+        """
+        Listener del LobbyDirectory. Puede llamarse desde el event loop o desde
+        el threadpool (rutas síncronas como POST /game), así que el encolado se
+        hace siempre en el thread del loop.
+        """
+        loop = self._loop
+        if loop is None or not self.subscribers or loop.is_closed():
+            return
+        room_id = (current or previous).id
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._enqueue(room_id, previous, current)
+        else:
+            loop.call_soon_threadsafe(self._enqueue, room_id, previous, current)
+
+    def _enqueue(self, room_id: int, previous: Optional[LobbyRoom], current: Optional[LobbyRoom]) -> None:
+        if room_id in self._pending:
+            was_available = self._pending[room_id][0]
+        else:
+            was_available = previous is not None and previous.is_available
+        self._pending[room_id] = (was_available, current)
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                self.window, lambda: asyncio.ensure_future(self.flush())
+            )
+
+    async def flush(self) -> None:
+        """Emite los cambios acumulados en la ventana (uno por sala)."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        for room_id, (was_available, current) in pending.items():
+            is_available = current is not None and current.is_available
+            if is_available and not was_available:
+                event, payload = 'room_added', current.to_item()
+            elif is_available:
+                event, payload = 'room_updated', current.to_item()
+            elif was_available:
+                event, payload = 'room_removed', {'id': room_id}
+            else:
+                continue
+            try:
+                await self.sio.emit(event, payload, room=LOBBY_ROOM)
+            except Exception as e:
+                logger.error(f"Error emitting {event} for room {room_id}: {e}")
+
+
+# Instancia global
+_lobby_broadcaster: Optional[LobbyBroadcaster] = None
+
+
+def get_lobby_broadcaster() -> LobbyBroadcaster:
+    global _lobby_broadcaster
+    if _lobby_broadcaster is None:
+        raise RuntimeError("LobbyBroadcaster no inicializado")
+    return _lobby_broadcaster
+
+
+def init_lobby_broadcaster(sio: socketio.AsyncServer, db_factory) -> LobbyBroadcaster:
+    global _lobby_broadcaster
+    if _lobby_broadcaster is not None:
+        get_lobby_directory().remove_listener(_lobby_broadcaster.on_directory_change)
+    _lobby_broadcaster = LobbyBroadcaster(
+        sio, db_factory, window=settings.LOBBY_PUSH_WINDOW_MS / 1000
+    )
+    get_lobby_directory().add_listener(_lobby_broadcaster.on_directory_change)
+    return _lobby_broadcaster
@@ -0,0 +1,172 @@
+# app/sockets/outbound.py
+"""
+Backpressure por socket.
+
+Engine.IO encola sin límite los paquetes de cada socket: si un cliente (un
+celular con mala red) deja de leer, cada estado completo se acumula detrás
+del anterior. Acá se mira la cola de Engine.IO antes de entregar:
+
+- Mientras el socket está al día (cola de Engine.IO <= OUTBOUND_SOFT_LIMIT)
+  los frames se entregan directo, como antes.
+- Si se atrasa, los envíos pasan a una cola propia del sid que se vacía a
+  medida que Engine.IO drena. En esa cola los snapshots de estado
+  (LATEST_WINS_EVENTS) son "último gana": uno nuevo reemplaza al pendiente
+  del mismo evento. Los eventos sueltos nunca se descartan.
+- Si la cola propia supera OUTBOUND_HARD_LIMIT durante más de
+  OUTBOUND_HARD_LIMIT_GRACE_MS el cliente se desconecta (reconecta y pide
+  el estado de nuevo).
+
+Métricas: `socket.outbound_queued` (gauge, entradas retenidas),
+`socket.outbound_dropped` (snapshots reemplazados) y
+`socket.slow_disconnects`.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from engineio import packet as eio_packet
+
+from app.services.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+LATEST_WINS_EVENTS = frozenset(("game_state_public", "game_state_private", "nsf_counter_tick"))
+
+
+class OutboundQueues:
+    """
+    Colas de salida de los sids atrasados.
+
+    Attributes:
+        soft_limit: Paquetes en la cola de Engine.IO a partir de los cuales se retiene
+        hard_limit: Entradas retenidas a partir de las cuales se cuenta el plazo de gracia
+        grace: Segundos sobre hard_limit antes de desconectar
+        poll_interval: Cada cuánto se revisa si Engine.IO drenó (segundos)
+    """
+
+    def __init__(self, sio, soft_limit: int = 8, hard_limit: int = 200,
+                 grace: float = 5.0, poll_interval: float = 0.05):
+        self.sio = sio
+        self.soft_limit = soft_limit
+        self.hard_limit = hard_limit
+        self.grace = grace
+        self.poll_interval = poll_interval
+        # sid -> cola de (evento, frames)
+        self._queues: Dict[str, Deque[Tuple[str, List[eio_packet.Packet]]]] = {}
+        self._over_since: Dict[str, float] = {}
+        self._drainers: Dict[str, asyncio.Task] = {}
+
+    def _eio_socket(self, sid: str):
+        eio_sid = self.sio.manager.eio_sid_from_sid(sid, "/")
+        if eio_sid is None:
+            return None
+        return self.sio.eio.sockets.get(eio_sid)
+
+    def eio_depth(self, sid: str) -> int:
+        """Paquetes esperando en la cola de Engine.IO del sid."""
+        socket = self._eio_socket(sid)
+        queue = getattr(socket, "queue", None)
+        if not isinstance(queue, asyncio.Queue):
+            return 0
+        return queue.qsize()
+
+    def depth(self, sid: str) -> int:
+        """Entradas retenidas en la cola propia del sid."""
+        queue = self._queues.get(sid)
+        return len(queue) if queue else 0
+
+    def is_congested(self, sid: str) -> bool:
+        return sid in self._queues or self.eio_depth(sid) > self.soft_limit
+
+    async def send(self, sid: str, event: str, frames: List[eio_packet.Packet]) -> None:
+        """Entrega los frames de un evento o los retiene si el sid está atrasado."""
+        if self.is_congested(sid):
+            self.enqueue(sid, event, frames)
+            return
+        eio_sid = self.sio.manager.eio_sid_from_sid(sid, "/")
+        if eio_sid is None:
+            return
+        for frame in frames:
+            await self.sio.eio.send_packet(eio_sid, frame)
+
+    def enqueue(self, sid: str, event: str, frames: List[eio_packet.Packet]) -> None:
+        metrics = get_metrics()
+        queue = self._queues.get(sid)
+        if queue is None:
+            queue = deque()
+            self._queues[sid] = queue
+        elif event in LATEST_WINS_EVENTS:
+            for item in queue:
+                if item[0] == event:
+                    queue.remove(item)
+                    metrics.inc("socket.outbound_dropped")
+                    break
+        queue.append((event, frames))
+        self._update_gauge()
+
+        if len(queue) > self.hard_limit:
+            self._over_since.setdefault(sid, time.monotonic())
+        if sid not in self._drainers:
+            self._drainers[sid] = asyncio.ensure_future(self._drain(sid))
+
+    async def _drain(self, sid: str) -> None:
+        try:
+            while True:
+                queue = self._queues.get(sid)
+                if not queue:
+                    break
+                if self._over_hard_limit(sid):
+                    await self._disconnect(sid)
+                    return
+                if self.eio_depth(sid) > self.soft_limit:
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                event, frames = queue.popleft()
+                if len(queue) <= self.hard_limit:
+                    self._over_since.pop(sid, None)
+                eio_sid = self.sio.manager.eio_sid_from_sid(sid, "/")
+                if eio_sid is None:
+                    break
+                for frame in frames:
+                    await self.sio.eio.send_packet(eio_sid, frame)
+                self._update_gauge()
+        except Exception as e:
+            logger.error(f"Error draining outbound queue for {sid}: {e}")
+        finally:
+            if self._drainers.get(sid) is asyncio.current_task():
+                del self._drainers[sid]
+            self._queues.pop(sid, None)
+            self._over_since.pop(sid, None)
+            self._update_gauge()
+
+    def _over_hard_limit(self, sid: str) -> bool:
+        since = self._over_since.get(sid)
+        return since is not None and time.monotonic() - since >= self.grace
+
+    async def _disconnect(self, sid: str) -> None:
+        depth = self.depth(sid)
+        self._queues.pop(sid, None)
+        get_metrics().inc("socket.slow_disconnects")
+        logger.warning(f"Disconnecting slow consumer {sid} ({depth} queued events)")
+        socket = self._eio_socket(sid)
+        if socket is not None:
+            # Sin esperar a que drene la cola de Engine.IO: justamente está trabada
+            await socket.close(wait=False, abort=True)
+
+    def discard(self, sid: str) -> None:
+        """Descarta lo retenido de un sid (se desconectó)."""
+        self._queues.pop(sid, None)
+        self._over_since.pop(sid, None)
+        drainer = self._drainers.pop(sid, None)
+        # Si se llega acá desde el propio drainer (desconexión por lento) no se cancela
+        if drainer is not None and drainer is not asyncio.current_task():
+            drainer.cancel()
+        self._update_gauge()
+
+    def _update_gauge(self) -> None:
+        get_metrics().set_gauge(
+            "socket.outbound_queued", sum(len(q) for q in self._queues.values())
+        )
@@ -0,0 +1,129 @@
+# app/sockets/room_broadcast.py
+"""
+Agrupamiento de broadcasts de estado por sala.
+
+Un mismo request suele emitir el estado completo más eventos sueltos
+(notificar_nsf_counter_start + notificar_estado_partida, take_deck + card
+drawn, acciones de detective + desgracia social, ...) y una ráfaga de
+requests de la misma sala reconstruye y emite el estado completo cada vez.
+
+notificar_estado_partida ya no emite en el momento: marca la sala como
+"sucia" y guarda el último estado (o el builder que lo arma, ver
+game_state_builder: así el estado completo se construye una sola vez, en el
+flush y en un thread). La sala se vacía una sola vez por ventana
+(ROOM_BROADCAST_WINDOW_MS):
+
+- Si llega otro estado antes del flush, el anterior se descarta y el nuevo
+  ocupa el final de la cola.
+- Mientras la sala tiene algo pendiente, los eventos que pasan por
+  WebSocketManager.emit_to_room / emit_to_sid (game_state sueltos, NSF,
+  detective, fin de partida, ...) se encolan detrás, así el cliente los
+  recibe en el mismo orden en que se emitieron.
+- Si la sala no tiene nada pendiente los eventos salen directo.
+
+Con ventana 0 no se agrupa nada (comportamiento anterior).
+"""
+
+import asyncio
+import contextvars
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from app.services.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+Send = Callable[[], Awaitable[None]]
+
+_STATE = "state"
+_EVENT = "event"
+
+# True mientras se entrega la cola de una sala: esos emits salen directo
+_delivering: contextvars.ContextVar[bool] = contextvars.ContextVar("room_broadcast_delivering", default=False)
+
+
+class RoomBroadcastScheduler:
+    """
+    Cola de emisión por sala.
+
+    Attributes:
+        window: Ventana de agrupamiento en segundos (0 = deshabilitado)
+    """
+
+    def __init__(self, window: float = 0.03):
+        self.window = window
+        # room_id -> cola de (tipo, send)
+        self._queues: Dict[int, Deque[Tuple[str, Send]]] = {}
+        self._flushing: set = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0
+
+    def is_pending(self, room_id: int) -> bool:
+        return room_id in self._queues
+
+    def schedule_state(self, room_id: int, send: Send) -> None:
+        """
+        Encola el estado completo de una sala reemplazando al que estuviera
+        pendiente. Abre la ventana si la sala no tenía nada pendiente.
+        """
+        queue = self._queues.get(room_id)
+        if queue is None:
+            queue = deque()
+            self._queues[room_id] = queue
+            if room_id not in self._flushing:
+                asyncio.get_running_loop().call_later(
+                    self.window, lambda: asyncio.ensure_future(self.flush(room_id))
+                )
+        for item in queue:
+            if item[0] == _STATE:
+                queue.remove(item)
+                get_metrics().inc("socket.states_coalesced")
+                break
+        queue.append((_STATE, send))
+
+    def defer(self, room_id: Optional[int], send: Send) -> bool:
+        """
+        Encola un evento suelto si la sala tiene un flush pendiente.
+
+        Returns:
+            True si quedó encolado (el caller no debe emitirlo), False si
+            tiene que salir directo
+        """
+        if room_id is None or _delivering.get():
+            return False
+        queue = self._queues.get(room_id)
+        if queue is None:
+            return False
+        queue.append((_EVENT, send))
+        return True
+
+    async def flush(self, room_id: int) -> None:
+        """Entrega en orden todo lo pendiente de una sala."""
+        if room_id in self._flushing:
+            return
+        self._flushing.add(room_id)
+        token = _delivering.set(True)
+        try:
+            queue = self._queues.get(room_id)
+            # Lo que se encole durante la entrega sale en esta misma pasada
+            while queue:
+                kind, send = queue.popleft()
+                try:
+                    await send()
+                except Exception as e:
+                    logger.error(f"Error delivering {kind} broadcast for room {room_id}: {e}")
+            self._queues.pop(room_id, None)
+        finally:
+            _delivering.reset(token)
+            self._flushing.discard(room_id)
+
+    async def flush_all(self) -> None:
+        for room_id in list(self._queues):
+            await self.flush(room_id)
+
+    def clear(self) -> None:
+        self._queues.clear()
+        self._flushing.clear()
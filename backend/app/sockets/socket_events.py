@@ -1,33 +1,110 @@
 # sockets/socket_events.py
 from .socket_manager import init_ws_manager, get_ws_manager
+from .lobby_channel import get_lobby_broadcaster
+from .wire_format import negotiate_card_format, negotiate_encoding
+from .event_log import get_room_event_logs
+from app.services.lobby_directory import get_lobby_directory
 from app.db.database import SessionLocal
 from app.db.models import Room
+from app.services.loop_monitor import labelled
+from app.services.profiling import profiled
 import socketio
 import logging
 
 logger = logging.getLogger(__name__)
 
+async def _unsubscribe_lobby(sid):
+    try:
+        await get_lobby_broadcaster().unsubscribe(sid)
+    except RuntimeError:
+        # Canal de lobby no inicializado
+        pass
+
+
+def _directory_room(room_id: int):
+    """Sala activa del LobbyDirectory (se carga de la BD una sola vez por proceso)"""
+    directory = get_lobby_directory()
+    if not directory.loaded:
+        db = SessionLocal()
+        try:
+            directory.ensure_loaded(db)
+        except Exception as e:
+            logger.warning(f"Lobby directory not loaded: {e}")
+            return None
+        finally:
+            db.close()
+    return directory.get_room(room_id)
+
+
 def register_events(sio: socketio.AsyncServer):
     """Registra todos los eventos de socketIO"""
 
     # inicializar manager
     ws_manager = get_ws_manager()
 
+    async def _connect_spectator(sid, query_params):
+        try:
+            room_id = int(query_params.get('room_id', [''])[0])
+        except ValueError:
+            await sio.emit('connect_error', {'message': 'invalid room_id format'}, room=sid)
+            return False
+        
+        # Se valida contra el directorio en memoria: sumar espectadores no agrega queries
+        lobby_room = _directory_room(room_id)
+        if lobby_room is None:
+            await sio.emit('connect_error', {'message': 'room not found'}, room=sid)
+            return False
+        
+        await sio.save_session(sid, {'room_id': room_id, 'spectator': True})
+        ws_manager.set_encoding(sid, negotiate_encoding(query_params.get('encoding', [None])[0]))
+        ws_manager.set_card_format(sid, negotiate_card_format(query_params.get('cards', [None])[0]))
+        await ws_manager.join_as_spectator(sid, room_id, lobby_room.id_game)
+        
+        room_epoch, room_seq = get_room_event_logs().position(room_id)
+        await sio.emit('connected', {
+            'message': 'Conectado como espectador',
+            'room_id': room_id,
+            'sid': sid,
+            'spectator': True,
+            'encoding': ws_manager.get_encoding(sid),
+            'epoch': room_epoch,
+            'seq': room_seq
+        }, room=sid)
+        logger.info("✅ Spectator connected to game %s (sid: %s)", room_id, sid)
+        return True
+
     @sio.event
+    @labelled("socket:connect")
+    @profiled("socket:connect")
     async def connect(sid, environ):
         """Maneja nuevas conexiones"""
         try:
-            # Debug logging
-            logger.info(f"=== NEW CONNECTION ATTEMPT ===")
-            logger.info(f"SID: {sid}")
-            logger.info(f"Query string: {environ.get('QUERY_STRING', 'None')}")
+            logger.debug("New connection attempt (sid: %s, query: %s)", sid, environ.get('QUERY_STRING'))
             
             # Parse query parameters
             query_string = environ.get('QUERY_STRING', '')
             from urllib.parse import parse_qs
             query_params = parse_qs(query_string)
             
-            logger.info(f"Parsed query params: {query_params}")
+            logger.debug("Parsed query params: %s", query_params)
+
+            # Suscripción al canal de lobby (sin room_id ni user_id obligatorio)
+            lobby_flag = query_params.get('lobby', ['0'])[0].lower()
+            if lobby_flag in ('1', 'true') and not query_params.get('room_id'):
+                await sio.save_session(sid, {'lobby': True})
+                await get_lobby_broadcaster().subscribe(sid)
+                await sio.emit('connected', {
+                    'message': 'Conectado al lobby',
+                    'lobby': True,
+                    'sid': sid
+                }, room=sid)
+                logger.info("✅ Lobby subscriber connected (sid: %s)", sid)
+                return True
+            
+            # Espectadores: sin user_id, solo reciben los eventos públicos de la sala
+            role = query_params.get('role', [''])[0].lower()
+            if role == 'spectator':
+                return await _connect_spectator(sid, query_params)
             
             # Get user_id from query params
             user_id_list = query_params.get('user_id', [])
@@ -57,38 +134,69 @@ def register_events(sio: socketio.AsyncServer):
                 await sio.emit('connect_error', {'message': 'invalid room_id format'}, room=sid)
                 return False
             
-            logger.info(f"Extracted - SID: {sid}, Game ID: {room_id}, User ID: {user_id}")
+            logger.debug("Extracted - SID: %s, Game ID: %s, User ID: %s", sid, room_id, user_id)
 
-            # Validate room exists
-            db = SessionLocal()
-            try:
-                room = db.query(Room).filter(Room.id == room_id).first()
-                if not room:
-                    await sio.emit('connect_error', {'message': 'room not found'}, room=sid)
-                    return False
-            finally:
-                db.close()
+            # Validate room exists: salas activas desde el directorio en memoria,
+            # la BD solo para las que no están (p.ej. partidas terminadas)
+            if _directory_room(room_id) is None:
+                db = SessionLocal()
+                try:
+                    room = db.query(Room).filter(Room.id == room_id).first()
+                    if not room:
+                        await sio.emit('connect_error', {'message': 'room not found'}, room=sid)
+                        return False
+                finally:
+                    db.close()
             
             # Guardar session con toda la información
             await sio.save_session(sid, {
                 'user_id': user_id,
                 'room_id': room_id
             })
+
+            # Formato de payloads: JSON por defecto, msgpack si el cliente lo pide
+            encoding = negotiate_encoding(query_params.get('encoding', [None])[0])
+            ws_manager.set_encoding(sid, encoding)
+            # Cartas completas por defecto, solo ids de catálogo con ?cards=ids
+            card_format = negotiate_card_format(query_params.get('cards', [None])[0])
+            ws_manager.set_card_format(sid, card_format)
             
-            logger.info(f"🚪 Attempting to join room for game {room_id}")
-            # Usar ws_manager para unirse al room automáticamente
-            success = await ws_manager.join_game_room(sid, room_id, user_id)
+            # Reconexión: ?last_seq=N&epoch=E reenvía solo los eventos perdidos
+            resumed = None
+            last_seq_list = query_params.get('last_seq', [])
+            if last_seq_list:
+                try:
+                    last_seq = int(last_seq_list[0])
+                except ValueError:
+                    last_seq = None
+                if last_seq is not None:
+                    epoch = query_params.get('epoch', [None])[0]
+                    resumed = await ws_manager.resume_game_room(sid, room_id, user_id, epoch, last_seq)
+            
+            if resumed:
+                success = True
+            else:
+                logger.debug("🚪 Attempting to join room for game %s", room_id)
+                # Usar ws_manager para unirse al room automáticamente
+                success = await ws_manager.join_game_room(sid, room_id, user_id)
             
             if success:
+                room_epoch, room_seq = get_room_event_logs().position(room_id)
                 # Notificar conexión exitosa al cliente
                 await sio.emit('connected', {
                     'message': 'Conectado exitosamente',
                     'user_id': user_id,
                     'room_id': room_id,
-                    'sid': sid
+                    'sid': sid,
+                    'encoding': encoding,
+                    'cards': card_format,
+                    # Posición en el stream de la sala, para reanudar
+                    'epoch': room_epoch,
+                    'seq': room_seq,
+                    'resumed': resumed
                 }, room=sid)
                 
-                logger.info(f"✅ User {user_id} connected successfully to game {room_id} (sid: {sid})")
+                logger.info("✅ User %s connected successfully to game %s (sid: %s)", user_id, room_id, sid)
                 return True
             else:
                 logger.error(f"❌ Failed to join user {user_id} to game {room_id}")
@@ -101,16 +209,25 @@ def register_events(sio: socketio.AsyncServer):
             return False
 
     @sio.event
+    @labelled("socket:disconnect")
+    @profiled("socket:disconnect")
     async def disconnect(sid):
         """Maneja desconecciones"""
         try:
             # Obtener datos de sesión
             session = await sio.get_session(sid)
+
+            # Quitar la suscripción al lobby si la tenía
+            await _unsubscribe_lobby(sid)
             user_id = session.get('user_id', 'Unknown') if session else 'Unknown'
             room_id = session.get('room_id', 'Unknown') if session else 'Unknown'
             
             logger.info(f"Usuario {user_id} desconectado de juego {room_id} (sid: {sid})")
             
+            if session and session.get('spectator'):
+                await ws_manager.leave_spectator(sid)
+                return
+            
             # Salir del room si estaba en uno
             if session and 'room_id' in session:
                 await ws_manager.leave_game_room(sid, session['room_id'])
@@ -122,4 +239,21 @@ def register_events(sio: socketio.AsyncServer):
                 }, room=f"game_{session['room_id']}")
             
         except Exception as e:
-            logger.error(f"Error en disconnect para sid {sid}: {e}")       
+            logger.error(f"Error en disconnect para sid {sid}: {e}")
+
+    @sio.event
+    @labelled("socket:lobby_subscribe")
+    @profiled("socket:lobby_subscribe")
+    async def lobby_subscribe(sid, data=None):
+        """Suscribe un socket ya conectado al canal de lobby"""
+        try:
+            await get_lobby_broadcaster().subscribe(sid)
+        except Exception as e:
+            logger.error(f"Error en lobby_subscribe para sid {sid}: {e}")
+            await sio.emit('error', {'message': 'Error suscribiendo al lobby'}, room=sid)
+
+    @sio.event
+    @labelled("socket:lobby_unsubscribe")
+    async def lobby_unsubscribe(sid, data=None):
+        """Quita la suscripción al canal de lobby"""
+        await _unsubscribe_lobby(sid)
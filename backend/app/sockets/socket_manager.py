@@ -1,8 +1,19 @@
 import socketio 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 import logging
+import time
 from datetime import datetime
 from sqlalchemy.orm import Session
+from app.config import settings
+from app.services.lobby_directory import get_lobby_directory
+from app.services.metrics import get_metrics
+from . import wire_format
+from .frames import EncodedPayload
+from .event_log import get_room_event_logs
+from .frames import get_state_frames, public_state_body
+from .outbound import OutboundQueues
+from .room_broadcast import RoomBroadcastScheduler
+import asyncio
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +24,27 @@ class WebSocketManager:
         # tracking interno: sid -> {user_id, game_id, connected_at} se pierde si se cae el server
         self.db_factory = db_factory  # Función que retorna una Session de DB
         self.user_sessions: Dict[str, dict] = {}
+        # sid -> room_id de los espectadores (no son Player, solo reciben lo público)
+        self.spectators: Dict[str, int] = {}
+        self._snapshot_locks: Dict[int, asyncio.Lock] = {}
+        # sid -> formato negociado; solo se guardan los que no son JSON
+        self.encodings: Dict[str, str] = {}
+        # sid -> formato de cartas; solo se guardan los que piden cartas por id
+        self.card_formats: Dict[str, str] = {}
+        # sid -> latencia de sus emits {count, last_ms, max_ms, timeouts}
+        self.emit_stats: Dict[str, dict] = {}
+        # Estados agrupados por sala (ver sockets/room_broadcast.py)
+        self.scheduler = RoomBroadcastScheduler(settings.ROOM_BROADCAST_WINDOW_MS / 1000)
+        # room_id -> user_ids conectados en la ventana actual (ver join_game_room)
+        self.join_window = settings.JOIN_BROADCAST_WINDOW_MS / 1000
+        self._roster_pending: Dict[int, List[int]] = {}
+        # Colas de los sockets atrasados (ver sockets/outbound.py)
+        self.outbound = OutboundQueues(
+            sio,
+            soft_limit=settings.OUTBOUND_SOFT_LIMIT,
+            hard_limit=settings.OUTBOUND_HARD_LIMIT,
+            grace=settings.OUTBOUND_HARD_LIMIT_GRACE_MS / 1000,
+        )
 
     def get_room_name(self, room_id: int) -> str:
         """Genera nombre estandar del room para una partida"""
@@ -25,6 +57,7 @@ class WebSocketManager:
             
             # Implementar: Validar que el usuario puede acceder a esta partida
             await self.sio.enter_room(sid, room)
+            get_room_event_logs().ensure(room_id)
             
             # actualizar tracking interno
             self.user_sessions[sid] = {
@@ -34,24 +67,11 @@ class WebSocketManager:
             }
             logger.debug(f"User {user_id} joined room {room} with sid {sid}, sessions: {self.user_sessions}")
             
-            # notificar a otros jugadores en el room (skip current user)
-            await self.sio.emit('player_connected', {
-                'user_id': user_id,
-                'room_id': room_id,
-                'timestamp': datetime.now().isoformat()
-            }, room=room, skip_sid=sid)
-
-            # Obtener participantes con datos completos de la DB
-            participants = await self.get_room_participants(room_id)
-
-            await self.sio.emit('game_state_public', {
-                'room_id': room_id,
-                'status': 'WAITING',
-                'turno_actual': None,
-                'jugadores': participants,
-                'mazos': {},
-                'timestamp': datetime.now().isoformat()
-            }, room=room)
+            # Las conexiones simultáneas (p.ej. todos después de start) comparten un único roster
+            if self.join_window > 0:
+                self._queue_roster(room_id, user_id)
+            else:
+                await self._broadcast_roster(room_id, [user_id], skip_sid=sid)
             
             logger.info(f"Usuario {user_id} se unió a room {room}")
             return True
@@ -61,8 +81,238 @@ class WebSocketManager:
             await self.sio.emit('error', {'message': 'Error uniendose a la partida'}, room=sid)
             return False
 
+    def _queue_roster(self, room_id: int, user_id: int):
+        pending = self._roster_pending.get(room_id)
+        if pending is not None:
+            pending.append(user_id)
+            return
+        self._roster_pending[room_id] = [user_id]
+        asyncio.get_running_loop().call_later(
+            self.join_window, lambda: asyncio.ensure_future(self._flush_roster(room_id))
+        )
+
+    async def _flush_roster(self, room_id: int):
+        user_ids = self._roster_pending.pop(room_id, [])
+        if not user_ids:
+            return
+        if len(user_ids) > 1:
+            get_metrics().inc("socket.roster_broadcasts_coalesced", len(user_ids) - 1)
+        try:
+            await self._broadcast_roster(room_id, user_ids)
+        except Exception as e:
+            logger.error(f"Error broadcasting roster for room {room_id}: {e}")
+
+    async def _broadcast_roster(self, room_id: int, user_ids: List[int], skip_sid: Optional[str] = None):
+        """Emite player_connected y el roster de la sala (una vez por tanda de conexiones)"""
+        room = self.get_room_name(room_id)
+        await self.sio.emit('player_connected', {
+            'user_id': user_ids[-1],
+            'user_ids': user_ids,
+            'room_id': room_id,
+            'timestamp': datetime.now().isoformat()
+        }, room=room, skip_sid=skip_sid)
+
+        # Con la partida empezada el roster de espera pisaría el estado real
+        if get_state_frames().latest_public(room_id) is not None:
+            return
+
+        participants = self._participants_from_directory(room_id)
+        if participants is None:
+            # Sala fuera del directorio: datos completos de la DB
+            participants = await self.get_room_participants(room_id)
+
+        # Por emit_to_room: respeta la cola de la sala, el seq y las colas de salida
+        await self.emit_to_room(room_id, 'game_state_public', {
+            'room_id': room_id,
+            'status': 'WAITING',
+            'turno_actual': None,
+            'jugadores': participants,
+            'mazos': {},
+            'timestamp': datetime.now().isoformat()
+        })
+
+    def _participants_from_directory(self, room_id: int) -> Optional[List[dict]]:
+        """Participantes conectados armados desde el LobbyDirectory (None si la sala no está)"""
+        lobby_room = get_lobby_directory().get_room(room_id)
+        if lobby_room is None:
+            return None
+        connected_at = {
+            s['user_id']: s['connected_at']
+            for s in self.user_sessions.values()
+            if s.get('room_id') == room_id
+        }
+        participants = [
+            {**player, 'connected_at': connected_at[pid]}
+            for pid, player in lobby_room.players.items()
+            if pid in connected_at
+        ]
+        participants.sort(key=lambda x: x.get('order') if x.get('order') is not None else 999)
+        return participants
+
+    async def resume_game_room(
+        self,
+        sid: str,
+        room_id: int,
+        user_id: int,
+        epoch: Optional[str],
+        last_seq: int,
+    ) -> Optional[str]:
+        """
+        Reconecta un jugador reenviándole solo lo que se perdió (ver
+        sockets/event_log.py).
+
+        Args:
+            epoch, last_seq: posición del último evento de sala que vio el cliente
+
+        Returns:
+            "events" si alcanzó con el buffer, "snapshot" si se le mandó el
+            último estado, None si no hay con qué reanudar (usar join_game_room)
+        """
+        logs = get_room_event_logs()
+        mode = "events"
+        if logs.since(room_id, epoch, last_seq) is None:
+            state_frames = get_state_frames()
+            public = state_frames.latest_public(room_id)
+            if public is None:
+                return None
+            epoch, last_seq = logs.position(room_id)
+            await self._deliver_to_sid(sid, "game_state_public", public)
+            private = state_frames.latest_private(room_id, user_id)
+            if private is not None:
+                await self._deliver_to_sid(sid, "game_state_private", private)
+            mode = "snapshot"
+
+        replayed = await self._catch_up(sid, room_id, epoch, last_seq)
+
+        # Sin awaits desde el último since(): ningún evento de la sala queda en el medio
+        room = self.get_room_name(room_id)
+        self.user_sessions[sid] = {
+            'user_id': user_id,
+            'room_id': room_id,
+            'connected_at': datetime.now().isoformat()
+        }
+        await self.sio.enter_room(sid, room)
+
+        await self.sio.emit('player_connected', {
+            'user_id': user_id,
+            'room_id': room_id,
+            'timestamp': datetime.now().isoformat()
+        }, room=room, skip_sid=sid)
+        get_metrics().inc(f"socket.resume_{mode}")
+        logger.info(f"User {user_id} resumed room {room} from seq {last_seq} ({mode}, {replayed} events)")
+        return mode
+
+    async def _catch_up(self, sid: str, room_id: int, epoch: Optional[str], seq: int) -> int:
+        """
+        Reenvía al sid los eventos de sala posteriores a `seq`, incluidos los
+        que se emitan mientras tanto. Al volver no quedan eventos pendientes.
+
+        Returns:
+            Cantidad de eventos reenviados
+        """
+        logs = get_room_event_logs()
+        replayed = 0
+        missed = logs.since(room_id, epoch, seq)
+        while missed:
+            for _, event, data in missed:
+                await self._deliver_to_sid(sid, event, data)
+            replayed += len(missed)
+            seq = missed[-1][0]
+            missed = logs.since(room_id, epoch, seq)
+        return replayed
+
+    async def join_as_spectator(self, sid: str, room_id: int, game_id: Optional[int] = None):
+        """
+        Suma un espectador a la sala. Recibe el último estado público ya
+        codificado y después los eventos de sala, nunca los privados.
+        Solo si todavía no hay estado cacheado se arma uno (una vez por sala).
+        """
+        logs = get_room_event_logs()
+        epoch, seq = logs.position(room_id)
+        public = get_state_frames().latest_public(room_id)
+        if public is None and game_id is not None:
+            public = await self._build_public_snapshot(room_id, game_id)
+        if public is not None:
+            await self._deliver_to_sid(sid, "game_state_public", public)
+        await self._catch_up(sid, room_id, epoch, seq)
+
+        # Sin awaits desde el último since(): ningún evento de la sala queda en el medio
+        self.spectators[sid] = room_id
+        await self.sio.enter_room(sid, self.get_room_name(room_id))
+        get_metrics().set_gauge("socket.spectators", len(self.spectators))
+        logger.info(f"Spectator {sid} joined room {room_id}")
+
+    async def _build_public_snapshot(self, room_id: int, game_id: int) -> Optional[EncodedPayload]:
+        # Varios espectadores llegando juntos arman el estado una sola vez
+        lock = self._snapshot_locks.setdefault(room_id, asyncio.Lock())
+        async with lock:
+            public = get_state_frames().latest_public(room_id)
+            if public is not None:
+                return public
+            # En un thread: el lock solo frena a los espectadores de esta sala, no al loop
+            try:
+                game_state = await asyncio.to_thread(self._build_game_state, game_id)
+            except Exception as e:
+                logger.error(f"Error building spectator snapshot for room {room_id}: {e}")
+                return None
+            if not game_state:
+                return None
+            return get_state_frames().public(
+                room_id, "game_state_public", public_state_body(room_id, game_state)
+            )
+
+    def _build_game_state(self, game_id: int) -> Dict:
+        from app.services.game_status_service import build_complete_game_state  # Import aquí para evitar circular imports
+        db = self.db_factory()
+        try:
+            return build_complete_game_state(db, game_id)
+        finally:
+            db.close()
+
+    async def leave_spectator(self, sid: str):
+        room_id = self.spectators.pop(sid, None)
+        self.encodings.pop(sid, None)
+        self.card_formats.pop(sid, None)
+        self.emit_stats.pop(sid, None)
+        self.outbound.discard(sid)
+        get_metrics().set_gauge("socket.spectators", len(self.spectators))
+        if room_id is not None:
+            # Con el último espectador se va el lock (salvo que otro esté armando el snapshot)
+            lock = self._snapshot_locks.get(room_id)
+            if lock is not None and not lock.locked() and not self.get_spectator_sids(room_id):
+                self._snapshot_locks.pop(room_id, None)
+            await self.sio.leave_room(sid, self.get_room_name(room_id))
+
+    def discard_room(self, room_id: int) -> None:
+        """Libera el estado por sala del manager cuando la partida termina."""
+        self._snapshot_locks.pop(room_id, None)
+
+    def get_spectator_sids(self, room_id: int) -> List[str]:
+        return [sid for sid, r in self.spectators.items() if r == room_id]
+
+    def set_encoding(self, sid: str, encoding: str):
+        """Registra el formato de payload negociado por una conexión"""
+        if encoding == wire_format.JSON:
+            self.encodings.pop(sid, None)
+        else:
+            self.encodings[sid] = encoding
+
+    def get_encoding(self, sid: str) -> str:
+        return self.encodings.get(sid, wire_format.JSON)
+
+    def set_card_format(self, sid: str, card_format: str):
+        """Registra si la conexión recibe cartas completas o solo ids de catálogo"""
+        if card_format == wire_format.CARDS_FULL:
+            self.card_formats.pop(sid, None)
+        else:
+            self.card_formats[sid] = card_format
+
     async def leave_game_room(self, sid: str, room_id: int = None):
         """Salir del room"""
+        self.encodings.pop(sid, None)
+        self.card_formats.pop(sid, None)
+        self.emit_stats.pop(sid, None)
+        self.outbound.discard(sid)
         try: 
             if sid not in self.user_sessions:
                 return
@@ -108,8 +358,7 @@ class WebSocketManager:
                 if session_data.get('room_id') == room_id
             ]
 
-            # DEBUG
-            logger.info(f"🔍 Connected user_ids for room {room_id}: {connected_user_ids}")
+            logger.debug("🔍 Connected user_ids for room %s: %s", room_id, connected_user_ids)
             
             if not connected_user_ids:
                 return []
@@ -120,8 +369,7 @@ class WebSocketManager:
                 Player.id_room == room_id
             ).all()
 
-            # DEBUG
-            logger.info(f"🔍 Players found in DB: {[p.id for p in players]}")
+            logger.debug("🔍 Players found in DB: %s", [p.id for p in players])
             
             # Construir la lista de participantes con formato correcto
             for player in players:
@@ -154,18 +402,158 @@ class WebSocketManager:
 
     async def emit_to_room(self, room_id: int, event: str, data: Dict):
         """Emite un evento a todos los jugadores en una partida"""
+        # Si la sala tiene un estado pendiente el evento sale detrás de él
+        if self.scheduler.defer(room_id, lambda: self.emit_to_room(room_id, event, data)):
+            return
+        # seq de sala + buffer para reanudar sesiones (se guarda aunque no haya nadie conectado)
+        data = get_room_event_logs().record(room_id, event, data)
         room = self.get_room_name(room_id) # Tomo a que partida le mando la notificacion
+        room_sids = [sid for sid, s in self.user_sessions.items() if s['room_id'] == room_id]
+        room_sids += self.get_spectator_sids(room_id)
         # Chequeo que la room no este vacia
-        if not any(s['room_id'] == room_id for s in self.user_sessions.values()):
-          logger.warning(f"La room esta vacía: {room}")
+        if not room_sids:
+          logger.debug("La room esta vacía: %s", room)
           return
         
-        await self.sio.emit(event, data, room=room)
+        if isinstance(data, EncodedPayload):
+            await self._send_frames(room_sids, event, data)
+            return
+
+        # Los sockets atrasados reciben el evento por su cola (ver sockets/outbound.py)
+        congested = [sid for sid in room_sids if self.outbound.is_congested(sid)]
+        binary_sids = [sid for sid in room_sids if sid in self.encodings and sid not in congested]
+        if not binary_sids and not congested:
+            await self.sio.emit(event, data, room=room)
+            return
+
+        # JSON al resto de la room, msgpack (codificado una sola vez) a los que lo negociaron
+        await self.sio.emit(event, data, room=room, skip_sid=binary_sids + congested)
+        if binary_sids:
+            packed = wire_format.pack(data)
+            for sid in binary_sids:
+                await self.sio.emit(event, packed, to=sid)
+        if congested:
+            payload = EncodedPayload(data)
+            for sid in congested:
+                self.outbound.enqueue(sid, event, payload.frames(self.sio, event, self.get_encoding(sid)))
     
     async def emit_to_sid(self, sid: str, event: str, data: Dict):
         """Emite un evento privado a un jugador"""
+        room_id = self.user_sessions.get(sid, {}).get('room_id')
+        if self.scheduler.defer(room_id, lambda: self.emit_to_sid(sid, event, data)):
+            return
+        await self._deliver_to_sid(sid, event, data)
+
+    async def _deliver_to_sid(self, sid: str, event: str, data: Dict):
+        if isinstance(data, EncodedPayload):
+            await self._send_frames([sid], event, data)
+            return
+        if self.outbound.is_congested(sid):
+            frames = EncodedPayload(data).frames(self.sio, event, self.get_encoding(sid))
+            self.outbound.enqueue(sid, event, frames)
+            return
+        if sid in self.encodings:
+            data = wire_format.pack(data)
         await self.sio.emit(event, data, to=sid)
     
+    async def emit_many(
+        self,
+        emits: Iterable[Tuple[str, str, Dict]],
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Emite varios eventos privados en paralelo (un socket lento no demora
+        al resto).
+
+        Args:
+            emits: tuplas (sid, evento, payload)
+            concurrency: máximo de emits en vuelo (default EMIT_CONCURRENCY)
+            timeout: segundos por emit antes de abandonarlo (default EMIT_TIMEOUT_MS)
+        """
+        emits = list(emits)
+        if not emits:
+            return
+        if concurrency is None:
+            concurrency = settings.EMIT_CONCURRENCY
+        if timeout is None:
+            timeout = settings.EMIT_TIMEOUT_MS / 1000
+
+        # Si la sala tiene un flush pendiente la tanda entera se encola detrás
+        # (una sola vez), así la latencia y el timeout miden el envío real
+        by_room: Dict[Optional[int], List[Tuple[str, str, Dict]]] = {}
+        for emit in emits:
+            by_room.setdefault(self.user_sessions.get(emit[0], {}).get('room_id'), []).append(emit)
+        emits = []
+        for room_id, batch in by_room.items():
+            if not self.scheduler.defer(
+                room_id, lambda batch=batch: self.emit_many(batch, concurrency, timeout)
+            ):
+                emits.extend(batch)
+        if not emits:
+            return
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _emit(sid: str, event: str, data: Dict):
+            async with semaphore:
+                await self._timed_emit(sid, event, data, timeout)
+
+        await asyncio.gather(*(_emit(sid, event, data) for sid, event, data in emits))
+
+    async def _timed_emit(self, sid: str, event: str, data: Dict, timeout: float):
+        metrics = get_metrics()
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._deliver_to_sid(sid, event, data), timeout)
+        except asyncio.TimeoutError:
+            metrics.inc("socket.emit_timeouts")
+            self._emit_stats(sid)["timeouts"] += 1
+            logger.warning(f"Emit {event} to {sid} timed out after {timeout * 1000:.0f}ms")
+            return
+        except Exception as e:
+            metrics.inc("socket.emit_errors")
+            logger.error(f"Error emitting {event} to {sid}: {e}")
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        metrics.observe("socket.emit_ms", elapsed_ms)
+        stats = self._emit_stats(sid)
+        stats["count"] += 1
+        stats["last_ms"] = elapsed_ms
+        if elapsed_ms > stats["max_ms"]:
+            stats["max_ms"] = elapsed_ms
+
+    def _emit_stats(self, sid: str) -> dict:
+        stats = self.emit_stats.get(sid)
+        if stats is None:
+            stats = {"count": 0, "last_ms": 0.0, "max_ms": 0.0, "timeouts": 0}
+            self.emit_stats[sid] = stats
+        return stats
+
+    def slowest_consumers(self, limit: int = 10) -> List[dict]:
+        """Sockets con mayor latencia de emit (para /metrics)."""
+        ranked = sorted(
+            self.emit_stats.items(),
+            key=lambda item: (item[1]["timeouts"], item[1]["max_ms"]),
+            reverse=True,
+        )
+        return [
+            {"sid": sid, "user_id": self.user_sessions.get(sid, {}).get("user_id"),
+             "queued": self.outbound.depth(sid), **stats}
+            for sid, stats in ranked[:limit]
+        ]
+
+    async def _send_frames(self, sids: List[str], event: str, payload: EncodedPayload):
+        """Entrega frames ya codificados directo a Engine.IO (sin re-serializar)"""
+        sends = []
+        for sid in sids:
+            target = payload
+            if sid in self.card_formats:
+                target = payload.variant(wire_format.CARDS_IDS, wire_format.compact_cards)
+            frames = target.frames(self.sio, event, self.get_encoding(sid))
+            sends.append(self.outbound.send(sid, event, frames))
+        if sends:
+            await asyncio.gather(*sends)
+
     def get_sids_in_game(self, room_id: int) -> List[str]:
         sids = [sid for sid, s in self.user_sessions.items() if s.get('room_id') == room_id]
         logger.debug(f"get_sids_in_game({room_id}): user_sessions={self.user_sessions}, sids={sids}")
@@ -1,6 +1,8 @@
 # app/sockets/socket_service.py
 from .socket_manager import get_ws_manager
-from typing import Dict, Any, Optional, List
+from .frames import get_state_frames, public_state_body
+from typing import Callable, Dict, Any, Optional, List, Union
+import asyncio
 import logging
 from datetime import datetime
 
@@ -32,23 +34,15 @@ class WebSocketService:
                 - jugadores: List[Dict] (player info)
                 - mazos: Dict (deck, discard, draft counts/data)
         """
-        logger.info(f"🔵 Notifying public state to room {room_id}")
+        logger.debug("🔵 Notifying public state to room %s", room_id)
         
-        mensaje_publico = {
-            "type": "game_state_public",
-            "room_id": room_id,
-            "game_id": game_state.get("game_id"),
-            "status": game_state.get("status", "WAITING"),
-            "turno_actual": game_state.get("turno_actual"),
-            "jugadores": game_state.get("jugadores", []),
-            "mazos": game_state.get("mazos", {}),
-            "sets": game_state.get("sets", []),
-            "secretsFromAllPlayers": game_state.get("secretsFromAllPlayers", []),
-            "timestamp": datetime.now().isoformat()
-        }
+        # Se codifica una vez por versión del estado (ver sockets/frames.py)
+        mensaje_publico = get_state_frames().public(
+            room_id, "game_state_public", public_state_body(room_id, game_state)
+        )
         
         await self.ws_manager.emit_to_room(room_id, "game_state_public", mensaje_publico)
-        logger.info(f"✅ Emitted game_state_public to room {room_id}")
+        logger.debug("✅ Emitted game_state_public to room %s", room_id)
     
     async def notificar_estados_privados(
         self,
@@ -68,13 +62,15 @@ class WebSocketService:
                     }
                 }
         """
-        logger.info(f"🟢 Notifying private states to room {room_id}")
+        logger.debug("🟢 Notifying private states to room %s", room_id)
         sids = self.ws_manager.get_sids_in_game(room_id)
         
         if not sids:
             logger.warning(f"Room {room_id} has no connected players")
             return
           
+        state_frames = get_state_frames()
+        emits = []
         for sid in sids:
             session = self.ws_manager.get_user_session(sid)
             if not session:
@@ -83,16 +79,18 @@ class WebSocketService:
             user_id = session["user_id"]
             private_data = estados_privados.get(user_id, {})
             
-            mensaje_privado = {
+            # Si la mano / secretos del jugador no cambiaron se reusa el frame anterior
+            mensaje_privado = state_frames.private(room_id, user_id, "game_state_private", {
                 "type": "game_state_private",
                 "user_id": user_id,
                 "mano": private_data.get("mano", []),
                 "secretos": private_data.get("secretos", []),
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            await self.ws_manager.emit_to_sid(sid, "game_state_private", mensaje_privado)
-            logger.info(f"✅ Emitted game_state_private to user {user_id}")
+            })
+            emits.append((sid, "game_state_private", mensaje_privado))
+        
+        # En paralelo: un socket lento no demora al resto de la sala
+        await self.ws_manager.emit_many(emits)
+        logger.debug("✅ Emitted game_state_private to %s sockets", len(emits))
     
     async def notificar_fin_partida(
         self,
@@ -110,12 +108,14 @@ class WebSocketService:
             reason: String explaining why game ended
         """
         logger.info(f"🏁 Notifying game ended to room {room_id}")
+        self.ws_manager.discard_room(room_id)
         sids = self.ws_manager.get_sids_in_game(room_id)
         
         if not sids:
             logger.warning(f"Room {room_id} has no connected players")
             return
         
+        emits = []
         for sid in sids:
             session = self.ws_manager.get_user_session(sid)
             if not session:
@@ -132,10 +132,10 @@ class WebSocketService:
                 "reason": reason,
                 "timestamp": datetime.now().isoformat()
             }
-            
-            await self.ws_manager.emit_to_sid(sid, "game_ended", resultado)
-            print(f"✅ Se emitio el fin de partida")
-            logger.info(f"✅ Emitted game_ended to user {user_id} (winner: {is_winner})")
+            emits.append((sid, "game_ended", resultado))
+            logger.debug("Emitting game_ended to user %s (winner: %s)", user_id, is_winner)
+        
+        await self.ws_manager.emit_many(emits)
     
     # --------------------------------------------
     # | Metodo Anterior - backward compatibility |
@@ -145,7 +145,7 @@ class WebSocketService:
         self,
         room_id: int,
         jugador_que_actuo: Optional[int] = None,
-        game_state: Optional[Dict] = None,
+        game_state: Optional[Union[Dict, Callable[[], Dict]]] = None,
         partida_finalizada: bool = False,
     ):
         """
@@ -153,13 +153,45 @@ class WebSocketService:
         Kept for backward compatibility, but prefer using individual methods
         
         This calls the three refactored methods internally
+
+        game_state puede ser el dict ya armado o un builder sin argumentos
+        (game_state_builder): el builder corre una sola vez al vaciar la sala,
+        en un thread, y solo el del último request de la ventana.
         """
-        logger.info(f"🎮 Notifying game state to room {room_id} (legacy method)")
+        logger.debug("🎮 Notifying game state to room %s (legacy method)", room_id)
         
         if not game_state:
             logger.warning(f"No game_state provided to notificar_estado_partida")
             return
         
+        # Se agrupa por sala: si llega otro estado dentro de la ventana este se descarta
+        scheduler = self.ws_manager.scheduler
+        if scheduler is not None and scheduler.enabled:
+            scheduler.schedule_state(
+                room_id,
+                lambda: self._emitir_estado_partida(room_id, game_state, partida_finalizada),
+            )
+            return
+        
+        await self._emitir_estado_partida(room_id, game_state, partida_finalizada)
+
+    async def _emitir_estado_partida(
+        self,
+        room_id: int,
+        game_state: Union[Dict, Callable[[], Dict]],
+        partida_finalizada: bool,
+    ):
+        # La partida terminó mientras el estado esperaba el flush: ya salió game_ended
+        if get_state_frames().is_discarded(room_id):
+            logger.debug("Skipping state broadcast for ended room %s", room_id)
+            return
+
+        if callable(game_state):
+            game_state = await asyncio.to_thread(game_state)
+            if not game_state:
+                logger.warning(f"Game state builder returned nothing for room {room_id}")
+                return
+
         # 1. Public state
         await self.notificar_estado_publico(room_id, game_state)
         
@@ -505,7 +537,7 @@ class WebSocketService:
         }
         await self.ws_manager.emit_to_room(room_id, "player_must_draw", mensaje)
         logger.info(f"✅ Emitted player_must_draw to room {room_id}")
-        print(f"✅ Emitted player_must_draw to room {room_id}")
+        logger.debug("✅ Emitted player_must_draw to room %s", room_id)
 
 
     async def notificar_card_drawn_simple(
@@ -625,7 +657,7 @@ class WebSocketService:
         }
         
         await self.ws_manager.emit_to_room(room_id, "social_disgrace_update", mensaje)
-        print(f"'social_disgrace_update' emitido a room {room_id}")
+        logger.debug("'social_disgrace_update' emitido a room %s", room_id)
 
     # ==================
     # | NOT SO FAST    |
@@ -731,10 +763,9 @@ class WebSocketService:
         }
         
         await self.ws_manager.emit_to_room(room_id, "nsf_counter_tick", mensaje)
-        # Log temporal para debugging
-        logger.info(
-            f"⏱️  Emitted nsf_counter_tick to room {room_id}: "
-            f"Action {action_id} - {remaining_time}s remaining, {elapsed_time}s elapsed"
+        logger.debug(
+            "⏱️  Emitted nsf_counter_tick to room %s: Action %s - %ss remaining, %ss elapsed",
+            room_id, action_id, remaining_time, elapsed_time
         )
     
     async def notificar_nsf_played(
@@ -0,0 +1,103 @@
+# app/sockets/wire_format.py
+"""
+Formato de los payloads de Socket.IO por conexión.
+
+Por defecto todo sale como JSON con el encoder de python-socketio. Un cliente
+puede pedir MessagePack al conectarse (`?encoding=msgpack`): a ese socket los
+eventos que pasan por WebSocketManager.emit_to_room / emit_to_sid le llegan
+como un único adjunto binario con el dict codificado en msgpack (el paquete
+de Socket.IO sigue siendo el estándar, así que no hace falta otro parser en el
+cliente). Los pocos emits que no pasan por el manager siguen en JSON, por lo
+que un cliente msgpack tiene que aceptar ambos.
+
+msgpack es una dependencia opcional: si no está instalado se negocia JSON.
+
+Independientemente del formato, un cliente puede pedir cartas por id
+(`?cards=ids`): en los estados de partida cada carta viaja solo con su id de
+instancia (CardsXGame.id), su `card_id` y los campos propios de la instancia
+(hidden / revealed, position, ...); nombre, descripción, tipo e imagen salen
+del catálogo (`GET /api/cards/catalog`, cacheable con ETag).
+"""
+
+import enum
+import logging
+from datetime import date, datetime
+from typing import Any, Optional
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depende del entorno
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+JSON = "json"
+MSGPACK = "msgpack"
+
+CARDS_FULL = "full"
+CARDS_IDS = "ids"
+
+# Campos que salen del catálogo y se omiten en el formato por ids
+CATALOG_FIELDS = frozenset(("name", "description", "type", "img_src"))
+
+
+def msgpack_available() -> bool:
+    return msgpack is not None
+
+
+def negotiate_encoding(requested: Optional[str]) -> str:
+    """
+    Decide el formato de una conexión a partir del parámetro `encoding`.
+
+    Args:
+        requested: valor pedido por el cliente (None si no lo mandó)
+
+    Returns:
+        MSGPACK si lo pidió y está disponible, JSON en cualquier otro caso
+    """
+    if requested and requested.lower() == MSGPACK:
+        if msgpack_available():
+            return MSGPACK
+        logger.warning("msgpack requested but not installed; falling back to json")
+    return JSON
+
+
+def negotiate_card_format(requested: Optional[str]) -> str:
+    """CARDS_IDS si el cliente lo pidió, CARDS_FULL por defecto."""
+    if requested and requested.lower() == CARDS_IDS:
+        return CARDS_IDS
+    return CARDS_FULL
+
+
+def compact_cards(data: Any) -> Any:
+    """
+    Copia de `data` donde cada carta (dict con `card_id`) pierde los campos
+    de catálogo. El resto de la estructura queda igual.
+    """
+    if isinstance(data, dict):
+        is_card = "card_id" in data
+        return {
+            key: compact_cards(value)
+            for key, value in data.items()
+            if not (is_card and key in CATALOG_FIELDS)
+        }
+    if isinstance(data, list):
+        return [compact_cards(item) for item in data]
+    return data
+
+
+def _default(obj: Any):
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+
+def pack(data: Any) -> bytes:
+    """Codifica un payload en msgpack (strings como str, bytes como bin)."""
+    return msgpack.packb(data, default=_default, use_bin_type=True)
+
+
+def unpack(raw: bytes) -> Any:
+    return msgpack.unpackb(raw, raw=False)
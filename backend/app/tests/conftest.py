@@ -9,4 +9,27 @@ def setup_test_environment():
     # Deshabilitar event listeners de SQLAlchemy durante tests
     os.environ["DISABLE_DB_EVENTS"] = "true"
     
-    yield
\ No newline at end of file
+    yield
+
+@pytest.fixture(autouse=True)
+def reset_in_memory_state():
+    """Limpia los registros en memoria (directorio del lobby, etc.) entre tests"""
+    from app.services.lobby_directory import get_lobby_directory
+    from app.services.game_tracker import get_game_trackers
+    from app.services.seat_ring import get_seat_rings
+    from app.sockets.frames import get_state_frames
+    from app.services.card_catalog import get_card_catalog
+    from app.sockets.event_log import get_room_event_logs
+    get_lobby_directory().invalidate()
+    get_game_trackers().clear()
+    get_seat_rings().clear()
+    get_state_frames().clear()
+    get_card_catalog().invalidate()
+    get_room_event_logs().clear()
+    yield
+    get_lobby_directory().invalidate()
+    get_game_trackers().clear()
+    get_seat_rings().clear()
+    get_state_frames().clear()
+    get_card_catalog().invalidate()
+    get_room_event_logs().clear()
@@ -4,6 +4,7 @@ from fastapi import HTTPException
 from datetime import datetime
 
 from app.routes.another_victim import another_victim, VictimRequest
+from app.services.game_context import GameContext
 from app.db.models import CardState, TurnStatus, ActionType, ActionResult
 from app.schemas.detective_set_schema import SetType
 
@@ -149,12 +150,31 @@ class TestAnotherVictim:
         card.card.name = "Another Victim"
         return card
     
+    @pytest.fixture(autouse=True)
+    def mock_load_context(self):
+        """load_game_context parcheado; setup_query_chain le da las respuestas"""
+        with patch('app.routes.another_victim.load_game_context') as loader:
+            self.load_context = loader
+            yield loader
+
     def setup_query_chain(self, mock_db, responses):
         """
         Helper para configurar cadenas de queries de SQLAlchemy.
-        responses: lista de respuestas en orden de ejecución
+        responses: lista de respuestas en orden de ejecución. Las primeras
+        (sala, juego, actor, turno) las devuelve load_game_context.
         """
         response_iter = iter(responses)
+
+        def load_context(db, room_id, actor_id=None):
+            room = next(response_iter, None)
+            if room is None:
+                return None
+            game = next(response_iter, None)
+            actor = next(response_iter, None) if game else None
+            turn = next(response_iter, None) if actor else None
+            return GameContext(room, game, actor, turn)
+
+        self.load_context.side_effect = load_context
         
         def create_query_mock(*args, **kwargs):
             mock_query = Mock()
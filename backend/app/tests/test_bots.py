@@ -0,0 +1,207 @@
+import random
+from itertools import combinations_with_replacement
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.bots import Bot, BotView, GreedyStrategy, Strategy, get_strategy
+from app.bots.client import BotRequestError
+from app.bots.rules import SetPlay, find_detective_sets, is_valid_set
+from app.schemas.detective_set_schema import SetType
+from app.services.detective_set_service import DetectiveSetService
+
+ME, OTHER = 1, 2
+
+
+def card(cxg_id, card_id):
+    return {"id": cxg_id, "card_id": card_id, "name": f"card {card_id}"}
+
+
+def view_with(hand=(), turn=ME, secrets=None, discard=3):
+    view = BotView(ME, room_id=10)
+    view.apply("game_state_public", {
+        "game_id": 5,
+        "status": "INGAME",
+        "turno_actual": turn,
+        "jugadores": [{"player_id": ME, "hand_size": len(hand)}, {"player_id": OTHER, "hand_size": 6}],
+        "mazos": {"deck": {"count": 20, "draft": [card(90, 3), card(91, 13), card(92, 11)]},
+                  "discard": {"count": discard}},
+        "secretsFromAllPlayers": secrets if secrets is not None else [
+            {"id": 70, "player_id": OTHER, "hidden": True},
+            {"id": 71, "player_id": OTHER, "hidden": False},
+        ],
+    })
+    view.apply("game_state_private", {
+        "user_id": ME,
+        "mano": list(hand),
+        "secretos": [{"id": 80, "revealed": False}, {"id": 81, "revealed": True}],
+    })
+    return view
+
+
+# ---------- reglas ----------
+
+def test_is_valid_set_matches_detective_set_service():
+    service = DetectiveSetService(db=None)
+    detective_ids = [4, 6, 7, 8, 9, 10, 11, 12]
+    for size in (2, 3):
+        for types in combinations_with_replacement(detective_ids, size):
+            cards = [SimpleNamespace(id_card=c) for c in types]
+            for set_type in SetType:
+                try:
+                    service._validate_set_combination(cards, set_type, 4 in types)
+                    expected = True
+                except HTTPException:
+                    expected = False
+                assert is_valid_set(types, set_type) == expected, (types, set_type)
+
+
+def test_find_detective_sets_uses_wildcard_only_when_needed():
+    hand = [card(1, 11), card(2, 11), card(3, 4), card(4, 8), card(5, 10), card(6, 13)]
+
+    plays = find_detective_sets(hand)
+
+    assert SetPlay(SetType.POIROT, [1, 2, 3], True) in plays
+    assert SetPlay(SetType.BERESFORD, [4, 5], False) in plays
+    assert plays[0].set_type == SetType.POIROT
+
+
+def test_find_detective_sets_empty_without_sets():
+    assert find_detective_sets([card(1, 11), card(2, 6), card(3, 13)]) == []
+
+
+# ---------- vista ----------
+
+def test_view_tracks_turn_hand_and_nsf_windows():
+    view = view_with([card(1, 13)])
+
+    assert view.is_my_turn
+    assert [c["id"] for c in view.hand] == [1]
+    assert [s["id"] for s in view.own_hidden_secrets()] == [80]
+
+    view.apply("nsf_counter_start", {"action_id": 7, "player_id": OTHER})
+    view.apply("nsf_played", {"action_id": 7, "player_id": ME})
+    assert view.nsf_windows[7] == {"player_id": OTHER, "played": 1}
+
+    view.apply("nsf_counter_complete", {"action_id": 7, "final_result": "cancelled"})
+    assert view.nsf_windows == {}
+    assert view.nsf_results[7] == "cancelled"
+
+    view.apply("game_ended", {"ganaste": True})
+    assert view.finished and view.won and not view.is_my_turn
+
+
+# ---------- estrategias ----------
+
+def test_should_play_nsf_follows_chain_parity():
+    strategy = Strategy(random.Random(1), nsf_rate=1.0)
+    view = view_with([card(1, 13)])
+
+    # Acción de otro sin NSF todavía: conviene cancelarla
+    view.apply("nsf_counter_start", {"action_id": 7, "player_id": OTHER})
+    assert strategy.should_play_nsf(view, 7)
+    # Ya quedó cancelada: no gastar otro
+    view.apply("nsf_played", {"action_id": 7, "player_id": ME})
+    assert not strategy.should_play_nsf(view, 7)
+
+    # Acción propia cancelada por otro: contra-NSF
+    view.apply("nsf_counter_start", {"action_id": 8, "player_id": ME})
+    view.apply("nsf_played", {"action_id": 8, "player_id": OTHER})
+    assert strategy.should_play_nsf(view, 8)
+
+    view.hand = []
+    assert not strategy.should_play_nsf(view, 8)
+
+
+def test_choose_target_respects_set_type():
+    strategy = Strategy(random.Random(1))
+    view = view_with()
+
+    assert strategy.choose_target(view, SetType.POIROT, [OTHER]) == (OTHER, 70)
+    assert strategy.choose_target(view, SetType.PYNE, [OTHER]) == (OTHER, 71)
+    assert strategy.choose_target(view, SetType.BERESFORD, [OTHER]) == (OTHER, None)
+    assert strategy.choose_target(view, SetType.POIROT, [ME]) == (None, None)
+
+
+def test_greedy_keeps_sets_and_nsf_when_discarding():
+    view = view_with([card(1, 11), card(2, 11), card(3, 11), card(4, 13), card(5, 17), card(6, 15)])
+
+    assert GreedyStrategy(random.Random(1)).choose_discard(view) == [5, 6]
+
+
+def test_get_strategy_unknown_name():
+    assert isinstance(get_strategy("greedy"), GreedyStrategy)
+    with pytest.raises(ValueError):
+        get_strategy("nope")
+
+
+# ---------- bot ----------
+
+def make_bot(view_hand, strategy=None):
+    client = MagicMock()
+    for method in ("discard", "draft_pick", "take_deck", "finish_turn", "start_action",
+                   "cancel_action", "play_detective_set", "detective_action", "play_nsf"):
+        setattr(client, method, AsyncMock(return_value={}))
+    bot = Bot(client, ME, 10, strategy=strategy or GreedyStrategy(random.Random(1), play_rate=0.0),
+              think_time=(0, 0))
+    bot.view = view_with(view_hand)
+    return bot, client
+
+
+@pytest.mark.asyncio
+async def test_take_turn_discards_refills_and_finishes():
+    hand = [card(1, 11), card(2, 11), card(3, 11), card(4, 13), card(5, 17), card(6, 15)]
+    bot, client = make_bot(hand)
+    client.discard.return_value = {"hand": {"cards": hand[:4]}}
+    client.draft_pick.side_effect = [{}, BotRequestError("POST", "/pick", 404, "Card not found in draft")]
+
+    await bot.take_turn()
+
+    client.discard.assert_awaited_once_with(10, ME, [5, 6])
+    assert [c.args[2] for c in client.draft_pick.await_args_list] == [90, 91]
+    client.take_deck.assert_awaited_once_with(10, ME, 1)
+    client.finish_turn.assert_awaited_once_with(10, ME)
+    assert bot.stats.moves["draft_pick"] == 1
+    assert bot.stats.errors["draft_pick:404"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_set_goes_through_cancel_route():
+    hand = [card(1, 11), card(2, 11), card(3, 11)]
+    bot, client = make_bot(hand, GreedyStrategy(random.Random(1)))
+    client.start_action.return_value = {"actionId": 40, "actionNSFId": 41, "cancellable": True}
+    # El resultado de la ventana llega antes de que el bot se ponga a esperar
+    await bot.handle_event("nsf_counter_complete", {"action_id": 40, "final_result": "cancelled"})
+
+    await bot._play_set(find_detective_sets(hand)[0])
+
+    client.cancel_action.assert_awaited_once_with(10, ME, 40, [1, 2, 3], "CREATE_SET")
+    client.play_detective_set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_one_step_set_picks_player_and_secret():
+    hand = [card(1, 11), card(2, 11), card(3, 11)]
+    bot, client = make_bot(hand, GreedyStrategy(random.Random(1)))
+    client.start_action.return_value = {"actionId": 40, "actionNSFId": None, "cancellable": False}
+    client.play_detective_set.return_value = {
+        "actionId": 50, "nextAction": {"type": "selectPlayerAndSecret", "allowedPlayers": [OTHER]},
+    }
+
+    await bot._play_set(find_detective_sets(hand)[0])
+
+    client.play_detective_set.assert_awaited_once_with(10, ME, "poirot", [1, 2, 3], False)
+    client.detective_action.assert_awaited_once_with(10, 50, ME, target_player_id=OTHER, secret_id=70)
+
+
+@pytest.mark.asyncio
+async def test_select_own_secret_reveals_a_hidden_secret():
+    bot, client = make_bot([], Strategy(random.Random(1)))
+
+    await bot.handle_event("select_own_secret", {"action_id": "50", "requester_id": OTHER})
+    for task in list(bot._tasks):
+        await task
+
+    client.detective_action.assert_awaited_once_with(10, 50, ME, secret_id=80)
@@ -0,0 +1,81 @@
+"""
+Tests para el catálogo de cartas (GET /api/cards/catalog).
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db import models
+from app.db.database import Base
+from app.main import app
+from app.routes.cards import get_db
+from app.services.card_catalog import get_card_catalog
+
+engine = create_engine(
+    "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    db.add_all([
+        models.Card(id=1, name="Hercule Poirot", description="d", type="DETECTIVE", img_src="p.png", qty=3),
+        models.Card(id=2, name="Not so fast", description="n", type="INSTANT", img_src="n.png", qty=10),
+    ])
+    db.commit()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def client(db):
+    def _get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = _get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def test_catalog_returns_cards_with_strong_etag(client):
+    response = client.get("/api/cards/catalog")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [c["id"] for c in body["cards"]] == [1, 2]
+    assert body["cards"][0] == {"id": 1, "name": "Hercule Poirot", "description": "d",
+                                "type": "DETECTIVE", "img_src": "p.png"}
+    etag = response.headers["etag"]
+    assert etag == f'"{body["version"]}"'
+    assert "max-age" in response.headers["cache-control"]
+
+
+def test_catalog_not_modified_for_matching_etag(client):
+    etag = client.get("/api/cards/catalog").headers["etag"]
+
+    response = client.get("/api/cards/catalog", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    stale = client.get("/api/cards/catalog", headers={"If-None-Match": '"old"'})
+    assert stale.status_code == 200
+
+
+def test_catalog_version_follows_content(db, client):
+    first = client.get("/api/cards/catalog").headers["etag"]
+
+    db.get(models.Card, 2).img_src = "n2.png"
+    db.commit()
+    # Cargado una vez: no se vuelve a leer la tabla hasta invalidar
+    assert client.get("/api/cards/catalog").headers["etag"] == first
+
+    get_card_catalog().invalidate()
+    assert client.get("/api/cards/catalog").headers["etag"] != first
@@ -13,6 +13,7 @@ from app.db.models import (
     CardState, TurnStatus, ActionType, ActionResult, 
     ActionName, CardType
 )
+from app.services.game_context import GameContext
 
 
 class TestCardTradePlay:
@@ -101,32 +102,22 @@ class TestCardTradePlay:
         card.card.type.value = "SECRET"
         return card
     
-    def setup_db_queries_play(self, mock_db, actor, target, turn, p1_card, target_has_cards=True):
-        """Configura todos los queries del db para card_trade_play"""
-        # Query 1: Actor player
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = actor
-        
-        # Query 2: Target player
+    def setup_db_queries_play(self, mock_db, target, p1_card, target_has_cards=True):
+        """Configura los queries del db para card_trade_play (después del contexto)"""
+        # Query 1: Target player
         mock_target_query = Mock()
         mock_target_query.filter.return_value.first.return_value = target
         
-        # Query 3: Turn
-        mock_turn_query = Mock()
-        mock_turn_query.filter.return_value.first.return_value = turn
-        
-        # Query 4: P1 card
+        # Query 2: P1 card
         mock_p1_card_query = Mock()
         mock_p1_card_query.filter.return_value.first.return_value = p1_card
         
-        # Query 5: Target has cards count
+        # Query 3: Target has cards count
         mock_target_cards_query = Mock()
         mock_target_cards_query.filter.return_value.count.return_value = 1 if target_has_cards else 0
         
         mock_db.query.side_effect = [
-            mock_actor_query,
             mock_target_query,
-            mock_turn_query,
             mock_p1_card_query,
             mock_target_cards_query
         ]
@@ -135,7 +126,7 @@ class TestCardTradePlay:
     @pytest.mark.asyncio
     async def test_card_trade_play_room_not_found(self, mock_db):
         """Test cuando no se encuentra la sala"""
-        with patch('app.routes.card_trade.get_room_by_id', return_value=None):
+        with patch('app.routes.card_trade.load_game_context', return_value=None):
             request = CardTradePlayRequest(own_card_id=100, target_player_id=20)
             
             with pytest.raises(HTTPException) as exc_info:
@@ -152,8 +143,7 @@ class TestCardTradePlay:
     @pytest.mark.asyncio
     async def test_card_trade_play_game_not_found(self, mock_db, mock_room):
         """Test cuando no se encuentra el juego"""
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=None):
+        with patch('app.routes.card_trade.load_game_context', return_value=GameContext(mock_room)):
             
             request = CardTradePlayRequest(own_card_id=100, target_player_id=20)
             
@@ -172,9 +162,9 @@ class TestCardTradePlay:
     async def test_card_trade_play_not_your_turn(self, mock_db, mock_room, mock_game):
         """Test cuando no es el turno del jugador"""
         mock_game.player_turn_id = 999
+        context = GameContext(mock_room, mock_game)
         
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.card_trade.load_game_context', return_value=context):
             
             request = CardTradePlayRequest(own_card_id=100, target_player_id=20)
             
@@ -194,12 +184,9 @@ class TestCardTradePlay:
         self, mock_db, mock_room, mock_game
     ):
         """Test cuando no se encuentra el actor"""
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = None
-        mock_db.query.return_value = mock_actor_query
+        context = GameContext(mock_room, mock_game)
         
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.card_trade.load_game_context', return_value=context):
             
             request = CardTradePlayRequest(own_card_id=100, target_player_id=20)
             
@@ -219,16 +206,14 @@ class TestCardTradePlay:
         self, mock_db, mock_room, mock_game, mock_actor
     ):
         """Test cuando no se encuentra el jugador objetivo"""
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = mock_actor
+        context = GameContext(mock_room, mock_game, mock_actor)
         
         mock_target_query = Mock()
         mock_target_query.filter.return_value.first.return_value = None
         
-        mock_db.query.side_effect = [mock_actor_query, mock_target_query]
+        mock_db.query.side_effect = [mock_target_query]
         
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.card_trade.load_game_context', return_value=context):
             
             request = CardTradePlayRequest(own_card_id=100, target_player_id=20)
             
@@ -250,16 +235,14 @@ class TestCardTradePlay:
         """Test cuando intentas intercambiar contigo mismo"""
         mock_actor.id = 10
         
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = mock_actor
+        context = GameContext(mock_room, mock_game, mock_actor)
         
         mock_target_query = Mock()
         mock_target_query.filter.return_value.first.return_value = mock_actor
         
-        mock_db.query.side_effect = [mock_actor_query, mock_target_query]
+        mock_db.query.side_effect = [mock_target_query]
         
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.card_trade.load_game_context', return_value=context):
             
             request = CardTradePlayRequest(own_card_id=100, target_player_id=10)
             
@@ -279,19 +262,14 @@ class TestCardTradePlay:
         self, mock_db, mock_room, mock_game, mock_actor, mock_target
     ):
         """Test cuando no hay turno activo"""
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = mock_actor
+        context = GameContext(mock_room, mock_game, mock_actor, current_turn=None)
         
         mock_target_query = Mock()
         mock_target_query.filter.return_value.first.return_value = mock_target
         
-        mock_turn_query = Mock()
-        mock_turn_query.filter.return_value.first.return_value = None
+        mock_db.query.side_effect = [mock_target_query]
         
-        mock_db.query.side_effect = [mock_actor_query, mock_target_query, mock_turn_query]
-        
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.card_trade.load_game_context', return_value=context):
             
             request = CardTradePlayRequest(own_card_id=100, target_player_id=20)
             
@@ -314,17 +292,15 @@ class TestCardTradePlay:
         mock_target, mock_turn, mock_p1_card
     ):
         """Test que se hace rollback en caso de error"""
-        self.setup_db_queries_play(
-            mock_db, mock_actor, mock_target, mock_turn, mock_p1_card
-        )
+        self.setup_db_queries_play(mock_db, mock_target, mock_p1_card)
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         mock_db.commit.side_effect = Exception("Database error")
         
         mock_ws = AsyncMock()
         
         with patch('app.routes.card_trade.get_websocket_service', return_value=mock_ws), \
-             patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+             patch('app.routes.card_trade.load_game_context', return_value=context):
             
             request = CardTradePlayRequest(own_card_id=100, target_player_id=20)
             
@@ -431,8 +407,8 @@ class TestCardTradeComplete:
         card.card.type.value = "SECRET"
         return card
     
-    def setup_db_queries_complete(self, mock_db, action, p1, p2, p1_card, p2_card):
-        """Configura todos los queries del db para card_trade_complete"""
+    def setup_db_queries_complete(self, mock_db, action, p1, p1_card, p2_card):
+        """Configura los queries del db para card_trade_complete (P2 viene del contexto)"""
         # Query 1: Action
         mock_action_query = Mock()
         mock_action_query.filter.return_value.first.return_value = action
@@ -441,22 +417,17 @@ class TestCardTradeComplete:
         mock_p1_query = Mock()
         mock_p1_query.filter.return_value.first.return_value = p1
         
-        # Query 3: P2 (target/actor)
-        mock_p2_query = Mock()
-        mock_p2_query.filter.return_value.first.return_value = p2
-        
-        # Query 4: P1 card
+        # Query 3: P1 card
         mock_p1_card_query = Mock()
         mock_p1_card_query.filter.return_value.first.return_value = p1_card
         
-        # Query 5: P2 card
+        # Query 4: P2 card
         mock_p2_card_query = Mock()
         mock_p2_card_query.filter.return_value.first.return_value = p2_card
         
         mock_db.query.side_effect = [
             mock_action_query,
             mock_p1_query,
-            mock_p2_query,
             mock_p1_card_query,
             mock_p2_card_query
         ]
@@ -468,17 +439,17 @@ class TestCardTradeComplete:
     ):
         """Test exitoso de completar intercambio de cartas"""
         self.setup_db_queries_complete(
-            mock_db, mock_action, mock_p1, mock_p2, mock_p1_card, mock_p2_card
+            mock_db, mock_action, mock_p1, mock_p1_card, mock_p2_card
         )
+        context = GameContext(mock_room, mock_game, mock_p2)
         
         mock_ws = AsyncMock()
         mock_ws.notificar_card_trade_complete = AsyncMock()
         mock_ws.notificar_estado_partida = AsyncMock()
         
         with patch('app.routes.card_trade.get_websocket_service', return_value=mock_ws), \
-             patch('app.routes.card_trade.build_complete_game_state', return_value={"test": "state"}), \
-             patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+             patch('app.routes.card_trade.game_state_builder', return_value={"test": "state"}), \
+             patch('app.routes.card_trade.load_game_context', return_value=context):
             
             request = CardTradeCompleteRequest(
                 action_id=1,
@@ -516,7 +487,7 @@ class TestCardTradeComplete:
     @pytest.mark.asyncio
     async def test_card_trade_complete_room_not_found(self, mock_db):
         """Test cuando no se encuentra la sala"""
-        with patch('app.routes.card_trade.get_room_by_id', return_value=None):
+        with patch('app.routes.card_trade.load_game_context', return_value=None):
             request = CardTradeCompleteRequest(action_id=1, own_card_id=200)
             
             with pytest.raises(HTTPException) as exc_info:
@@ -533,8 +504,7 @@ class TestCardTradeComplete:
     @pytest.mark.asyncio
     async def test_card_trade_complete_game_not_found(self, mock_db, mock_room):
         """Test cuando no se encuentra el juego"""
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=None):
+        with patch('app.routes.card_trade.load_game_context', return_value=GameContext(mock_room)):
             
             request = CardTradeCompleteRequest(action_id=1, own_card_id=200)
             
@@ -558,8 +528,7 @@ class TestCardTradeComplete:
         mock_action_query.filter.return_value.first.return_value = None
         mock_db.query.return_value = mock_action_query
         
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.card_trade.load_game_context', return_value=GameContext(mock_room, mock_game)):
             
             request = CardTradeCompleteRequest(action_id=999, own_card_id=200)
             
@@ -585,8 +554,7 @@ class TestCardTradeComplete:
         mock_action_query.filter.return_value.first.return_value = mock_action
         mock_db.query.return_value = mock_action_query
         
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.card_trade.load_game_context', return_value=GameContext(mock_room, mock_game)):
             
             request = CardTradeCompleteRequest(action_id=1, own_card_id=200)
             
@@ -612,8 +580,7 @@ class TestCardTradeComplete:
         mock_action_query.filter.return_value.first.return_value = None  # No encuentra porque no está PENDING
         mock_db.query.return_value = mock_action_query
         
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.card_trade.load_game_context', return_value=GameContext(mock_room, mock_game)):
             
             request = CardTradeCompleteRequest(action_id=1, own_card_id=200)
             
@@ -642,18 +609,15 @@ class TestCardTradeComplete:
         mock_p1_query = Mock()
         mock_p1_query.filter.return_value.first.return_value = mock_p1
         
-        mock_p2_query = Mock()
-        mock_p2_query.filter.return_value.first.return_value = mock_p2
-        
         mock_p1_card_query = Mock()
         mock_p1_card_query.filter.return_value.first.return_value = mock_p1_card
         
         mock_db.query.side_effect = [
-            mock_action_query, mock_p1_query, mock_p2_query, mock_p1_card_query
+            mock_action_query, mock_p1_query, mock_p1_card_query
         ]
+        context = GameContext(mock_room, mock_game, mock_p2)
         
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.card_trade.load_game_context', return_value=context):
             
             request = CardTradeCompleteRequest(action_id=1, own_card_id=200)
             
@@ -680,9 +644,6 @@ class TestCardTradeComplete:
         mock_p1_query = Mock()
         mock_p1_query.filter.return_value.first.return_value = mock_p1
         
-        mock_p2_query = Mock()
-        mock_p2_query.filter.return_value.first.return_value = mock_p2
-        
         mock_p1_card_query = Mock()
         mock_p1_card_query.filter.return_value.first.return_value = mock_p1_card
         
@@ -690,12 +651,12 @@ class TestCardTradeComplete:
         mock_p2_card_query.filter.return_value.first.return_value = None
         
         mock_db.query.side_effect = [
-            mock_action_query, mock_p1_query, mock_p2_query, 
+            mock_action_query, mock_p1_query,
             mock_p1_card_query, mock_p2_card_query
         ]
+        context = GameContext(mock_room, mock_game, mock_p2)
         
-        with patch('app.routes.card_trade.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.card_trade.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.card_trade.load_game_context', return_value=context):
             
             request = CardTradeCompleteRequest(action_id=1, own_card_id=200)
             
@@ -5,6 +5,7 @@ from datetime import datetime
 
 from app.routes.cards_off_the_table import cards_off_the_table, TargetRequest
 from app.db.models import CardState, TurnStatus, ActionType, ActionResult, ActionName, CardType
+from app.services.game_context import GameContext
 
 
 class TestCardsOffTheTable:
@@ -119,55 +120,45 @@ class TestCardsOffTheTable:
         card.card.type.value = "ACTION"
         return [card]
     
-    def setup_db_queries(self, mock_db, actor, target, turn, cott_card, nsf_cards, 
+    def setup_db_queries(self, mock_db, target, cott_card, nsf_cards, 
                          max_discard_pos, remaining_cards, top_discard, discard_count, deck_count):
-        """Configura todos los queries del db en orden"""
+        """Configura los queries del db en orden (sala, juego, actor y turno vienen del contexto)"""
         
-        # Query 1: Actor player
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = actor
-        
-        # Query 2: Target player
+        # Query 1: Target player
         mock_target_query = Mock()
         mock_target_query.filter.return_value.first.return_value = target
         
-        # Query 3: Turn
-        mock_turn_query = Mock()
-        mock_turn_query.filter.return_value.first.return_value = turn
-        
-        # Query 4: COTT card
+        # Query 2: COTT card
         mock_cott_query = Mock()
         mock_cott_query.join.return_value.filter.return_value.first.return_value = cott_card
         
-        # Query 5: NSF cards
+        # Query 3: NSF cards
         mock_nsf_query = Mock()
         mock_nsf_query.join.return_value.filter.return_value.all.return_value = nsf_cards
         
-        # Query 6: Max discard position
+        # Query 4: Max discard position
         mock_discard_pos_query = Mock()
         mock_discard_pos_query.filter.return_value.order_by.return_value.first.return_value = max_discard_pos
         
-        # Query 7: Target remaining cards
+        # Query 5: Target remaining cards
         mock_remaining_query = Mock()
         mock_remaining_query.filter.return_value.all.return_value = remaining_cards
         
-        # Query 8: Top discard
+        # Query 6: Top discard
         mock_top_discard_query = Mock()
         mock_top_discard_query.filter.return_value.order_by.return_value.first.return_value = top_discard
         
-        # Query 9: Discard count
+        # Query 7: Discard count
         mock_discard_count_query = Mock()
         mock_discard_count_query.filter.return_value.count.return_value = discard_count
         
-        # Query 10: Deck count
+        # Query 8: Deck count
         mock_deck_count_query = Mock()
         mock_deck_count_query.filter.return_value.count.return_value = deck_count
         
         # Configurar side_effect para db.query()
         query_responses = [
-            mock_actor_query,           # Player (actor)
             mock_target_query,          # Player (target)
-            mock_turn_query,            # Turn
             mock_cott_query,            # CardsXGame (COTT)
             mock_nsf_query,             # CardsXGame (NSF)
             mock_discard_pos_query,     # CardsXGame.position (max discard)
@@ -190,9 +181,7 @@ class TestCardsOffTheTable:
         # Configurar queries
         self.setup_db_queries(
             mock_db, 
-            mock_actor, 
             mock_target, 
-            mock_turn, 
             mock_cott_card, 
             mock_nsf_cards, 
             (5,),  # max_discard_position
@@ -201,18 +190,18 @@ class TestCardsOffTheTable:
             3,  # discard_count
             10  # deck_count
         )
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         # Mock websocket service
         mock_ws = AsyncMock()
         mock_ws.notificar_estado_partida = AsyncMock()
         
         with patch('app.routes.cards_off_the_table.get_websocket_service', return_value=mock_ws), \
-             patch('app.routes.cards_off_the_table.build_complete_game_state', return_value={
+             patch('app.routes.cards_off_the_table.game_state_builder', return_value={
                  "game_id": 1,
                  "status": "INGAME"
              }), \
-             patch('app.routes.cards_off_the_table.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.cards_off_the_table.get_game_by_id', return_value=mock_game):
+             patch('app.routes.cards_off_the_table.load_game_context', return_value=context):
             
             request = TargetRequest(targetPlayerId=20)
             
@@ -269,9 +258,7 @@ class TestCardsOffTheTable:
         # Configurar queries (sin NSF cards)
         self.setup_db_queries(
             mock_db,
-            mock_actor,
             mock_target,
-            mock_turn,
             mock_cott_card,
             [],  # No NSF cards
             (5,),
@@ -280,13 +267,13 @@ class TestCardsOffTheTable:
             1,  # discard_count
             10
         )
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         mock_ws = AsyncMock()
         
         with patch('app.routes.cards_off_the_table.get_websocket_service', return_value=mock_ws), \
-             patch('app.routes.cards_off_the_table.build_complete_game_state', return_value={}), \
-             patch('app.routes.cards_off_the_table.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.cards_off_the_table.get_game_by_id', return_value=mock_game):
+             patch('app.routes.cards_off_the_table.game_state_builder', return_value={}), \
+             patch('app.routes.cards_off_the_table.load_game_context', return_value=context):
             
             request = TargetRequest(targetPlayerId=20)
             
@@ -305,7 +292,7 @@ class TestCardsOffTheTable:
     async def test_room_not_found(self, mock_db):
         """Test cuando no se encuentra la sala"""
         
-        with patch('app.routes.cards_off_the_table.get_room_by_id', return_value=None):
+        with patch('app.routes.cards_off_the_table.load_game_context', return_value=None):
             request = TargetRequest(targetPlayerId=20)
             
             with pytest.raises(HTTPException) as exc_info:
@@ -323,8 +310,7 @@ class TestCardsOffTheTable:
     async def test_game_not_found(self, mock_db, mock_room):
         """Test cuando no se encuentra el juego"""
         
-        with patch('app.routes.cards_off_the_table.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.cards_off_the_table.get_game_by_id', return_value=None):
+        with patch('app.routes.cards_off_the_table.load_game_context', return_value=GameContext(mock_room)):
             
             request = TargetRequest(targetPlayerId=20)
             
@@ -344,8 +330,7 @@ class TestCardsOffTheTable:
         """Test cuando no es el turno del jugador"""
         mock_game.player_turn_id = 999  # Different player
         
-        with patch('app.routes.cards_off_the_table.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.cards_off_the_table.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.cards_off_the_table.load_game_context', return_value=GameContext(mock_room, mock_game)):
             
             request = TargetRequest(targetPlayerId=20)
             
@@ -364,13 +349,10 @@ class TestCardsOffTheTable:
     async def test_actor_not_found(self, mock_db, mock_room, mock_game):
         """Test cuando no se encuentra el actor"""
         
-        # Mock query que retorna None para el actor
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = None
-        mock_db.query.return_value = mock_query
+        # El actor no está en la sala
+        context = GameContext(mock_room, mock_game)
         
-        with patch('app.routes.cards_off_the_table.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.cards_off_the_table.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.cards_off_the_table.load_game_context', return_value=context):
             
             request = TargetRequest(targetPlayerId=20)
             
@@ -389,17 +371,15 @@ class TestCardsOffTheTable:
     async def test_target_not_found(self, mock_db, mock_room, mock_game, mock_actor):
         """Test cuando no se encuentra el jugador objetivo"""
         
-        # Primera query retorna actor, segunda retorna None (target)
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = mock_actor
+        # El actor viene del contexto, la query del target retorna None
+        context = GameContext(mock_room, mock_game, mock_actor)
         
         mock_target_query = Mock()
         mock_target_query.filter.return_value.first.return_value = None
         
-        mock_db.query.side_effect = [mock_actor_query, mock_target_query]
+        mock_db.query.side_effect = [mock_target_query]
         
-        with patch('app.routes.cards_off_the_table.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.cards_off_the_table.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.cards_off_the_table.load_game_context', return_value=context):
             
             request = TargetRequest(targetPlayerId=20)
             
@@ -418,19 +398,14 @@ class TestCardsOffTheTable:
     async def test_no_active_turn(self, mock_db, mock_room, mock_game, mock_actor, mock_target):
         """Test cuando no hay turno activo"""
         
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = mock_actor
+        context = GameContext(mock_room, mock_game, mock_actor, current_turn=None)
         
         mock_target_query = Mock()
         mock_target_query.filter.return_value.first.return_value = mock_target
         
-        mock_turn_query = Mock()
-        mock_turn_query.filter.return_value.first.return_value = None
+        mock_db.query.side_effect = [mock_target_query]
         
-        mock_db.query.side_effect = [mock_actor_query, mock_target_query, mock_turn_query]
-        
-        with patch('app.routes.cards_off_the_table.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.cards_off_the_table.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.cards_off_the_table.load_game_context', return_value=context):
             
             request = TargetRequest(targetPlayerId=20)
             
@@ -451,22 +426,17 @@ class TestCardsOffTheTable:
     ):
         """Test cuando el jugador no tiene la carta Cards off the table"""
         
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = mock_actor
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         mock_target_query = Mock()
         mock_target_query.filter.return_value.first.return_value = mock_target
         
-        mock_turn_query = Mock()
-        mock_turn_query.filter.return_value.first.return_value = mock_turn
-        
         mock_cott_query = Mock()
         mock_cott_query.join.return_value.filter.return_value.first.return_value = None
         
-        mock_db.query.side_effect = [mock_actor_query, mock_target_query, mock_turn_query, mock_cott_query]
+        mock_db.query.side_effect = [mock_target_query, mock_cott_query]
         
-        with patch('app.routes.cards_off_the_table.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.cards_off_the_table.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.cards_off_the_table.load_game_context', return_value=context):
             
             request = TargetRequest(targetPlayerId=20)
             
@@ -490,9 +460,7 @@ class TestCardsOffTheTable:
         
         self.setup_db_queries(
             mock_db,
-            mock_actor,
             mock_target,
-            mock_turn,
             mock_cott_card,
             mock_nsf_cards,
             (5,),
@@ -501,11 +469,11 @@ class TestCardsOffTheTable:
             3,
             10
         )
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         mock_db.commit.side_effect = Exception("Database error")
         
-        with patch('app.routes.cards_off_the_table.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.cards_off_the_table.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.cards_off_the_table.load_game_context', return_value=context):
             
             request = TargetRequest(targetPlayerId=20)
             
@@ -530,9 +498,7 @@ class TestCardsOffTheTable:
         
         self.setup_db_queries(
             mock_db,
-            mock_actor,
             mock_target,
-            mock_turn,
             mock_cott_card,
             mock_nsf_cards,
             None,  # No hay max_discard_position
@@ -541,13 +507,13 @@ class TestCardsOffTheTable:
             3,
             10
         )
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         mock_ws = AsyncMock()
         
         with patch('app.routes.cards_off_the_table.get_websocket_service', return_value=mock_ws), \
-             patch('app.routes.cards_off_the_table.build_complete_game_state', return_value={}), \
-             patch('app.routes.cards_off_the_table.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.cards_off_the_table.get_game_by_id', return_value=mock_game):
+             patch('app.routes.cards_off_the_table.game_state_builder', return_value={}), \
+             patch('app.routes.cards_off_the_table.load_game_context', return_value=context):
             
             request = TargetRequest(targetPlayerId=20)
             
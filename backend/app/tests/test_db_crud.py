@@ -898,6 +898,84 @@ def test_create_card_action(db):
     assert len(actions) == 3
 
 
+def test_create_card_action_deferred_single_insert_at_commit(db):
+    """Las acciones hijas diferidas se escriben en un solo INSERT al commit."""
+    from sqlalchemy import event
+    from app.db.action_log import pending_actions
+
+    room = crud.create_room(db, {"name": "Test Room", "status": "INGAME"})
+    player = crud.create_player(db, {"name": "Player1", "avatar_src": "avatar1.png", "birthdate": date(2000, 1, 1), "id_room": room.id, "order": 1})
+    game = crud.create_game(db, {"player_turn_id": player.id})
+    turn = models.Turn(number=1, id_game=game.id, player_id=player.id, status=models.TurnStatus.IN_PROGRESS)
+    db.add(turn)
+    db.commit()
+    game_id, player_id, turn_id = game.id, player.id, turn.id
+
+    parent = crud.create_parent_card_action(
+        db, game_id, turn_id, player_id,
+        action_type=models.ActionType.DISCARD,
+        action_name=models.ActionName.END_TURN_DISCARD,
+        source_pile=models.SourcePile.DISCARD_PILE,
+    )
+    # La acción padre queda visible inmediatamente
+    assert parent.id is not None
+    parent_id = parent.id
+
+    inserts = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO ACTIONS_PER_TURN"):
+            inserts.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        for pos in range(3):
+            result = crud.create_card_action(
+                db, game_id, turn_id, player_id,
+                action_type=models.ActionType.DISCARD,
+                source_pile=models.SourcePile.DISCARD_PILE,
+                card_id=pos + 1, position=pos,
+                parent_action_id=parent_id, deferred=True,
+            )
+            assert result is None
+        assert len(pending_actions(db)) == 3
+        assert inserts == []
+
+        db.commit()
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(inserts) == 1
+    assert pending_actions(db) == []
+    children = crud.get_actions_by_filters(db, parent_action_id=parent_id)
+    assert sorted(c.position_card for c in children) == [0, 1, 2]
+    assert all(c.action_name == models.ActionName.END_TURN_DISCARD for c in children)
+
+
+def test_create_card_action_deferred_dropped_on_rollback(db):
+    """Un rollback descarta las acciones diferidas pendientes."""
+    from app.db.action_log import pending_actions
+
+    room = crud.create_room(db, {"name": "Test Room", "status": "INGAME"})
+    player = crud.create_player(db, {"name": "Player1", "avatar_src": "avatar1.png", "birthdate": date(2000, 1, 1), "id_room": room.id, "order": 1})
+    game = crud.create_game(db, {"player_turn_id": player.id})
+    game_id, player_id = game.id, player.id
+
+    crud.create_card_action(
+        db, game_id, None, player_id,
+        action_type=models.ActionType.DRAW,
+        source_pile=models.SourcePile.DRAW_PILE,
+        card_id=1, deferred=True,
+    )
+    assert len(pending_actions(db)) == 1
+
+    db.rollback()
+    db.commit()
+
+    assert pending_actions(db) == []
+    assert db.query(models.ActionsPerTurn).filter(models.ActionsPerTurn.id_game == game_id).count() == 0
+
+
 # ------------------------------
 # TESTS DETECTIVE ACTION
 # ------------------------------
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, patch, Mock
 from fastapi import HTTPException
 from app.routes.delay import delay_murderer_escape
 from app.schemas.delay_schema import delay_escape_request
+from app.services.game_context import GameContext
 
 
 class TestDelayMurdererEscape:
@@ -33,17 +34,20 @@ class TestDelayMurdererEscape:
         game.player_turn_id = 7
         return game
 
+    @pytest.fixture(autouse=True)
+    def load_context(self):
+        with patch("app.routes.delay.load_game_context") as loader:
+            yield loader
+
     # ---------- TEST: CASO OK ----------
     @pytest.mark.asyncio
     @patch("app.routes.delay.build_complete_game_state", return_value={})
     @patch("app.routes.delay.get_websocket_service", return_value=AsyncMock())
     @patch("app.routes.delay.crud")
-    async def test_delay_murderer_escape_ok(self, mock_crud, mock_ws, mock_state, mock_db, mock_room, mock_game):
+    async def test_delay_murderer_escape_ok(self, mock_crud, mock_ws, mock_state, mock_db, mock_room, mock_game, load_context):
         """Debe devolver status=ok y las cartas movidas correctamente"""
 
-        mock_crud.get_room_by_id.return_value = mock_room
-        mock_crud.get_game_by_id.return_value = mock_game
-        mock_crud.get_current_turn.return_value = Mock(id=10)
+        load_context.return_value = GameContext(mock_room, mock_game, current_turn=Mock(id=10))
         mock_crud.create_action.return_value = Mock(id=123)
         mock_crud.list_players_by_room.return_value = []
 
@@ -68,8 +72,8 @@ class TestDelayMurdererEscape:
 
     # ---------- TEST: ROOM NOT FOUND ----------
     @pytest.mark.asyncio
-    @patch("app.routes.delay.crud.get_room_by_id", return_value=None)
-    async def test_room_not_found_raises_404(self, mock_room, mock_db):
+    async def test_room_not_found_raises_404(self, mock_db, load_context):
+        load_context.return_value = None
         payload = delay_escape_request(card_id=1, quantity=1)
         with pytest.raises(HTTPException) as excinfo:
             await delay_murderer_escape(room_id=999, payload=payload, user_id=7, db=mock_db)
@@ -79,10 +83,9 @@ class TestDelayMurdererEscape:
     # ---------- TEST: NOT YOUR TURN ----------
     @pytest.mark.asyncio
     @patch("app.routes.delay.crud")
-    async def test_not_your_turn_raises_403(self, mock_crud, mock_db, mock_room, mock_game):
-        mock_crud.get_room_by_id.return_value = mock_room
+    async def test_not_your_turn_raises_403(self, mock_crud, mock_db, mock_room, mock_game, load_context):
         mock_game.player_turn_id = 9
-        mock_crud.get_game_by_id.return_value = mock_game
+        load_context.return_value = GameContext(mock_room, mock_game)
         payload = delay_escape_request(card_id=1, quantity=1)
         with pytest.raises(HTTPException) as excinfo:
             await delay_murderer_escape(room_id=1, payload=payload, user_id=7, db=mock_db)
@@ -92,10 +95,9 @@ class TestDelayMurdererEscape:
     # ---------- TEST: EVENT CARD NOT FOUND ----------
     @pytest.mark.asyncio
     @patch("app.routes.delay.crud")
-    async def test_event_card_not_found_raises_404(self, mock_crud, mock_db, mock_room, mock_game):
-        mock_crud.get_room_by_id.return_value = mock_room
-        mock_crud.get_game_by_id.return_value = mock_game
+    async def test_event_card_not_found_raises_404(self, mock_crud, mock_db, mock_room, mock_game, load_context):
         mock_game.player_turn_id = 7
+        load_context.return_value = GameContext(mock_room, mock_game)
         mock_db.query.return_value.filter.return_value.first.return_value = None
         payload = delay_escape_request(card_id=123, quantity=2)
         with pytest.raises(HTTPException) as excinfo:
@@ -108,11 +110,9 @@ class TestDelayMurdererEscape:
     @patch("app.routes.delay.build_complete_game_state", return_value={})
     @patch("app.routes.delay.get_websocket_service", return_value=AsyncMock())
     @patch("app.routes.delay.crud")
-    async def test_discard_empty_returns_500(self, mock_crud, mock_ws, mock_state, mock_db, mock_room, mock_game):
+    async def test_discard_empty_returns_500(self, mock_crud, mock_ws, mock_state, mock_db, mock_room, mock_game, load_context):
         """Debe devolver 500 porque el HTTPException(400) interno se captura y se transforma en 500"""
-        mock_crud.get_room_by_id.return_value = mock_room
-        mock_crud.get_game_by_id.return_value = mock_game
-        mock_crud.get_current_turn.return_value = Mock(id=10)
+        load_context.return_value = GameContext(mock_room, mock_game, current_turn=Mock(id=10))
         mock_crud.create_action.return_value = Mock(id=123)
 
         event_card = Mock()
@@ -157,7 +157,7 @@ class TestDetectiveActionRoute:
     
     @pytest.mark.asyncio
     @patch('app.routes.detective_action.get_websocket_service')
-    @patch('app.routes.detective_action.build_complete_game_state')
+    @patch('app.routes.detective_action.game_state_builder')
     async def test_execute_detective_action_success(
         self,
         mock_build_state,
@@ -259,7 +259,7 @@ class TestDetectiveActionRoute:
     
     @pytest.mark.asyncio
     @patch('app.routes.detective_action.get_websocket_service')
-    @patch('app.routes.detective_action.build_complete_game_state')
+    @patch('app.routes.detective_action.game_state_builder')
     async def test_service_http_exception_is_reraised(
         self,
         mock_build_state,
@@ -297,7 +297,7 @@ class TestDetectiveActionRoute:
     
     @pytest.mark.asyncio
     @patch('app.routes.detective_action.get_websocket_service')
-    @patch('app.routes.detective_action.build_complete_game_state')
+    @patch('app.routes.detective_action.game_state_builder')
     @patch('app.routes.detective_action.DetectiveActionService')
     async def test_unexpected_exception_returns_500(
         self,
@@ -337,15 +337,15 @@ class TestDetectiveActionRoute:
     
     @pytest.mark.asyncio
     @patch('app.routes.detective_action.get_websocket_service')
-    @patch('app.routes.detective_action.build_complete_game_state')
-    async def test_build_game_state_exception_is_handled(
+    @patch('app.services.game_status_service.build_complete_game_state')
+    async def test_game_state_is_built_at_flush_not_in_request(
         self,
         mock_build_state,
         mock_ws_service,
         setup_full_game,
         db
     ):
-        """Test que errores en build_game_state no rompen el flow"""
+        """Test que el estado completo no se arma en el request: se pasa un builder"""
         from app.routes.detective_action import execute_detective_action
         
         data = setup_full_game
@@ -356,9 +356,6 @@ class TestDetectiveActionRoute:
         mock_ws.notificar_estado_partida = AsyncMock()
         mock_ws_service.return_value = mock_ws
         
-        # Mock build_game_state que falla
-        mock_build_state.side_effect = Exception("Database connection lost")
-        
         request = DetectiveActionRequest(
             actionId=data["action"].id,
             executorId=data["player1"].id,
@@ -366,23 +363,22 @@ class TestDetectiveActionRoute:
             secretId=data["secret"].id
         )
         
-        # No debe fallar
         response = await execute_detective_action(
             room_id=data["room"].id,
             request=request,
             db=db
         )
         
-        # Verificar que el response es exitoso
         assert response.success is True
         
-        # Verificar que se llamó a WebSocket con game_state vacío
+        # El builder queda para el flush de la sala
         call_args = mock_ws.notificar_estado_partida.call_args
-        assert call_args[1]["game_state"] == {}
+        assert callable(call_args[1]["game_state"])
+        mock_build_state.assert_not_called()
     
     @pytest.mark.asyncio
     @patch('app.routes.detective_action.get_websocket_service')
-    @patch('app.routes.detective_action.build_complete_game_state')
+    @patch('app.routes.detective_action.game_state_builder')
     async def test_websocket_exception_does_not_break_response(
         self,
         mock_build_state,
@@ -443,7 +439,7 @@ class TestDetectiveActionRoute:
     
     @pytest.mark.asyncio
     @patch('app.routes.detective_action.get_websocket_service')
-    @patch('app.routes.detective_action.build_complete_game_state')
+    @patch('app.routes.detective_action.game_state_builder')
     async def test_response_structure(
         self,
         mock_build_state,
@@ -508,7 +504,7 @@ class TestDetectiveActionRoute:
     
     @pytest.mark.asyncio
     @patch('app.routes.detective_action.get_websocket_service')
-    @patch('app.routes.detective_action.build_complete_game_state')
+    @patch('app.routes.detective_action.game_state_builder')
     @patch('app.routes.detective_action.DetectiveActionService')
     async def test_action_not_completed_two_step_action(
         self,
@@ -572,7 +568,7 @@ class TestDetectiveActionRoute:
     
     @pytest.mark.asyncio
     @patch('app.routes.detective_action.get_websocket_service')
-    @patch('app.routes.detective_action.build_complete_game_state')
+    @patch('app.routes.detective_action.game_state_builder')
     @patch('app.routes.detective_action.DetectiveActionService')
     async def test_two_step_action_with_metadata(
         self,
@@ -628,7 +624,7 @@ class TestDetectiveActionRoute:
     
     @pytest.mark.asyncio
     @patch('app.routes.detective_action.get_websocket_service')
-    @patch('app.routes.detective_action.build_complete_game_state')
+    @patch('app.routes.detective_action.game_state_builder')
     @patch('app.routes.detective_action.DetectiveActionService')
     async def test_websocket_exception_during_notification(
         self,
@@ -687,7 +683,7 @@ class TestDetectiveActionRoute:
     
     @pytest.mark.asyncio
     @patch('app.routes.detective_action.get_websocket_service')
-    @patch('app.routes.detective_action.build_complete_game_state')
+    @patch('app.routes.detective_action.game_state_builder')
     @patch('app.routes.detective_action.DetectiveActionService')
     async def test_completed_action_with_transferred_secret(
         self,
@@ -744,7 +740,7 @@ class TestDetectiveActionRoute:
     
     @pytest.mark.asyncio
     @patch('app.routes.detective_action.get_websocket_service')
-    @patch('app.routes.detective_action.build_complete_game_state')
+    @patch('app.routes.detective_action.game_state_builder')
     @patch('app.routes.detective_action.DetectiveActionService')
     async def test_completed_action_with_hidden_secret(
         self,
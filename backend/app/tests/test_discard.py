@@ -237,7 +237,7 @@ async def test_discard_invalid_cards():
 
 
 @pytest.mark.asyncio
-@patch('app.routes.discard.build_complete_game_state')
+@patch('app.routes.discard.game_state_builder')
 @patch('app.routes.discard.get_websocket_service')
 @patch('app.routes.discard.descartar_cartas')
 async def test_discard_success(mock_descartar, mock_ws, mock_build_state):
@@ -291,7 +291,7 @@ async def test_discard_success(mock_descartar, mock_ws, mock_build_state):
     mock_ws_service.notificar_player_must_draw = AsyncMock()
     mock_ws.return_value = mock_ws_service
     
-    # Mock build_complete_game_state
+    # Mock game_state_builder
     mock_build_state.return_value = {"jugadores": []}
     
     # Setup queries with proper chaining
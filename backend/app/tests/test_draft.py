@@ -112,7 +112,10 @@ async def test_pick_card_success_with_ws(monkeypatch, mock_db_game_room):
     monkeypatch.setattr(draft, "_build_hand_view", lambda *a, **kw: MagicMock(cards=[1, 2]))
     monkeypatch.setattr(draft, "_build_deck_view", lambda *a, **kw: MagicMock())
     monkeypatch.setattr(draft, "pick_card_from_draft", lambda *a, **kw: fake_picked)
-    monkeypatch.setattr(draft, "build_complete_game_state", lambda *a, **kw: fake_game_state)
+    build = MagicMock(return_value=fake_game_state)
+    monkeypatch.setattr(draft, "build_complete_game_state", build)
+    builder = MagicMock()
+    monkeypatch.setattr(draft, "game_state_builder", MagicMock(return_value=builder))
     monkeypatch.setattr(draft, "procesar_ultima_carta", AsyncMock())
     mock_ws = AsyncMock()
     mock_ws.notificar_estados_privados = AsyncMock()
@@ -122,7 +125,12 @@ async def test_pick_card_success_with_ws(monkeypatch, mock_db_game_room):
     result = await draft.pick_card(10, request, db)
     assert "picked_card" in result
     assert result["picked_card"].id == 1
+    # El estado (con los privados) se arma una sola vez al flush de la sala
     mock_ws.notificar_estado_partida.assert_awaited_once()
+    assert mock_ws.notificar_estado_partida.await_args.kwargs["game_state"] is builder
+    draft.game_state_builder.assert_called_once_with(10)
+    mock_ws.notificar_estados_privados.assert_not_awaited()
+    build.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_pick_card_empty_draft_triggers_procesar_ultima(monkeypatch, mock_db_game_room):
@@ -150,7 +158,7 @@ async def test_pick_card_ws_exception(monkeypatch, mock_db_game_room):
     monkeypatch.setattr("app.routes.draft.build_complete_game_state", lambda *a, **kw: {"estados_privados": {}})
     monkeypatch.setattr("app.routes.draft._build_deck_view", lambda *a, **kw: MagicMock())
     ws_mock = AsyncMock()
-    ws_mock.notificar_estados_privados.side_effect = Exception("ws fail")
+    ws_mock.notificar_estado_partida.side_effect = Exception("ws fail")
     monkeypatch.setattr("app.routes.draft.get_websocket_service", lambda: ws_mock)
     monkeypatch.setattr("app.routes.draft.logger", MagicMock())
     request = MagicMock(user_id=1, card_id=1)
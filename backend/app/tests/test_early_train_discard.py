@@ -360,7 +360,7 @@ class TestEarlyTrainDiscardEffect:
                 assert kwargs['turn_id'] is None
                 assert kwargs['action_type'] == ActionType.DISCARD
                 assert kwargs['source_pile'] == SourcePile.DISCARD_PILE
-                assert kwargs['card_id'] == mock_deck_cards[i].id_card
+                assert kwargs['card_id'] == mock_deck_cards[i].id
                 assert kwargs['result'] == ActionResult.SUCCESS
                 assert kwargs['parent_action_id'] == 999
 
@@ -4,6 +4,7 @@ from fastapi import HTTPException
 
 from app.routes.early_train_to_paddington import early_train_to_paddington, EarlyTrainRequest
 from app.db.models import CardState, TurnStatus, CardType
+from app.services.game_context import GameContext
 
 
 class TestEarlyTrainToPaddington:
@@ -114,51 +115,41 @@ class TestEarlyTrainToPaddington:
         card.card.type.value = "EVENT"
         return card
     
-    def setup_db_queries(self, mock_db, actor, turn, event_card, deck_cards, 
+    def setup_db_queries(self, mock_db, event_card, deck_cards, 
                          max_discard_pos, remaining_deck_cards, top_discard, 
                          discard_count, deck_count):
-        """Configura todos los queries del db en orden"""
+        """Configura los queries del db en orden (sala, juego, actor y turno vienen del contexto)"""
         
-        # Query 1: Actor player
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = actor
-        
-        # Query 2: Turn
-        mock_turn_query = Mock()
-        mock_turn_query.filter.return_value.first.return_value = turn
-        
-        # Query 3: Event card
+        # Query 1: Event card
         mock_event_query = Mock()
         mock_event_query.join.return_value.filter.return_value.first.return_value = event_card
         
-        # Query 4: First 6 deck cards
+        # Query 2: First 6 deck cards
         mock_deck_query = Mock()
         mock_deck_query.filter.return_value.order_by.return_value.limit.return_value.all.return_value = deck_cards
         
-        # Query 5: Max discard position
+        # Query 3: Max discard position
         mock_discard_pos_query = Mock()
         mock_discard_pos_query.filter.return_value.order_by.return_value.first.return_value = max_discard_pos
         
-        # Query 6: Remaining deck cards
+        # Query 4: Remaining deck cards
         mock_remaining_deck_query = Mock()
         mock_remaining_deck_query.filter.return_value.order_by.return_value.all.return_value = remaining_deck_cards
         
-        # Query 7: Top discard
+        # Query 5: Top discard
         mock_top_discard_query = Mock()
         mock_top_discard_query.filter.return_value.order_by.return_value.first.return_value = top_discard
         
-        # Query 8: Discard count
+        # Query 6: Discard count
         mock_discard_count_query = Mock()
         mock_discard_count_query.filter.return_value.count.return_value = discard_count
         
-        # Query 9: Deck count
+        # Query 7: Deck count
         mock_deck_count_query = Mock()
         mock_deck_count_query.filter.return_value.count.return_value = deck_count
         
         # Configurar side_effect para db.query()
         query_responses = [
-            mock_actor_query,           # Player (actor)
-            mock_turn_query,            # Turn
             mock_event_query,           # CardsXGame (event card)
             mock_deck_query,            # CardsXGame (first 6)
             mock_discard_pos_query,     # CardsXGame.position (max discard)
@@ -180,8 +171,6 @@ class TestEarlyTrainToPaddington:
         # Configurar queries
         self.setup_db_queries(
             mock_db,
-            mock_actor,
-            mock_turn,
             mock_event_card,
             mock_deck_cards,
             (5,),  # max_discard_position
@@ -190,18 +179,18 @@ class TestEarlyTrainToPaddington:
             9,  # discard_count (3 originales + 6 movidas)
             4   # deck_count (10 - 6)
         )
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         # Mock websocket service
         mock_ws = AsyncMock()
         mock_ws.notificar_estado_partida = AsyncMock()
         
         with patch('app.routes.early_train_to_paddington.get_websocket_service', return_value=mock_ws), \
-             patch('app.routes.early_train_to_paddington.build_complete_game_state', return_value={
+             patch('app.routes.early_train_to_paddington.game_state_builder', return_value={
                  "game_id": 1,
                  "status": "INGAME"
              }), \
-             patch('app.routes.early_train_to_paddington.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.early_train_to_paddington.get_game_by_id', return_value=mock_game):
+             patch('app.routes.early_train_to_paddington.load_game_context', return_value=context):
             
             request = EarlyTrainRequest(card_id=100)
             
@@ -247,7 +236,7 @@ class TestEarlyTrainToPaddington:
     async def test_room_not_found(self, mock_db):
         """Test cuando no se encuentra la sala"""
         
-        with patch('app.routes.early_train_to_paddington.get_room_by_id', return_value=None):
+        with patch('app.routes.early_train_to_paddington.load_game_context', return_value=None):
             request = EarlyTrainRequest(card_id=100)
             
             with pytest.raises(HTTPException) as exc_info:
@@ -265,8 +254,7 @@ class TestEarlyTrainToPaddington:
     async def test_game_not_found(self, mock_db, mock_room):
         """Test cuando no se encuentra el juego"""
         
-        with patch('app.routes.early_train_to_paddington.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.early_train_to_paddington.get_game_by_id', return_value=None):
+        with patch('app.routes.early_train_to_paddington.load_game_context', return_value=GameContext(mock_room)):
             
             request = EarlyTrainRequest(card_id=100)
             
@@ -286,8 +274,7 @@ class TestEarlyTrainToPaddington:
         """Test cuando no es el turno del jugador"""
         mock_game.player_turn_id = 999  # Different player
         
-        with patch('app.routes.early_train_to_paddington.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.early_train_to_paddington.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.early_train_to_paddington.load_game_context', return_value=GameContext(mock_room, mock_game)):
             
             request = EarlyTrainRequest(card_id=100)
             
@@ -306,12 +293,10 @@ class TestEarlyTrainToPaddington:
     async def test_actor_not_found(self, mock_db, mock_room, mock_game):
         """Test cuando no se encuentra el actor"""
         
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = None
-        mock_db.query.return_value = mock_query
+        # El actor no está en la sala
+        context = GameContext(mock_room, mock_game)
         
-        with patch('app.routes.early_train_to_paddington.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.early_train_to_paddington.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.early_train_to_paddington.load_game_context', return_value=context):
             
             request = EarlyTrainRequest(card_id=100)
             
@@ -330,16 +315,9 @@ class TestEarlyTrainToPaddington:
     async def test_no_active_turn(self, mock_db, mock_room, mock_game, mock_actor):
         """Test cuando no hay turno activo"""
         
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = mock_actor
-        
-        mock_turn_query = Mock()
-        mock_turn_query.filter.return_value.first.return_value = None
+        context = GameContext(mock_room, mock_game, mock_actor, current_turn=None)
         
-        mock_db.query.side_effect = [mock_actor_query, mock_turn_query]
-        
-        with patch('app.routes.early_train_to_paddington.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.early_train_to_paddington.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.early_train_to_paddington.load_game_context', return_value=context):
             
             request = EarlyTrainRequest(card_id=100)
             
@@ -358,19 +336,14 @@ class TestEarlyTrainToPaddington:
     async def test_event_card_not_found(self, mock_db, mock_room, mock_game, mock_actor, mock_turn):
         """Test cuando el jugador no tiene la carta del evento"""
         
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = mock_actor
-        
-        mock_turn_query = Mock()
-        mock_turn_query.filter.return_value.first.return_value = mock_turn
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         mock_event_query = Mock()
         mock_event_query.join.return_value.filter.return_value.first.return_value = None
         
-        mock_db.query.side_effect = [mock_actor_query, mock_turn_query, mock_event_query]
+        mock_db.query.side_effect = [mock_event_query]
         
-        with patch('app.routes.early_train_to_paddington.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.early_train_to_paddington.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.early_train_to_paddington.load_game_context', return_value=context):
             
             request = EarlyTrainRequest(card_id=100)
             
@@ -389,11 +362,7 @@ class TestEarlyTrainToPaddington:
     async def test_empty_deck(self, mock_db, mock_room, mock_game, mock_actor, mock_turn, mock_event_card):
         """Test cuando el deck está vacío"""
         
-        mock_actor_query = Mock()
-        mock_actor_query.filter.return_value.first.return_value = mock_actor
-        
-        mock_turn_query = Mock()
-        mock_turn_query.filter.return_value.first.return_value = mock_turn
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         mock_event_query = Mock()
         mock_event_query.join.return_value.filter.return_value.first.return_value = mock_event_card
@@ -401,10 +370,9 @@ class TestEarlyTrainToPaddington:
         mock_deck_query = Mock()
         mock_deck_query.filter.return_value.order_by.return_value.limit.return_value.all.return_value = []
         
-        mock_db.query.side_effect = [mock_actor_query, mock_turn_query, mock_event_query, mock_deck_query]
+        mock_db.query.side_effect = [mock_event_query, mock_deck_query]
         
-        with patch('app.routes.early_train_to_paddington.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.early_train_to_paddington.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.early_train_to_paddington.load_game_context', return_value=context):
             
             request = EarlyTrainRequest(card_id=100)
             
@@ -443,8 +411,6 @@ class TestEarlyTrainToPaddington:
         
         self.setup_db_queries(
             mock_db,
-            mock_actor,
-            mock_turn,
             mock_event_card,
             deck_cards,  # Solo 3 cartas
             (5,),
@@ -453,13 +419,13 @@ class TestEarlyTrainToPaddington:
             6,  # 3 originales + 3 movidas
             0   # Deck vacío
         )
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         mock_ws = AsyncMock()
         
         with patch('app.routes.early_train_to_paddington.get_websocket_service', return_value=mock_ws), \
-             patch('app.routes.early_train_to_paddington.build_complete_game_state', return_value={}), \
-             patch('app.routes.early_train_to_paddington.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.early_train_to_paddington.get_game_by_id', return_value=mock_game):
+             patch('app.routes.early_train_to_paddington.game_state_builder', return_value={}), \
+             patch('app.routes.early_train_to_paddington.load_game_context', return_value=context):
             
             request = EarlyTrainRequest(card_id=100)
             
@@ -489,8 +455,6 @@ class TestEarlyTrainToPaddington:
         
         self.setup_db_queries(
             mock_db,
-            mock_actor,
-            mock_turn,
             mock_event_card,
             mock_deck_cards,
             (5,),
@@ -499,11 +463,11 @@ class TestEarlyTrainToPaddington:
             9,
             4
         )
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         mock_db.commit.side_effect = Exception("Database error")
         
-        with patch('app.routes.early_train_to_paddington.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.early_train_to_paddington.get_game_by_id', return_value=mock_game):
+        with patch('app.routes.early_train_to_paddington.load_game_context', return_value=context):
             
             request = EarlyTrainRequest(card_id=100)
             
@@ -527,8 +491,6 @@ class TestEarlyTrainToPaddington:
         
         self.setup_db_queries(
             mock_db,
-            mock_actor,
-            mock_turn,
             mock_event_card,
             mock_deck_cards,
             None,  # No hay max_discard_position
@@ -537,13 +499,13 @@ class TestEarlyTrainToPaddington:
             6,
             4
         )
+        context = GameContext(mock_room, mock_game, mock_actor, mock_turn)
         
         mock_ws = AsyncMock()
         
         with patch('app.routes.early_train_to_paddington.get_websocket_service', return_value=mock_ws), \
-             patch('app.routes.early_train_to_paddington.build_complete_game_state', return_value={}), \
-             patch('app.routes.early_train_to_paddington.get_room_by_id', return_value=mock_room), \
-             patch('app.routes.early_train_to_paddington.get_game_by_id', return_value=mock_game):
+             patch('app.routes.early_train_to_paddington.game_state_builder', return_value={}), \
+             patch('app.routes.early_train_to_paddington.load_game_context', return_value=context):
             
             request = EarlyTrainRequest(card_id=100)
             
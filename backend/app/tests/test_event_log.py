@@ -0,0 +1,115 @@
+"""
+Tests para el buffer de eventos por sala y la reanudación de sesiones.
+"""
+
+import pytest
+import socketio
+from unittest.mock import AsyncMock, MagicMock
+
+from app.sockets.event_log import RoomEventLogs, get_room_event_logs
+from app.sockets.frames import get_state_frames
+from app.sockets.socket_manager import WebSocketManager
+
+
+def test_since_returns_missed_events_collapsing_snapshots():
+    logs = RoomEventLogs(capacity=10)
+    epoch, _ = logs.position(1)
+    logs.record(1, "game_state_public", {"n": 1})
+    logs.record(1, "card_drawn", {"c": 1})
+    logs.record(1, "game_state_public", {"n": 2})
+    logs.record(1, "card_drawn", {"c": 2})
+
+    missed = logs.since(1, epoch, 1)
+    assert [(seq, event) for seq, event, _ in missed] == [
+        (2, "card_drawn"), (3, "game_state_public"), (4, "card_drawn"),
+    ]
+    assert missed[1][2] == {"n": 2, "seq": 3}
+    assert logs.since(1, epoch, 4) == []
+    # Otro epoch (sala recreada / server reiniciado) o seq del futuro: snapshot
+    assert logs.since(1, "other", 1) is None
+    assert logs.since(1, epoch, 9) is None
+
+
+def test_since_too_far_behind_needs_snapshot():
+    logs = RoomEventLogs(capacity=3)
+    epoch, _ = logs.position(1)
+    for n in range(6):
+        logs.record(1, "evt", {"n": n})
+
+    assert logs.since(1, epoch, 2) is None
+    assert [seq for seq, _, _ in logs.since(1, epoch, 3)] == [4, 5, 6]
+
+
+def test_encoded_payload_stamped_once():
+    logs = RoomEventLogs()
+    logs.ensure(1)
+    sio = socketio.AsyncServer(async_mode="asgi")
+    payload = get_state_frames().public(1, "game_state_public", {"type": "game_state_public"})
+
+    assert logs.record(1, "game_state_public", payload) is payload
+    assert payload["seq"] == 1
+    # El frame pre-armado incluye el seq y sigue igual al del encoder de Socket.IO
+    expected = sio.packet_class(2, namespace="/", data=["game_state_public", dict(payload)]).encode()
+    assert payload.frames(sio, "game_state_public")[0].data == expected
+
+    # Re-emitir la misma versión no genera otro seq
+    logs.record(1, "game_state_public", payload)
+    assert logs.position(1)[1] == 1
+
+
+def test_record_does_not_recreate_a_discarded_room():
+    logs = RoomEventLogs()
+    logs.ensure(1)
+    logs.record(1, "evt", {"n": 1})
+    logs.discard_room(1)
+
+    # game_cancelled / estado tardío después de terminar la partida
+    assert logs.record(1, "game_cancelled", {"n": 2}) == {"n": 2}
+    assert logs.get(1) is None
+
+
+@pytest.fixture
+def mgr():
+    sio = MagicMock()
+    sio.emit = AsyncMock()
+    sio.enter_room = AsyncMock()
+    manager = WebSocketManager(sio, MagicMock())
+    manager.scheduler.window = 0
+    manager._send_frames = AsyncMock()
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_resume_replays_only_missed_events(mgr):
+    mgr.user_sessions = {"other": {"room_id": 1, "user_id": 2}}
+    get_room_event_logs().ensure(1)
+    for n in range(3):
+        await mgr.emit_to_room(1, "detective_action", {"n": n})
+    epoch, _ = get_room_event_logs().position(1)
+    mgr.sio.emit.reset_mock()
+
+    mode = await mgr.resume_game_room("back", 1, 5, epoch, 1)
+
+    assert mode == "events"
+    replayed = [c for c in mgr.sio.emit.await_args_list if c.kwargs.get("to") == "back"]
+    assert [c.args[1]["n"] for c in replayed] == [1, 2]
+    assert mgr.user_sessions["back"]["user_id"] == 5
+    mgr.sio.enter_room.assert_awaited_once_with("back", "game_1")
+
+
+@pytest.mark.asyncio
+async def test_resume_too_far_behind_sends_cached_snapshot(mgr):
+    public = get_state_frames().public(1, "game_state_public", {"type": "game_state_public"})
+    private = get_state_frames().private(1, 5, "game_state_private", {"user_id": 5})
+
+    mode = await mgr.resume_game_room("back", 1, 5, "stale-epoch", 40)
+
+    assert mode == "snapshot"
+    sent = [(c.args[0], c.args[1], c.args[2]) for c in mgr._send_frames.await_args_list]
+    assert sent == [(["back"], "game_state_public", public), (["back"], "game_state_private", private)]
+
+
+@pytest.mark.asyncio
+async def test_resume_without_cached_state_falls_back_to_join(mgr):
+    assert await mgr.resume_game_room("back", 1, 5, "stale-epoch", 40) is None
+    assert "back" not in mgr.user_sessions
@@ -1,3 +1,4 @@
+import logging
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from app.db.events import (
@@ -90,12 +91,12 @@ class TestShouldCheckSocialDisgrace:
 class TestRegisterEvents:
     """Tests para register_events()"""
     
-    def test_register_events_prints_message(self, capsys):
-        """register_events() imprime mensaje de confirmación"""
-        register_events()
+    def test_register_events_logs_message(self, caplog):
+        """register_events() loguea mensaje de confirmación"""
+        with caplog.at_level(logging.INFO, logger="app.db.events"):
+            register_events()
         
-        captured = capsys.readouterr()
-        assert "Social disgrace event listeners registered" in captured.out
+        assert "Social disgrace event listeners registered" in caplog.text
 
 
 class TestAfterUpdateListener:
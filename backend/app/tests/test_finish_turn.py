@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, AsyncMock, patch
 from app.routes.finish_turn import router, get_db
 from app.db import models
 from app.main import app
+from app.services.game_context import GameContext
 from datetime import datetime
 
 # --- Setup FastAPI test client ---
@@ -41,14 +42,6 @@ def test_finish_turn_success(mock_db, mock_get_db):
 
     # mock query chain behavior
     def query_side_effect(model):
-        if model == models.Room:
-            q = MagicMock()
-            q.filter.return_value.first.return_value = room
-            return q
-        if model == models.Game:
-            q = MagicMock()
-            q.filter.return_value.first.return_value = game
-            return q
         if model == models.Player:
             q = MagicMock()
             q.filter.return_value.order_by.return_value.all.return_value = players
@@ -62,8 +55,10 @@ def test_finish_turn_success(mock_db, mock_get_db):
     mock_db.query.side_effect = query_side_effect
     mock_db.commit = MagicMock()
     mock_db.refresh = MagicMock()
+    context = GameContext(room=room, game=game, actor=players[0])
 
-    with patch("app.routes.finish_turn.build_complete_game_state") as mock_build_state, \
+    with patch("app.routes.finish_turn.load_game_context", return_value=context), \
+         patch("app.routes.finish_turn.game_state_builder") as mock_build_state, \
          patch("app.routes.finish_turn.get_websocket_service") as mock_ws:
         mock_build_state.return_value = {"game_id": 10, "status": "INGAME"}
 
@@ -92,9 +87,8 @@ def test_finish_turn_success(mock_db, mock_get_db):
 def test_finish_turn_room_not_found(mock_db, mock_get_db):
     app.dependency_overrides[get_db] = mock_get_db
 
-    mock_db.query.return_value.filter.return_value.first.return_value = None
-
-    response = client.post("/game/999/finish-turn", json={"user_id": 1})
+    with patch("app.routes.finish_turn.load_game_context", return_value=None):
+        response = client.post("/game/999/finish-turn", json={"user_id": 1})
     assert response.status_code == 404
     assert response.json()["detail"] == "room_not_found"
 
@@ -109,19 +103,10 @@ def test_finish_turn_game_not_found(mock_db, mock_get_db):
     app.dependency_overrides[get_db] = mock_get_db
 
     room = models.Room(id=1, id_game=10)
-    def query_side_effect(model):
-        if model == models.Room:
-            q = MagicMock()
-            q.filter.return_value.first.return_value = room
-            return q
-        if model == models.Game:
-            q = MagicMock()
-            q.filter.return_value.first.return_value = None
-            return q
-        return MagicMock()
-    mock_db.query.side_effect = query_side_effect
+    context = GameContext(room=room, game=None)
 
-    resp = client.post("/game/1/finish-turn", json={"user_id": 1})
+    with patch("app.routes.finish_turn.load_game_context", return_value=context):
+        resp = client.post("/game/1/finish-turn", json={"user_id": 1})
     assert resp.status_code == 404
     assert resp.json()["detail"] == "game_not_found"
 
@@ -138,14 +123,6 @@ def test_finish_turn_not_your_turn(mock_db, mock_get_db):
     room, game, players = make_mock_room_game_players(turn_user_id=2)
 
     def query_side_effect(model):
-        if model == models.Room:
-            q = MagicMock()
-            q.filter.return_value.first.return_value = room
-            return q
-        if model == models.Game:
-            q = MagicMock()
-            q.filter.return_value.first.return_value = game
-            return q
         if model == models.Player:
             q = MagicMock()
             q.filter.return_value.order_by.return_value.all.return_value = players
@@ -153,8 +130,10 @@ def test_finish_turn_not_your_turn(mock_db, mock_get_db):
         return MagicMock()
 
     mock_db.query.side_effect = query_side_effect
+    context = GameContext(room=room, game=game, actor=players[0])
 
-    resp = client.post("/game/1/finish-turn", json={"user_id": 1})
+    with patch("app.routes.finish_turn.load_game_context", return_value=context):
+        resp = client.post("/game/1/finish-turn", json={"user_id": 1})
     assert resp.status_code == 403
     assert resp.json()["detail"] == "not_your_turn"
 
@@ -185,22 +164,10 @@ def test_finish_turn_handles_turn_transitions(mock_db, mock_get_db):
     mock_db.add = MagicMock(side_effect=lambda obj: added_objects.append(obj))
 
     def query_side_effect(model):
-        if model == models.Room:
-            q = MagicMock()
-            q.filter.return_value.first.return_value = room
-            return q
-        if model == models.Game:
-            q = MagicMock()
-            q.filter.return_value.first.return_value = game
-            return q
         if model == models.Player:
             q = MagicMock()
             q.filter.return_value.order_by.return_value.all.return_value = players
             return q
-        if model == models.Turn:
-            q = MagicMock()
-            q.filter.return_value.filter.return_value.filter.return_value.first.return_value = current_turn
-            return q
         if model == models.CardsXGame:
             q = MagicMock()
             q.filter.return_value.count.return_value = 25
@@ -210,8 +177,10 @@ def test_finish_turn_handles_turn_transitions(mock_db, mock_get_db):
     mock_db.query.side_effect = query_side_effect
     mock_db.commit = MagicMock()
     mock_db.refresh = MagicMock()
+    context = GameContext(room=room, game=game, actor=players[0], current_turn=current_turn)
 
-    with patch("app.routes.finish_turn.build_complete_game_state") as mock_build_state, \
+    with patch("app.routes.finish_turn.load_game_context", return_value=context), \
+         patch("app.routes.finish_turn.game_state_builder") as mock_build_state, \
          patch("app.routes.finish_turn.get_websocket_service") as mock_ws:
         mock_build_state.return_value = {"game_id": 10, "status": "INGAME"}
 
@@ -0,0 +1,133 @@
+"""
+Tests para los frames de estado pre-codificados (sockets/frames.py).
+"""
+
+import pytest
+import socketio
+from unittest.mock import AsyncMock, MagicMock
+from socketio import packet as sio_packet
+
+from app.sockets import wire_format
+from app.sockets.frames import StateFrameCache
+from app.sockets.socket_manager import WebSocketManager
+
+
+@pytest.fixture
+def sio():
+    server = socketio.AsyncServer(async_mode="asgi")
+    server.eio.send_packet = AsyncMock()
+    server.manager.eio_sid_from_sid = MagicMock(side_effect=lambda sid, ns: f"eio-{sid}")
+    return server
+
+
+def _body(deck=25):
+    return {"type": "game_state_public", "room_id": 1, "jugadores": [{"player_id": 1, "name": "Ñandú"}],
+            "mazos": {"deck": {"count": deck}}}
+
+
+def test_spliced_json_frame_matches_socketio_encoder(sio):
+    payload = StateFrameCache().public(1, "game_state_public", _body())
+
+    frame = payload.frames(sio, "game_state_public")
+    expected = sio.packet_class(sio_packet.EVENT, namespace="/",
+                                data=["game_state_public", dict(payload)]).encode()
+    assert len(frame) == 1
+    assert frame[0].data == expected
+    assert payload["version"] == 1 and "timestamp" in payload
+
+
+def test_unchanged_state_reuses_version_and_frames(sio):
+    cache = StateFrameCache()
+    first = cache.public(1, "game_state_public", _body())
+    frames = first.frames(sio, "game_state_public")
+
+    again = cache.public(1, "game_state_public", _body())
+    assert again is first
+    assert again.frames(sio, "game_state_public") is frames
+
+    changed = cache.public(1, "game_state_public", _body(deck=24))
+    assert changed is not first
+    assert changed["version"] == 2
+    assert cache.version(1) == 2
+
+
+def test_private_payloads_versioned_per_user():
+    cache = StateFrameCache()
+    a = cache.private(1, 10, "game_state_private", {"user_id": 10, "mano": [1]})
+    b = cache.private(1, 11, "game_state_private", {"user_id": 11, "mano": [2]})
+
+    assert cache.private(1, 10, "game_state_private", {"user_id": 10, "mano": [1]}) is a
+    assert b is not a
+
+    cache.discard_room(1)
+    assert cache.private(1, 10, "game_state_private", {"user_id": 10, "mano": [1]}) is not a
+
+
+def test_discarded_room_is_not_cached_again():
+    cache = StateFrameCache()
+    cache.public(1, "game_state_public", _body())
+    cache.private(1, 5, "game_state_private", {"user_id": 5})
+    cache.discard_room(1)
+
+    # Broadcast tardío después de game_ended: sale, pero no queda en la cache
+    late = cache.public(1, "game_state_public", _body(deck=20))
+    cache.private(1, 5, "game_state_private", {"user_id": 5, "n": 2})
+
+    assert late["mazos"]["deck"]["count"] == 20
+    assert cache.is_discarded(1)
+    assert cache.latest_public(1) is None
+    assert cache.latest_private(1, 5) is None
+    assert cache.version(1) == 0
+
+
+@pytest.mark.asyncio
+async def test_manager_sends_raw_frames_per_encoding(sio):
+    mgr = WebSocketManager(sio, MagicMock())
+    mgr.user_sessions = {"s1": {"room_id": 1, "user_id": 1}, "s2": {"room_id": 1, "user_id": 2}}
+    mgr.set_encoding("s2", wire_format.MSGPACK)
+    payload = StateFrameCache().public(1, "game_state_public", _body())
+
+    await mgr.emit_to_room(1, "game_state_public", payload)
+
+    sent = [(c.args[0], c.args[1]) for c in sio.eio.send_packet.await_args_list]
+    json_frames = [p for sid, p in sent if sid == "eio-s1"]
+    binary_frames = [p for sid, p in sent if sid == "eio-s2"]
+    assert json_frames == payload.frames(sio, "game_state_public")
+    # msgpack viaja como BINARY_EVENT: encabezado + adjunto
+    assert len(binary_frames) == 2
+    assert wire_format.unpack(binary_frames[1].data) == dict(payload)
+
+
+def test_compact_cards_drops_catalog_fields_only_on_cards():
+    body = {"type": "game_state_private", "user_id": 1,
+            "mano": [{"id": 7, "card_id": 3, "name": "Poirot", "type": "DETECTIVE",
+                      "img_src": "p.png", "description": "d"}],
+            "jugadores": [{"player_id": 1, "name": "Ñandú"}]}
+
+    compact = wire_format.compact_cards(body)
+
+    assert compact["mano"] == [{"id": 7, "card_id": 3}]
+    assert compact["jugadores"] == body["jugadores"]
+    assert body["mano"][0]["name"] == "Poirot"
+
+
+@pytest.mark.asyncio
+async def test_manager_sends_card_id_variant_to_negotiated_sids(sio):
+    mgr = WebSocketManager(sio, MagicMock())
+    mgr.user_sessions = {"s1": {"room_id": 1, "user_id": 1}, "s2": {"room_id": 1, "user_id": 2}}
+    mgr.set_card_format("s2", wire_format.CARDS_IDS)
+    body = dict(_body(), mazos={"discard": {"top": "Poirot", "top_card_id": 3, "count": 1}},
+                draft=[{"id": 9, "card_id": 3, "name": "Poirot", "img_src": "p.png"}])
+    payload = StateFrameCache().public(1, "game_state_public", body)
+
+    await mgr.emit_to_room(1, "game_state_public", payload)
+    await mgr.emit_to_room(1, "game_state_public", payload)
+
+    variant = payload.variant(wire_format.CARDS_IDS, wire_format.compact_cards)
+    assert variant["draft"] == [{"id": 9, "card_id": 3}]
+    assert variant["version"] == payload["version"]
+    sent = [(c.args[0], c.args[1]) for c in sio.eio.send_packet.await_args_list]
+    assert [p for sid, p in sent if sid == "eio-s2"] == variant.frames(sio, "game_state_public") * 2
+    assert [p for sid, p in sent if sid == "eio-s1"] == payload.frames(sio, "game_state_public") * 2
+    # La variante se calcula una vez por versión
+    assert payload.variant(wire_format.CARDS_IDS, wire_format.compact_cards) is variant
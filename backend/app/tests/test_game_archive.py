@@ -0,0 +1,189 @@
+"""
+Tests para el archivado de partidas terminadas (hot / cold split).
+"""
+
+import pytest
+from datetime import date, datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db import models, crud
+from app.db.database import Base
+from app.services.game_archive import (
+    archive_finished_games,
+    archive_game,
+    find_archivable_games,
+    load_game_history,
+    purge_expired_archives,
+)
+
+# StaticPool: la ruta corre en el threadpool de TestClient y necesita ver la
+# misma base en memoria
+engine = create_engine(
+    "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+OLD = datetime(2020, 1, 1, 12, 0, 0)
+
+
+def _foreign_keys(enabled):
+    with engine.connect() as conn:
+        conn.exec_driver_sql(f"PRAGMA foreign_keys={'ON' if enabled else 'OFF'}")
+
+
+@pytest.fixture(scope="function")
+def db():
+    # Como MySQL: las FKs se chequean (SQLite las ignora por defecto). Se
+    # apagan para el drop_all, que no sabe cortar los ciclos entre tablas.
+    Base.metadata.create_all(bind=engine)
+    _foreign_keys(True)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    _foreign_keys(False)
+    Base.metadata.drop_all(bind=engine)
+
+
+def _make_game(db, name, status):
+    game = crud.create_game(db, {})
+    room = crud.create_room(db, {"name": name, "status": status, "id_game": game.id})
+    player = crud.create_player(db, {
+        "name": f"{name}-P1", "avatar_src": "a.png", "birthdate": date(2000, 1, 1),
+        "id_room": room.id, "is_host": True, "order": 1,
+    })
+    card = db.get(models.Card, 1)
+    if card is None:
+        db.add(models.Card(id=1, name="Card", description="d", type="EVENT", img_src="c.png", qty=10))
+    turn = models.Turn(number=1, id_game=game.id, player_id=player.id,
+                       status=models.TurnStatus.FINISHED, start_time=OLD)
+    db.add(turn)
+    cards = [
+        models.CardsXGame(id_game=game.id, id_card=1, is_in=models.CardState.HAND,
+                          position=i, player_id=player.id, hidden=True)
+        for i in range(3)
+    ]
+    db.add_all(cards)
+    db.flush()
+    parent = crud.create_parent_card_action(
+        db, game.id, turn.id, player.id,
+        action_type=models.ActionType.DISCARD,
+        action_name=models.ActionName.END_TURN_DISCARD,
+    )
+    crud.create_card_action(
+        db, game.id, turn.id, player.id,
+        action_type=models.ActionType.DISCARD,
+        source_pile=models.SourcePile.DISCARD_PILE,
+        card_id=cards[0].id, position=0, parent_action_id=parent.id,
+    )
+    db.commit()
+    return game.id, room.id
+
+
+def _live_counts(db, game_id):
+    return [
+        db.query(model).filter(model.id_game == game_id).count()
+        for model in (models.Turn, models.CardsXGame, models.ActionsPerTurn)
+    ]
+
+
+def test_archive_moves_rows_out_of_live_tables(db):
+    game_id, room_id = _make_game(db, "Done", models.RoomStatus.FINISH)
+    before = load_game_history(db, game_id)
+    assert before["archived"] is False
+
+    archive = archive_game(db, game_id)
+    db.commit()
+
+    assert archive is not None
+    assert (archive.turns_count, archive.cards_count, archive.actions_count) == (1, 3, 2)
+    assert _live_counts(db, game_id) == [0, 0, 0]
+
+    after = load_game_history(db, game_id)
+    assert after["archived"] is True
+    assert after["room_id"] == room_id
+    for section in ("turns", "cards", "actions", "social_disgrace"):
+        assert after[section] == before[section]
+    child = next(a for a in after["actions"] if a["parent_action_id"] is not None)
+    assert child["action_type"] == "DISCARD"
+
+
+def test_only_finished_games_are_archived(db):
+    live_id, _ = _make_game(db, "Live", models.RoomStatus.INGAME)
+    done_id, _ = _make_game(db, "Done", models.RoomStatus.FINISH)
+
+    assert archive_game(db, live_id) is None
+    assert find_archivable_games(db, timedelta(minutes=60)) == [done_id]
+
+    assert archive_finished_games(db, timedelta(minutes=60)) == [done_id]
+    assert find_archivable_games(db, timedelta(minutes=60)) == []
+    assert archive_game(db, done_id) is None
+    assert _live_counts(db, live_id) == [1, 3, 2]
+
+
+def test_archiving_keeps_other_games_actions_valid(db):
+    # La partida terminada tiene los CardsXGame.id más bajos
+    done_id, _ = _make_game(db, "Done", models.RoomStatus.FINISH)
+    live_id, _ = _make_game(db, "Live", models.RoomStatus.INGAME)
+
+    assert archive_finished_games(db, timedelta(minutes=60)) == [done_id]
+
+    turn = db.query(models.Turn).filter(models.Turn.id_game == live_id).one()
+    card = db.query(models.CardsXGame).filter(models.CardsXGame.id_game == live_id).first()
+    crud.create_card_action(
+        db, live_id, turn.id, turn.player_id,
+        action_type=models.ActionType.DISCARD,
+        source_pile=models.SourcePile.DISCARD_PILE,
+        card_id=card.id, position=1,
+    )
+    db.commit()
+    assert _live_counts(db, live_id) == [1, 3, 3]
+
+
+def test_recent_finished_games_stay_hot(db):
+    _make_game(db, "Done", models.RoomStatus.FINISH)
+
+    assert find_archivable_games(db, timedelta(days=365 * 100)) == []
+
+
+def test_purge_respects_retention(db):
+    game_id, _ = _make_game(db, "Done", models.RoomStatus.FINISH)
+    archive_game(db, game_id).archived_at = OLD
+    db.commit()
+
+    assert purge_expired_archives(db, 0) == 0
+    assert purge_expired_archives(db, 30) == 1
+    assert db.get(models.GameArchive, game_id) is None
+
+
+def test_history_unknown_game(db):
+    assert load_game_history(db, 9999) is None
+
+
+def test_history_route_serves_archive_and_rejects_live_games(db):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.routes.history import get_db
+
+    live_id, live_room = _make_game(db, "Live", models.RoomStatus.INGAME)
+    done_id, done_room = _make_game(db, "Done", models.RoomStatus.FINISH)
+    archive_game(db, done_id)
+    db.commit()
+
+    def _get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = _get_db
+    try:
+        client = TestClient(app)
+        response = client.get(f"/api/game/{done_room}/history")
+        assert response.status_code == 200
+        body = response.json()
+        assert body["archived"] is True
+        assert len(body["cards"]) == 3
+
+        assert client.get(f"/api/game/{live_room}/history").status_code == 400
+        assert client.get("/api/game/9999/history").status_code == 404
+    finally:
+        app.dependency_overrides.pop(get_db, None)
@@ -0,0 +1,105 @@
+"""
+Tests para el GameContext (sala + juego + actor + turno en una sola query).
+"""
+
+import pytest
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.db import models, crud
+from app.db.database import Base
+from app.services.game_context import load_game_context, invalidate_game_context
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def setup(db):
+    game = crud.create_game(db, {})
+    room = crud.create_room(db, {"name": "Room", "status": "INGAME", "id_game": game.id})
+    players = [
+        crud.create_player(db, {
+            "name": f"P{i}", "avatar_src": "a.png", "birthdate": date(2000, 1, 1),
+            "id_room": room.id, "is_host": i == 1, "order": i,
+        })
+        for i in (1, 2)
+    ]
+    game.player_turn_id = players[0].id
+    db.add(models.Turn(number=1, id_game=game.id, player_id=players[0].id,
+                       status=models.TurnStatus.FINISHED))
+    turn = models.Turn(number=2, id_game=game.id, player_id=players[0].id,
+                       status=models.TurnStatus.IN_PROGRESS)
+    db.add(turn)
+    db.commit()
+    return {"game": game, "room": room, "players": players, "turn": turn}
+
+
+@pytest.fixture
+def query_count():
+    count = [0]
+
+    def _count(*args, **kwargs):
+        count[0] += 1
+
+    event.listen(engine, "before_cursor_execute", _count)
+    yield count
+    event.remove(engine, "before_cursor_execute", _count)
+
+
+def test_loads_everything_in_one_query(db, setup, query_count):
+    room_id, game_id = setup["room"].id, setup["game"].id
+    actor_id, turn_id = setup["players"][0].id, setup["turn"].id
+    db.expire_all()
+    query_count[0] = 0
+
+    ctx = load_game_context(db, room_id, actor_id)
+
+    assert query_count[0] == 1
+    assert ctx.room.id == room_id
+    assert ctx.game.id == game_id
+    assert ctx.actor.id == actor_id
+    assert ctx.current_turn.id == turn_id
+    assert ctx.is_actor_turn
+    assert ctx.actor_turn is ctx.current_turn
+
+
+def test_other_player_and_foreign_player(db, setup):
+    other = load_game_context(db, setup["room"].id, setup["players"][1].id)
+    assert other.actor.id == setup["players"][1].id
+    assert not other.is_actor_turn
+    assert other.actor_turn is None
+    assert other.current_turn is not None
+
+    foreign = load_game_context(db, setup["room"].id, 9999)
+    assert foreign.actor is None
+    assert foreign.game is not None
+
+
+def test_missing_room(db, setup):
+    assert load_game_context(db, 9999, setup["players"][0].id) is None
+
+
+def test_memoized_until_commit(db, setup, query_count):
+    room_id, actor_id = setup["room"].id, setup["players"][0].id
+    query_count[0] = 0
+    first = load_game_context(db, room_id, actor_id)
+    assert load_game_context(db, room_id, actor_id) is first
+    assert query_count[0] == 1
+
+    invalidate_game_context(db)
+    assert load_game_context(db, room_id, actor_id) is not first
+
+    cached = load_game_context(db, room_id, actor_id)
+    db.commit()
+    assert load_game_context(db, room_id, actor_id) is not cached
@@ -0,0 +1,334 @@
+"""
+Tests para el GameTracker (roles, secretos, desgracia y mazos en memoria).
+"""
+
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import models, crud
+from app.db.database import Base
+from app.db.models import CardState, CardType
+from app.services.game_tracker import get_game_tracker, get_game_trackers
+from app.services import game_service
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def game(db):
+    """Partida de 3 jugadores: P1 asesino, P2 cómplice, P3 detective."""
+    cards = {
+        "murderer": models.Card(id=1, name="You are the Murderer!!", type=CardType.SECRET,
+                                description="", img_src="", qty=1),
+        "accomplice": models.Card(id=2, name="You are the Accomplice!", type=CardType.SECRET,
+                                  description="", img_src="", qty=1),
+        "secret": models.Card(id=3, name="Secret", type=CardType.SECRET,
+                              description="", img_src="", qty=10),
+        "event": models.Card(id=4, name="Event", type=CardType.EVENT,
+                             description="", img_src="", qty=10),
+        "nsf": models.Card(id=13, name="Not so fast", type=CardType.INSTANT,
+                           description="", img_src="", qty=10),
+    }
+    db.add_all(cards.values())
+    g = crud.create_game(db, {})
+    room = crud.create_room(db, {"name": "Room", "status": "INGAME", "id_game": g.id})
+    players = [
+        crud.create_player(db, {
+            "name": f"P{i}", "avatar_src": f"a{i}.png", "birthdate": date(2000, 1, 1),
+            "id_room": room.id, "is_host": i == 1, "order": i,
+        })
+        for i in (1, 2, 3)
+    ]
+
+    def add(card, is_in, player=None, hidden=True):
+        cxg = models.CardsXGame(id_game=g.id, id_card=cards[card].id, is_in=is_in,
+                                position=1, player_id=player.id if player else None,
+                                hidden=hidden)
+        db.add(cxg)
+        return cxg
+
+    secrets = {
+        "murderer": add("murderer", CardState.SECRET_SET, players[0]),
+        "accomplice": add("accomplice", CardState.SECRET_SET, players[1]),
+        "p3_a": add("secret", CardState.SECRET_SET, players[2]),
+        "p3_b": add("secret", CardState.SECRET_SET, players[2]),
+    }
+    draft = [add("event", CardState.DRAFT) for _ in range(2)]
+    deck = [add("event", CardState.DECK) for _ in range(3)]
+    nsf = add("nsf", CardState.HAND, players[1])
+    db.commit()
+
+    tracker = get_game_trackers().load(db, g.id)
+    return {"game": g, "room": room, "players": players, "secrets": secrets,
+            "draft": draft, "deck": deck, "nsf": nsf, "tracker": tracker}
+
+
+def test_load_resolves_roles_and_counts(game):
+    tracker = game["tracker"]
+    p1, p2, p3 = (p.id for p in game["players"])
+
+    assert tracker.murderer_id == p1
+    assert tracker.accomplice_id == p2
+    assert tracker.detective_ids == {p3}
+    assert tracker.total_secrets[p3] == 2
+    assert tracker.hidden_secrets[p3] == 2
+    assert tracker.disgraced == set()
+    assert tracker.draft_count == 2
+    assert tracker.deck_count == 3
+
+
+def test_changes_apply_on_commit(db, game):
+    tracker = game["tracker"]
+    p3 = game["players"][2].id
+
+    game["secrets"]["p3_a"].hidden = False
+    game["secrets"]["p3_b"].hidden = False
+    db.flush()
+    # Todavía no commiteado: el tracker no lo ve
+    assert tracker.hidden_secrets[p3] == 2
+
+    db.commit()
+    assert tracker.hidden_secrets[p3] == 0
+    assert tracker.disgraced == {p3}
+    assert tracker.all_detectives_disgraced()
+
+    # Ocultar uno lo saca de desgracia
+    game["secrets"]["p3_a"].hidden = True
+    db.commit()
+    assert tracker.disgraced == set()
+
+
+def test_rollback_discards_pending_changes(db, game):
+    tracker = game["tracker"]
+    game["draft"][0].is_in = "HAND"
+    db.flush()
+    db.rollback()
+
+    assert tracker.draft_count == 2
+    assert tracker.cards[game["draft"][0].id].is_in == CardState.DRAFT
+
+
+def test_piles_and_secret_transfer(db, game):
+    tracker = game["tracker"]
+    p1, p2, p3 = (p.id for p in game["players"])
+
+    game["draft"][0].is_in = "HAND"
+    game["draft"][0].player_id = p3
+    game["deck"][0].is_in = CardState.DRAFT
+    game["secrets"]["accomplice"].player_id = p3
+    db.commit()
+
+    assert tracker.draft_count == 2
+    assert tracker.deck_count == 2
+    assert tracker.accomplice_id == p3
+    assert tracker.total_secrets[p2] == 0
+    assert tracker.detective_ids == {p2}
+
+    db.delete(game["deck"][1])
+    db.commit()
+    assert tracker.deck_count == 1
+
+
+@pytest.mark.asyncio
+async def test_win_for_reveal_uses_tracker(db, game):
+    p1, p2, p3 = game["players"]
+    mock_db = MagicMock()
+
+    with patch("app.services.game_service._end_game_with_winners", new_callable=AsyncMock) as end:
+        assert not await game_service.win_for_reveal(mock_db, game["game"].id, game["room"].id,
+                                                     game["secrets"]["p3_a"])
+        assert await game_service.win_for_reveal(mock_db, game["game"].id, game["room"].id,
+                                                 game["secrets"]["murderer"])
+
+    mock_db.query.assert_not_called()
+    winners = end.await_args.kwargs["winners"]
+    assert winners == [{"role": "detective", "player_id": p3.id, "name": "P3", "avatar_src": "a3.png"}]
+
+
+@pytest.mark.asyncio
+async def test_win_for_total_disgrace_uses_tracker(db, game):
+    mock_db = MagicMock()
+
+    with patch("app.services.game_service._end_game_with_winners", new_callable=AsyncMock) as end:
+        assert not await game_service.win_for_total_disgrace(mock_db, game["game"].id)
+        end.assert_not_awaited()
+
+        game["secrets"]["p3_a"].hidden = False
+        game["secrets"]["p3_b"].hidden = False
+        db.commit()
+        assert await game_service.win_for_total_disgrace(mock_db, game["game"].id)
+
+    mock_db.query.assert_not_called()
+    kwargs = end.await_args.kwargs
+    assert kwargs["reason"] == "TOTAL_DISGRACE"
+    assert {w["player_id"] for w in kwargs["winners"]} == {game["players"][0].id, game["players"][1].id}
+
+
+@pytest.mark.asyncio
+async def test_procesar_ultima_carta_uses_tracker_roles(game):
+    with patch("app.services.game_service.finalizar_partida", new_callable=AsyncMock) as fin, \
+         patch("app.sockets.socket_service.get_websocket_service") as ws:
+        ws.return_value.notificar_fin_partida = AsyncMock()
+        await game_service.procesar_ultima_carta(game["game"].id, game["room"].id, {"mazos": {}})
+
+    winners = fin.await_args.args[1]
+    assert [w["role"] for w in winners] == ["murderer", "accomplice"]
+    assert winners[0]["player_id"] == game["players"][0].id
+
+
+def test_finished_game_is_discarded(game):
+    get_game_trackers().discard(game["game"].id)
+    assert get_game_tracker(game["game"].id) is None
+
+
+# ===============================
+# Desgracia social con tracker
+# ===============================
+
+def _reveal_all(db, game):
+    game["secrets"]["p3_a"].hidden = False
+    game["secrets"]["p3_b"].hidden = False
+    db.commit()
+
+
+def test_disgrace_enter_and_exit_without_reads(db, game):
+    from sqlalchemy import event
+    from app.services.social_disgrace_service import update_social_disgrace_status
+
+    tracker = game["tracker"]
+    p3 = game["players"][2]
+    game_id, p3_id = game["game"].id, p3.id
+    _reveal_all(db, game)
+
+    statements = []
+    listener = lambda conn, cur, stmt, *a: statements.append(stmt.split()[0])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        change = update_social_disgrace_status(db, game_id, p3_id)
+        again = update_social_disgrace_status(db, game_id, p3_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert change["action"] == "entered"
+    assert change["player_name"] == "P3" and change["avatar_src"] == "a3.png"
+    assert again is None
+    assert "SELECT" not in statements
+    assert p3.id in tracker.disgrace_registered
+    assert crud.check_player_in_social_disgrace(db, game["game"].id, p3.id)
+    assert tracker.disgrace_entries()[0]["player_id"] == p3.id
+
+    game["secrets"]["p3_a"].hidden = True
+    db.commit()
+    change = update_social_disgrace_status(db, game["game"].id, p3.id)
+    assert change["action"] == "exited"
+    assert tracker.disgrace_registered == {}
+    assert not crud.check_player_in_social_disgrace(db, game["game"].id, p3.id)
+
+
+def test_disgrace_rollback_keeps_tracker_in_sync(db, game):
+    from app.services.social_disgrace_service import update_social_disgrace_status_no_commit
+
+    p3 = game["players"][2]
+    _reveal_all(db, game)
+
+    assert update_social_disgrace_status_no_commit(db, game["game"].id, p3.id)["action"] == "entered"
+    db.rollback()
+    assert game["tracker"].disgrace_registered == {}
+
+
+def test_disgrace_uncommitted_card_changes_use_db_path(db, game):
+    from app.services.social_disgrace_service import update_social_disgrace_status_no_commit
+
+    p3 = game["players"][2]
+    game["secrets"]["p3_a"].hidden = False
+    game["secrets"]["p3_b"].hidden = False
+    db.flush()
+
+    # El tracker todavía no ve el reveal; el camino por BD sí
+    change = update_social_disgrace_status_no_commit(db, game["game"].id, p3.id)
+    assert change["action"] == "entered"
+
+
+@pytest.mark.asyncio
+async def test_notify_social_disgrace_change_uses_tracker(db, game):
+    from app.services.social_disgrace_service import (
+        notify_social_disgrace_change, update_social_disgrace_status
+    )
+
+    p3 = game["players"][2]
+    _reveal_all(db, game)
+    change = update_social_disgrace_status(db, game["game"].id, p3.id)
+
+    ws = MagicMock()
+    ws.notificar_social_disgrace_update = AsyncMock()
+    with patch("app.db.database.SessionLocal") as session_local, \
+         patch("app.sockets.socket_service.get_websocket_service", return_value=ws):
+        await notify_social_disgrace_change(game["game"].id, change)
+
+    session_local.assert_not_called()
+    kwargs = ws.notificar_social_disgrace_update.await_args.kwargs
+    assert kwargs["room_id"] == game["room"].id
+    assert [p["player_id"] for p in kwargs["players_in_disgrace"]] == [p3.id]
+
+
+# ===============================
+# Índice de Not So Fast
+# ===============================
+
+def test_nsf_index_follows_hand_changes(db, game):
+    tracker = game["tracker"]
+    p1, p2, p3 = (p.id for p in game["players"])
+
+    assert tracker.nsf_cards(p2) == {game["nsf"].id}
+    assert tracker.any_other_has_nsf(p1)
+    assert not tracker.any_other_has_nsf(p2)
+
+    # robo / intercambio: pasa a la mano de P3
+    game["nsf"].player_id = p3
+    db.commit()
+    assert not tracker.has_nsf(p2) and tracker.has_nsf(p3)
+
+    # descarte
+    game["nsf"].is_in = CardState.DISCARD
+    game["nsf"].player_id = None
+    db.commit()
+    assert not tracker.any_other_has_nsf(p1)
+
+    # una carta robada del mazo que resulta ser NSF (id_card cambiado por swap)
+    game["deck"][0].id_card = 13
+    game["deck"][0].is_in = "HAND"
+    game["deck"][0].player_id = p1
+    db.commit()
+    assert tracker.nsf_cards(p1) == {game["deck"][0].id}
+
+
+def test_check_players_have_nsf_without_queries(db, game):
+    from sqlalchemy import event
+    from app.services.not_so_fast_service import NotSoFastService
+
+    game_id = game["game"].id
+    p1, p2 = game["players"][0].id, game["players"][1].id
+    service = NotSoFastService(db)
+
+    statements = []
+    listener = lambda conn, cur, stmt, *a: statements.append(stmt)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        assert service._check_players_have_nsf(game_id, p1) is True
+        assert service._check_players_have_nsf(game_id, p2) is False
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert statements == []
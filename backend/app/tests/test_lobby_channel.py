@@ -0,0 +1,170 @@
+"""
+Tests para el canal de lobby por Socket.IO (push de cambios de salas).
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.db.models import RoomStatus
+from app.services.lobby_directory import get_lobby_directory
+from app.sockets import socket_events
+from app.sockets.lobby_channel import LOBBY_ROOM, LobbyBroadcaster
+
+
+def _room(room_id, status=RoomStatus.WAITING, players_max=4):
+    return SimpleNamespace(
+        id=room_id, name=f"room{room_id}", players_min=2,
+        players_max=players_max, status=status, id_game=None,
+    )
+
+
+def _players(n):
+    return [
+        SimpleNamespace(id=i + 1, name=f"p{i}", avatar_src="a.png", is_host=i == 0, order=i + 1)
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def mock_sio():
+    sio = MagicMock()
+    sio.emit = AsyncMock()
+    sio.enter_room = AsyncMock()
+    sio.leave_room = AsyncMock()
+    sio.save_session = AsyncMock()
+    return sio
+
+
+@pytest.fixture
+def broadcaster(mock_sio):
+    directory = get_lobby_directory()
+    directory.loaded = True  # directorio vacío ya "cargado"
+    b = LobbyBroadcaster(mock_sio, db_factory=MagicMock(), window=0.01)
+    directory.add_listener(b.on_directory_change)
+    yield b
+    directory.remove_listener(b.on_directory_change)
+
+
+def _events(mock_sio, skip_snapshot=True):
+    events = [(c.args[0], c.args[1]) for c in mock_sio.emit.await_args_list]
+    return [e for e in events if not (skip_snapshot and e[0] == "lobby_snapshot")]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_sends_snapshot(broadcaster, mock_sio):
+    get_lobby_directory().upsert_room(_room(1), _players(1))
+
+    await broadcaster.subscribe("sid1")
+
+    mock_sio.enter_room.assert_awaited_once_with("sid1", LOBBY_ROOM)
+    event, payload = mock_sio.emit.await_args_list[0].args
+    assert event == "lobby_snapshot"
+    assert [item["id"] for item in payload["items"]] == [1]
+    assert "sid1" in broadcaster.subscribers
+
+
+@pytest.mark.asyncio
+async def test_changes_are_coalesced_per_room(broadcaster, mock_sio):
+    directory = get_lobby_directory()
+    await broadcaster.subscribe("sid1")
+
+    # create + 2 joins dentro de la misma ventana -> un solo room_added
+    directory.upsert_room(_room(5), _players(1))
+    directory.upsert_room(_room(5), _players(2))
+    directory.upsert_room(_room(5), _players(3))
+    await asyncio.sleep(0.05)
+
+    events = _events(mock_sio)
+    assert events == [("room_added", {
+        "id": 5, "name": "room5", "players_min": 2, "players_max": 4,
+        "players_joined": 3, "host_id": 1,
+    })]
+    kwargs = mock_sio.emit.await_args_list[-1].kwargs
+    assert kwargs["room"] == LOBBY_ROOM
+
+
+@pytest.mark.asyncio
+async def test_availability_transitions(broadcaster, mock_sio):
+    directory = get_lobby_directory()
+    directory.upsert_room(_room(7, players_max=2), _players(1))
+    await broadcaster.subscribe("sid1")
+
+    directory.upsert_room(_room(7, players_max=2), _players(1))
+    await asyncio.sleep(0.05)
+    assert _events(mock_sio)[-1][0] == "room_updated"
+
+    # se llena -> desaparece del lobby
+    directory.upsert_room(_room(7, players_max=2), _players(2))
+    await asyncio.sleep(0.05)
+    assert _events(mock_sio)[-1] == ("room_removed", {"id": 7})
+
+    # sale un jugador -> vuelve a aparecer
+    directory.upsert_room(_room(7, players_max=2), _players(1))
+    await asyncio.sleep(0.05)
+    assert _events(mock_sio)[-1][0] == "room_added"
+
+    # arranca la partida
+    directory.upsert_room(_room(7, status=RoomStatus.INGAME, players_max=2), _players(1))
+    await asyncio.sleep(0.05)
+    assert _events(mock_sio)[-1] == ("room_removed", {"id": 7})
+
+
+@pytest.mark.asyncio
+async def test_created_and_cancelled_within_window_emits_nothing(broadcaster, mock_sio):
+    directory = get_lobby_directory()
+    await broadcaster.subscribe("sid1")
+
+    directory.upsert_room(_room(9), _players(1))
+    directory.remove_room(9)
+    await asyncio.sleep(0.05)
+
+    assert _events(mock_sio) == []
+
+
+@pytest.mark.asyncio
+async def test_change_from_worker_thread_is_marshalled_to_loop(broadcaster, mock_sio):
+    await broadcaster.subscribe("sid1")
+
+    thread = threading.Thread(
+        target=get_lobby_directory().upsert_room, args=(_room(11), _players(1))
+    )
+    thread.start()
+    thread.join()
+    await asyncio.sleep(0.05)
+
+    assert _events(mock_sio)[-1][0] == "room_added"
+
+
+@pytest.mark.asyncio
+async def test_no_subscribers_no_work(broadcaster, mock_sio):
+    get_lobby_directory().upsert_room(_room(1), _players(1))
+    await asyncio.sleep(0.03)
+    mock_sio.emit.assert_not_awaited()
+
+    await broadcaster.subscribe("sid1")
+    await broadcaster.unsubscribe("sid1")
+    mock_sio.leave_room.assert_awaited_once_with("sid1", LOBBY_ROOM)
+    assert broadcaster.subscribers == set()
+
+
+@pytest.mark.asyncio
+async def test_connect_with_lobby_flag_subscribes(mock_sio):
+    lobby = MagicMock()
+    lobby.subscribe = AsyncMock()
+    with patch("app.sockets.socket_events.get_ws_manager") as ws_manager, \
+         patch("app.sockets.socket_events.get_lobby_broadcaster", return_value=lobby):
+        ws_manager.return_value = MagicMock()
+        socket_events.register_events(mock_sio)
+        connect = mock_sio.event.call_args_list[0][0][0]
+
+        result = await connect("sid-lobby", {"QUERY_STRING": "lobby=1"})
+
+    assert result is True
+    lobby.subscribe.assert_awaited_once_with("sid-lobby")
+    mock_sio.save_session.assert_awaited_once_with("sid-lobby", {"lobby": True})
+    args, kwargs = mock_sio.emit.await_args_list[-1]
+    assert args[0] == "connected" and args[1]["lobby"] is True
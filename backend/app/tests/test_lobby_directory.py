@@ -0,0 +1,136 @@
+"""
+Tests para el directorio en memoria del lobby y GET /api/game_list.
+"""
+
+import pytest
+from datetime import date
+from unittest.mock import MagicMock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import models, crud
+from app.db.database import Base
+from app.db.models import RoomStatus
+from app.routes.get_list import get_game_list
+from app.services.lobby_directory import LobbyDirectory, get_lobby_directory
+
+engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+def _room(db, name, status=RoomStatus.WAITING, players=1, players_max=4):
+    room = crud.create_room(db, {
+        "name": name,
+        "status": status,
+        "players_min": 2,
+        "players_max": players_max,
+    })
+    for i in range(players):
+        crud.create_player(db, {
+            "name": f"{name}-p{i}",
+            "avatar_src": f"avatar{i}.png",
+            "birthdate": date(2000, 1, 1),
+            "id_room": room.id,
+            "is_host": i == 0,
+            "order": i + 1,
+        })
+    return room
+
+
+def test_ensure_loaded_reads_active_rooms_once(db):
+    waiting = _room(db, "waiting", players=2)
+    full = _room(db, "full", players=2, players_max=2)
+    ingame = _room(db, "ingame", status=RoomStatus.INGAME)
+    _room(db, "finished", status=RoomStatus.FINISH)
+
+    directory = LobbyDirectory()
+    directory.ensure_loaded(db)
+
+    assert directory.get_room(ingame.id) is not None
+    rooms, next_cursor = directory.list_available(limit=10)
+    assert [r.id for r in rooms] == [waiting.id]
+    assert rooms[0].players_joined == 2
+    assert rooms[0].host_id is not None
+    assert next_cursor is None
+    assert directory.get_room(full.id).is_available is False
+
+    # Cargado: no vuelve a tocar la BD
+    mock_db = MagicMock()
+    directory.ensure_loaded(mock_db)
+    mock_db.query.assert_not_called()
+
+
+def test_cursor_pagination_is_id_descending(db):
+    ids = [_room(db, f"room{i}").id for i in range(5)]
+    directory = LobbyDirectory()
+    directory.ensure_loaded(db)
+
+    page1, cursor = directory.list_available(limit=2)
+    page2, cursor2 = directory.list_available(limit=2, cursor=cursor)
+    page3, cursor3 = directory.list_available(limit=2, cursor=cursor2)
+
+    assert [r.id for r in page1 + page2 + page3] == sorted(ids, reverse=True)
+    assert cursor3 is None
+    offset_page, _ = directory.list_available(limit=2, offset=2)
+    assert [r.id for r in offset_page] == [r.id for r in page2]
+
+
+def test_incremental_updates(db):
+    room = _room(db, "room", players=1, players_max=2)
+    directory = LobbyDirectory()
+    directory.ensure_loaded(db)
+
+    # join: la sala se llena y deja de estar disponible
+    crud.create_player(db, {
+        "name": "joiner", "avatar_src": "a.png", "birthdate": date(2000, 1, 1),
+        "id_room": room.id, "is_host": False, "order": 2,
+    })
+    directory.upsert_room(room, crud.list_players_by_room(db, room.id))
+    assert directory.list_available(limit=10)[0] == []
+    assert directory.get_room(room.id).players_joined == 2
+
+    # leave: vuelve a estar disponible
+    directory.upsert_room(room, crud.list_players_by_room(db, room.id)[:1])
+    assert [r.id for r in directory.list_available(limit=10)[0]] == [room.id]
+
+    # start: INGAME no se lista
+    room.status = RoomStatus.INGAME
+    directory.upsert_room(room, crud.list_players_by_room(db, room.id))
+    assert directory.list_available(limit=10)[0] == []
+    assert directory.get_room(room.id).status == RoomStatus.INGAME
+
+    # cancel / fin de partida
+    directory.remove_room(room.id)
+    assert directory.get_room(room.id) is None
+
+
+def test_hooks_are_noop_until_loaded():
+    directory = LobbyDirectory()
+    assert directory.upsert_room(MagicMock(), []) is None
+    assert directory.remove_room(1) is None
+    assert directory.get_room(1) is None
+
+
+def test_game_list_endpoint_uses_directory(db):
+    rooms = [_room(db, f"room{i}") for i in range(3)]
+
+    first = get_game_list(page=1, limit=2, cursor=None, db=db)
+    assert [i.id for i in first.items] == [rooms[2].id, rooms[1].id]
+    assert first.next_cursor == rooms[1].id
+
+    # Segunda página por cursor, servida sin BD
+    mock_db = MagicMock()
+    second = get_game_list(page=1, limit=2, cursor=first.next_cursor, db=mock_db)
+    assert [i.id for i in second.items] == [rooms[0].id]
+    assert second.next_cursor is None
+    mock_db.query.assert_not_called()
+    assert get_lobby_directory().loaded
@@ -0,0 +1,88 @@
+"""
+Tests para la configuración de logging (QueueHandler + formato key=value).
+"""
+
+import logging
+import queue
+
+import pytest
+
+from app.config import settings
+from app import logging_config
+from app.logging_config import (
+    KeyValueFormatter,
+    LazyQueueHandler,
+    parse_module_levels,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+def _record(msg, args=(), **extra):
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_key_value_formatter_includes_extras_and_quotes():
+    line = KeyValueFormatter().format(_record("carta %s descartada", (7,), game_id=3, player="Mr Brown"))
+
+    assert "level=INFO" in line
+    assert "logger=app.test" in line
+    assert 'msg="carta 7 descartada"' in line
+    assert "game_id=3" in line
+    assert 'player="Mr Brown"' in line
+
+
+def test_lazy_queue_handler_only_resolves_message():
+    q = queue.SimpleQueue()
+    handler = LazyQueueHandler(q)
+    cards = [1, 2]
+    handler.emit(_record("cards=%s", (cards,)))
+    cards.append(3)
+
+    queued = q.get_nowait()
+    assert queued.getMessage() == "cards=[1, 2]"
+    assert queued.args is None
+
+
+def test_parse_module_levels():
+    assert parse_module_levels("app.sockets=debug, socketio=WARNING,,bad") == {
+        "app.sockets": "DEBUG",
+        "socketio": "WARNING",
+    }
+
+
+@pytest.fixture
+def restore_logging():
+    root = logging.getLogger()
+    saved = (root.level, list(root.handlers))
+    names = ["socketio", "engineio", "app.sockets"]
+    levels = {n: logging.getLogger(n).level for n in names}
+    shutdown_logging()
+    yield
+    shutdown_logging()
+    root.setLevel(saved[0])
+    root.handlers[:] = saved[1]
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+
+def test_setup_logging_installs_queue_and_levels(monkeypatch, restore_logging):
+    monkeypatch.setattr(settings, "LOG_LEVEL", "INFO")
+    monkeypatch.setattr(settings, "LOG_LEVELS", "app.sockets=DEBUG")
+
+    setup_logging()
+    setup_logging()  # idempotente
+
+    root = logging.getLogger()
+    queue_handlers = [h for h in root.handlers if isinstance(h, LazyQueueHandler)]
+    assert len(queue_handlers) == 1
+    assert logging_config._listener is not None
+    assert logging.getLogger("app.sockets").level == logging.DEBUG
+    assert logging.getLogger("socketio").level == logging.WARNING
+    assert logging.getLogger("engineio").level == logging.WARNING
+
+    shutdown_logging()
+    assert not [h for h in root.handlers if isinstance(h, LazyQueueHandler)]
+    assert logging_config._listener is None
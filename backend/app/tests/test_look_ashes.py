@@ -2,13 +2,14 @@ import pytest
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from fastapi.testclient import TestClient
 from app.db import models
+from app.services.game_context import GameContext
 from app.main import app
 
 client = TestClient(app)
 
 def test_play_room_not_found():
     """Test que retorna 404 cuando la sala no existe"""
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=None):
+    with patch('app.routes.look_ashes.load_game_context', return_value=None):
         payload = {"card_id": 1}
         resp = client.post(f"/api/game/99999/look-into-ashes/play", json=payload, headers={"http-user-id": "1"})
         assert resp.status_code == 404
@@ -20,7 +21,7 @@ def test_play_room_has_no_active_game():
     mock_room = Mock()
     mock_room.id_game = None
     
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=mock_room):
+    with patch('app.routes.look_ashes.load_game_context', return_value=GameContext(mock_room)):
         payload = {"card_id": 1}
         resp = client.post(f"/api/game/1/look-into-ashes/play", json=payload, headers={"http-user-id": "1"})
         assert resp.status_code == 400
@@ -32,8 +33,7 @@ def test_play_game_not_found():
     mock_room = Mock()
     mock_room.id_game = 10
     
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=mock_room), \
-         patch('app.routes.look_ashes.crud.get_game_by_id', return_value=None):
+    with patch('app.routes.look_ashes.load_game_context', return_value=GameContext(mock_room)):
         payload = {"card_id": 1}
         resp = client.post(f"/api/game/1/look-into-ashes/play", json=payload, headers={"http-user-id": "1"})
         assert resp.status_code == 404
@@ -48,8 +48,7 @@ def test_play_not_your_turn():
     mock_game = Mock()
     mock_game.player_turn_id = 2  # Different player
     
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=mock_room), \
-         patch('app.routes.look_ashes.crud.get_game_by_id', return_value=mock_game):
+    with patch('app.routes.look_ashes.load_game_context', return_value=GameContext(mock_room, mock_game)):
         payload = {"card_id": 1}
         resp = client.post(f"/api/game/1/look-into-ashes/play", json=payload, headers={"http-user-id": "1"})
         assert resp.status_code == 403
@@ -70,8 +69,7 @@ def test_play_event_card_not_in_hand():
     mock_query = MagicMock()
     mock_query.first.return_value = None
     
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=mock_room), \
-         patch('app.routes.look_ashes.crud.get_game_by_id', return_value=mock_game), \
+    with patch('app.routes.look_ashes.load_game_context', return_value=GameContext(mock_room, mock_game)), \
          patch('app.routes.look_ashes.SessionLocal') as mock_db_class:
         
         mock_db = MagicMock()
@@ -104,8 +102,7 @@ def test_play_card_not_event_type():
     mock_query = MagicMock()
     mock_query.first.return_value = mock_card_entry
     
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=mock_room), \
-         patch('app.routes.look_ashes.crud.get_game_by_id', return_value=mock_game), \
+    with patch('app.routes.look_ashes.load_game_context', return_value=GameContext(mock_room, mock_game)), \
          patch('app.routes.look_ashes.SessionLocal') as mock_db_class:
         
         mock_db = MagicMock()
@@ -144,9 +141,7 @@ def test_play_no_current_turn():
     mock_query2 = MagicMock()
     mock_query2.limit.return_value.all.return_value = [mock_discard_card]
     
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=mock_room), \
-         patch('app.routes.look_ashes.crud.get_game_by_id', return_value=mock_game), \
-         patch('app.routes.look_ashes.crud.get_current_turn', return_value=None), \
+    with patch('app.routes.look_ashes.load_game_context', return_value=GameContext(mock_room, mock_game, current_turn=None)), \
          patch('app.routes.look_ashes.SessionLocal') as mock_db_class:
         
         mock_db = MagicMock()
@@ -162,7 +157,7 @@ def test_play_no_current_turn():
 
 def test_select_room_not_found():
     """Test que retorna 404 cuando la sala no existe en select"""
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=None):
+    with patch('app.routes.look_ashes.load_game_context', return_value=None):
         payload = {"action_id": 1, "selected_card_id": 1}
         resp = client.post(f"/api/game/999999/look-into-ashes/select", json=payload, headers={"http-user-id": "1"})
         assert resp.status_code == 404
@@ -173,8 +168,7 @@ def test_select_game_not_found():
     mock_room = Mock()
     mock_room.id_game = 10
     
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=mock_room), \
-         patch('app.routes.look_ashes.crud.get_game_by_id', return_value=None):
+    with patch('app.routes.look_ashes.load_game_context', return_value=GameContext(mock_room)):
         payload = {"action_id": 1, "selected_card_id": 1}
         resp = client.post(f"/api/game/1/look-into-ashes/select", json=payload, headers={"http-user-id": "1"})
         assert resp.status_code == 404
@@ -187,8 +181,7 @@ def test_select_parent_action_not_found():
     
     mock_game = Mock()
     
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=mock_room), \
-         patch('app.routes.look_ashes.crud.get_game_by_id', return_value=mock_game), \
+    with patch('app.routes.look_ashes.load_game_context', return_value=GameContext(mock_room, mock_game)), \
          patch('app.routes.look_ashes.crud.get_action_by_id', return_value=None):
         payload = {"action_id": 999, "selected_card_id": 1}
         resp = client.post(f"/api/game/1/look-into-ashes/select", json=payload, headers={"http-user-id": "1"})
@@ -208,8 +201,7 @@ def test_select_parent_action_invalid():
     mock_action.action_name = models.ActionName.LOOK_INTO_THE_ASHES.value
     mock_action.result = models.ActionResult.SUCCESS
     
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=mock_room), \
-         patch('app.routes.look_ashes.crud.get_game_by_id', return_value=mock_game), \
+    with patch('app.routes.look_ashes.load_game_context', return_value=GameContext(mock_room, mock_game)), \
          patch('app.routes.look_ashes.crud.get_action_by_id', return_value=mock_action):
         payload = {"action_id": 1, "selected_card_id": 1}
         resp = client.post(f"/api/game/1/look-into-ashes/select", json=payload, headers={"http-user-id": "1"})
@@ -232,8 +224,7 @@ def test_select_action_expired():
     mock_action.result = models.ActionResult.SUCCESS
     mock_action.action_time = datetime.now() - timedelta(minutes=11)  # Expired
     
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=mock_room), \
-         patch('app.routes.look_ashes.crud.get_game_by_id', return_value=mock_game), \
+    with patch('app.routes.look_ashes.load_game_context', return_value=GameContext(mock_room, mock_game)), \
          patch('app.routes.look_ashes.crud.get_action_by_id', return_value=mock_action):
         payload = {"action_id": 1, "selected_card_id": 1}
         resp = client.post(f"/api/game/1/look-into-ashes/select", json=payload, headers={"http-user-id": "1"})
@@ -261,8 +252,7 @@ def test_select_card_not_found():
     mock_query = MagicMock()
     mock_query.first.return_value = None
     
-    with patch('app.routes.look_ashes.crud.get_room_by_id', return_value=mock_room), \
-         patch('app.routes.look_ashes.crud.get_game_by_id', return_value=mock_game), \
+    with patch('app.routes.look_ashes.load_game_context', return_value=GameContext(mock_room, mock_game)), \
          patch('app.routes.look_ashes.crud.get_action_by_id', return_value=mock_action), \
          patch('app.routes.look_ashes.SessionLocal') as mock_db_class:
         
@@ -0,0 +1,112 @@
+"""
+Tests para el watchdog del event loop y el registro de métricas.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.metrics import MetricsRegistry
+from app.services.loop_monitor import (
+    LoopMonitor,
+    LoopLabelMiddleware,
+    get_task_label,
+    labelled,
+    normalize_path,
+    task_label,
+)
+
+
+def test_metrics_registry_counters_gauges_and_summaries():
+    metrics = MetricsRegistry()
+    metrics.inc("a")
+    metrics.inc("a", 2)
+    metrics.set_gauge("g", 5)
+    metrics.observe("s", 3)
+    metrics.observe("s", 7)
+
+    snap = metrics.snapshot()
+    assert snap["counters"]["a"] == 3
+    assert snap["gauges"]["g"] == 5
+    assert snap["summaries"]["s"] == {"count": 2, "sum": 10.0, "max": 7}
+
+    metrics.reset()
+    assert metrics.get_counter("a") == 0
+
+
+def test_normalize_path_replaces_numeric_segments():
+    assert normalize_path("/api/game/12/discard") == "/api/game/{id}/discard"
+    assert normalize_path("/game/7") == "/game/{id}"
+    assert normalize_path("/health") == "/health"
+
+
+@pytest.mark.asyncio
+async def test_task_label_is_scoped_and_restored():
+    task = asyncio.current_task()
+    with task_label("outer"):
+        assert get_task_label(task) == "outer"
+        with task_label("inner"):
+            assert get_task_label(task) == "inner"
+        assert get_task_label(task) == "outer"
+    assert get_task_label(task) == task.get_name()
+
+
+@pytest.mark.asyncio
+async def test_labelled_decorator_preserves_name():
+    @labelled("socket:test")
+    async def handler():
+        return get_task_label(asyncio.current_task())
+
+    assert handler.__name__ == "handler"
+    assert await handler() == "socket:test"
+
+
+@pytest.mark.asyncio
+async def test_middleware_labels_http_requests():
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["label"] = get_task_label(asyncio.current_task())
+
+    middleware = LoopLabelMiddleware(app)
+    await middleware({"type": "http", "method": "POST", "path": "/api/game/3/discard"}, None, None)
+    assert seen["label"] == "POST /api/game/{id}/discard"
+
+
+@pytest.mark.asyncio
+async def test_monitor_detects_blocking_call_with_label():
+    metrics = MetricsRegistry()
+    monitor = LoopMonitor(interval=0.01, threshold=0.05, metrics=metrics)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.03)
+
+        @labelled("POST /api/game/{id}/start")
+        async def slow_handler():
+            time.sleep(0.3)  # llamada bloqueante simulada (ORM síncrono)
+
+        await slow_handler()
+        await asyncio.sleep(0.03)
+    finally:
+        await monitor.stop()
+
+    assert metrics.get_counter("loop.blocked") >= 1
+    assert metrics.get_counter("loop.blocked.POST /api/game/{id}/start") >= 1
+    assert metrics.get_counter("loop.lag_exceeded") >= 1
+    stall = monitor.recent_stalls[-1]
+    assert stall["label"] == "POST /api/game/{id}/start"
+    assert "slow_handler" in stall["stack"]
+    assert not monitor.running
+
+
+@pytest.mark.asyncio
+async def test_monitor_quiet_loop_reports_nothing():
+    metrics = MetricsRegistry()
+    monitor = LoopMonitor(interval=0.01, threshold=0.2, metrics=metrics)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    assert metrics.get_counter("loop.blocked") == 0
+    assert metrics.snapshot()["summaries"]["loop.lag_ms"]["count"] >= 1
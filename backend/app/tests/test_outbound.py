@@ -0,0 +1,114 @@
+"""
+Tests para la backpressure por socket (sockets/outbound.py).
+"""
+
+import asyncio
+import pytest
+import socketio
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.metrics import get_metrics
+from app.sockets.frames import EncodedPayload
+from app.sockets.outbound import OutboundQueues
+from app.sockets.socket_manager import WebSocketManager
+
+
+class _FakeSocket:
+    def __init__(self):
+        self.queue = asyncio.Queue()
+        self.close = AsyncMock()
+
+
+@pytest.fixture
+def sio():
+    server = socketio.AsyncServer(async_mode="asgi")
+    server.manager.eio_sid_from_sid = MagicMock(side_effect=lambda sid, ns: f"eio-{sid}")
+    server.eio.sockets = {"eio-slow": _FakeSocket(), "eio-ok": _FakeSocket()}
+    server.eio.send_packet = AsyncMock(
+        side_effect=lambda eio_sid, pkt: server.eio.sockets[eio_sid].queue.put_nowait(pkt)
+    )
+    get_metrics().reset()
+    yield server
+    get_metrics().reset()
+
+
+def _frames(sio, event, n):
+    return EncodedPayload({"n": n}).frames(sio, event)
+
+
+def _stall(sio, sid, packets=3):
+    for _ in range(packets):
+        sio.eio.sockets[f"eio-{sid}"].queue.put_nowait(object())
+
+
+def _drain_eio(sio, sid):
+    queue = sio.eio.sockets[f"eio-{sid}"].queue
+    out = []
+    while not queue.empty():
+        out.append(queue.get_nowait())
+    return out
+
+
+@pytest.mark.asyncio
+async def test_latest_wins_for_snapshots_never_for_events(sio):
+    outbound = OutboundQueues(sio, soft_limit=2, poll_interval=0.01)
+    _stall(sio, "slow")
+
+    await outbound.send("ok", "game_state_public", _frames(sio, "game_state_public", 0))
+    for n in range(3):
+        await outbound.send("slow", "game_state_public", _frames(sio, "game_state_public", n))
+        await outbound.send("slow", "player_acted", _frames(sio, "player_acted", n))
+
+    # El socket al día no se ve afectado
+    assert len(_drain_eio(sio, "ok")) == 1
+    assert outbound.depth("slow") == 4
+    assert get_metrics().get_counter("socket.outbound_dropped") == 2
+    assert get_metrics().gauges["socket.outbound_queued"] == 4
+
+    delivered = []
+    _drain_eio(sio, "slow")  # el cliente vuelve a leer
+    for _ in range(2):
+        # El drainer entrega hasta volver a pasar el soft limit
+        await asyncio.sleep(0.05)
+        delivered += [pkt.data for pkt in _drain_eio(sio, "slow")]
+    assert delivered == [
+        '2["player_acted",{"n":0}]',
+        '2["player_acted",{"n":1}]',
+        '2["game_state_public",{"n":2}]',
+        '2["player_acted",{"n":2}]',
+    ]
+    assert outbound.depth("slow") == 0
+    assert not outbound.is_congested("slow")
+
+
+@pytest.mark.asyncio
+async def test_disconnects_consumer_over_hard_limit(sio):
+    outbound = OutboundQueues(sio, soft_limit=0, hard_limit=2, grace=0, poll_interval=0.01)
+    _stall(sio, "slow", packets=1)
+
+    for n in range(4):
+        await outbound.send("slow", f"event_{n}", _frames(sio, f"event_{n}", n))
+    await asyncio.sleep(0.03)
+
+    sio.eio.sockets["eio-slow"].close.assert_awaited_once_with(wait=False, abort=True)
+    assert get_metrics().get_counter("socket.slow_disconnects") == 1
+    assert outbound.depth("slow") == 0
+
+
+@pytest.mark.asyncio
+async def test_manager_routes_plain_emits_of_congested_sids(sio):
+    sio.emit = AsyncMock()
+    mgr = WebSocketManager(sio, MagicMock())
+    mgr.outbound = OutboundQueues(sio, soft_limit=1, poll_interval=10)
+    mgr.user_sessions = {"slow": {"room_id": 1, "user_id": 1}, "ok": {"room_id": 1, "user_id": 2}}
+    _stall(sio, "slow")
+
+    await mgr.emit_to_room(1, "nsf_counter_tick", {"remaining": 3})
+    await mgr.emit_to_room(1, "nsf_counter_tick", {"remaining": 2})
+    await mgr.emit_to_sid("slow", "select_own_secret", {"x": 1})
+
+    assert sio.emit.await_args_list[0].kwargs == {"room": "game_1", "skip_sid": ["slow"]}
+    assert mgr.outbound.depth("slow") == 2
+
+    await mgr.leave_game_room("slow")
+    assert mgr.outbound.depth("slow") == 0
@@ -338,13 +338,13 @@ class TestPlayDetectiveSetRoute:
             route_mod.SessionLocal = original_sessionlocal
 
     def test_build_game_state_exception_is_handled(self, client, setup_game_data, monkeypatch):
-        """Force build_complete_game_state to raise and ensure route still returns 200"""
+        """A game state builder that raises at flush must not break the route"""
         from app.routes import play_detective_set as route_mod
 
-        def boom(*args, **kwargs):
+        def boom():
             raise RuntimeError("boom")
 
-        monkeypatch.setattr(route_mod, "build_complete_game_state", boom)
+        monkeypatch.setattr(route_mod, "game_state_builder", lambda game_id: boom)
 
         data = setup_game_data
         resp = client.post(
@@ -0,0 +1,124 @@
+"""
+Tests para el profiling opcional por request / evento de socket.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.config import settings
+from app.services import profiling
+from app.services.profiling import (
+    ProfilingMiddleware,
+    get_report,
+    make_profile_token,
+    profiled,
+    verify_profile_token,
+)
+
+engine = create_engine("sqlite:///:memory:")
+
+
+@pytest.fixture(autouse=True)
+def profiling_settings(monkeypatch):
+    monkeypatch.setattr(settings, "SECRET_KEY", "test-secret-key-123")
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", False)
+    profiling.clear_reports()
+    yield
+    profiling.clear_reports()
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware)
+
+    @app.get("/slow")
+    async def slow():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_token_roundtrip_and_tampering():
+    token = make_profile_token()
+    assert verify_profile_token(token)
+    assert not verify_profile_token(token + "x")
+    assert not verify_profile_token("garbage")
+    assert not verify_profile_token(None)
+    assert not verify_profile_token(make_profile_token(ttl_seconds=-10))
+
+
+def test_token_invalid_without_secret(monkeypatch):
+    token = make_profile_token()
+    monkeypatch.setattr(settings, "SECRET_KEY", "")
+    assert not verify_profile_token(token)
+
+
+def test_request_without_token_is_not_profiled(client):
+    response = client.get("/slow")
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+
+
+def test_signed_header_profiles_request(client):
+    response = client.get("/slow", headers={"X-Profile-Token": make_profile_token()})
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    report_id = response.headers["x-profile-id"]
+    assert "sql=2" in response.headers["x-profile-summary"]
+
+    report = get_report(report_id)
+    assert report["label"] == "GET /slow"
+    assert report["sql_count"] == 2
+    assert report["top"]
+    assert report["wall_ms"] >= 0
+
+
+def test_invalid_header_is_ignored(client):
+    response = client.get("/slow", headers={"X-Profile-Token": "123.bad"})
+    assert "x-profile-id" not in response.headers
+
+
+def test_env_flag_profiles_everything(client, monkeypatch):
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    response = client.get("/slow")
+    assert get_report(response.headers["x-profile-id"]) is not None
+
+
+def test_debug_route_returns_report(client):
+    from app.routes.debug import get_profile_report
+    from fastapi import HTTPException
+    import asyncio
+
+    response = client.get("/slow", headers={"X-Profile-Token": make_profile_token()})
+    report = asyncio.run(get_profile_report(response.headers["x-profile-id"]))
+    assert report["sql_count"] == 2
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(get_profile_report("missing"))
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_profiled_socket_handler(monkeypatch):
+    calls = []
+
+    @profiled("socket:test")
+    async def handler(sid):
+        calls.append(sid)
+        return True
+
+    assert await handler("sid-1") is True
+    assert profiling._reports == {}
+
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    assert await handler("sid-2") is True
+    assert calls == ["sid-1", "sid-2"]
+    (report,) = profiling._reports.values()
+    assert report["label"] == "socket:test"
@@ -0,0 +1,181 @@
+"""
+Tests para el replay binario de partidas (codec, lector y exportación).
+"""
+
+import pytest
+from collections import Counter
+from datetime import date, datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db import models, crud
+from app.db.database import Base
+from app.services.game_archive import archive_game
+from app.services.replay import (
+    ReplayFormatError,
+    ReplayWriter,
+    export_replay,
+    read_replay,
+    read_uvarint,
+    record_initial_deal,
+    write_uvarint,
+)
+
+engine = create_engine(
+    "sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+def test_uvarint_roundtrip():
+    for value in (0, 1, 127, 128, 300, 2**31, 2**40 + 5):
+        buf = bytearray()
+        write_uvarint(buf, value)
+        assert read_uvarint(bytes(buf), 0) == (value, len(buf))
+    with pytest.raises(ReplayFormatError):
+        read_uvarint(b"\x80", 0)
+
+
+def test_writer_reader_roundtrip_with_nulls_and_negatives():
+    writer = ReplayWriter()
+    writer.header(7, None)
+    writer.card({"id": 1, "id_card": 20, "is_in": models.CardState.REMOVED,
+                 "position": -1, "player_id": None, "hidden": False})
+    action = {name: None for name in (
+        "id", "parent_action_id", "triggered_by_action_id", "turn_id", "player_id",
+        "action_time", "action_name", "action_type", "result", "player_source",
+        "player_target", "secret_target", "selected_card_id", "card_given_id",
+        "card_received_id", "direction", "source_pile", "position_card",
+        "selected_set_id", "to_be_hidden",
+    )}
+    action.update(id=5, player_id=3, action_name="Custom", action_type=models.ActionType.DRAW,
+                  action_time=datetime(2025, 1, 2, 3, 4, 5), to_be_hidden=True)
+    writer.action(action)
+    writer.action(dict(action, id=6))
+    writer.end()
+    data = writer.take()
+
+    replay = read_replay(data)
+    assert (replay.game_id, replay.room_id) == (7, None)
+    assert replay.deal == [{"id": 1, "id_card": 20, "is_in": "REMOVED",
+                            "position": -1, "player_id": None, "hidden": False}]
+    assert [a["id"] for a in replay.actions] == [5, 6]
+    assert replay.actions[0]["action_type"] == "DRAW"
+    assert replay.actions[0]["to_be_hidden"] is True
+    assert replay.actions[0]["parent_action_id"] is None
+    # Los strings repetidos se internan: la segunda acción no los reescribe
+    assert data.count(b"Custom") == 1
+
+    with pytest.raises(ReplayFormatError):
+        read_replay(b"XXXX")
+    with pytest.raises(ReplayFormatError):
+        read_replay(data[:-1])
+
+
+@pytest.fixture
+def finished_game(db):
+    game = crud.create_game(db, {})
+    room = crud.create_room(db, {"name": "Replay", "status": models.RoomStatus.INGAME, "id_game": game.id})
+    players = [
+        crud.create_player(db, {
+            "name": f"P{i}", "avatar_src": "a.png", "birthdate": date(2000, 1, 1),
+            "id_room": room.id, "is_host": i == 1, "order": i,
+        })
+        for i in (1, 2)
+    ]
+    p1 = players[0].id
+    # Ids de catálogo distintos de los CardsXGame.id para que el replay los traduzca
+    db.add_all([models.Card(id=i, name=f"C{i}", description="d", type="EVENT", img_src="c.png", qty=5)
+                for i in (11, 12, 13)])
+    cards = [
+        models.CardsXGame(id_game=game.id, id_card=11, is_in=models.CardState.HAND, position=1, player_id=p1),
+        models.CardsXGame(id_game=game.id, id_card=12, is_in=models.CardState.DECK, position=1),
+        models.CardsXGame(id_game=game.id, id_card=13, is_in=models.CardState.DECK, position=2),
+    ]
+    db.add_all(cards)
+    turn = models.Turn(number=1, id_game=game.id, player_id=p1, status=models.TurnStatus.IN_PROGRESS)
+    db.add(turn)
+    db.commit()
+    record_initial_deal(db, game.id)
+
+    # Robar la carta 2 del mazo y descartar la carta 1
+    draw = crud.create_parent_card_action(db, game.id, turn.id, p1, models.ActionType.DRAW,
+                                          models.ActionName.DRAW_FROM_DECK, models.SourcePile.DRAW_PILE)
+    crud.create_card_action(db, game.id, turn.id, p1, models.ActionType.DRAW,
+                            models.SourcePile.DRAW_PILE, card_id=cards[1].id, position=1,
+                            parent_action_id=draw.id, deferred=True)
+    db.commit()  # cada comando commitea: las hijas quedan justo después de su padre
+    discard = crud.create_parent_card_action(db, game.id, turn.id, p1, models.ActionType.DISCARD,
+                                             models.ActionName.END_TURN_DISCARD, models.SourcePile.DISCARD_PILE)
+    crud.create_card_action(db, game.id, turn.id, p1, models.ActionType.DISCARD,
+                            models.SourcePile.DISCARD_PILE, card_id=cards[0].id, position=1,
+                            parent_action_id=discard.id, deferred=True)
+    cards[0].is_in = models.CardState.DISCARD
+    cards[0].player_id = None
+    cards[1].is_in = models.CardState.HAND
+    cards[1].player_id = p1
+    room.status = models.RoomStatus.FINISH
+    db.commit()
+    return {"room": room, "game_id": game.id, "p1": p1}
+
+
+def test_replay_rebuilds_intermediate_states(db, finished_game):
+    p1 = finished_game["p1"]
+    replay = read_replay(export_replay(db, finished_game["room"]))
+
+    assert replay.game_id == finished_game["game_id"]
+    assert [p["name"] for p in replay.players] == ["P1", "P2"]
+    assert len(replay.deal) == 3
+    assert len(replay.actions) == 4
+
+    start = replay.state_at(0)
+    assert start.hands[p1] == Counter({11: 1})
+    assert start.deck_count == 2
+
+    after_draw = replay.state_at(2)
+    assert after_draw.hands[p1] == Counter({11: 1, 12: 1})
+    assert after_draw.deck_count == 1
+
+    end = replay.state_at()
+    assert +end.hands[p1] == Counter({12: 1})
+    assert end.discard == [11]
+    assert end.applied == 4
+
+
+def test_replay_identical_after_archiving(db, finished_game):
+    before = export_replay(db, finished_game["room"])
+    archive_game(db, finished_game["game_id"])
+    db.commit()
+
+    assert export_replay(db, finished_game["room"]) == before
+
+
+def test_replay_route_streams_binary(db, finished_game):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.routes.history import get_db
+
+    expected = export_replay(db, finished_game["room"])
+    room_id = finished_game["room"].id
+
+    def _get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = _get_db
+    try:
+        response = TestClient(app).get(f"/api/game/{room_id}/replay")
+        assert response.status_code == 200
+        assert response.content == expected
+        assert response.headers["content-type"] == "application/x-dotc-replay"
+    finally:
+        app.dependency_overrides.pop(get_db, None)
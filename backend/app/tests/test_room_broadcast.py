@@ -0,0 +1,148 @@
+"""
+Tests para el agrupamiento de broadcasts por sala (sockets/room_broadcast.py).
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.metrics import get_metrics
+from app.sockets.room_broadcast import RoomBroadcastScheduler
+from app.sockets.socket_manager import WebSocketManager
+
+
+@pytest.fixture
+def mgr():
+    sio = MagicMock()
+    sio.emit = AsyncMock()
+    manager = WebSocketManager(sio, MagicMock())
+    manager.scheduler = RoomBroadcastScheduler(window=0.01)
+    manager.user_sessions = {"s1": {"room_id": 1, "user_id": 10}, "s2": {"room_id": 2, "user_id": 20}}
+    return manager
+
+
+def _sent(mgr):
+    return [call.args[0] for call in mgr.sio.emit.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_superseded_states_dropped_and_events_keep_order(mgr):
+    get_metrics().reset()
+    scheduler = mgr.scheduler
+
+    scheduler.schedule_state(1, lambda: mgr.emit_to_room(1, "state", {"n": 1}))
+    await mgr.emit_to_room(1, "nsf_counter_start", {})
+    await mgr.emit_to_sid("s1", "card_drawn", {})
+    scheduler.schedule_state(1, lambda: mgr.emit_to_room(1, "state", {"n": 2}))
+    await mgr.emit_to_room(1, "disgrace", {})
+    assert _sent(mgr) == []
+
+    await asyncio.sleep(0.05)
+
+    assert _sent(mgr) == ["nsf_counter_start", "card_drawn", "state", "disgrace"]
+    state_call = mgr.sio.emit.await_args_list[2]
+    assert state_call.args[1]["n"] == 2
+    assert get_metrics().get_counter("socket.states_coalesced") == 1
+    assert not scheduler.is_pending(1)
+    get_metrics().reset()
+
+
+@pytest.mark.asyncio
+async def test_idle_rooms_emit_directly(mgr):
+    mgr.scheduler.schedule_state(1, lambda: mgr.emit_to_room(1, "state", {}))
+
+    await mgr.emit_to_room(2, "other_room", {})
+    await mgr.emit_to_sid("s2", "private", {})
+    assert _sent(mgr) == ["other_room", "private"]
+
+    await mgr.scheduler.flush_all()
+    assert _sent(mgr) == ["other_room", "private", "state"]
+
+
+@pytest.mark.asyncio
+async def test_events_enqueued_during_flush_are_delivered_in_same_pass(mgr):
+    gate = asyncio.Event()
+
+    async def _slow_state():
+        await gate.wait()
+        await mgr.emit_to_room(1, "state", {})
+
+    mgr.scheduler.schedule_state(1, _slow_state)
+    flushing = asyncio.ensure_future(mgr.scheduler.flush(1))
+    await asyncio.sleep(0)
+
+    # Otro request emite mientras se entrega la cola: sale detrás
+    await mgr.emit_to_room(1, "late_event", {})
+    gate.set()
+    await flushing
+
+    assert _sent(mgr) == ["state", "late_event"]
+    assert not mgr.scheduler.is_pending(1)
+
+
+@pytest.mark.asyncio
+async def test_service_schedules_full_state_when_enabled(mgr, monkeypatch):
+    from app.sockets import socket_service
+    monkeypatch.setattr(socket_service, "get_ws_manager", lambda: mgr)
+    service = socket_service.WebSocketService()
+    game_state = {"game_id": 1, "jugadores": [], "mazos": {},
+                  "estados_privados": {10: {"mano": [], "secretos": []}}}
+
+    await service.notificar_estado_partida(1, game_state=game_state)
+    await service.notificar_estado_partida(1, game_state=dict(game_state, turno_actual=10))
+    assert _sent(mgr) == []
+
+    mgr._send_frames = AsyncMock()
+    await mgr.scheduler.flush_all()
+
+    events = [call.args[1] for call in mgr._send_frames.await_args_list]
+    assert events == ["game_state_public", "game_state_private"]
+    assert mgr._send_frames.await_args_list[0].args[2]["turno_actual"] == 10
+
+
+@pytest.mark.asyncio
+async def test_service_builds_lazy_state_once_per_window_off_the_loop(mgr, monkeypatch):
+    import threading
+    from app.sockets import socket_service
+    monkeypatch.setattr(socket_service, "get_ws_manager", lambda: mgr)
+    service = socket_service.WebSocketService()
+    loop_thread = threading.get_ident()
+    builds = []
+
+    def builder(n):
+        def build():
+            builds.append((n, threading.get_ident()))
+            return {"game_id": 1, "jugadores": [], "mazos": {}, "turno_actual": n}
+        return build
+
+    for n in range(3):
+        await service.notificar_estado_partida(1, game_state=builder(n))
+    assert builds == []
+
+    mgr._send_frames = AsyncMock()
+    await mgr.scheduler.flush_all()
+
+    assert [n for n, _ in builds] == [2]
+    assert builds[0][1] != loop_thread
+    assert mgr._send_frames.await_args_list[0].args[2]["turno_actual"] == 2
+
+
+@pytest.mark.asyncio
+async def test_service_drops_pending_state_once_the_game_ended(mgr, monkeypatch):
+    from app.sockets import socket_service
+    from app.sockets.frames import get_state_frames
+    monkeypatch.setattr(socket_service, "get_ws_manager", lambda: mgr)
+    service = socket_service.WebSocketService()
+    build = MagicMock(return_value={"game_id": 1, "jugadores": [], "mazos": {}})
+
+    await service.notificar_estado_partida(1, game_state=build)
+    await mgr.emit_to_room(1, "game_ended", {})
+    get_state_frames().discard_room(1)
+
+    mgr._send_frames = AsyncMock()
+    await mgr.scheduler.flush_all()
+
+    build.assert_not_called()
+    mgr._send_frames.assert_not_awaited()
+    assert _sent(mgr) == ["game_ended"]
+    assert get_state_frames().latest_public(1) is None
@@ -0,0 +1,66 @@
+"""
+Tests para el SeatRing (orden circular de la mesa) y su registro.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.db.models import Direction
+from app.services.seat_ring import SeatRing, SeatRingRegistry
+
+
+def _players(*ids):
+    return [SimpleNamespace(id=pid) for pid in ids]
+
+
+def test_next_prev_wrap_around():
+    ring = SeatRing(1, [10, 20, 30, 40])
+
+    assert ring.next(20) == 30
+    assert ring.next(40) == 10
+    assert ring.prev(20) == 10
+    assert ring.prev(10) == 40
+    assert ring.neighbor(30, Direction.LEFT) == 20
+    assert ring.neighbor(30, Direction.RIGHT) == 40
+    assert ring.next(99) is None
+    assert 30 in ring and 99 not in ring
+
+
+def test_rotation_maps_every_seat():
+    ring = SeatRing(1, [10, 20, 30])
+
+    assert ring.rotation(Direction.RIGHT) == {10: 20, 20: 30, 30: 10}
+    assert ring.rotation(Direction.LEFT) == {10: 30, 20: 10, 30: 20}
+
+
+def test_single_seat_has_no_neighbors():
+    ring = SeatRing(1, [10])
+
+    assert ring.next(10) is None
+    assert ring.prev(10) is None
+    assert ring.rotation(Direction.LEFT) == {}
+
+
+def test_registry_ensure_loads_once_and_invalidates():
+    registry = SeatRingRegistry()
+    db = MagicMock()
+    db.query.return_value.filter.return_value.order_by.return_value.all.return_value = _players(3, 1, 2)
+
+    ring = registry.ensure(db, 7)
+    assert ring.seats == (3, 1, 2)
+    assert registry.ensure(db, 7) is ring
+    assert db.query.call_count == 1
+
+    registry.invalidate(7)
+    assert registry.get(7) is None
+    registry.ensure(db, 7)
+    assert db.query.call_count == 2
+
+
+def test_registry_build_replaces_ring():
+    registry = SeatRingRegistry()
+    registry.build(7, _players(1, 2))
+    ring = registry.build(7, _players(2, 1))
+
+    assert registry.get(7) is ring
+    assert ring.next(2) == 1
@@ -0,0 +1,137 @@
+import random
+from collections import Counter
+
+import pytest
+
+from app.schemas.detective_set_schema import SetType
+from app.services import game_rules
+from app.services.game_rules import NSF_CANCELLED, NSF_CONTINUE, deal_cards, nsf_chain_result
+from app.simulator import SimGame, SimulationReport, load_catalog, play_game, run_simulations
+from app.simulator.engine import MURDERER_CAUGHT, MURDERER_ESCAPED, TOTAL_DISGRACE, TURN_LIMIT
+
+CATALOG = load_catalog()
+BY_NAME = {card.name: card for card in CATALOG}
+
+
+# ---------- catálogo y reglas ----------
+
+def test_catalog_ids_match_service_constants():
+    assert BY_NAME["Harley Quin Wildcard"].id == game_rules.HARLEY_QUIN_CARD_ID
+    assert BY_NAME["Not so fast"].id == game_rules.NOT_SO_FAST_CARD_ID
+    assert BY_NAME["Cards off the table"].id == game_rules.CARDS_OFF_THE_TABLE_CARD_ID
+    assert BY_NAME["Hercule Poirot"].id == game_rules.SET_CARD_IDS[SetType.POIROT]
+
+
+def test_nsf_chain_result_parity():
+    assert [nsf_chain_result(n) for n in range(4)] == [NSF_CONTINUE, NSF_CANCELLED, NSF_CONTINUE, NSF_CANCELLED]
+
+
+def test_set_cancellable_only_without_both_beresfords():
+    assert not game_rules.is_set_cancellable([8, 10])
+    assert game_rules.is_set_cancellable([8, 4])
+    assert not game_rules.is_event_cancellable(game_rules.CARDS_OFF_THE_TABLE_CARD_ID)
+
+
+# ---------- reparto ----------
+
+@pytest.mark.parametrize("players", [2, 4, 5, 6])
+def test_deal_cards_sizes_roles_and_conservation(players):
+    deal = deal_cards(CATALOG, players, random.Random(players))
+
+    assert all(len(hand) == 6 for hand in deal.hands)
+    assert all(sum(c.type == "INSTANT" for c in hand) == 1 for hand in deal.hands)
+    assert all(len(secrets) == 3 for secrets in deal.secrets)
+    assert BY_NAME["You are the Murderer!!"] in deal.secrets[deal.murderer]
+    if players >= 5:
+        assert deal.accomplice not in (None, deal.murderer)
+        assert BY_NAME["You are the Accomplice!"] in deal.secrets[deal.accomplice]
+    else:
+        assert deal.accomplice is None
+
+    # Mazo + descarte = copias no secretas del catálogo menos lo repartido
+    # (cada mano sale del catálogo completo, así que se descuenta hasta agotar)
+    excluded = {"Card Back", "Murderer Escapes!"}
+    if players == 2:
+        excluded |= game_rules.TWO_PLAYER_EXCLUDED_NAMES
+    copies = Counter({c.id: c.qty for c in CATALOG if c.type != "SECRET" and c.name not in excluded})
+    dealt = Counter(c.id for c in [*sum(deal.hands, []), *deal.draft])
+    assert Counter(c.id for c in [deal.discard, *deal.deck]) == copies - dealt
+
+
+def test_deal_cards_two_players_excludes_point_and_blackmailed():
+    deal = deal_cards(CATALOG, 2, random.Random(3))
+    names = {c.name for c in [*sum(deal.hands, []), *deal.draft, *deal.deck]}
+    assert not names & game_rules.TWO_PLAYER_EXCLUDED_NAMES
+
+
+# ---------- motor ----------
+
+def test_play_game_is_reproducible_with_a_seed():
+    first = play_game(CATALOG, 4, random.Random(11))
+    second = play_game(CATALOG, 4, random.Random(11))
+
+    assert first == second
+    assert first.outcome in (MURDERER_CAUGHT, MURDERER_ESCAPED, TOTAL_DISGRACE)
+    assert first.actions["finish_turn"] <= first.turns == first.actions["discard"]
+
+
+def test_nsf_window_follows_chain_parity():
+    game = SimGame(CATALOG, 3, random.Random(1), nsf_rate=1.0)
+    nsf = [{"id": 900 + i, "card_id": game_rules.NOT_SO_FAST_CARD_ID} for i in range(3)]
+    game.hands = [[nsf[0]], [nsf[1]], [nsf[2]]]
+
+    # Un rival cancela, el dueño contra-NSF, el otro rival vuelve a cancelar
+    assert not game.nsf_window(0, cancellable=True)
+    assert game.actions["nsf"] == 3 and game.actions["cancel_action"] == 1
+    assert game.hands == [[], [], []]
+
+    game.hands[1].append(nsf[1])
+    assert game.nsf_window(0, cancellable=False)
+    assert game.hands[1] == [nsf[1]]
+
+
+def test_revealing_the_murderer_ends_the_game():
+    game = SimGame(CATALOG, 4, random.Random(2))
+    murderer_secret = next(
+        s for s in game.secrets[game.murderer] if s["card_id"] == game.murderer_card_id
+    )
+
+    game.reveal(murderer_secret)
+
+    assert game.outcome == MURDERER_CAUGHT
+
+
+def test_turn_limit_stops_the_game():
+    result = play_game(CATALOG, 4, random.Random(5), max_turns=3)
+    assert result.outcome == TURN_LIMIT and result.turns == 3
+
+
+# ---------- corridas ----------
+
+def test_run_simulations_same_report_in_process_and_pool(monkeypatch):
+    monkeypatch.setattr("app.simulator.runner.CHUNK_SIZE", 50)
+
+    local = run_simulations(120, players=4, workers=1, seed=9)
+    pooled = run_simulations(120, players=4, workers=2, seed=9)
+
+    assert local.games == pooled.games == 120
+    assert local.outcomes == pooled.outcomes
+    assert local.turns == pooled.turns
+    assert local.actions == pooled.actions
+
+
+def test_report_summary_percentiles_and_rates():
+    report = SimulationReport(players=4)
+    for turns in (10, 10, 20, 30):
+        report.add(MURDERER_ESCAPED if turns < 30 else MURDERER_CAUGHT, turns, Counter(discard=turns))
+
+    summary = report.summary()
+
+    assert summary["turns"] == {"mean": 17.5, "p50": 10, "p90": 30, "p99": 30, "max": 30}
+    assert summary["detectives_win"] == 0.25
+    assert summary["actions_per_turn"]["discard"] == 1.0
+
+
+def test_run_simulations_unknown_strategy():
+    with pytest.raises(ValueError):
+        run_simulations(1, strategy="nope")
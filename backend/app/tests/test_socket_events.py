@@ -113,3 +113,60 @@ async def test_disconnect_exception(mock_sio):
         disconnect = mock_sio.event.call_args_list[1][0][0]
         await disconnect("sid-error")
         ws_manager.return_value.leave_game_room.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_connect_negotiates_msgpack(mock_sio, mock_ws_manager):
+    with patch("app.sockets.socket_events.get_ws_manager", return_value=mock_ws_manager), \
+         patch("app.sockets.socket_events.SessionLocal") as mock_db:
+        mock_db.return_value.query.return_value.filter.return_value.first.return_value = MagicMock()
+
+        socket_events.register_events(mock_sio)
+        connect = mock_sio.event.call_args_list[0][0][0]
+        result = await connect("sid9", {"QUERY_STRING": "user_id=1&room_id=10&encoding=msgpack"})
+
+        assert result is True
+        mock_ws_manager.set_encoding.assert_called_once_with("sid9", "msgpack")
+        args, _ = mock_sio.emit.await_args_list[-1]
+        assert args[1]["encoding"] == "msgpack"
+
+
+@pytest.mark.asyncio
+async def test_connect_with_last_seq_resumes_instead_of_joining(mock_sio, mock_ws_manager):
+    mock_ws_manager.resume_game_room = AsyncMock(return_value="events")
+    with patch("app.sockets.socket_events.get_ws_manager", return_value=mock_ws_manager), \
+         patch("app.sockets.socket_events.SessionLocal") as mock_db:
+        mock_db.return_value.query.return_value.filter.return_value.first.return_value = MagicMock()
+
+        socket_events.register_events(mock_sio)
+        connect = mock_sio.event.call_args_list[0][0][0]
+        result = await connect("sid9", {"QUERY_STRING": "user_id=1&room_id=10&last_seq=7&epoch=abc"})
+
+        assert result is True
+        mock_ws_manager.resume_game_room.assert_awaited_once_with("sid9", 10, 1, "abc", 7)
+        mock_ws_manager.join_game_room.assert_not_awaited()
+        args, _ = mock_sio.emit.await_args_list[-1]
+        assert args[0] == "connected"
+        assert args[1]["resumed"] == "events"
+        assert "epoch" in args[1] and "seq" in args[1]
+
+
+@pytest.mark.asyncio
+async def test_connect_validates_active_rooms_without_db(mock_sio, mock_ws_manager):
+    from app.db.models import RoomStatus
+    from app.services.lobby_directory import get_lobby_directory
+    directory = get_lobby_directory()
+    directory.loaded = True
+    room = MagicMock(id=10, players_min=2, players_max=6, status=RoomStatus.INGAME, id_game=1)
+    room.name = "Sala"
+    directory.upsert_room(room, [])
+
+    with patch("app.sockets.socket_events.get_ws_manager", return_value=mock_ws_manager), \
+         patch("app.sockets.socket_events.SessionLocal") as mock_db:
+        socket_events.register_events(mock_sio)
+        connect = mock_sio.event.call_args_list[0][0][0]
+        result = await connect("sid1", {"QUERY_STRING": "user_id=1&room_id=10"})
+
+        assert result is True
+        mock_db.assert_not_called()
+        mock_ws_manager.join_game_room.assert_awaited_once_with("sid1", 10, 1)
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 import logging
 
+from app.sockets.event_log import get_room_event_logs
 from app.sockets.socket_manager import (
     WebSocketManager,
     get_ws_manager,
@@ -147,14 +148,16 @@ async def test_get_room_participants_empty(mock_sio, mock_db_factory):
 async def test_emit_to_room_with_players(mock_sio, mock_db_factory):
     mgr = WebSocketManager(mock_sio, mock_db_factory)
     mgr.user_sessions = {"s1": {"room_id": 5}}
+    get_room_event_logs().ensure(5)
     await mgr.emit_to_room(5, "eventX", {"x": 1})
-    mock_sio.emit.assert_awaited_once_with("eventX", {"x": 1}, room="game_5")
+    # Los eventos de sala llevan su número de secuencia
+    mock_sio.emit.assert_awaited_once_with("eventX", {"x": 1, "seq": 1}, room="game_5")
 
 
 @pytest.mark.asyncio
-async def test_emit_to_room_empty_warns(mock_sio, mock_db_factory, caplog):
+async def test_emit_to_room_empty_logs(mock_sio, mock_db_factory, caplog):
     mgr = WebSocketManager(mock_sio, mock_db_factory)
-    caplog.set_level(logging.WARNING)
+    caplog.set_level(logging.DEBUG)
     await mgr.emit_to_room(9, "event", {})
     assert "vacía" in caplog.text
     mock_sio.emit.assert_not_awaited()
@@ -165,3 +168,226 @@ async def test_emit_to_sid(mock_sio, mock_db_factory):
     mgr = WebSocketManager(mock_sio, mock_db_factory)
     await mgr.emit_to_sid("sid123", "private_evt", {"ok": True})
     mock_sio.emit.assert_awaited_once_with("private_evt", {"ok": True}, to="sid123")
+
+
+# ---------------------------------------------------------------------
+# msgpack por conexión
+# ---------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_emit_to_room_mixed_encodings(mock_sio, mock_db_factory):
+    from app.sockets import wire_format
+    mgr = WebSocketManager(mock_sio, mock_db_factory)
+    mgr.user_sessions = {"s1": {"room_id": 5}, "s2": {"room_id": 5}, "s3": {"room_id": 5}}
+    mgr.set_encoding("s2", wire_format.MSGPACK)
+    mgr.set_encoding("s3", wire_format.MSGPACK)
+    get_room_event_logs().ensure(5)
+
+    await mgr.emit_to_room(5, "eventX", {"x": 1})
+
+    calls = mock_sio.emit.await_args_list
+    assert calls[0].args == ("eventX", {"x": 1, "seq": 1})
+    assert calls[0].kwargs == {"room": "game_5", "skip_sid": ["s2", "s3"]}
+    assert [c.kwargs["to"] for c in calls[1:]] == ["s2", "s3"]
+    assert wire_format.unpack(calls[1].args[1]) == {"x": 1, "seq": 1}
+
+
+@pytest.mark.asyncio
+async def test_emit_to_sid_msgpack_and_leave_resets(mock_sio, mock_db_factory):
+    from app.sockets import wire_format
+    mgr = WebSocketManager(mock_sio, mock_db_factory)
+    mgr.user_sessions = {"sid1": {"room_id": 5, "user_id": 1}}
+    mgr.set_encoding("sid1", wire_format.MSGPACK)
+
+    await mgr.emit_to_sid("sid1", "private_evt", {"ok": True})
+    packed = mock_sio.emit.await_args.args[1]
+    assert isinstance(packed, bytes)
+    assert wire_format.unpack(packed) == {"ok": True}
+
+    await mgr.leave_game_room("sid1")
+    assert mgr.get_encoding("sid1") == wire_format.JSON
+
+
+def test_negotiate_encoding(monkeypatch):
+    from app.sockets import wire_format
+    assert wire_format.negotiate_encoding(None) == wire_format.JSON
+    assert wire_format.negotiate_encoding("json") == wire_format.JSON
+    assert wire_format.negotiate_encoding("MsgPack") == wire_format.MSGPACK
+
+    monkeypatch.setattr(wire_format, "msgpack", None)
+    assert wire_format.negotiate_encoding("msgpack") == wire_format.JSON
+
+
+# ---------------------------------------------------------------------
+# Emits privados en paralelo
+# ---------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_emit_many_slow_socket_does_not_block_others(mock_sio, mock_db_factory):
+    import asyncio
+    from app.services.metrics import get_metrics
+    get_metrics().reset()
+    delivered = []
+
+    async def _emit(event, data, to=None):
+        if to == "slow":
+            await asyncio.sleep(10)
+        delivered.append(to)
+
+    mock_sio.emit = AsyncMock(side_effect=_emit)
+    mgr = WebSocketManager(mock_sio, mock_db_factory)
+    mgr.user_sessions = {"slow": {"room_id": 5, "user_id": 1}, "a": {"room_id": 5, "user_id": 2}}
+
+    await asyncio.wait_for(
+        mgr.emit_many([(sid, "evt", {"n": i}) for i, sid in enumerate(["slow", "a", "b"])],
+                      concurrency=2, timeout=0.05),
+        timeout=1,
+    )
+
+    assert delivered == ["a", "b"]
+    assert mgr.emit_stats["slow"]["timeouts"] == 1
+    assert mgr.emit_stats["a"]["count"] == 1
+    assert get_metrics().get_counter("socket.emit_timeouts") == 1
+    assert get_metrics().summaries["socket.emit_ms"]["count"] == 2
+    assert mgr.slowest_consumers(1)[0]["sid"] == "slow"
+    assert mgr.slowest_consumers(1)[0]["user_id"] == 1
+
+    await mgr.leave_game_room("slow")
+    assert "slow" not in mgr.emit_stats
+    get_metrics().reset()
+
+
+@pytest.mark.asyncio
+async def test_emit_many_respects_concurrency_bound(mock_sio, mock_db_factory):
+    import asyncio
+    in_flight = {"now": 0, "max": 0}
+
+    async def _emit(event, data, to=None):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+
+    mock_sio.emit = AsyncMock(side_effect=_emit)
+    mgr = WebSocketManager(mock_sio, mock_db_factory)
+
+    await mgr.emit_many([(f"s{i}", "evt", {}) for i in range(6)], concurrency=2, timeout=1)
+
+    assert mock_sio.emit.await_count == 6
+    assert in_flight["max"] == 2
+
+
+@pytest.mark.asyncio
+async def test_emit_many_deferred_behind_pending_flush_is_timed_at_delivery(mock_sio, mock_db_factory):
+    import asyncio
+    from app.sockets.room_broadcast import RoomBroadcastScheduler
+
+    async def _emit(event, data, to=None):
+        if to == "slow":
+            await asyncio.sleep(10)
+
+    mock_sio.emit = AsyncMock(side_effect=_emit)
+    mgr = WebSocketManager(mock_sio, mock_db_factory)
+    mgr.scheduler = RoomBroadcastScheduler(window=10)
+    mgr.user_sessions = {"slow": {"room_id": 5, "user_id": 1}, "a": {"room_id": 5, "user_id": 2}}
+    mgr.scheduler.schedule_state(5, AsyncMock())
+
+    await mgr.emit_many([("slow", "evt", {}), ("a", "evt", {})], timeout=0.05)
+    # Encolada detrás del estado: todavía no salió ni se midió nada
+    mock_sio.emit.assert_not_awaited()
+    assert mgr.emit_stats == {}
+
+    await mgr.scheduler.flush(5)
+
+    assert mgr.emit_stats["slow"]["timeouts"] == 1
+    assert mgr.emit_stats["a"]["count"] == 1
+
+
+# ---------------------------------------------------------------------
+# Conexiones agrupadas y roster desde el directorio
+# ---------------------------------------------------------------------
+
+def _load_directory_room(room_id, n_players):
+    from app.db.models import RoomStatus
+    from app.services.lobby_directory import get_lobby_directory
+    directory = get_lobby_directory()
+    directory.loaded = True
+    players = [MagicMock(id=i, avatar_src=f"{i}.png", is_host=i == 1, order=n_players - i)
+               for i in range(1, n_players + 1)]
+    for p in players:
+        p.name = f"P{p.id}"
+    room = MagicMock(id=room_id, players_min=2, players_max=6,
+                     status=RoomStatus.INGAME, id_game=1)
+    room.name = "Sala"
+    directory.upsert_room(room, players)
+
+
+@pytest.mark.asyncio
+async def test_simultaneous_joins_share_one_roster_broadcast(mock_sio):
+    import asyncio
+    db_factory = MagicMock()
+    _load_directory_room(5, 6)
+    mgr = WebSocketManager(mock_sio, db_factory)
+    mgr.join_window = 0.01
+
+    for user_id in range(1, 7):
+        assert await mgr.join_game_room(f"sid{user_id}", 5, user_id) is True
+    assert mock_sio.emit.await_count == 0
+    await asyncio.sleep(0.05)
+
+    events = [c.args[0] for c in mock_sio.emit.await_args_list]
+    assert events == ["player_connected", "game_state_public"]
+    assert mock_sio.emit.await_args_list[0].args[1]["user_ids"] == [1, 2, 3, 4, 5, 6]
+    roster = mock_sio.emit.await_args_list[1].args[1]["jugadores"]
+    assert [p["id"] for p in roster] == [6, 5, 4, 3, 2, 1]  # ordenados por order
+    assert all("connected_at" in p for p in roster)
+    db_factory.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_join_without_window_broadcasts_immediately(mock_sio, mock_db_factory):
+    _load_directory_room(5, 2)
+    mgr = WebSocketManager(mock_sio, mock_db_factory)
+    mgr.join_window = 0
+
+    await mgr.join_game_room("sid1", 5, 1)
+
+    first = mock_sio.emit.await_args_list[0]
+    assert first.args[0] == "player_connected"
+    assert first.kwargs["skip_sid"] == "sid1"
+    assert [p["id"] for p in mock_sio.emit.await_args_list[1].args[1]["jugadores"]] == [1]
+
+
+@pytest.mark.asyncio
+async def test_roster_goes_through_room_queue(mock_sio, mock_db_factory):
+    from app.sockets.room_broadcast import RoomBroadcastScheduler
+    _load_directory_room(5, 2)
+    mgr = WebSocketManager(mock_sio, mock_db_factory)
+    mgr.join_window = 0
+    mgr.scheduler = RoomBroadcastScheduler(window=0.01)
+    mgr.scheduler.schedule_state(5, lambda: mgr.emit_to_room(5, "game_state_public", {"status": "INGAME"}))
+
+    await mgr.join_game_room("sid1", 5, 1)
+    assert [c.args[0] for c in mock_sio.emit.await_args_list] == ["player_connected"]
+
+    await mgr.scheduler.flush_all()
+    sent = [c.args[1] for c in mock_sio.emit.await_args_list[1:]]
+    assert [s["status"] for s in sent] == ["INGAME", "WAITING"]
+    assert sent[1]["seq"] > sent[0]["seq"]
+
+
+@pytest.mark.asyncio
+async def test_roster_skipped_once_the_game_state_exists(mock_sio, mock_db_factory):
+    from app.sockets.frames import get_state_frames
+    _load_directory_room(6, 2)
+    frames = get_state_frames()
+    frames.public(6, "game_state_public", {"game_id": 1, "jugadores": [], "mazos": {}})
+    mgr = WebSocketManager(mock_sio, mock_db_factory)
+    mgr.join_window = 0
+
+    try:
+        await mgr.join_game_room("sid1", 6, 1)
+    finally:
+        frames.discard_room(6)
+
+    assert [c.args[0] for c in mock_sio.emit.await_args_list] == ["player_connected"]
@@ -10,6 +10,14 @@ def mock_ws_manager():
     ws_manager = MagicMock()
     ws_manager.emit_to_room = AsyncMock()
     ws_manager.emit_to_sid = AsyncMock()
+
+    async def _emit_many(emits, **kwargs):
+        for sid, event, data in emits:
+            await ws_manager.emit_to_sid(sid, event, data)
+
+    ws_manager.emit_many = AsyncMock(side_effect=_emit_many)
+    # Sin agrupamiento por sala: los estados salen en el momento
+    ws_manager.scheduler = None
     ws_manager.get_sids_in_game = MagicMock(return_value=["sid1", "sid2"])
     ws_manager.get_user_session = MagicMock(side_effect=lambda sid: {"user_id": 1} if sid == "sid1" else {"user_id": 2})
     return ws_manager
@@ -0,0 +1,115 @@
+"""
+Tests para el modo espectador (estado público cacheado, sin Player).
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.db.models import RoomStatus
+from app.services.lobby_directory import get_lobby_directory
+from app.sockets import socket_events
+from app.sockets.frames import get_state_frames
+from app.sockets.socket_manager import WebSocketManager
+
+
+@pytest.fixture
+def mgr():
+    sio = MagicMock()
+    sio.emit = AsyncMock()
+    sio.enter_room = AsyncMock()
+    sio.leave_room = AsyncMock()
+    manager = WebSocketManager(sio, MagicMock())
+    manager.scheduler.window = 0
+    manager._send_frames = AsyncMock()
+    manager.user_sessions = {"p1": {"room_id": 1, "user_id": 10}}
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_spectator_gets_cached_public_state_and_no_private_events(mgr):
+    public = get_state_frames().public(1, "game_state_public", {"type": "game_state_public"})
+
+    await mgr.join_as_spectator("v1", 1, game_id=5)
+
+    assert mgr._send_frames.await_args.args == (["v1"], "game_state_public", public)
+    assert "v1" not in mgr.get_sids_in_game(1)
+    mgr.sio.enter_room.assert_awaited_once_with("v1", "game_1")
+
+    # El siguiente estado sale con los mismos frames para jugadores y espectadores
+    mgr._send_frames.reset_mock()
+    update = get_state_frames().public(1, "game_state_public", {"type": "game_state_public", "n": 2})
+    await mgr.emit_to_room(1, "game_state_public", update)
+    assert mgr._send_frames.await_args.args == (["p1", "v1"], "game_state_public", update)
+
+    await mgr.leave_spectator("v1")
+    assert mgr.get_spectator_sids(1) == []
+    mgr.sio.leave_room.assert_awaited_once_with("v1", "game_1")
+
+
+@pytest.mark.asyncio
+async def test_snapshot_built_once_for_many_spectators(mgr):
+    body = {"game_id": 5, "status": "INGAME", "jugadores": [], "mazos": {}}
+    with patch("app.services.game_status_service.build_complete_game_state",
+               return_value=body) as build:
+        for n in range(5):
+            await mgr.join_as_spectator(f"v{n}", 1, game_id=5)
+
+    build.assert_called_once()
+    assert len(mgr.get_spectator_sids(1)) == 5
+    sent = {call.args[2]["game_id"] for call in mgr._send_frames.await_args_list}
+    assert sent == {5}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_snapshot_built_off_the_loop_and_lock_released(mgr):
+    import asyncio
+    import threading
+    body = {"game_id": 6, "status": "INGAME", "jugadores": [], "mazos": {}}
+    threads = []
+
+    def build(db, game_id):
+        threads.append(threading.get_ident())
+        return body
+
+    with patch("app.services.game_status_service.build_complete_game_state", side_effect=build):
+        await asyncio.gather(*(mgr.join_as_spectator(f"w{n}", 2, game_id=6) for n in range(3)))
+
+    assert len(threads) == 1 and threads[0] != threading.get_ident()
+    assert 2 in mgr._snapshot_locks
+
+    for n in range(3):
+        await mgr.leave_spectator(f"w{n}")
+    assert 2 not in mgr._snapshot_locks
+
+    mgr._snapshot_locks[2] = asyncio.Lock()
+    mgr.discard_room(2)
+    assert 2 not in mgr._snapshot_locks
+
+
+@pytest.mark.asyncio
+async def test_connect_as_spectator_uses_lobby_directory():
+    sio = MagicMock()
+    sio.emit = AsyncMock()
+    sio.save_session = AsyncMock()
+    manager = MagicMock()
+    manager.join_as_spectator = AsyncMock()
+    manager.get_encoding.return_value = "json"
+
+    directory = get_lobby_directory()
+    directory.loaded = True
+    directory.upsert_room(MagicMock(id=3, name="Final", players_min=2, players_max=6,
+                                    status=RoomStatus.INGAME, id_game=30), [])
+
+    with patch("app.sockets.socket_events.get_ws_manager", return_value=manager), \
+         patch("app.sockets.socket_events.SessionLocal") as session_local:
+        socket_events.register_events(sio)
+        connect = sio.event.call_args_list[0][0][0]
+
+        assert await connect("v1", {"QUERY_STRING": "role=spectator&room_id=3"}) is True
+        assert await connect("v2", {"QUERY_STRING": "role=spectator&room_id=99"}) is False
+
+    session_local.assert_not_called()
+    manager.join_as_spectator.assert_awaited_once_with("v1", 3, 30)
+    sio.save_session.assert_awaited_once_with("v1", {"room_id": 3, "spectator": True})
+    connected = [c.args[1] for c in sio.emit.await_args_list if c.args[0] == "connected"]
+    assert connected[0]["spectator"] is True
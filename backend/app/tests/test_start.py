@@ -260,4 +260,50 @@ async def test_two_players_exclude_cards_in_same_file(monkeypatch, fake_ws, fake
     res = await start_game(1, types.SimpleNamespace(user_id=10), db)
     ids_in_db = [getattr(a, 'id_card', None) for a in db.added if hasattr(a, 'id_card')]
     assert len(ids_in_db) > 0
-    assert res['game']['id'] == 100
\ No newline at end of file
+    assert res['game']['id'] == 100
+
+# Reparto con semilla
+def make_seeded_db():
+    db = FakeDB(); db.rooms.append(Room(1))
+    db.players += [Player(10+i, f"P{i}", 1, date(1990+i,1,1), i==0) for i in range(5)]
+    db.cards += [Card(i, f"C{i}", CardType.SECRET if i>4 else CardType.EVENT, 3) for i in range(1,10)]
+    return db
+
+def dealt_cards(db):
+    return [(c.is_in, c.id_card, getattr(c, "player_id", None)) for c in db.added if isinstance(c, CardsXGame)]
+
+@pytest.fixture
+def capture_create(monkeypatch):
+    created = []
+    def fake(db, game_data):
+        created.append(game_data)
+        return GameObj(100)
+    monkeypatch.setattr("app.routes.start.create_game", fake)
+    return created
+
+@pytest.mark.asyncio
+async def test_same_seed_same_deal(monkeypatch, fake_ws, capture_create):
+    patch_models(monkeypatch)
+    monkeypatch.setattr(route_mod.settings, "SEEDED_DEALS_ENABLED", True)
+    deals = []
+    for seed in (7, 7, 8):
+        db = make_seeded_db()
+        await start_game(1, types.SimpleNamespace(user_id=10, seed=seed), db)
+        deals.append(dealt_cards(db))
+    assert deals[0] == deals[1]
+    assert deals[0] != deals[2]
+    assert [g["seed"] for g in capture_create] == [7, 7, 8]
+
+@pytest.mark.asyncio
+async def test_seed_rejected_when_disabled(monkeypatch, setup_db, fake_ws, capture_create):
+    patch_models(monkeypatch)
+    monkeypatch.setattr(route_mod.settings, "SEEDED_DEALS_ENABLED", False)
+    with pytest.raises(Exception, match="Reparto con semilla deshabilitado"):
+        await start_game(1, types.SimpleNamespace(user_id=10, seed=7), setup_db)
+    assert capture_create == []
+
+@pytest.mark.asyncio
+async def test_game_gets_random_seed(monkeypatch, setup_db, fake_ws, capture_create):
+    patch_models(monkeypatch)
+    await start_game(1, types.SimpleNamespace(user_id=10), setup_db)
+    assert 0 <= capture_create[0]["seed"] < 2**63
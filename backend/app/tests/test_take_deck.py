@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch, AsyncMock
 from fastapi import HTTPException
 from app.schemas.take_deck import TakeDeckRequest, TakeDeckResponse, CardSummary
 from app.db.models import Room, Game, CardsXGame, CardState, CardType, Player
+from app.services.game_context import GameContext
 
 def test_take_deck_request_schema():
     """Test que verifica el schema de TakeDeckRequest"""
@@ -188,11 +189,11 @@ async def test_take_from_deck_room_not_found():
     from app.schemas.take_deck import TakeDeckRequest
     
     mock_db = Mock()
-    mock_db.query.return_value.filter.return_value.first.return_value = None
     
     request = TakeDeckRequest(cantidad=2)
     
-    with pytest.raises(HTTPException) as exc_info:
+    with patch('app.routes.take_deck.load_game_context', return_value=None), \
+         pytest.raises(HTTPException) as exc_info:
         await take_from_deck(room_id=999, request=request, user_id=1, db=mock_db)
     
     assert exc_info.value.status_code == 404
@@ -210,12 +211,13 @@ async def test_take_from_deck_game_not_found():
     mock_room = Mock(spec=Room)
     mock_room.id_game = 10
     
-    # Primera query retorna room, segunda retorna None (game)
-    mock_db.query.return_value.filter.return_value.first.side_effect = [mock_room, None]
+    # La sala existe pero no tiene juego
+    context = GameContext(room=mock_room, game=None)
     
     request = TakeDeckRequest(cantidad=2)
     
-    with pytest.raises(HTTPException) as exc_info:
+    with patch('app.routes.take_deck.load_game_context', return_value=context), \
+         pytest.raises(HTTPException) as exc_info:
         await take_from_deck(room_id=1, request=request, user_id=1, db=mock_db)
     
     assert exc_info.value.status_code == 404
@@ -237,11 +239,12 @@ async def test_take_from_deck_not_your_turn():
     mock_game.id = 10
     mock_game.player_turn_id = 2  # Turno del jugador 2
     
-    mock_db.query.return_value.filter.return_value.first.side_effect = [mock_room, mock_game]
+    context = GameContext(room=mock_room, game=mock_game)
     
     request = TakeDeckRequest(cantidad=2)
     
-    with pytest.raises(HTTPException) as exc_info:
+    with patch('app.routes.take_deck.load_game_context', return_value=context), \
+         pytest.raises(HTTPException) as exc_info:
         await take_from_deck(room_id=1, request=request, user_id=1, db=mock_db)  # Usuario 1 intenta
     
     assert exc_info.value.status_code == 403
@@ -265,14 +268,15 @@ async def test_take_from_deck_deck_empty(mock_robar, mock_ws):
     mock_game.id = 10
     mock_game.player_turn_id = 1
     
-    mock_db.query.return_value.filter.return_value.first.side_effect = [mock_room, mock_game]
+    context = GameContext(room=mock_room, game=mock_game)
     
     # robar_cartas_del_mazo retorna lista vacía
     mock_robar.return_value = []
     
     request = TakeDeckRequest(cantidad=2)
     
-    with pytest.raises(HTTPException) as exc_info:
+    with patch('app.routes.take_deck.load_game_context', return_value=context), \
+         pytest.raises(HTTPException) as exc_info:
         await take_from_deck(room_id=1, request=request, user_id=1, db=mock_db)
     
     assert exc_info.value.status_code == 400
@@ -280,7 +284,7 @@ async def test_take_from_deck_deck_empty(mock_robar, mock_ws):
 
 
 @pytest.mark.asyncio
-@patch('app.routes.take_deck.build_complete_game_state')
+@patch('app.routes.take_deck.game_state_builder')
 @patch('app.routes.take_deck.get_websocket_service')
 @patch('app.routes.take_deck.robar_cartas_del_mazo')
 async def test_take_from_deck_success(mock_robar, mock_ws, mock_build_game_state):
@@ -333,7 +337,7 @@ async def test_take_from_deck_success(mock_robar, mock_ws, mock_build_game_state
     mock_ws_service.notificar_card_drawn_simple = AsyncMock()
     mock_ws.return_value = mock_ws_service
 
-    # Mock build_complete_game_state
+    # Mock game_state_builder
     game_state_mock = {
         "mazos": {"deck": {"count": 15}},
         "jugadores": [],
@@ -354,15 +358,11 @@ async def test_take_from_deck_success(mock_robar, mock_ws, mock_build_game_state
         query_count[0] += 1
         mock_query = Mock()
 
-        if query_count[0] == 1:  # Room query
-            mock_query.filter.return_value.first.return_value = mock_room
-        elif query_count[0] == 2:  # Game query
-            mock_query.filter.return_value.first.return_value = mock_game
-        elif query_count[0] == 3:  # Hand query
+        if query_count[0] == 1:  # Hand query
             mock_query.filter.return_value.all.return_value = hand_cards
-        elif query_count[0] == 4:  # Deck remaining count
+        elif query_count[0] == 2:  # Deck remaining count
             mock_query.filter.return_value.count.return_value = 15
-        elif query_count[0] == 5:  # Players query
+        elif query_count[0] == 3:  # Players query
             mock_query.filter.return_value.order_by.return_value.all.return_value = [mock_player]
         else:
             mock_query.filter.return_value.all.return_value = []
@@ -374,8 +374,10 @@ async def test_take_from_deck_success(mock_robar, mock_ws, mock_build_game_state
 
     request = TakeDeckRequest(cantidad=2)
 
-    # Execute
-    result = await take_from_deck(room_id=1, request=request, user_id=1, db=mock_db)
+    # Execute (sala y juego vienen del GameContext)
+    context = GameContext(room=mock_room, game=mock_game, actor=mock_player)
+    with patch('app.routes.take_deck.load_game_context', return_value=context):
+        result = await take_from_deck(room_id=1, request=request, user_id=1, db=mock_db)
 
     # Verify response structure
     assert isinstance(result, TakeDeckResponse)
@@ -398,7 +400,7 @@ async def test_take_from_deck_success(mock_robar, mock_ws, mock_build_game_state
 
     # Verify service calls
     mock_robar.assert_called_once_with(mock_db, mock_game, 1, 2)
-    mock_build_game_state.assert_called_once_with(mock_db, 10)
+    mock_build_game_state.assert_called_once_with(10)
     mock_ws_service.notificar_estado_partida.assert_called_once()
     mock_ws_service.notificar_card_drawn_simple.assert_called_once_with(
         room_id=1,
@@ -0,0 +1,53 @@
+"""
+Job de archivado de partidas terminadas (ver app/services/game_archive.py).
+
+Uso (desde backend/, p.ej. en un cron):
+    python scripts/archive_games.py
+    python scripts/archive_games.py --after-minutes 0 --retention-days 30
+    python scripts/archive_games.py --dry-run
+"""
+
+import argparse
+import os
+import sys
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings  # noqa: E402
+from app.db.database import SessionLocal  # noqa: E402
+from app.services.game_archive import (  # noqa: E402
+    archive_finished_games,
+    find_archivable_games,
+    purge_expired_archives,
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Archiva partidas terminadas fuera de las tablas vivas")
+    parser.add_argument("--after-minutes", type=int, default=settings.ARCHIVE_AFTER_MINUTES,
+                        help="minutos desde el último turno antes de archivar")
+    parser.add_argument("--retention-days", type=int, default=settings.ARCHIVE_RETENTION_DAYS,
+                        help="días que se guardan los archivos (0 = siempre)")
+    parser.add_argument("--limit", type=int, default=settings.ARCHIVE_BATCH_SIZE,
+                        help="máximo de partidas por corrida")
+    parser.add_argument("--dry-run", action="store_true", help="solo listar las partidas elegibles")
+    args = parser.parse_args(argv)
+
+    older_than = timedelta(minutes=args.after_minutes)
+    db = SessionLocal()
+    try:
+        if args.dry_run:
+            games = find_archivable_games(db, older_than, args.limit)
+            print(f"{len(games)} partida(s) para archivar: {games}")
+            return 0
+        archived = archive_finished_games(db, older_than, args.limit)
+        purged = purge_expired_archives(db, args.retention_days)
+        print(f"Archivadas {len(archived)} partida(s); {purged} archivo(s) vencidos borrados.")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
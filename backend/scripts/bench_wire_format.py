@@ -0,0 +1,127 @@
+"""
+Benchmark JSON vs MessagePack sobre estados de partida (ver app/sockets/wire_format.py).
+
+Uso (desde backend/):
+    python scripts/bench_wire_format.py                 # estado sintético de 6 jugadores
+    python scripts/bench_wire_format.py --room 12       # estado real desde la BD
+    python scripts/bench_wire_format.py --iterations 5000
+
+Mide el tiempo de codificación y los bytes del mensaje público
+(game_state_public) y de un mensaje privado (game_state_private), con el mismo
+json.dumps que usa python-socketio para armar los paquetes.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.sockets import wire_format  # noqa: E402
+
+
+def _card(cxg_id, card_id):
+    return {
+        "id": cxg_id,
+        "name": f"Card {card_id}",
+        "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor.",
+        "type": "EVENT",
+        "img_src": f"/cards/card_{card_id:02d}.png",
+    }
+
+
+def synthetic_state(num_players: int = 6):
+    """Estado con la misma forma que build_complete_game_state."""
+    jugadores, secrets, privados, sets = [], [], {}, []
+    cxg = 1
+    for pid in range(1, num_players + 1):
+        mano = []
+        for i in range(6):
+            mano.append(_card(cxg, (pid * 7 + i) % 30 + 1))
+            cxg += 1
+        secretos = []
+        for i in range(3):
+            secretos.append({**_card(cxg, 40 + i), "revealed": i == 0})
+            secrets.append({"id": cxg, "player_id": pid, "player_name": f"Player {pid}",
+                            "name": f"Secret {i}", "img_src": f"/cards/secret_{i}.png",
+                            "type": "SECRET", "hidden": i != 0, "position": i + 1})
+            cxg += 1
+        jugadores.append({
+            "player_id": pid, "name": f"Player {pid}", "avatar_src": f"/avatars/{pid}.png",
+            "order": pid, "is_host": pid == 1, "hand_size": 6, "total_secrets_count": 3,
+            "revealed_secrets_count": 1, "revealed_secrets": [secrets[-3]], "detective_set": pid <= 2,
+        })
+        privados[pid] = {"user_id": pid, "mano": mano, "secretos": secretos}
+        if pid <= 2:
+            sets.append({"owner_id": pid, "position": 1, "set_type": "Hercule Poirot",
+                         "cards": [_card(cxg + k, 12) for k in range(3)], "count": 3})
+            cxg += 3
+    return {
+        "game_id": 1, "status": "INGAME", "turno_actual": 1, "jugadores": jugadores,
+        "mazos": {"deck": {"count": 24, "draft": [_card(cxg + k, 20 + k) for k in range(3)]},
+                  "discard": {"count": 5, "top": "/cards/card_03.png"}},
+        "sets": sets, "secretsFromAllPlayers": secrets, "estados_privados": privados,
+    }
+
+
+def load_state(room_id: int):
+    from app.db.database import SessionLocal
+    from app.db.models import Room
+    from app.services.game_status_service import build_complete_game_state
+
+    db = SessionLocal()
+    try:
+        room = db.query(Room).filter(Room.id == room_id).first()
+        if room is None or room.id_game is None:
+            raise SystemExit(f"room {room_id} sin partida")
+        return build_complete_game_state(db, room.id_game)
+    finally:
+        db.close()
+
+
+def messages(state):
+    now = datetime.now().isoformat()
+    public = {"type": "game_state_public", "room_id": 1, "timestamp": now,
+              **{k: state.get(k) for k in ("game_id", "status", "turno_actual", "jugadores",
+                                           "mazos", "sets", "secretsFromAllPlayers")}}
+    user_id, private = next(iter(state["estados_privados"].items()))
+    private_msg = {"type": "game_state_private", "user_id": user_id, "mano": private["mano"],
+                   "secretos": private["secretos"], "timestamp": now}
+    return {"game_state_public": public, "game_state_private": private_msg}
+
+
+def bench(data, iterations):
+    encoders = {"json": lambda: json.dumps(data, separators=(",", ":")).encode("utf-8")}
+    if wire_format.msgpack_available():
+        encoders["msgpack"] = lambda: wire_format.pack(data)
+    rows = []
+    for name, encode in encoders.items():
+        size = len(encode())
+        seconds = timeit.timeit(encode, number=iterations)
+        rows.append((name, size, seconds / iterations * 1e6))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs MessagePack")
+    parser.add_argument("--room", type=int, help="room_id de una partida real en la BD")
+    parser.add_argument("--players", type=int, default=6, help="jugadores del estado sintético")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    state = load_state(args.room) if args.room else synthetic_state(args.players)
+    if not wire_format.msgpack_available():
+        print("msgpack no está instalado: solo se mide JSON (pip install msgpack)")
+
+    print(f"{'mensaje':<20} {'formato':<8} {'bytes':>8} {'us/encode':>10}")
+    for event, data in messages(state).items():
+        for name, size, micros in bench(data, args.iterations):
+            print(f"{event:<20} {name:<8} {size:>8} {micros:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
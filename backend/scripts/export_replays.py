@@ -0,0 +1,52 @@
+"""
+Exporta replays binarios de partidas terminadas (ver app/services/replay.py).
+
+Uso (desde backend/):
+    python scripts/export_replays.py --out replays/
+    python scripts/export_replays.py --out replays/ --room 12 --room 15
+
+Cada partida se escribe en <out>/game-<game_id>.dotr en streaming; las filas se
+leen como tuplas, sin cargar objetos ORM.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal  # noqa: E402
+from app.db.models import Room, RoomStatus  # noqa: E402
+from app.services.replay import iter_replay  # noqa: E402
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Exporta replays de partidas terminadas")
+    parser.add_argument("--out", required=True, help="directorio de salida")
+    parser.add_argument("--room", type=int, action="append", default=[],
+                        help="room_id a exportar (repetible); por defecto todas las terminadas")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    db = SessionLocal()
+    try:
+        query = db.query(Room).filter(Room.status == RoomStatus.FINISH, Room.id_game.isnot(None))
+        if args.room:
+            query = query.filter(Room.id.in_(args.room))
+        exported = 0
+        total_bytes = 0
+        for room in query.order_by(Room.id).all():
+            path = os.path.join(args.out, f"game-{room.id_game}.dotr")
+            with open(path, "wb") as fh:
+                for chunk in iter_replay(db, room):
+                    fh.write(chunk)
+                    total_bytes += len(chunk)
+            exported += 1
+        print(f"Exportadas {exported} partida(s), {total_bytes} bytes en {args.out}")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Partidas entre bots contra un servidor (ver app/bots/).
+
+Uso (desde backend/):
+    python scripts/run_bots.py --url http://localhost:8000 --rooms 10 --players 4
+    python scripts/run_bots.py --in-process --rooms 2 --think 0 0.05 --seed 7
+    python scripts/run_bots.py --rooms 50 --strategy greedy --think 0.5 3
+    python scripts/run_bots.py --in-process --rooms 4 --seed 7 --deal-seed 100
+
+Cada sala se crea, se llena, se inicia y se juega hasta el final; todas corren
+en paralelo. --in-process levanta app.main:socket_app en este mismo proceso
+(usa la BD de DATABASE_URL). --deal-seed fija el reparto de cada sala (sala i:
+semilla N + i); contra un servidor aparte requiere SEEDED_DEALS_ENABLED=true.
+Al final imprime turnos, jugadas por tipo y errores por request.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+from app.bots import play_room, serve_in_process  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.bots.strategy import STRATEGIES  # noqa: E402
+
+
+async def run(args, base_url: str):
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.http_timeout) as http:
+        results = await asyncio.gather(*(
+            play_room(
+                base_url,
+                players=args.players,
+                strategy=args.strategy,
+                think_time=tuple(args.think),
+                seed=None if args.seed is None else args.seed + room,
+                timeout=args.timeout,
+                transports=None if args.transport == "auto" else [args.transport],
+                http=http,
+                deal_seed=None if args.deal_seed is None else args.deal_seed + room,
+            )
+            for room in range(args.rooms)
+        ), return_exceptions=True)
+
+    turns, moves, errors, failed = 0, Counter(), Counter(), 0
+    for result in results:
+        if isinstance(result, BaseException):
+            failed += 1
+            print(f"room failed: {result!r}")
+            continue
+        for stats in result:
+            turns += stats.turns
+            moves.update(stats.moves)
+            errors.update(stats.errors)
+    return turns, moves, errors, failed
+
+
+async def main(args):
+    started = time.perf_counter()
+    if args.in_process:
+        if args.deal_seed is not None:
+            settings.SEEDED_DEALS_ENABLED = True
+        async with serve_in_process() as base_url:
+            turns, moves, errors, failed = await run(args, base_url)
+    else:
+        turns, moves, errors, failed = await run(args, args.url)
+    elapsed = time.perf_counter() - started
+
+    total = sum(moves.values())
+    print(f"\n{args.rooms} rooms x {args.players} bots ({args.strategy}) in {elapsed:.1f}s, {failed} failed")
+    print(f"turns: {turns}   requests: {total + sum(errors.values())} ({total / elapsed:.1f}/s ok)")
+    print("\nmoves:")
+    for move, count in moves.most_common():
+        print(f"  {move:<28} {count:>7}  {count / total:6.1%}")
+    if errors:
+        print("\nerrors:")
+        for error, count in errors.most_common():
+            print(f"  {error:<28} {count:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default="http://localhost:8000", help="Servidor")
+    target.add_argument("--in-process", action="store_true", help="Levantar el servidor en este proceso")
+    parser.add_argument("--rooms", type=int, default=1, help="Salas en paralelo")
+    parser.add_argument("--players", type=int, default=4, help="Bots por sala (2-6)")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="random")
+    parser.add_argument("--think", type=float, nargs=2, default=[0.2, 1.0], metavar=("MIN", "MAX"),
+                        help="Segundos de 'pensar' por decisión")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla de las estrategias")
+    parser.add_argument("--deal-seed", type=int, default=None, help="Semilla del reparto (sala i: N + i)")
+    parser.add_argument("--timeout", type=float, default=None, help="Máximo de segundos por partida")
+    parser.add_argument("--transport", choices=["polling", "websocket", "auto"], default="polling",
+                        help="Transporte de Engine.IO de los bots (websocket requiere aiohttp>=3.11)")
+    parser.add_argument("--http-timeout", type=float, default=30.0)
+    asyncio.run(main(parser.parse_args()))
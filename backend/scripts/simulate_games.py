@@ -0,0 +1,71 @@
+"""
+Simulador de partidas offline (ver app/simulator/): miles de partidas en
+memoria con las reglas de los servicios, sin servidor ni BD.
+
+Uso (desde backend/):
+    python scripts/simulate_games.py --games 20000 --players 4
+    python scripts/simulate_games.py --games 5000 --players 2 3 4 5 6 --seed 7
+    python scripts/simulate_games.py --games 10000 --strategy greedy --json
+
+Imprime, por cantidad de jugadores, la distribución de resultados, el largo
+de partida en turnos (cuánto vive una sala) y la mezcla de acciones por
+partida y por turno (requests a dimensionar en BD y sockets; mismos nombres
+que run_bots.py).
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.bots.strategy import STRATEGIES  # noqa: E402
+from app.simulator import DEFAULT_CATALOG_SQL, load_catalog, run_simulations  # noqa: E402
+
+
+def print_summary(summary):
+    turns = summary["turns"]
+    print(f"\n{summary['games']} games x {summary['players']} players "
+          f"({summary['games_per_second']} games/s)")
+    print(f"detectives win: {summary['detectives_win']:.1%}")
+    for outcome, share in summary["outcomes"].items():
+        print(f"  {outcome:<28} {share:6.1%}")
+    print(f"turns: mean {turns['mean']}  p50 {turns['p50']}  p90 {turns['p90']}  "
+          f"p99 {turns['p99']}  max {turns['max']}")
+    print(f"  {'action':<28} {'per game':>9} {'per turn':>9}")
+    for action, per_game in summary["actions_per_game"].items():
+        print(f"  {action:<28} {per_game:>9.2f} {summary['actions_per_turn'][action]:>9.3f}")
+
+
+def main(args):
+    catalog = load_catalog(args.catalog)
+    summaries = []
+    for players in args.players:
+        report = run_simulations(
+            args.games,
+            players=players,
+            workers=args.workers,
+            seed=args.seed,
+            strategy=args.strategy,
+            catalog=catalog,
+            max_turns=args.max_turns,
+        )
+        summaries.append(report.summary())
+        if not args.json:
+            print_summary(summaries[-1])
+    if args.json:
+        print(json.dumps(summaries, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=10000, help="Partidas por cantidad de jugadores")
+    parser.add_argument("--players", type=int, nargs="+", default=[4], help="Jugadores por partida (2-6)")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos (default: todos los cores)")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla base (partida i usa seed + i)")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="random")
+    parser.add_argument("--max-turns", type=int, default=1000, help="Corte de seguridad por partida")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG_SQL, help="Script SQL con el INSERT de cartas")
+    parser.add_argument("--json", action="store_true", help="Imprimir el reporte como JSON")
+    main(parser.parse_args())